@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+Spine 热键工具命令行入口（无界面）
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def _collect_hotkey_files(paths: List[str]) -> List[str]:
+    """
+    展开命令行给出的文件与目录
+
+    Args:
+        paths: 文件或目录路径
+
+    Returns:
+        排序后的 txt 文件列表（目录下递归查找）
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(glob.glob(os.path.join(path, "**", "*.txt"), recursive=True))
+        else:
+            files.append(path)
+    return sorted(set(os.path.abspath(f) for f in files))
+
+
+def _profile_names(files: List[str]) -> List[str]:
+    """以文件名作为配置名，重名时改用相对路径"""
+    stems = [os.path.splitext(os.path.basename(f))[0] for f in files]
+    if len(set(stems)) == len(stems):
+        return stems
+    base = os.path.commonpath(files) if len(files) > 1 else os.path.dirname(files[0])
+    return [os.path.splitext(os.path.relpath(f, base))[0] for f in files]
+
+
+def cmd_analyze(args: argparse.Namespace) -> int:
+    """analyze 子命令：多配置差异分析"""
+    from core.profile_analysis import ProfileAnalyzer, export_csv, export_json
+
+    files = _collect_hotkey_files(args.paths)
+    if not files:
+        print("未找到快捷键文件", file=sys.stderr)
+        return 1
+
+    analyzer = ProfileAnalyzer()
+    names = _profile_names(files)
+    for path, name in zip(files, names):
+        try:
+            analyzer.add_file(path, name)
+        except Exception as e:
+            print(f"跳过 {path}: {e}", file=sys.stderr)
+
+    baseline = args.baseline
+    if baseline and baseline not in analyzer.names:
+        baseline_path = os.path.abspath(baseline)
+        if baseline_path in files:
+            baseline = names[files.index(baseline_path)]
+
+    try:
+        result = analyzer.analyze(baseline)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    if args.format == "csv":
+        if not args.output:
+            print("CSV 格式需要通过 --output 指定输出目录", file=sys.stderr)
+            return 1
+        for path in export_csv(result, args.output):
+            print(path)
+    elif args.output:
+        export_json(result, args.output)
+        print(args.output)
+    else:
+        json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return 0
+
+
+def cmd_index(args: argparse.Namespace) -> int:
+    """index 子命令：目录索引与查询"""
+    from core.directory_index import DirectoryIndex
+
+    if not os.path.isdir(args.directory):
+        print(f"目录不存在: {args.directory}", file=sys.stderr)
+        return 1
+
+    index = DirectoryIndex(args.directory, args.index)
+    if not args.no_rescan:
+        stats = index.rescan()
+        print(
+            f"已索引 {len(index.files)} 个文件（新增 {stats['added']}，更新 {stats['updated']}，"
+            f"未变 {stats['unchanged']}，移除 {stats['removed']}，失败 {stats['failed']}）",
+            file=sys.stderr
+        )
+
+    if args.who_binds:
+        for relative, category_id, command_id in index.who_binds(args.who_binds):
+            print(f"{relative}\t{category_id}\t{command_id}")
+    if args.lacks:
+        for relative in index.files_lacking(args.lacks, args.category):
+            print(relative)
+    if args.common:
+        for shortcut, count in index.most_common_bindings(args.common, args.category, args.limit):
+            print(f"{count}\t{shortcut}")
+    return 0
+
+
+def cmd_store(args: argparse.Namespace) -> int:
+    """store 子命令：导入快捷键文件到 SQLite 数据库并执行查询"""
+    import sqlite3
+    from core.storage import SQLiteStorage
+    from utils.file_converter import FileConverter
+
+    files = _collect_hotkey_files(args.imports) if args.imports else []
+    names = _profile_names(files) if files else []
+    failed = 0
+    for path, name in zip(files, names):
+        try:
+            storage = SQLiteStorage(args.database, args.profile or name)
+            storage.load(FileConverter.load_hotkey_file(path))
+            storage.close()
+            print(f"已导入 {path} -> {args.profile or name}", file=sys.stderr)
+        except Exception as e:
+            print(f"跳过 {path}: {e}", file=sys.stderr)
+            failed += 1
+
+    storage = SQLiteStorage(args.database, args.profile or "default")
+    try:
+        if args.query:
+            for row in storage.query(args.query):
+                print("\t".join("" if value is None else str(value) for value in row))
+        elif not files:
+            for profile in storage.profiles():
+                print(profile)
+    except sqlite3.Error as e:
+        print(f"SQL 执行失败: {e}", file=sys.stderr)
+        return 1
+    finally:
+        storage.close()
+    return 1 if failed else 0
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    """daemon 子命令：前台运行本地快捷键守护进程"""
+    from core.config_manager import ConfigManager
+    from core.conflict_scopes import ConflictScopes
+    from core.keymap_daemon import KeymapDaemon
+    from utils.resource_path import get_external_resource_path
+
+    config_manager = ConfigManager(get_external_resource_path("config.json"))
+    daemon = KeymapDaemon(
+        args.socket, ConflictScopes(config_manager.get_conflict_scopes()), args.poll,
+        allowed_paths=args.allow_write or ()
+    )
+    for path in _collect_hotkey_files(args.preload or []):
+        try:
+            daemon.preload(path)
+        except Exception as e:
+            print(f"预加载失败 {path}: {e}", file=sys.stderr)
+    try:
+        daemon.start()
+    except OSError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(f"守护进程已启动: {daemon.socket_path}", file=sys.stderr)
+    daemon.wait()
+    return 0
+
+
+def cmd_client(args: argparse.Namespace) -> int:
+    """client 子命令：向守护进程发送一次请求"""
+    from core.keymap_daemon import KeymapClient, KeymapDaemonError
+
+    params = {}
+    for pair in args.params:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            print(f"参数格式应为 key=value: {pair}", file=sys.stderr)
+            return 1
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    if "path" in params:
+        params["path"] = os.path.abspath(params["path"])
+
+    try:
+        with KeymapClient(args.socket) as client:
+            result = client.call(args.method, **params)
+    except (OSError, KeymapDaemonError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    json.dump(result, sys.stdout, ensure_ascii=False)
+    print()
+    return 0
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    """merge 子命令：三方合并快捷键文件（退出码：0 无冲突，1 存在未解决的冲突，2 合并失败）"""
+    from core.config_manager import ConfigManager
+    from core.conflict_scopes import ConflictScopes
+    from core.keymap_merge import merge_keymaps
+    from utils.file_converter import FileConverter
+    from utils.resource_path import get_external_resource_path
+
+    files = _collect_hotkey_files(args.ours)
+    if not files:
+        print("未找到快捷键文件", file=sys.stderr)
+        return 1
+    if not args.in_place and not args.output:
+        print("需要通过 --output 指定输出位置，或使用 --in-place 覆盖原文件", file=sys.stderr)
+        return 1
+
+    config_manager = ConfigManager(get_external_resource_path("config.json"))
+    scopes = ConflictScopes(config_manager.get_conflict_scopes())
+    base = FileConverter.load_hotkey_file(args.base)
+    theirs = FileConverter.load_hotkey_file(args.theirs)
+
+    multiple = len(files) > 1 or os.path.isdir(args.ours[0])
+    root = os.path.commonpath(files) if len(files) > 1 else os.path.dirname(files[0])
+    report = {}
+    failed = 0
+    for path in files:
+        if args.in_place:
+            output = path
+        elif multiple:
+            output = os.path.join(args.output, os.path.relpath(path, root))
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+        else:
+            output = args.output
+        try:
+            merged, conflicts = merge_keymaps(base, FileConverter.load_hotkey_file(path), theirs, scopes)
+            FileConverter.write_hotkey_file(merged, output)
+        except Exception as e:
+            print(f"合并失败 {path}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        report[path] = conflicts
+        print(f"{output}: {len(conflicts)} 个冲突", file=sys.stderr)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    if failed:
+        return 2
+    return 1 if any(report.values()) else 0
+
+
+def cmd_defaults(args: argparse.Namespace) -> int:
+    """defaults 子命令：生成默认快捷键目录，或列出快捷键文件中与默认值不同的命令"""
+    from core.config_manager import ConfigManager
+    from core.default_catalog import (
+        CUSTOMIZED_STATUSES, DefaultCatalog, catalog_directory
+    )
+    from utils.file_converter import FileConverter
+    from utils.resource_path import get_external_resource_path
+
+    directory = args.directory or catalog_directory()
+    if not args.file:
+        for version in DefaultCatalog.available_versions(directory):
+            print(version)
+        return 0
+
+    version = args.version
+    if not version:
+        version = ConfigManager(get_external_resource_path("config.json")).get_compatible_version()
+
+    if args.build:
+        catalog = DefaultCatalog.from_hotkey_file(args.file, version)
+        output = os.path.join(directory, f"{version}.json")
+        catalog.save(output)
+        print(f"{output}: {len(catalog)} 个命令", file=sys.stderr)
+        return 0
+
+    catalog = DefaultCatalog.for_version(version, directory)
+    if catalog is None:
+        print(f"没有 Spine {version} 的默认快捷键目录", file=sys.stderr)
+        return 1
+    report: dict = {status: [] for status in CUSTOMIZED_STATUSES}
+    for category in FileConverter.load_hotkey_file(args.file):
+        for item in category.get("items", []):
+            status = catalog.classify(category["categoryId"], item["commandId"], item["shortcuts"])
+            if status in report:
+                report[status].append({
+                    "category": category["categoryId"],
+                    "command": item["commandId"],
+                    "shortcuts": item["shortcuts"],
+                    "default": catalog.get(category["categoryId"], item["commandId"])
+                })
+    json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Spine Hotkeys Editor 命令行工具"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser("analyze", help="分析多份快捷键配置的差异、重载与共识绑定")
+    analyze.add_argument("paths", nargs="+", help="快捷键 txt 文件或包含它们的目录")
+    analyze.add_argument("--baseline", help="作为基准的配置（配置名或文件路径）")
+    analyze.add_argument("--format", choices=["json", "csv"], default="json", help="输出格式")
+    analyze.add_argument("--output", help="输出文件（json）或目录（csv），默认将 JSON 输出到标准输出")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    index = subparsers.add_parser("index", help="索引团队快捷键目录并查询绑定")
+    index.add_argument("directory", help="快捷键文件所在目录")
+    index.add_argument("--index", help="索引文件路径（默认保存在目录中）")
+    index.add_argument("--no-rescan", action="store_true", help="直接使用已有索引，不重扫目录")
+    index.add_argument("--who-binds", metavar="SHORTCUT", help="列出绑定了该快捷键的文件与命令")
+    index.add_argument("--lacks", metavar="COMMAND", help="列出没有为该命令绑定快捷键的文件")
+    index.add_argument("--common", metavar="COMMAND", help="列出该命令最常见的绑定")
+    index.add_argument("--category", help="限定 --lacks / --common 的类别")
+    index.add_argument("--limit", type=int, default=5, help="--common 返回的数量")
+    index.set_defaults(handler=cmd_index)
+
+    store = subparsers.add_parser("store", help="将快捷键文件导入 SQLite 数据库并执行 SQL 查询")
+    store.add_argument("database", help="SQLite 数据库文件")
+    store.add_argument("--import", dest="imports", nargs="+", metavar="PATH",
+                       help="导入的快捷键 txt 文件或目录（每个文件作为一个配置）")
+    store.add_argument("--profile", help="配置名（导入时覆盖文件名）")
+    store.add_argument("--query", metavar="SQL",
+                       help="执行只读 SQL 查询（表：categories、commands、bindings）；不指定时列出配置")
+    store.set_defaults(handler=cmd_store)
+
+    merge = subparsers.add_parser(
+        "merge", help="三方合并：将 base 到 theirs 的变化合并进各份 ours",
+        description="三方合并：将 base 到 theirs 的变化合并进各份 ours。"
+                    "退出码：0 无冲突，1 存在未解决的冲突（已写出合并结果与报告），2 有文件合并失败"
+    )
+    merge.add_argument("base", help="共同基准文件")
+    merge.add_argument("theirs", help="对方文件（如新版默认配置）")
+    merge.add_argument("ours", nargs="+", help="本方文件或包含它们的目录")
+    merge.add_argument("--output", help="输出文件（单个 ours）或目录（多个 ours，保留相对路径）")
+    merge.add_argument("--in-place", action="store_true", help="直接覆盖 ours 文件")
+    merge.add_argument("--report", help="冲突报告 JSON 路径（默认输出到标准输出）")
+    merge.set_defaults(handler=cmd_merge)
+
+    defaults = subparsers.add_parser(
+        "defaults", help="由 Spine 的默认快捷键文件生成默认目录，或列出文件中与默认值不同的命令"
+    )
+    defaults.add_argument("file", nargs="?", help="快捷键 txt 文件（不指定时列出已有目录的版本）")
+    defaults.add_argument("--version", help="Spine 版本号（默认为 config.json 中的 compatible_version）")
+    defaults.add_argument("--build", action="store_true",
+                          help="将 file 作为该版本的默认快捷键生成目录（file 应为 Spine 恢复默认后保存的文件）")
+    defaults.add_argument("--directory", help="目录文件所在目录（默认为程序目录下的 defaults）")
+    defaults.set_defaults(handler=cmd_defaults)
+
+    daemon = subparsers.add_parser("daemon", help="运行本地守护进程，常驻内存提供快捷键查询与修改")
+    daemon.add_argument("--socket", help="Unix 域套接字路径（默认在临时目录中）")
+    daemon.add_argument("--poll", type=float, default=1.0, help="文件监视的轮询间隔（秒）")
+    daemon.add_argument("--preload", nargs="+", metavar="PATH",
+                        help="启动时预加载的快捷键文件或目录（允许 apply 写回）")
+    daemon.add_argument("--allow-write", nargs="+", metavar="PATH",
+                        help="另外允许 apply 写回的文件或目录")
+    daemon.set_defaults(handler=cmd_daemon)
+
+    client = subparsers.add_parser("client", help="向守护进程发送请求")
+    client.add_argument("method", help="方法：ping、load、unload、list、lookup、command、conflicts、apply、shutdown")
+    client.add_argument("params", nargs="*", metavar="KEY=VALUE",
+                        help="方法参数，值按 JSON 解析（失败时作为字符串），如 path=hotkeys.txt shortcut=F5")
+    client.add_argument("--socket", help="Unix 域套接字路径（默认在临时目录中）")
+    client.set_defaults(handler=cmd_client)
+
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """命令行主入口"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,12 @@
 
 from .config_manager import ConfigManager
 from .i18n_manager import I18nManager
+from .storage import HotkeyStorage, MemoryStorage, SQLiteStorage, create_storage
 from .hotkey_manager import HotkeyManager
+from .conflict_scopes import ConflictScopes
 from .conflict_detector import ConflictDetector
+from .occupancy_index import OccupancyIndex
+from .shortcut_finder import ShortcutFinder
+from .conflict_resolver import ConflictResolver
 from .keyboard_handler import KeyboardHandler
 from .controller import Controller
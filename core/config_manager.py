@@ -2,10 +2,13 @@
 """
 配置管理器模块
 负责 config.json 的读写和更新
+修改先在内存中标记为待写入，同一延迟窗口内的多次修改由后台线程合并为一次原子写入，退出时写入剩余修改
 """
 
+import atexit
 import json
 import os
+import threading
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -13,16 +16,25 @@ from typing import Any, Dict, List, Optional
 class ConfigManager:
     """配置管理器"""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, write_delay: float = 0.5):
         """
         初始化配置管理器
         
         Args:
             config_path: config.json 文件路径
+            write_delay: 修改后延迟写入的秒数（0 表示立即写入）
         """
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
+        self.write_delay = write_delay
+        # 保护 config 的读写与待写入状态
+        self._lock = threading.RLock()
+        # 保证文件写入按顺序进行
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
         self.load_config()
+        atexit.register(self.flush)
     
     def load_config(self) -> bool:
         """
@@ -46,18 +58,71 @@ class ConfigManager:
     
     def save_config(self) -> bool:
         """
-        保存配置文件
+        立即保存配置文件（先写临时文件再替换，中断时不会留下不完整的文件）
         
         Returns:
             保存是否成功
         """
-        try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent='\t', ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"保存配置文件失败: {e}")
-            return False
+        with self._write_lock:
+            with self._lock:
+                self._cancel_timer()
+                self._dirty = False
+                content = json.dumps(self.config, indent='\t', ensure_ascii=False)
+            try:
+                temp_path = f"{self.config_path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(temp_path, self.config_path)
+                return True
+            except Exception as e:
+                print(f"保存配置文件失败: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+    
+    def mark_dirty(self) -> None:
+        """标记配置已修改，在延迟窗口结束时由后台线程写入（窗口内的修改合并为一次写入）"""
+        with self._lock:
+            self._dirty = True
+            if self.write_delay > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.write_delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.save_config()
+    
+    def flush(self) -> bool:
+        """
+        写入待保存的修改（没有修改时不写文件）
+        
+        Returns:
+            是否成功（没有待写入的修改时返回 True）
+        """
+        with self._lock:
+            if not self._dirty:
+                self._cancel_timer()
+                return True
+        return self.save_config()
+    
+    def is_dirty(self) -> bool:
+        """是否有尚未写入文件的修改"""
+        with self._lock:
+            return self._dirty
+    
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _set_value(self, section: str, key: str, value: Any) -> None:
+        """设置配置项，值发生变化时标记待写入"""
+        with self._lock:
+            values = self.config.setdefault(section, {})
+            if key in values and values[key] == value:
+                return
+            values[key] = value
+        self.mark_dirty()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """获取默认配置"""
@@ -77,7 +142,47 @@ class ConfigManager:
                 "initialized": False,
                 "last_loaded": "",
                 "link_path": ""
-            }
+            },
+            "optimizer": self._get_default_optimizer_settings(),
+            "conflict_scopes": self._get_default_conflict_scopes(),
+            "storage": self._get_default_storage_settings(),
+            "history": self._get_default_history_settings()
+        }
+    
+    @staticmethod
+    def _get_default_conflict_scopes() -> Dict[str, List[str]]:
+        """获取默认的互斥类别（不会同时生效的类别之间不判定冲突）"""
+        return {
+            "Setup Mode": ["Animate Mode"]
+        }
+    
+    @staticmethod
+    def _get_default_storage_settings() -> Dict[str, Any]:
+        """获取默认存储后端设置"""
+        return {
+            "backend": "memory",
+            "path": "",
+            "profile": "default"
+        }
+    
+    @staticmethod
+    def _get_default_history_settings() -> Dict[str, Any]:
+        """获取默认备份历史保留策略"""
+        return {
+            "max_snapshots": 50,
+            "max_age_days": 90
+        }
+    
+    @staticmethod
+    def _get_default_optimizer_settings() -> Dict[str, Any]:
+        """获取默认键位优化设置"""
+        return {
+            "time_budget": 5.0,
+            "change_penalty": 1.0,
+            "travel_weight": 1.0,
+            "modifier_weight": 1.0,
+            "priorities": {},
+            "pinned": {}
         }
     
     def get_metadata(self) -> Dict[str, str]:
@@ -102,10 +207,7 @@ class ConfigManager:
     
     def set_primary_language(self, language: str) -> None:
         """设置主语言"""
-        if "localization" not in self.config:
-            self.config["localization"] = {}
-        self.config["localization"]["primary_language"] = language
-        self.save_config()
+        self._set_value("localization", "primary_language", language)
     
     def get_available_languages(self) -> List[str]:
         """获取可用语言列表"""
@@ -129,10 +231,7 @@ class ConfigManager:
     
     def set_initialized(self, status: bool) -> None:
         """设置初始化状态"""
-        if "system" not in self.config:
-            self.config["system"] = {}
-        self.config["system"]["initialized"] = status
-        self.save_config()
+        self._set_value("system", "initialized", status)
     
     def get_last_loaded(self) -> str:
         """获取最后加载时间"""
@@ -140,10 +239,7 @@ class ConfigManager:
     
     def set_last_loaded(self, date_str: str) -> None:
         """设置最后加载时间"""
-        if "system" not in self.config:
-            self.config["system"] = {}
-        self.config["system"]["last_loaded"] = date_str
-        self.save_config()
+        self._set_value("system", "last_loaded", date_str)
     
     def get_link_path(self) -> str:
         """获取链接路径"""
@@ -151,14 +247,71 @@ class ConfigManager:
     
     def set_link_path(self, path: str) -> None:
         """设置链接路径"""
-        if "system" not in self.config:
-            self.config["system"] = {}
-        self.config["system"]["link_path"] = path
-        self.save_config()
+        self._set_value("system", "link_path", path)
+    
+    def get_team_directory(self) -> str:
+        """获取团队快捷键目录"""
+        return self.config.get("system", {}).get("team_directory", "")
+    
+    def set_team_directory(self, path: str) -> None:
+        """设置团队快捷键目录"""
+        self._set_value("system", "team_directory", path)
     
     def update_system_status(self) -> None:
         """更新系统状态（最后加载时间）"""
-        if "system" not in self.config:
-            self.config["system"] = {}
-        self.config["system"]["last_loaded"] = datetime.now().strftime("%Y.%m.%d")
-        self.save_config()
+        self._set_value("system", "last_loaded", datetime.now().strftime("%Y.%m.%d"))
+    
+    def get_optimizer_settings(self) -> Dict[str, Any]:
+        """
+        获取键位优化设置
+        
+        Returns:
+            包含 time_budget、change_penalty、travel_weight、modifier_weight、
+            priorities ({类别: {命令: 权重}})、pinned ({类别: [命令]}) 的字典
+        """
+        settings = self._get_default_optimizer_settings()
+        settings.update(self.config.get("optimizer", {}))
+        return settings
+    
+    def get_conflict_scopes(self) -> Dict[str, List[str]]:
+        """
+        获取互斥类别配置
+        
+        Returns:
+            {category_id: [不会同时生效的 category_id, ...]}
+        """
+        return self.config.get("conflict_scopes", self._get_default_conflict_scopes())
+    
+    def set_conflict_scopes(self, exclusions: Dict[str, List[str]]) -> None:
+        """
+        设置互斥类别配置
+        
+        Args:
+            exclusions: {category_id: [category_id, ...]}
+        """
+        with self._lock:
+            self.config["conflict_scopes"] = exclusions
+        self.mark_dirty()
+    
+    def get_storage_settings(self) -> Dict[str, Any]:
+        """
+        获取存储后端设置
+        
+        Returns:
+            包含 backend ("memory" 或 "sqlite")、path（数据库路径，为空则使用 processing 目录）、
+            profile（配置名）的字典
+        """
+        settings = self._get_default_storage_settings()
+        settings.update(self.config.get("storage", {}))
+        return settings
+    
+    def get_history_settings(self) -> Dict[str, Any]:
+        """
+        获取备份历史保留策略
+        
+        Returns:
+            包含 max_snapshots（最多保留的记录数）、max_age_days（最长保留天数）的字典，0 表示不限
+        """
+        settings = self._get_default_history_settings()
+        settings.update(self.config.get("history", {}))
+        return settings
@@ -1,60 +1,198 @@
 # -*- coding: utf-8 -*-
 """
 冲突检测器模块
-负责检测全局快捷键冲突
+负责检测全局快捷键冲突（按类别作用域过滤，按物理按键组合比较）
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
 
-from .hotkey_manager import HotkeyManager
+from .conflict_scopes import ConflictScopes
+from .hotkey_manager import HotkeyManager, ProfileStateCache
+from utils.shortcut_codec import canonical_shortcut
+from utils.metrics import metrics
+from utils.tracing import span
+
+# 绑定: (category_id, command_id, 原始快捷键)
+Binding = Tuple[str, str, str]
 
 
 class ConflictDetector:
     """冲突检测器"""
     
-    def __init__(self, hotkey_manager: HotkeyManager):
+    def __init__(self, hotkey_manager: HotkeyManager,
+                 scopes: Optional[ConflictScopes] = None):
         """
-        初始化冲突检测器
+        初始化冲突检测器并订阅数据变更
         
         Args:
             hotkey_manager: 快捷键管理器实例
+            scopes: 类别作用域矩阵（默认所有类别互相重叠）
         """
         self.hotkey_manager = hotkey_manager
+        self.scopes = scopes or ConflictScopes()
+        # 按规范快捷键分桶的绑定列表，随数据变更增量维护
+        self._buckets: Dict[str, List[Binding]] = {}
+        self._conflict_bindings: Dict[str, List[Binding]] = {}
         self._conflict_cache: Dict[str, List[Tuple[str, str]]] = {}
+        # 每个存在冲突的命令参与的冲突快捷键数量
+        self._command_conflicts: Dict[Tuple[str, str], int] = {}
         self._cache_valid = False
+        # 其他配置的索引
+        self._profile_caches = ProfileStateCache(
+            hotkey_manager, self._capture_state, self._restore_state, self._reset_state
+        )
+        
+        hotkey_manager.add_listener(self._on_hotkey_changed)
     
     def invalidate_cache(self) -> None:
-        """使缓存失效"""
+        """使缓存失效（下次查询时整体重建）"""
         self._cache_valid = False
+        self._buckets.clear()
+        self._conflict_bindings.clear()
         self._conflict_cache.clear()
+        self._command_conflicts.clear()
+    
+    def set_scopes(self, scopes: ConflictScopes) -> None:
+        """
+        更换作用域矩阵
+        
+        Args:
+            scopes: 新的作用域矩阵
+        """
+        self.scopes = scopes
+        self._profile_caches.clear()
+        self.invalidate_cache()
+    
+    def _capture_state(self) -> tuple:
+        return (self._buckets, self._conflict_bindings, self._conflict_cache,
+                self._command_conflicts, self._cache_valid)
+    
+    def _restore_state(self, state: tuple) -> None:
+        (self._buckets, self._conflict_bindings, self._conflict_cache,
+         self._command_conflicts, self._cache_valid) = state
+    
+    def _reset_state(self) -> None:
+        # 换出的容器已归缓存所有，不能原地清空
+        self._buckets, self._conflict_bindings, self._conflict_cache = {}, {}, {}
+        self._command_conflicts = {}
+        self._cache_valid = False
+    
+    def _on_hotkey_changed(self, event: str, category_id: str, command_id: str,
+                           old_shortcut: str, new_shortcut: str) -> None:
+        """处理快捷键管理器的变更通知，只更新受影响的快捷键桶"""
+        if event == 'switch':
+            # 索引已由配置状态缓存换入
+            return
+        if event == 'reset':
+            self._profile_caches.clear()
+        if not self._cache_valid:
+            return
+        if event == 'reset':
+            self.invalidate_cache()
+            return
+        if old_shortcut:
+            key = canonical_shortcut(old_shortcut)
+            bindings = self._buckets.get(key, [])
+            binding = (category_id, command_id, old_shortcut)
+            if binding in bindings:
+                bindings.remove(binding)
+            self._update_bucket(key)
+        if new_shortcut:
+            key = canonical_shortcut(new_shortcut)
+            self._buckets.setdefault(key, []).append((category_id, command_id, new_shortcut))
+            self._update_bucket(key)
+    
+    def _update_bucket(self, key: str) -> None:
+        """重新判断单个快捷键桶的冲突状态"""
+        metrics.increment("conflicts.bucket_updates")
+        bindings = self._buckets.get(key)
+        if not bindings:
+            self._buckets.pop(key, None)
+            self._conflict_bindings.pop(key, None)
+            self._update_command_conflicts(self._conflict_cache.pop(key, []), [])
+            return
+        conflicting = self.scopes.conflicting([(cat, cmd) for cat, cmd, _ in bindings])
+        self._update_command_conflicts(self._conflict_cache.get(key, []), conflicting)
+        if conflicting:
+            self._conflict_cache[key] = conflicting
+            members = set(conflicting)
+            self._conflict_bindings[key] = [b for b in bindings if (b[0], b[1]) in members]
+        else:
+            self._conflict_bindings.pop(key, None)
+            self._conflict_cache.pop(key, None)
+    
+    def _update_command_conflicts(self, old: List[Tuple[str, str]],
+                                  new: List[Tuple[str, str]]) -> None:
+        """单个快捷键桶的冲突命令变化后，更新每个命令的冲突计数"""
+        old_set, new_set = set(old), set(new)
+        for command in old_set - new_set:
+            count = self._command_conflicts.get(command, 0) - 1
+            if count > 0:
+                self._command_conflicts[command] = count
+            else:
+                self._command_conflicts.pop(command, None)
+        for command in new_set - old_set:
+            self._command_conflicts[command] = self._command_conflicts.get(command, 0) + 1
+    
+    def _ensure_cache(self) -> None:
+        """缓存失效时整体重建"""
+        if not self._cache_valid:
+            self.detect_all_conflicts()
     
     def detect_all_conflicts(self) -> Dict[str, List[Tuple[str, str]]]:
         """
-        全局冲突检测
+        全局冲突检测（按作用域过滤，缓存有效时直接返回增量维护的结果）
         
         Returns:
-            冲突字典 {shortcut: [(category_id, command_id), ...]}
-            仅包含有多个命令使用的快捷键
-        """
-        shortcut_map: Dict[str, List[Tuple[str, str]]] = {}
-        
-        all_shortcuts = self.hotkey_manager.get_all_shortcuts()
-        for category_id, command_id, shortcut, _ in all_shortcuts:
-            if shortcut:
-                if shortcut not in shortcut_map:
-                    shortcut_map[shortcut] = []
-                shortcut_map[shortcut].append((category_id, command_id))
-        
-        conflicts = {
-            shortcut: commands
-            for shortcut, commands in shortcut_map.items()
-            if len(commands) > 1
-        }
+            冲突字典 {规范快捷键: [(category_id, command_id), ...]}
+            仅包含作用域重叠的多个命令使用的快捷键，列表中只含实际冲突的命令；
+            字符模式字面量与等价的一般模式按键（如 '!' 与 shift + NUM_1）归入同一项
+        """
+        if self._cache_valid:
+            return self._conflict_cache
+        
+        with span("ConflictDetector.detect_all_conflicts", "conflicts"), \
+                metrics.timer("conflicts.full_recompute"):
+            self._buckets.clear()
+            self._conflict_bindings.clear()
+            self._conflict_cache.clear()
+            self._command_conflicts.clear()
+            
+            all_shortcuts = self.hotkey_manager.get_all_shortcuts()
+            for category_id, command_id, shortcut, _ in all_shortcuts:
+                if shortcut:
+                    key = canonical_shortcut(shortcut)
+                    if key not in self._buckets:
+                        self._buckets[key] = []
+                    self._buckets[key].append((category_id, command_id, shortcut))
+            
+            for key, bindings in self._buckets.items():
+                if len(bindings) > 1:
+                    self._update_bucket(key)
+            
+            self._cache_valid = True
+        
+        return self._conflict_cache
+    
+    def get_conflicting_bindings(self) -> Dict[str, List[Binding]]:
+        """
+        获取冲突绑定及其原始写法
         
-        self._conflict_cache = conflicts
-        self._cache_valid = True
+        Returns:
+            {规范快捷键: [(category_id, command_id, 原始快捷键), ...]}
+        """
+        self._ensure_cache()
+        return self._conflict_bindings
+    
+    def get_conflicting_command_keys(self) -> AbstractSet[Tuple[str, str]]:
+        """
+        获取存在冲突的命令（随数据变更增量维护）
         
-        return conflicts
+        Returns:
+            {(category_id, command_id), ...}（只读视图）
+        """
+        self._ensure_cache()
+        return self._command_conflicts.keys()
     
     def check_conflict(self, shortcut: str,
                        exclude_category: Optional[str] = None,
@@ -70,19 +208,7 @@ class ConflictDetector:
         Returns:
             是否存在冲突
         """
-        if not shortcut:
-            return False
-        
-        commands = self.hotkey_manager.find_commands_by_shortcut(shortcut)
-        
-        if exclude_category and exclude_command:
-            commands = [
-                (cat, cmd, idx)
-                for cat, cmd, idx in commands
-                if not (cat == exclude_category and cmd == exclude_command)
-            ]
-        
-        return len(commands) > 0
+        return len(self.get_conflicting_commands(shortcut, exclude_category, exclude_command)) > 0
     
     def get_conflicting_commands(self, shortcut: str,
                                   exclude_category: Optional[str] = None,
@@ -90,6 +216,8 @@ class ConflictDetector:
         """
         获取与某快捷键冲突的命令列表
         
+        指定 exclude_category 时，只返回与该类别作用域重叠的命令。
+        
         Args:
             shortcut: 快捷键
             exclude_category: 排除的类别 ID
@@ -101,27 +229,33 @@ class ConflictDetector:
         if not shortcut:
             return []
         
-        commands = self.hotkey_manager.find_commands_by_shortcut(shortcut)
+        self._ensure_cache()
         
-        result_set: Set[Tuple[str, str]] = set()
-        for cat, cmd, _ in commands:
+        result: List[Tuple[str, str]] = []
+        for cat, cmd, _ in self._buckets.get(canonical_shortcut(shortcut), []):
             if exclude_category and exclude_command:
                 if cat == exclude_category and cmd == exclude_command:
                     continue
-            result_set.add((cat, cmd))
+            if exclude_category and not self.scopes.overlaps(exclude_category, cat):
+                continue
+            if (cat, cmd) not in result:
+                result.append((cat, cmd))
         
-        return list(result_set)
+        return result
     
     def get_shortcuts_with_conflicts(self) -> Set[str]:
         """
         获取所有存在冲突的快捷键集合
         
         Returns:
-            冲突快捷键集合
+            冲突快捷键集合（原始写法）
         """
-        if not self._cache_valid:
-            self.detect_all_conflicts()
-        return set(self._conflict_cache.keys())
+        self._ensure_cache()
+        return {
+            shortcut
+            for bindings in self._conflict_bindings.values()
+            for _, _, shortcut in bindings
+        }
     
     def is_shortcut_conflicting(self, shortcut: str) -> bool:
         """
@@ -133,6 +267,20 @@ class ConflictDetector:
         Returns:
             是否冲突
         """
-        if not self._cache_valid:
-            self.detect_all_conflicts()
-        return shortcut in self._conflict_cache
+        self._ensure_cache()
+        return canonical_shortcut(shortcut) in self._conflict_cache
+    
+    def is_command_conflicting(self, shortcut: str, category_id: str, command_id: str) -> bool:
+        """
+        检查某命令的快捷键是否与作用域重叠的其他命令冲突
+        
+        Args:
+            shortcut: 快捷键
+            category_id: 类别 ID
+            command_id: 命令 ID
+            
+        Returns:
+            是否冲突
+        """
+        self._ensure_cache()
+        return (category_id, command_id) in self._conflict_cache.get(canonical_shortcut(shortcut), [])
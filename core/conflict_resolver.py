@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+冲突批量解决模块
+将冲突绑定与候选空闲快捷键建模为带权二部图，一次求出最小代价的重新分配方案
+"""
+
+import heapq
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .conflict_detector import ConflictDetector
+from .hotkey_manager import HotkeyManager
+from .shortcut_finder import ShortcutFinder
+
+# 保留原快捷键 / 改为候选快捷键 / 解除绑定 的代价
+KEEP_COST = 0.0
+MOVE_COST = 10.0
+UNBIND_COST = 60.0
+
+# 每个冲突绑定参与匹配的候选数量（助记/邻近候选 + 错位分配的通用空闲候选）
+CANDIDATES_PER_BINDING = 12
+SPREAD_PER_BINDING = 8
+
+# 变更项: (category_id, command_id, 原快捷键, 新快捷键)，新快捷键为空表示解除绑定
+Change = Tuple[str, str, str, str]
+
+
+def min_cost_assignment(edges: List[List[Tuple[Hashable, float]]]) -> List[Hashable]:
+    """
+    稀疏二部图最小代价匹配（带势函数的最短增广路）
+    每个左侧节点恰好匹配一个右侧节点，右侧节点容量为 1
+
+    Args:
+        edges: edges[i] 为左侧节点 i 的 [(右侧节点, 代价), ...]
+
+    Returns:
+        每个左侧节点匹配到的右侧节点
+
+    Raises:
+        ValueError: 存在无法匹配的左侧节点
+    """
+    u: List[float] = [0.0] * len(edges)
+    v: Dict[Hashable, float] = {}
+    match_right: Dict[Hashable, int] = {}
+    match_left: List[Optional[Hashable]] = [None] * len(edges)
+
+    for source, source_edges in enumerate(edges):
+        if not source_edges:
+            raise ValueError(f"左侧节点 {source} 没有候选")
+        u[source] = min(cost - v.get(r, 0.0) for r, cost in source_edges)
+
+        dist: Dict[Hashable, float] = {}
+        prev: Dict[Hashable, int] = {}
+        done_right: List[Hashable] = []
+        heap: List[Tuple[float, int, Hashable]] = []
+        counter = 0
+
+        def relax(left: int, base: float) -> None:
+            nonlocal counter
+            offset = base - u[left]
+            v_get = v.get
+            dist_get = dist.get
+            for r, cost in edges[left]:
+                d = offset + cost - v_get(r, 0.0)
+                if d < dist_get(r, math.inf):
+                    dist[r] = d
+                    prev[r] = left
+                    counter += 1
+                    heapq.heappush(heap, (d, counter, r))
+
+        relax(source, 0.0)
+        finished = set()
+        target = None
+        while heap:
+            d, _, r = heapq.heappop(heap)
+            if r in finished or d > dist[r]:
+                continue
+            finished.add(r)
+            if r not in match_right:
+                target = r
+                break
+            done_right.append(r)
+            relax(match_right[r], d)
+
+        if target is None:
+            raise ValueError(f"左侧节点 {source} 无法增广")
+
+        total = dist[target]
+        for r in done_right:
+            shift = total - dist[r]
+            v[r] = v.get(r, 0.0) - shift
+            u[match_right[r]] += shift
+        u[source] += total
+
+        r = target
+        while True:
+            left = prev[r]
+            previous = match_left[left]
+            match_left[left] = r
+            match_right[r] = left
+            if left == source:
+                break
+            r = previous
+
+    return match_left
+
+
+class ConflictResolver:
+    """冲突批量解决器"""
+
+    def __init__(self, hotkey_manager: HotkeyManager,
+                 conflict_detector: ConflictDetector,
+                 shortcut_finder: ShortcutFinder):
+        """
+        初始化冲突解决器
+
+        Args:
+            hotkey_manager: 快捷键管理器实例
+            conflict_detector: 冲突检测器实例
+            shortcut_finder: 空闲快捷键推荐器实例
+        """
+        self.hotkey_manager = hotkey_manager
+        self.conflict_detector = conflict_detector
+        self.shortcut_finder = shortcut_finder
+
+    def resolve(self, name_provider: Optional[Callable[[str], Sequence[str]]] = None,
+                pinned: Optional[Dict[str, List[str]]] = None) -> List[Change]:
+        """
+        计算消除全部冲突的最小代价方案（不修改数据）
+
+        每个冲突绑定可以：保留原快捷键（同一快捷键只能保留一个）、
+        改为候选空闲快捷键、或解除绑定，三者代价依次升高。
+        固定命令的绑定不参与分配，所在快捷键上的其他绑定都须移走或解除。
+
+        Args:
+            name_provider: 根据命令 ID 返回助记名称列表，默认使用命令 ID
+            pinned: 固定不动的命令 {category_id: [command_id, ...]}（与键位优化的设置相同）
+
+        Returns:
+            变更列表 [(category_id, command_id, 原快捷键, 新快捷键), ...]
+        """
+        if name_provider is None:
+            name_provider = lambda command_id: [command_id]
+        pinned = pinned or {}
+
+        conflicts = self.conflict_detector.get_conflicting_bindings()
+
+        finder = self.shortcut_finder
+        free_codes = finder.free_codes()
+
+        bindings: List[Tuple[str, str, str]] = []
+        edges: List[List[Tuple[Hashable, float]]] = []
+        for key, conflict_bindings in conflicts.items():
+            key_pinned = any(
+                command_id in pinned.get(category_id, ()) for category_id, command_id, _ in conflict_bindings
+            )
+            for category_id, command_id, shortcut in conflict_bindings:
+                if command_id in pinned.get(category_id, ()):
+                    continue
+                node_edges: List[Tuple[Hashable, float]] = (
+                    [] if key_pinned else [(('keep', key), KEEP_COST)]
+                )
+                scores = finder.score_candidates(
+                    name_provider(command_id), [shortcut], CANDIDATES_PER_BINDING
+                )
+                best = sorted(scores, key=lambda code: (scores[code], code))
+                for code in best[:CANDIDATES_PER_BINDING]:
+                    node_edges.append((code, MOVE_COST + scores[code]))
+                
+                # 各绑定错开取通用候选，避免所有绑定争抢同一批低成本组合
+                if free_codes:
+                    start = (len(bindings) * SPREAD_PER_BINDING) % len(free_codes)
+                    for offset in range(min(SPREAD_PER_BINDING, len(free_codes))):
+                        code = free_codes[(start + offset) % len(free_codes)]
+                        if code not in scores:
+                            node_edges.append((code, MOVE_COST + finder.base_cost(code)))
+                node_edges.append((('unbind', len(bindings)), UNBIND_COST))
+                bindings.append((category_id, command_id, shortcut))
+                edges.append(node_edges)
+
+        assignment = min_cost_assignment(edges)
+
+        space = self.shortcut_finder.occupancy_index.space
+        changes: List[Change] = []
+        for (category_id, command_id, shortcut), right in zip(bindings, assignment):
+            if isinstance(right, tuple):
+                if right[0] == 'keep':
+                    continue
+                changes.append((category_id, command_id, shortcut, ""))
+            else:
+                changes.append((category_id, command_id, shortcut, space.decode(right)))
+        return changes
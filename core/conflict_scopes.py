@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+冲突作用域模块
+记录哪些类别不会同时生效，以每个类别一个位集的形式参与冲突判断
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class ConflictScopes:
+    """
+    类别作用域矩阵
+    默认所有类别两两重叠（同一快捷键即冲突）；配置为互斥的类别之间不产生冲突
+    """
+
+    def __init__(self, exclusions: Optional[Dict[str, List[str]]] = None):
+        """
+        初始化作用域矩阵
+
+        Args:
+            exclusions: 互斥类别 {category_id: [不会同时生效的 category_id, ...]}，关系自动对称
+        """
+        self._bits: Dict[str, int] = {}
+        # 每个类别的互斥位集：对应位为 1 的类别与其不会同时生效
+        self._exclusive: Dict[str, int] = {}
+        self.set_exclusions(exclusions or {})
+
+    def bit(self, category_id: str) -> int:
+        """
+        获取类别对应的位（首次出现时分配）
+
+        Args:
+            category_id: 类别 ID
+
+        Returns:
+            仅包含该类别的位集
+        """
+        value = self._bits.get(category_id)
+        if value is None:
+            value = 1 << len(self._bits)
+            self._bits[category_id] = value
+        return value
+
+    def set_exclusions(self, exclusions: Dict[str, List[str]]) -> None:
+        """
+        重新设置互斥关系
+
+        Args:
+            exclusions: {category_id: [category_id, ...]}
+        """
+        self._exclusive.clear()
+        for category_id, others in exclusions.items():
+            self.bit(category_id)
+            for other in others:
+                if other == category_id:
+                    continue
+                self._exclusive[category_id] = self._exclusive.get(category_id, 0) | self.bit(other)
+                self._exclusive[other] = self._exclusive.get(other, 0) | self.bit(category_id)
+
+    def to_config(self) -> Dict[str, List[str]]:
+        """
+        导出为配置格式（每对互斥关系只记录一次）
+
+        Returns:
+            {category_id: [category_id, ...]}
+        """
+        names = {bit: name for name, bit in self._bits.items()}
+        result: Dict[str, List[str]] = {}
+        for category_id, mask in self._exclusive.items():
+            own = self._bits[category_id]
+            others = [names[bit] for bit in sorted(names) if mask & bit and bit > own]
+            if others:
+                result[category_id] = others
+        return result
+
+    def overlaps(self, category_a: str, category_b: str) -> bool:
+        """判断两个类别是否可能同时生效"""
+        if category_a == category_b:
+            return True
+        return not (self._exclusive.get(category_a, 0) & self.bit(category_b))
+
+    def conflicting(self, commands: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        从同一快捷键下的命令中筛选实际冲突的命令
+
+        以位集求交判断：命令所在类别出现多次，或存在另一个与之重叠的类别，即视为冲突。
+        同一命令的重复绑定（如 '!' 与 shift + NUM_1）只计一次，不视为冲突。
+
+        Args:
+            commands: [(category_id, command_id), ...]
+
+        Returns:
+            存在冲突的命令（保持原顺序）
+        """
+        commands = list(dict.fromkeys(commands))
+        if len(commands) < 2:
+            return []
+
+        present = 0
+        repeated = 0
+        for category_id, _ in commands:
+            bit = self.bit(category_id)
+            if present & bit:
+                repeated |= bit
+            present |= bit
+
+        if not self._exclusive:
+            return commands
+
+        result = []
+        for category_id, command_id in commands:
+            bit = self._bits[category_id]
+            others = present & ~bit & ~self._exclusive.get(category_id, 0)
+            if others or repeated & bit:
+                result.append((category_id, command_id))
+        return result
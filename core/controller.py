@@ -7,17 +7,35 @@
 import os
 import subprocess
 import sys
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QFileDialog, QApplication
 
 from .config_manager import ConfigManager
 from .i18n_manager import I18nManager
 from .hotkey_manager import HotkeyManager
 from .conflict_detector import ConflictDetector
+from .conflict_scopes import ConflictScopes
+from .default_catalog import DefaultCatalog, DefaultsTracker
+from .keymap_filters import FILTER_ALL, FILTERS, KeymapFilters
 from .keyboard_handler import KeyboardHandler
+from .link_watcher import LinkWatcher
+from .occupancy_index import OccupancyIndex
+from .shortcut_finder import ShortcutFinder
+from .storage import ProfileStorage, create_storage
+from .conflict_resolver import ConflictResolver
 from utils.file_converter import FileConverter
+from utils.metrics import default_metrics_path, dump_metrics, metrics
 from utils.resource_path import get_external_resource_path
+from utils.shortcut_codec import canonical_shortcut
+from utils.snapshot_store import KIND_SAVE, SnapshotStore
+from utils.tracing import default_trace_path, traced, tracer
+
+# 界面状态的脏标记
+UI_BUTTONS = "buttons"
+UI_STATUS = "status"
 
 
 class Controller:
@@ -36,23 +54,85 @@ class Controller:
         self.config_manager = ConfigManager(
             get_external_resource_path("config.json")
         )
-        self.i18n_manager = I18nManager(
-            get_external_resource_path("language")
+        self.i18n_manager = I18nManager("language")
+        self.hotkey_manager = HotkeyManager(self._create_storage())
+        self.profiles_path = get_external_resource_path("profiles.json")
+        if isinstance(self.hotkey_manager.storage, ProfileStorage):
+            self.hotkey_manager.storage.load_file(self.profiles_path)
+        self.conflict_scopes = ConflictScopes(self.config_manager.get_conflict_scopes())
+        self.conflict_detector = ConflictDetector(self.hotkey_manager, self.conflict_scopes)
+        self.occupancy_index = OccupancyIndex(self.hotkey_manager, self.conflict_scopes)
+        self.shortcut_finder = ShortcutFinder(self.occupancy_index)
+        self.defaults_tracker = DefaultsTracker(
+            self.hotkey_manager,
+            DefaultCatalog.for_version(self.config_manager.get_compatible_version())
+        )
+        self.keymap_filters = KeymapFilters(
+            self.hotkey_manager, self.conflict_detector, self.defaults_tracker
+        )
+        self.conflict_resolver = ConflictResolver(
+            self.hotkey_manager, self.conflict_detector, self.shortcut_finder
         )
-        self.hotkey_manager = HotkeyManager()
-        self.conflict_detector = ConflictDetector(self.hotkey_manager)
         self.keyboard_handler = KeyboardHandler('normal')
+        self.link_watcher = LinkWatcher(parent=self.dialog)
+        history_settings = self.config_manager.get_history_settings()
+        self.snapshot_store = SnapshotStore(
+            get_external_resource_path(os.path.join("processing", "history")),
+            int(history_settings.get("max_snapshots", 50)),
+            int(history_settings.get("max_age_days", 90))
+        )
 
         self.is_linked = False
         self.is_quote_mode_active = False
         self.current_mode = 'normal'
         
         self.row_data_map: Dict[int, Tuple[str, str, int]] = {}
+        # 每个命令首个快捷键所在的行
+        self._command_rows: Dict[Tuple[str, str], int] = {}
+        # 上次渲染后快捷键发生变化的命令与快捷键，编辑后只更新这些命令及其冲突对象的行
+        self._dirty_commands: Set[Tuple[str, str]] = set()
+        self._dirty_shortcuts: Set[str] = set()
+        self._rows_stale = False
 
         self.current_category = ""
+        self.current_filter = FILTER_ALL
+        
+        # 同一轮事件循环内请求的界面状态刷新合并为一次，且每帧最多执行一次
+        self._ui_dirty: Set[str] = set()
+        self._ui_refresh_interval = 0.016
+        self._ui_last_refresh = 0.0
+        self._ui_refresh_timer = QTimer(self.dialog)
+        self._ui_refresh_timer.setSingleShot(True)
+        self._ui_refresh_timer.timeout.connect(self._flush_ui_refresh)
+        # 刷新期间共享的选中行查询结果
+        self._selection_memo: Optional[Dict[str, Any]] = None
+        
+        self._optimizer_job = None
+        self._heatmap_dialog = None
+        self._heatmap_refresh_pending = False
+        self._index_dialog = None
+        self._directory_index = None
+        self._history_dialog = None
+        self._metrics_dialog = None
+        self._history_entries: List[Dict] = []
+        self.hotkey_manager.add_listener(self._on_hotkey_data_changed)
+        self.link_watcher.external_change.connect(self._on_link_file_changed)
 
         self._connect_signals()
     
+    def _create_storage(self):
+        """按配置创建快捷键存储后端（SQLite 数据库默认放在 processing 目录）"""
+        settings = self.config_manager.get_storage_settings()
+        if settings.get("backend") == "sqlite" and not settings.get("path"):
+            processing_dir = get_external_resource_path("processing")
+            os.makedirs(processing_dir, exist_ok=True)
+            settings["path"] = os.path.join(processing_dir, "hotkeys.db")
+        try:
+            return create_storage(settings)
+        except Exception as e:
+            print(f"创建存储后端失败，改用内存存储: {e}")
+            return create_storage()
+    
     def _connect_signals(self):
         """连接 UI 信号到处理方法"""
         self.dialog.btn_link.clicked.connect(self.on_link_clicked)
@@ -65,6 +145,19 @@ class Controller:
         self.dialog.btn_hotkey_doc.clicked.connect(lambda: self.on_info_button('hotkey_doc'))
         self.dialog.btn_key_mapping.clicked.connect(lambda: self.on_info_button('key_mapping'))
         self.dialog.btn_about.clicked.connect(lambda: self.on_info_button('about'))
+        self.dialog.action_resolve_conflicts.triggered.connect(self.on_resolve_conflicts)
+        self.dialog.action_optimize_keymap.triggered.connect(self.on_optimize_keymap)
+        self.dialog.action_reset_default.triggered.connect(self.on_reset_default)
+        self.dialog.action_reset_all_defaults.triggered.connect(self.on_reset_all_defaults)
+        self.dialog.action_keyboard_heatmap.triggered.connect(self.on_show_keyboard_heatmap)
+        self.dialog.action_directory_index.triggered.connect(self.on_show_directory_index)
+        self.dialog.action_history.triggered.connect(self.on_show_history)
+        self.dialog.menu_tools.aboutToShow.connect(self._on_tools_menu_about_to_show)
+        self.dialog.action_tracing.toggled.connect(self.on_tracing_toggled)
+        self.dialog.action_export_trace.triggered.connect(self.on_export_trace)
+        self.dialog.action_metrics.triggered.connect(self.on_show_metrics)
+        self.dialog.action_new_profile.triggered.connect(self.on_new_profile)
+        self.dialog.action_delete_profile.triggered.connect(self.on_delete_profile)
 
         from PySide6.QtWidgets import QDialogButtonBox
         self.dialog.button_box.button(QDialogButtonBox.StandardButton.Ok).clicked.connect(self.on_save)
@@ -72,10 +165,14 @@ class Controller:
         self.dialog.button_box.button(QDialogButtonBox.StandardButton.Cancel).clicked.connect(self.on_cancel)
         
         self.dialog.combo_category.currentIndexChanged.connect(self.on_category_changed)
+        self.dialog.combo_filter.currentIndexChanged.connect(self.on_filter_changed)
         self.dialog.combo_language.currentIndexChanged.connect(self.on_language_changed)
-        self.dialog.hotkey_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.dialog.combo_profile.currentIndexChanged.connect(self.on_profile_changed)
+        self.dialog.hotkey_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.dialog.hotkey_edit_clicked.connect(self.on_hotkey_edit_clicked)
+        self.dialog.section_changed.connect(self.on_section_changed)
     
+    @traced(category="ui")
     def initialize(self):
         """执行启动初始化流程"""
         language = self.config_manager.get_primary_language()
@@ -83,7 +180,7 @@ class Controller:
         
         self.update_ui_texts()
         self._populate_language_combo()
-        self._update_button_states()
+        self._request_ui_refresh()
         self._update_window_title()
         
         link_path = self.config_manager.get_link_path()
@@ -95,6 +192,15 @@ class Controller:
             self.config_manager.set_initialized(True)
         
         self.config_manager.update_system_status()
+        QTimer.singleShot(0, self._prewarm_dialogs)
+    
+    def _prewarm_dialogs(self):
+        """主窗口显示后预先创建常用对话框并排版较长的说明文本"""
+        from ui.dialogs import prepare_document, prewarm_dialogs
+        
+        prewarm_dialogs(self.dialog)
+        for key in ("userGuide", "shortcutsGuide", "keyMapping"):
+            prepare_document(self.i18n_manager.get_text(key, ""))
     
     def update_ui_texts(self):
         """更新所有界面文本"""
@@ -107,6 +213,18 @@ class Controller:
         self.dialog.label_language.setText(
             self.i18n_manager.get_text("labelLanguage", "语言：")
         )
+        self.dialog.label_profile.setText(
+            self.i18n_manager.get_text("labelProfile", "配置：")
+        )
+        self.dialog.btn_profile.setText(
+            self.i18n_manager.get_text("btnProfile", "配置管理")
+        )
+        self.dialog.action_new_profile.setText(
+            self.i18n_manager.get_text("actionNewProfile", "新建配置（复制当前）")
+        )
+        self.dialog.action_delete_profile.setText(
+            self.i18n_manager.get_text("actionDeleteProfile", "删除当前配置")
+        )
         self.dialog.label_status.setText(
             self.i18n_manager.get_text("statusLabel", "  请选择想设置快捷方式的操作")
         )
@@ -123,6 +241,61 @@ class Controller:
         self.dialog.btn_quote_mode.setText(
             self.i18n_manager.get_text("btnQuoteMode", "单引号模式")
         )
+        self.dialog.btn_tools.setText(
+            self.i18n_manager.get_text("btnTools", "工具")
+        )
+        self.dialog.action_resolve_conflicts.setText(
+            self.i18n_manager.get_text("actionResolveConflicts", "解决全部冲突")
+        )
+        self.dialog.action_optimize_keymap.setText(
+            self.i18n_manager.get_text("actionOptimizeKeymap", "优化键位布局")
+        )
+        self.dialog.action_reset_default.setText(
+            self.i18n_manager.get_text("actionResetDefault", "恢复默认快捷键")
+        )
+        self.dialog.action_reset_all_defaults.setText(
+            self.i18n_manager.get_text("actionResetAllDefaults", "全部恢复默认")
+        )
+        self.dialog.label_filter.setText(
+            self.i18n_manager.get_text("labelFilter", "筛选：")
+        )
+        filter_texts = [
+            self.i18n_manager.get_text("filter_all", "全部"),
+            self.i18n_manager.get_text("filter_conflicts", "仅冲突"),
+            self.i18n_manager.get_text("filter_unbound", "仅未绑定"),
+            self.i18n_manager.get_text("filter_multiBound", "仅多重绑定"),
+            self.i18n_manager.get_text("filter_customized", "仅已自定义")
+        ]
+        for i, text in enumerate(filter_texts):
+            self.dialog.combo_filter.setItemText(i, text)
+            available = self.keymap_filters.available(FILTERS[i])
+            self.dialog.combo_filter.model().item(i).setEnabled(available)
+            self.dialog.combo_filter.setItemData(
+                i,
+                None if available else self.i18n_manager.get_text(
+                    "tooltip_noDefaults", "没有 Spine {version} 的默认快捷键目录"
+                ).format(version=self.config_manager.get_compatible_version()),
+                Qt.ToolTipRole
+            )
+        self.dialog.action_keyboard_heatmap.setText(
+            self.i18n_manager.get_text("actionKeyboardHeatmap", "键盘热力图")
+        )
+        self.dialog.action_directory_index.setText(
+            self.i18n_manager.get_text("actionDirectoryIndex", "团队快捷键目录")
+        )
+        self.dialog.action_history.setText(
+            self.i18n_manager.get_text("actionHistory", "备份历史")
+        )
+        self.dialog.action_tracing.setText(
+            self.i18n_manager.get_text("actionTracing", "记录性能跟踪")
+        )
+        self.dialog.action_export_trace.setText(
+            self.i18n_manager.get_text("actionExportTrace", "导出性能跟踪...")
+        )
+        self.dialog.action_metrics.setText(
+            self.i18n_manager.get_text("actionMetrics", "运行指标")
+        )
+        self._populate_profile_combo()
         
         if self.is_linked:
             self.dialog.btn_link.setText(
@@ -190,22 +363,84 @@ class Controller:
         
         self.dialog.setWindowTitle(f"{base_title} {version} {status}")
     
+    def _request_ui_refresh(self, *parts: str):
+        """
+        标记需要刷新的界面状态，在事件循环空闲时合并执行
+        
+        Args:
+            parts: UI_BUTTONS、UI_STATUS（不指定表示全部）
+        """
+        self._ui_dirty.update(parts or (UI_BUTTONS, UI_STATUS))
+        if self._ui_refresh_timer.isActive():
+            return
+        elapsed = time.perf_counter() - self._ui_last_refresh
+        delay = max(0.0, self._ui_refresh_interval - elapsed)
+        self._ui_refresh_timer.start(int(delay * 1000))
+    
+    def _flush_ui_refresh(self):
+        """执行已标记的界面状态刷新，选中行的查询只做一次"""
+        self._ui_refresh_timer.stop()
+        dirty, self._ui_dirty = self._ui_dirty, set()
+        if not dirty:
+            return
+        self._ui_last_refresh = time.perf_counter()
+        self._selection_memo = None
+        self._selection_memo = self._selection_context()
+        try:
+            if UI_BUTTONS in dirty:
+                self._update_button_states()
+            if UI_STATUS in dirty:
+                self._update_status_label()
+        finally:
+            self._selection_memo = None
+    
+    def _selection_context(self) -> Dict[str, Any]:
+        """
+        获取选中行的命令与快捷键（刷新期间返回共享结果）
+        
+        Returns:
+            {"row", "key": (cat_id, cmd_id, idx) 或 None, "shortcuts", "conflicts"}，
+            conflicts 在首次需要时才查询
+        """
+        if self._selection_memo is not None:
+            return self._selection_memo
+        row = self.dialog.get_selected_row()
+        context: Dict[str, Any] = {"row": row, "key": None, "shortcuts": None, "conflicts": None}
+        if row >= 0 and row in self.row_data_map:
+            cat_id, cmd_id, idx = self.row_data_map[row]
+            context["key"] = (cat_id, cmd_id, idx)
+            context["shortcuts"] = self.hotkey_manager.storage.get_shortcuts(cat_id, cmd_id)
+        return context
+    
+    def _selection_conflicts(self, context: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """选中快捷键的冲突命令（结果缓存在 context 中）"""
+        if context["conflicts"] is None:
+            context["conflicts"] = []
+            shortcuts = context["shortcuts"]
+            if context["key"] is not None and shortcuts is not None:
+                cat_id, cmd_id, idx = context["key"]
+                if idx < len(shortcuts) and shortcuts[idx]:
+                    context["conflicts"] = self.conflict_detector.get_conflicting_commands(
+                        shortcuts[idx], cat_id, cmd_id
+                    )
+        return context["conflicts"]
+    
     def _update_button_states(self):
         """更新按钮启用/禁用状态"""
         self.dialog.btn_open_folder.setEnabled(self.is_linked)
         
-        selected_row = self.dialog.get_selected_row()
+        context = self._selection_context()
+        selected_row = context["row"]
         has_selection = selected_row >= 0 and self.is_linked
         
         has_hotkey = False
         can_delete = False
         can_add = False
         
-        if has_selection and selected_row in self.row_data_map:
-            cat_id, cmd_id, idx = self.row_data_map[selected_row]
-            item = self.hotkey_manager.get_item(cat_id, cmd_id)
-            if item:
-                shortcuts = item.get("shortcuts", [])
+        if has_selection and context["key"] is not None:
+            idx = context["key"][2]
+            shortcuts = context["shortcuts"]
+            if shortcuts is not None:
                 total_rows = len(shortcuts)
                 
                 if idx < total_rows:
@@ -224,39 +459,52 @@ class Controller:
         self.dialog.btn_edit_hotkey.setEnabled(has_selection)
         self.dialog.btn_add_hotkey.setEnabled(has_selection and can_add)
         self.dialog.btn_delete_hotkey.setEnabled(has_selection and can_delete)
+        self.dialog.action_resolve_conflicts.setEnabled(self.is_linked)
+        self.dialog.action_optimize_keymap.setEnabled(self.is_linked)
+        self.dialog.action_keyboard_heatmap.setEnabled(self.is_linked)
+        
+        has_defaults = self.is_linked and self.defaults_tracker.available()
+        self.dialog.combo_filter.setEnabled(self.is_linked)
+        self.dialog.action_reset_all_defaults.setEnabled(has_defaults)
+        can_reset = False
+        if has_defaults and has_selection and context["key"] is not None:
+            cat_id, cmd_id, _ = context["key"]
+            can_reset = (self.defaults_tracker.is_customized(cat_id, cmd_id)
+                         and (cat_id, cmd_id) in self.defaults_tracker.catalog)
+        self.dialog.action_reset_default.setEnabled(can_reset)
     
     def _update_status_label(self):
         """更新底部状态栏"""
-        selected_row = self.dialog.get_selected_row()
+        context = self._selection_context()
         
-        if selected_row < 0 or selected_row not in self.row_data_map:
+        if context["key"] is None:
             self.dialog.set_status_text(
                 self.i18n_manager.get_text("statusLabel", "请选择想设置快捷方式的操作")
             )
             return
         
-        cat_id, cmd_id, idx = self.row_data_map[selected_row]
+        cat_id, cmd_id, idx = context["key"]
         cmd_name = self.i18n_manager.get_command_name(cmd_id)
         note = self.i18n_manager.get_command_note(cmd_id)
         
-        item = self.hotkey_manager.get_item(cat_id, cmd_id)
         conflict_text = ""
-        if item:
-            shortcuts = item.get("shortcuts", [])
-            if idx < len(shortcuts) and shortcuts[idx]:
-                shortcut = shortcuts[idx]
-                conflicts = self.conflict_detector.get_conflicting_commands(
-                    shortcut, cat_id, cmd_id
-                )
-                if conflicts:
-                    conflict_names = [
-                        self.i18n_manager.get_command_name(c[1])
-                        for c in conflicts
-                    ]
-                    conflict_label = self.i18n_manager.get_text("statusConflict", "存在冲突：")
-                    conflict_text = f"\t\t{conflict_label}{'、'.join(conflict_names)}"
-        
-        line1 = f"「{cmd_name}」{conflict_text}"
+        conflicts = self._selection_conflicts(context)
+        if conflicts:
+            conflict_names = [
+                self.i18n_manager.get_command_name(c[1])
+                for c in conflicts
+            ]
+            conflict_label = self.i18n_manager.get_text("statusConflict", "存在冲突：")
+            conflict_text = f"\t\t{conflict_label}{'、'.join(conflict_names)}"
+        
+        default_text = ""
+        if self.defaults_tracker.is_customized(cat_id, cmd_id):
+            defaults = self.defaults_tracker.catalog.get(cat_id, cmd_id) or []
+            default_label = self.i18n_manager.get_text("statusDefault", "默认：")
+            empty_text = self.i18n_manager.get_text("text_unbound", "（无）")
+            default_text = f"\t\t{default_label}{', '.join(defaults) or empty_text}"
+        
+        line1 = f"「{cmd_name}」{conflict_text}{default_text}"
         line2 = note if note else ""
         
         if line2:
@@ -278,6 +526,7 @@ class Controller:
         if file_path:
             self._do_import(file_path)
     
+    @traced(category="ui")
     def _do_import(self, file_path: str):
         """执行导入流程"""
         from ui.dialogs import AlertDialog
@@ -295,22 +544,26 @@ class Controller:
         try:
             from utils.resource_path import get_external_resource_path
             processing_dir = get_external_resource_path("processing")
-            json_path = FileConverter.import_and_process(file_path, processing_dir)
+            json_path = FileConverter.import_and_process(
+                file_path, processing_dir, self.snapshot_store
+            )
             
             self.hotkey_manager.load_from_json(json_path)
             self._normalize_empty_shortcuts()
             self.config_manager.set_link_path(file_path)
+            self.link_watcher.watch(file_path)
             self.is_linked = True
+            self._save_profiles()
             
             self.dialog.btn_link.setText(
                 self.i18n_manager.get_text("btnLink_relink", "重链接")
             )
             self._update_window_title()
-            self._update_button_states()
+            self._request_ui_refresh()
+            self._populate_profile_combo()
             self._populate_category_combo()
-            
-            if self.current_category:
-                self._render_hotkey_list()
+            self._render_hotkey_list()
+            self.dialog.hotkey_table.scrollToTop()
         
         except Exception as e:
             AlertDialog.show_alert(
@@ -320,13 +573,184 @@ class Controller:
                 self.i18n_manager.get_text("btn_ok", "确认")
             )
     
+    def _on_link_file_changed(self, changes: list, structural: bool):
+        """
+        链接文件被外部修改：逐个命令三方合并，无法自动合并的命令保留本程序的修改并提示
+        
+        Args:
+            changes: [(category_id, command_id, 外部修改前, 外部修改后), ...]
+            structural: 外部是否增删了类别或命令
+        """
+        from ui.dialogs import AlertDialog
+        from .keymap_merge import merge_shortcuts
+        
+        if structural and not self.hotkey_manager.is_modified():
+            self._do_import(self.config_manager.get_link_path())
+            self.dialog.set_status_text(
+                self.i18n_manager.get_text("status_externalReloaded", "链接文件已被外部修改，已重新载入")
+            )
+            return
+        
+        was_modified = self.hotkey_manager.is_modified()
+        merged = 0
+        conflicts = []
+        for cat_id, cmd_id, base, theirs in changes:
+            item = self.hotkey_manager.get_item(cat_id, cmd_id)
+            if item is None:
+                continue
+            ours = [s for s in item.get("shortcuts", []) if s]
+            result, conflicted = merge_shortcuts(base, ours, theirs)
+            if conflicted:
+                conflicts.append((cat_id, cmd_id, ours, theirs))
+            elif result != ours:
+                self.hotkey_manager.replace_shortcuts(cat_id, cmd_id, result or [""])
+                merged += 1
+        self.hotkey_manager.set_modified(was_modified)
+        
+        if merged:
+            self._render_hotkey_list()
+        self.dialog.set_status_text(
+            self.i18n_manager.get_text(
+                "status_externalMerged", "已合并链接文件的外部修改：{count} 项"
+            ).format(count=merged)
+        )
+        
+        if conflicts or structural:
+            lines = []
+            if conflicts:
+                lines.append(self.i18n_manager.get_text(
+                    "dialogContent_externalConflicts",
+                    "以下命令在外部与本程序中均被修改，已保留本程序中的修改，保存时将覆盖外部修改："
+                ))
+                for cat_id, cmd_id, ours, theirs in conflicts:
+                    lines.append(
+                        f"「{self.i18n_manager.get_command_name(cmd_id)}」 "
+                        f"{', '.join(theirs) or '-'} → {', '.join(ours) or '-'}"
+                    )
+            if structural:
+                lines.append(self.i18n_manager.get_text(
+                    "dialogContent_externalStructure",
+                    "外部新增或删除了类别或命令，重新链接后才会载入，保存时将覆盖这些修改。"
+                ))
+            AlertDialog.show_alert(
+                self.dialog,
+                self.i18n_manager.get_text("dialogTitle_externalChange", "链接文件已被外部修改"),
+                "\n".join(lines),
+                self.i18n_manager.get_text("btn_ok", "确认")
+            )
+    
     def _normalize_empty_shortcuts(self):
         """将空快捷键列表转换为包含单个空字符串的列表"""
-        for category in self.hotkey_manager.data:
-            for item in category.get("items", []):
-                shortcuts = item.get("shortcuts", [])
-                if not shortcuts:
-                    item["shortcuts"] = [""]
+        self.hotkey_manager.normalize_empty_shortcuts()
+    
+    def _save_profiles(self):
+        """保存多配置数据（基准与各配置的差异）"""
+        if isinstance(self.hotkey_manager.storage, ProfileStorage):
+            self.hotkey_manager.storage.save_file(self.profiles_path)
+    
+    def _profile_display_name(self, name: str) -> str:
+        """配置的显示名称"""
+        if name == ProfileStorage.DEFAULT_PROFILE:
+            return self.i18n_manager.get_text("profile_default", "默认")
+        return name
+    
+    def _populate_profile_combo(self):
+        """填充配置下拉列表"""
+        profiles = self.hotkey_manager.profiles()
+        self.dialog.combo_profile.blockSignals(True)
+        self.dialog.combo_profile.clear()
+        for name in profiles:
+            self.dialog.combo_profile.addItem(self._profile_display_name(name), name)
+        index = self.dialog.combo_profile.findData(self.hotkey_manager.active_profile())
+        self.dialog.combo_profile.setCurrentIndex(max(index, 0))
+        self.dialog.combo_profile.blockSignals(False)
+        
+        supported = bool(profiles)
+        self.dialog.combo_profile.setEnabled(supported and self.is_linked)
+        self.dialog.btn_profile.setEnabled(supported and self.is_linked)
+        self.dialog.action_delete_profile.setEnabled(
+            self.hotkey_manager.active_profile() != ProfileStorage.DEFAULT_PROFILE
+        )
+    
+    def _show_profile(self):
+        """切换配置后刷新界面（保留当前类别）"""
+        category = self.current_category
+        self._populate_profile_combo()
+        self._populate_category_combo()
+        index = self.dialog.combo_category.findData(category)
+        if index >= 0:
+            self.current_category = category
+            self.dialog.combo_category.blockSignals(True)
+            self.dialog.combo_category.setCurrentIndex(index)
+            self.dialog.combo_category.blockSignals(False)
+        self._render_hotkey_list()
+        self._request_ui_refresh()
+    
+    def on_profile_changed(self, index: int):
+        """切换配置：只交换视图与索引，界面随之刷新"""
+        name = self.dialog.combo_profile.itemData(index)
+        if not name or not self.is_linked:
+            return
+        if self.hotkey_manager.switch_profile(name):
+            self._save_profiles()
+            self._show_profile()
+            self.dialog.set_status_text(
+                self.i18n_manager.get_text(
+                    "status_profileSwitched", "已切换到配置「{name}」，保存后写入链接文件"
+                ).format(name=self._profile_display_name(name))
+            )
+    
+    def on_new_profile(self):
+        """以当前配置为副本新建配置并切换过去"""
+        from ui.dialogs import AlertDialog, TextInputDialog
+        
+        name = TextInputDialog.get_text(
+            self.dialog,
+            self.i18n_manager.get_text("dialogTitle_newProfile", "新建配置"),
+            self.i18n_manager.get_text("dialogContent_profileName", "配置名称"),
+            self.i18n_manager.get_text("btn_ok", "确认"),
+            self.i18n_manager.get_text("btn_cancel", "取消")
+        )
+        if name is None:
+            return
+        if not self.hotkey_manager.create_profile(name):
+            AlertDialog.show_alert(
+                self.dialog,
+                self.i18n_manager.get_text("dialogTitle_newProfile", "新建配置"),
+                self.i18n_manager.get_text("dialogContent_profileExists", "配置名称为空或已存在"),
+                self.i18n_manager.get_text("btn_ok", "确认")
+            )
+            return
+        was_modified = self.hotkey_manager.is_modified()
+        self.hotkey_manager.switch_profile(name)
+        # 新配置与原配置内容相同，切换本身不产生需要保存的修改
+        self.hotkey_manager.set_modified(was_modified)
+        self._save_profiles()
+        self._show_profile()
+    
+    def on_delete_profile(self):
+        """删除当前配置并切换回默认配置"""
+        from ui.dialogs import ConfirmDialog
+        
+        name = self.hotkey_manager.active_profile()
+        if name == ProfileStorage.DEFAULT_PROFILE:
+            return
+        result = ConfirmDialog.ask(
+            self.dialog,
+            self.i18n_manager.get_text("actionDeleteProfile", "删除当前配置"),
+            self.i18n_manager.get_text(
+                "dialogContent_deleteProfile", "确定删除配置「{name}」吗？"
+            ).format(name=name),
+            self.i18n_manager.get_text("btn_yes", "是"),
+            self.i18n_manager.get_text("btn_no", "否"),
+            self.i18n_manager.get_text("btn_cancel", "取消")
+        )
+        if result != ConfirmDialog.YES:
+            return
+        self.hotkey_manager.switch_profile(ProfileStorage.DEFAULT_PROFILE)
+        self.hotkey_manager.delete_profile(name)
+        self._save_profiles()
+        self._show_profile()
     
     def _populate_category_combo(self):
         """填充类别下拉列表"""
@@ -344,6 +768,7 @@ class Controller:
         
         self.dialog.combo_category.blockSignals(False)
     
+    @traced(category="ui")
     def _render_hotkey_list(self, preserve_selection: bool = False, target_row: int = -1):
         """
         渲染快捷键列表
@@ -352,67 +777,188 @@ class Controller:
             preserve_selection: 是否保持之前的选中状态
             target_row: 指定要选中的行索引（-1表示使用当前选中行）
         """
+        from ui.hotkey_list_model import header_row, separator_row
+        
+        started = time.perf_counter()
         current_row = self.dialog.get_selected_row()
         scroll_bar = self.dialog.hotkey_table.verticalScrollBar()
         scroll_position = scroll_bar.value()
         
-        self.dialog.clear_hotkey_list()
         self.row_data_map.clear()
-        
-        if not self.current_category:
-            return
-        
-        self.conflict_detector.invalidate_cache()
-        conflicting_shortcuts = self.conflict_detector.get_shortcuts_with_conflicts()
-        items = self.hotkey_manager.get_items_by_category(self.current_category)
-        
-        row_index = 0
-        for i, item in enumerate(items):
-            cmd_id = item.get("commandId", "")
-            shortcuts = item.get("shortcuts", [])
-            
-            if i > 0:
-                self.dialog.add_separator_row()
-                row_index += 1
-            
-            cmd_name = self.i18n_manager.get_command_name(cmd_id)
+        self._command_rows.clear()
+        self._dirty_commands.clear()
+        self._dirty_shortcuts.clear()
+        self._rows_stale = False
+        
+        if self.current_filter != FILTER_ALL:
+            # 筛选结果（已按列表顺序排列）
+            rows = []
+            for cat_id, cmd_id in self.keymap_filters.results(self.current_filter):
+                item = self.hotkey_manager.get_item(cat_id, cmd_id)
+                if item is not None:
+                    rows.append((cat_id, cmd_id, item.get("shortcuts", [])))
+        else:
+            # 全部类别连续显示，视图只绘制可见行
+            rows = [
+                (cat_id, item.get("commandId", ""), item.get("shortcuts", []))
+                for cat_id in self.hotkey_manager.get_categories()
+                for item in self.hotkey_manager.get_items_by_category(cat_id)
+            ]
+        
+        specs = []
+        section = None
+        for cat_id, cmd_id, shortcuts in rows:
+            if cat_id != section:
+                section = cat_id
+                specs.append(header_row(self.i18n_manager.get_category_name(cat_id), cat_id))
+            elif specs:
+                specs.append(separator_row())
             
-            if not shortcuts:
-                show_warning = False
-                self.dialog.add_hotkey_row(cmd_name, "", show_warning)
-                self.row_data_map[row_index] = (self.current_category, cmd_id, 0)
-                row_index += 1
-            else:
-                for idx, shortcut in enumerate(shortcuts):
-                    name_display = cmd_name if idx == 0 else ""
-                    show_warning = shortcut in conflicting_shortcuts
-                    
-                    self.dialog.add_hotkey_row(name_display, shortcut, show_warning)
-                    self.row_data_map[row_index] = (self.current_category, cmd_id, idx)
-                    row_index += 1
-
+            self._command_rows[(cat_id, cmd_id)] = len(specs)
+            for idx, spec in enumerate(self._command_row_specs(cat_id, cmd_id, shortcuts)):
+                self.row_data_map[len(specs)] = (cat_id, cmd_id, idx)
+                specs.append(spec)
+        
+        self.dialog.set_hotkey_rows(specs)
         scroll_bar.setValue(scroll_position)
+        metrics.observe_latency("render.full", time.perf_counter() - started)
+        metrics.increment("render.rows_listed", len(specs))
 
         if preserve_selection or target_row >= 0:
             row_to_select = target_row if target_row >= 0 else current_row
-            if row_to_select >= 0 and row_to_select < self.dialog.hotkey_table.rowCount():
-                if row_to_select not in self.dialog._separator_rows:
-                    self.dialog.hotkey_table.selectRow(row_to_select)
-                    self.dialog._selected_row = row_to_select
+            self.dialog.select_row(row_to_select)
+    
+    def _command_row_specs(self, cat_id: str, cmd_id: str, shortcuts: List[str]) -> list:
+        """
+        生成单个命令的快捷键行（每个快捷键一行，名称只显示在首行）
+        
+        Args:
+            cat_id: 类别 ID
+            cmd_id: 命令 ID
+            shortcuts: 快捷键列表
+            
+        Returns:
+            行记录列表
+        """
+        from ui.hotkey_list_model import hotkey_row
+        
+        cmd_name = self.i18n_manager.get_command_name(cmd_id)
+        if not shortcuts:
+            return [hotkey_row(cmd_name)]
+        return [
+            hotkey_row(
+                cmd_name if idx == 0 else "",
+                shortcut,
+                self.conflict_detector.is_command_conflicting(shortcut, cat_id, cmd_id)
+            )
+            for idx, shortcut in enumerate(shortcuts)
+        ]
+    
+    def _update_command_rows(self, cat_id: str, cmd_id: str) -> int:
+        """
+        重新生成单个命令的行，行数变化时后续行的映射随之平移
+        
+        Args:
+            cat_id: 类别 ID
+            cmd_id: 命令 ID
+            
+        Returns:
+            更新的行数（命令不在列表中时为 0）
+        """
+        first = self._command_rows.get((cat_id, cmd_id))
+        if first is None:
+            return 0
+        count = 0
+        while self.row_data_map.get(first + count, ("", "", 0))[:2] == (cat_id, cmd_id):
+            count += 1
+        
+        item = self.hotkey_manager.get_item(cat_id, cmd_id)
+        specs = self._command_row_specs(cat_id, cmd_id, item.get("shortcuts", []) if item else [])
+        delta = len(specs) - count
+        if delta:
+            end = first + count
+            self.row_data_map = {
+                row + delta if row >= end else row: data
+                for row, data in self.row_data_map.items()
+                if not first <= row < end
+            }
+            for key, row in self._command_rows.items():
+                if row > first:
+                    self._command_rows[key] = row + delta
+        for idx in range(len(specs)):
+            self.row_data_map[first + idx] = (cat_id, cmd_id, idx)
+        
+        self.dialog.replace_hotkey_rows(first, count, specs)
+        return len(specs)
+    
+    def _refresh_changed_rows(self, select: Optional[Tuple[str, str, int]] = None):
+        """
+        编辑后只更新快捷键变化的命令，以及与变化的快捷键相关（冲突状态可能改变）的命令
+        
+        筛选模式下编辑可能改变筛选结果，此时整体重新渲染（筛选结果通常很少）。
+        
+        Args:
+            select: 更新后要选中的 (category_id, command_id, 快捷键下标)，None 表示保持当前选中
+        """
+        if self._rows_stale or self.current_filter != FILTER_ALL:
+            self._render_hotkey_list(preserve_selection=select is None)
+            if select is not None:
+                self._select_command_row(*select)
+            return
+        
+        started = time.perf_counter()
+        commands, self._dirty_commands = self._dirty_commands, set()
+        shortcuts, self._dirty_shortcuts = self._dirty_shortcuts, set()
+        for shortcut in shortcuts:
+            commands.update(self.conflict_detector.get_conflicting_commands(shortcut))
+        
+        updated = 0
+        for cat_id, cmd_id in commands:
+            updated += self._update_command_rows(cat_id, cmd_id)
+        metrics.observe_latency("render.partial", time.perf_counter() - started)
+        metrics.increment("render.rows_updated", updated)
+        
+        if select is not None:
+            self._select_command_row(*select)
+    
+    def _select_command_row(self, cat_id: str, cmd_id: str, idx: int):
+        """选中命令的第 idx 个快捷键所在的行（超出时选中最后一个）"""
+        first = self._command_rows.get((cat_id, cmd_id))
+        if first is None:
+            return
+        row = first
+        while row - first < idx and self.row_data_map.get(row + 1, ("", "", 0))[:2] == (cat_id, cmd_id):
+            row += 1
+        self.dialog.select_row(row)
     
     def on_category_changed(self, index: int):
-        """处理类别切换"""
+        """类别下拉框作为跳转列表：滚动到该类别的标题行"""
         if index >= 0:
             self.current_category = self.dialog.combo_category.itemData(index)
-            self._render_hotkey_list()
-            self.dialog.clear_selection()
-            self._update_button_states()
-            self._update_status_label()
+            self.dialog.scroll_to_section(self.current_category)
+    
+    def on_section_changed(self, category_id: str):
+        """列表滚动到另一个类别时同步类别下拉框"""
+        self.current_category = category_id
+        index = self.dialog.combo_category.findData(category_id)
+        if index >= 0 and index != self.dialog.combo_category.currentIndex():
+            self.dialog.combo_category.blockSignals(True)
+            self.dialog.combo_category.setCurrentIndex(index)
+            self.dialog.combo_category.blockSignals(False)
+    
+    def on_filter_changed(self, index: int):
+        """切换筛选（筛选时列出全部类别中的结果）"""
+        if not 0 <= index < len(FILTERS):
+            return
+        self.current_filter = FILTERS[index]
+        self._render_hotkey_list()
+        self.dialog.hotkey_table.scrollToTop()
+        self.dialog.clear_selection()
+        self._request_ui_refresh()
     
     def on_selection_changed(self):
         """处理表格选择变化"""
-        self._update_button_states()
-        self._update_status_label()
+        self._request_ui_refresh()
     
     def on_hotkey_edit_clicked(self, row: int):
         """处理快捷键输入框点击"""
@@ -448,6 +994,13 @@ class Controller:
         else:
             mode_text = self.i18n_manager.get_text("dialogTitle_normalMode", "一般模式")
         
+        suggestions = []
+        if not self.is_quote_mode_active:
+            suggestions = self.shortcut_finder.suggest(
+                [self.i18n_manager.get_command_name(cmd_id), cmd_id],
+                [s for s in shortcuts if s]
+            )
+        
         new_hotkey = KeyInputDialog.capture(
             self.dialog,
             mode=self.current_mode,
@@ -455,7 +1008,9 @@ class Controller:
             mode_text=mode_text,
             prompt_text=self.i18n_manager.get_text("dialogContent_pressKey", "请从键盘按下要设置的快捷键"),
             delete_text=self.i18n_manager.get_text("btnDeleteHotkey", "删除快捷键"),
-            cancel_text=self.i18n_manager.get_text("btn_cancel", "取消")
+            cancel_text=self.i18n_manager.get_text("btn_cancel", "取消"),
+            suggestions=suggestions,
+            suggestion_text=self.i18n_manager.get_text("dialogContent_suggestions", "推荐：")
         )
         
         if new_hotkey is None:
@@ -465,8 +1020,9 @@ class Controller:
             self._do_delete_hotkey(cat_id, cmd_id, idx)
             return
         
-        existing_shortcuts = [s for i, s in enumerate(shortcuts) if s and i != idx]
-        if new_hotkey in existing_shortcuts:
+        new_canonical = canonical_shortcut(new_hotkey)
+        existing_shortcuts = [canonical_shortcut(s) for i, s in enumerate(shortcuts) if s and i != idx]
+        if new_canonical in existing_shortcuts:
             AlertDialog.show_alert(
                 self.dialog,
                 self.i18n_manager.get_text("dialogTitle_warning", "提示"),
@@ -493,8 +1049,12 @@ class Controller:
                     conflict_item = self.hotkey_manager.get_item(conflict_cat, conflict_cmd)
                     if conflict_item:
                         conflict_shortcuts = conflict_item.get("shortcuts", [])
-                        if new_hotkey in conflict_shortcuts:
-                            conflict_idx = conflict_shortcuts.index(new_hotkey)
+                        matches = [
+                            i for i, s in enumerate(conflict_shortcuts)
+                            if s and canonical_shortcut(s) == new_canonical
+                        ]
+                        if matches:
+                            conflict_idx = matches[0]
                             if len(conflict_shortcuts) == 1:
                                 self.hotkey_manager.set_shortcut_at_index(conflict_cat, conflict_cmd, 0, "")
                             else:
@@ -505,8 +1065,8 @@ class Controller:
         else:
             self.hotkey_manager.set_shortcut_at_index(cat_id, cmd_id, idx, new_hotkey)
         
-        self._render_hotkey_list(preserve_selection=True)
-        self._update_button_states()
+        self._refresh_changed_rows(select=(cat_id, cmd_id, idx))
+        self._request_ui_refresh()
     
     def on_add_hotkey(self):
         """处理添加快捷键"""
@@ -517,20 +1077,10 @@ class Controller:
         cat_id, cmd_id, _ = self.row_data_map[selected_row]
         new_idx = self.hotkey_manager.add_empty_shortcut(cat_id, cmd_id)
         if new_idx >= 0:
-            self._render_hotkey_list()
-            
-            target_row = -1
-            for row, (r_cat, r_cmd, r_idx) in self.row_data_map.items():
-                if r_cat == cat_id and r_cmd == cmd_id and r_idx == new_idx:
-                    target_row = row
-                    break
-
-            if target_row >= 0 and target_row < self.dialog.hotkey_table.rowCount():
-                if target_row not in self.dialog._separator_rows:
-                    self.dialog.hotkey_table.selectRow(target_row)
-                    self.dialog._selected_row = target_row
-            
-            self._update_button_states()
+            # 新增空位置不产生变更通知
+            self._dirty_commands.add((cat_id, cmd_id))
+            self._refresh_changed_rows(select=(cat_id, cmd_id, new_idx))
+            self._request_ui_refresh()
     
     def on_delete_hotkey(self):
         """处理删除快捷键"""
@@ -551,21 +1101,656 @@ class Controller:
         if idx >= len(shortcuts):
             return
         
-        selected_row = self.dialog.get_selected_row()
-        target_row = selected_row
-        
-        is_first_shortcut = (idx == 0)
-        
         if len(shortcuts) == 1:
             self.hotkey_manager.set_shortcut_at_index(cat_id, cmd_id, 0, "")
         else:
             self.hotkey_manager.remove_shortcut_at_index(cat_id, cmd_id, idx)
+        
+        # 删除后选中同一命令的上一个快捷键（删除的是首个时选中新的首个）
+        self._refresh_changed_rows(select=(cat_id, cmd_id, max(idx - 1, 0)))
+        self._request_ui_refresh()
+    
+    def on_resolve_conflicts(self):
+        """处理解决全部冲突"""
+        from ui.dialogs import AlertDialog, ChangePreviewDialog
+        
+        if not self.is_linked:
+            return
+        
+        changes = self.conflict_resolver.resolve(
+            lambda cmd_id: [self.i18n_manager.get_command_name(cmd_id), cmd_id],
+            self.config_manager.get_optimizer_settings()["pinned"]
+        )
+        title = self.i18n_manager.get_text("dialogTitle_resolveConflicts", "解决冲突")
+        
+        if not changes:
+            AlertDialog.show_alert(
+                self.dialog,
+                title,
+                self.i18n_manager.get_text("dialogContent_noConflicts", "当前没有快捷键冲突"),
+                self.i18n_manager.get_text("btn_ok", "确认")
+            )
+            return
+        
+        content = self.i18n_manager.get_text(
+            "dialogContent_resolvePreview", "将按以下方案调整 {count} 个快捷键："
+        ).format(count=len(changes))
+        
+        if ChangePreviewDialog.confirm(
+            self.dialog,
+            title,
+            content,
+            self._format_change_lines(changes),
+            self.i18n_manager.get_text("btn_apply", "应用"),
+            self.i18n_manager.get_text("btn_cancel", "取消")
+        ):
+            self.hotkey_manager.apply_changes(changes)
+            self._refresh_changed_rows()
+            self._request_ui_refresh()
+    
+    def on_reset_default(self):
+        """将选中的命令恢复为默认快捷键"""
+        selected_row = self.dialog.get_selected_row()
+        if not self.is_linked or selected_row not in self.row_data_map:
+            return
+        cat_id, cmd_id, _ = self.row_data_map[selected_row]
+        self._apply_default_plan(self.defaults_tracker.reset_plan([(cat_id, cmd_id)]))
+    
+    def on_reset_all_defaults(self):
+        """将所有已自定义的命令恢复为默认快捷键（预览后应用）"""
+        from ui.dialogs import AlertDialog, ChangePreviewDialog
+        
+        if not self.is_linked:
+            return
+        
+        plan = self.defaults_tracker.reset_plan(sorted(self.defaults_tracker.customized()))
+        title = self.i18n_manager.get_text("actionResetAllDefaults", "全部恢复默认")
+        if not plan:
+            AlertDialog.show_alert(
+                self.dialog,
+                title,
+                self.i18n_manager.get_text("dialogContent_allDefault", "所有命令都已是默认快捷键"),
+                self.i18n_manager.get_text("btn_ok", "确认")
+            )
+            return
+        
+        lines = self._format_change_lines([
+            (cat_id, cmd_id, ", ".join(current), ", ".join(defaults))
+            for cat_id, cmd_id, current, defaults in plan
+        ])
+        if ChangePreviewDialog.confirm(
+            self.dialog,
+            title,
+            self.i18n_manager.get_text(
+                "dialogContent_resetPreview", "将以下 {count} 个命令恢复为默认快捷键："
+            ).format(count=len(plan)),
+            lines,
+            self.i18n_manager.get_text("btn_apply", "应用"),
+            self.i18n_manager.get_text("btn_cancel", "取消")
+        ):
+            self._apply_default_plan(plan)
+    
+    def _apply_default_plan(self, plan: List[Tuple[str, str, List[str], List[str]]]):
+        """在单个事务中应用恢复默认的修改并刷新列表"""
+        if not plan:
+            return
+        with self.hotkey_manager.storage.transaction():
+            for cat_id, cmd_id, _, defaults in plan:
+                self.hotkey_manager.replace_shortcuts(cat_id, cmd_id, defaults or [""])
+                # 只有空位置数量变化时没有变更通知
+                self._dirty_commands.add((cat_id, cmd_id))
+        self._refresh_changed_rows()
+        self._request_ui_refresh()
+    
+    def on_optimize_keymap(self):
+        """处理优化键位布局（在子进程中搜索，界面显示进度）"""
+        from PySide6.QtCore import QTimer
+        from PySide6.QtWidgets import QProgressDialog
+        from .keymap_optimizer import ErgonomicCostModel, KeymapOptimizer, OptimizerWorker
+        
+        if not self.is_linked or self._optimizer_job is not None:
+            return
+        
+        settings = self.config_manager.get_optimizer_settings()
+        optimizer = KeymapOptimizer(
+            self.hotkey_manager,
+            ErgonomicCostModel(settings["travel_weight"], settings["modifier_weight"]),
+            settings["priorities"],
+            settings["pinned"],
+            settings["change_penalty"],
+            self.conflict_scopes
+        )
+        problem = optimizer.build_problem()
+        worker = OptimizerWorker(problem, float(settings["time_budget"]))
+        
+        progress_dialog = QProgressDialog(
+            self.i18n_manager.get_text("dialogContent_optimizing", "正在搜索更省力的键位分配…"),
+            self.i18n_manager.get_text("btn_cancel", "取消"),
+            0, 100, self.dialog
+        )
+        progress_dialog.setWindowTitle(
+            self.i18n_manager.get_text("dialogTitle_optimize", "键位优化")
+        )
+        progress_dialog.setModal(True)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
+        
+        timer = QTimer(self.dialog)
+        timer.setInterval(100)
+        
+        def finish():
+            timer.stop()
+            worker.cancel()
+            progress_dialog.close()
+            self._optimizer_job = None
+        
+        def poll():
+            for message in worker.poll():
+                if message[0] == 'progress':
+                    progress_dialog.setValue(int(message[1] * 100))
+                elif message[0] == 'result':
+                    finish()
+                    self._on_optimize_finished(problem, *message[1:])
+                    return
+                elif message[0] == 'error':
+                    finish()
+                    self._show_optimize_error(message[1])
+                    return
+            if not worker.is_alive():
+                finish()
+                self._show_optimize_error("")
+        
+        timer.timeout.connect(poll)
+        progress_dialog.canceled.connect(finish)
+        self._optimizer_job = (worker, timer, progress_dialog)
+        
+        worker.start()
+        timer.start()
+        progress_dialog.show()
+    
+    def _on_optimize_finished(self, problem, assignment: List[int],
+                              initial_cost: float, best_cost: float, unplaced: List[int]):
+        """处理键位优化结果"""
+        from ui.dialogs import AlertDialog, ChangePreviewDialog
+        from .keymap_optimizer import KeymapOptimizer
+        
+        title = self.i18n_manager.get_text("dialogTitle_optimize", "键位优化")
+        changes = KeymapOptimizer.changes_from_assignment(problem, assignment)
+        
+        unplaced_text = ""
+        if unplaced:
+            names = [
+                f"[{self.i18n_manager.get_category_name(problem['movable'][i][0])}] "
+                f"{self.i18n_manager.get_command_name(problem['movable'][i][1])}"
+                for i in unplaced
+            ]
+            unplaced_text = "\n".join([self.i18n_manager.get_text(
+                "dialogContent_optimizeUnplaced", "可用键位不足，以下 {count} 个冲突的快捷键保持不变："
+            ).format(count=len(unplaced))] + names)
+        
+        if not changes:
+            AlertDialog.show_alert(
+                self.dialog,
+                title,
+                "\n".join(filter(None, (
+                    self.i18n_manager.get_text("dialogContent_optimizeNoChange", "当前键位已无需调整"),
+                    unplaced_text
+                ))),
+                self.i18n_manager.get_text("btn_ok", "确认")
+            )
+            return
+        
+        content = self.i18n_manager.get_text(
+            "dialogContent_optimizePreview", "总成本 {before} → {after}，将调整 {count} 个快捷键："
+        ).format(before=f"{initial_cost:.1f}", after=f"{best_cost:.1f}", count=len(changes))
+        if unplaced_text:
+            content = f"{unplaced_text}\n{content}"
+        
+        if ChangePreviewDialog.confirm(
+            self.dialog,
+            title,
+            content,
+            self._format_change_lines(changes),
+            self.i18n_manager.get_text("btn_apply", "应用"),
+            self.i18n_manager.get_text("btn_cancel", "取消")
+        ):
+            self.hotkey_manager.apply_changes(changes)
+            self._refresh_changed_rows()
+            self._request_ui_refresh()
+    
+    def _show_optimize_error(self, message: str):
+        """显示键位优化失败提示"""
+        from ui.dialogs import AlertDialog
+        
+        AlertDialog.show_alert(
+            self.dialog,
+            self.i18n_manager.get_text("dialogTitle_optimize", "键位优化"),
+            f"{self.i18n_manager.get_text('dialogContent_optimizeFailed', '键位优化失败')} {message}".strip(),
+            self.i18n_manager.get_text("btn_ok", "确认")
+        )
+    
+    def on_show_keyboard_heatmap(self):
+        """显示键盘热力图（非模态，随编辑实时更新）"""
+        from ui.keyboard_view import KeyboardHeatmapDialog
+        from utils.key_constants import KEY_NAMES
+        
+        if not self.is_linked:
+            return
+        
+        if self._heatmap_dialog is None:
+            self._heatmap_dialog = KeyboardHeatmapDialog(
+                self.dialog,
+                self.i18n_manager.get_text("dialogTitle_keyboardHeatmap", "键盘热力图"),
+                self.i18n_manager.get_text(
+                    "dialogContent_heatmapLegend",
+                    "颜色越深表示该键已占用的修饰键组合越多，偏红表示存在冲突；右下角数字为 已占用/冲突 组合数。点击按键查看命令。"
+                )
+            )
+            self._heatmap_dialog.keyboard_view.key_clicked.connect(self._on_heatmap_key_clicked)
+            self.occupancy_index.take_dirty_keys()
+            self._heatmap_dialog.keyboard_view.set_key_stats(
+                {name: self.occupancy_index.key_stats(name) for name in KEY_NAMES}
+            )
+        else:
+            self._refresh_keyboard_heatmap()
+        
+        self._heatmap_dialog.show()
+        self._heatmap_dialog.raise_()
+        self._heatmap_dialog.activateWindow()
+    
+    def _on_hotkey_data_changed(self, event: str, category_id: str = "", command_id: str = "",
+                                old_shortcut: str = "", new_shortcut: str = ""):
+        """记录需要更新的列表行，并将快捷键数据变更合并为一次热力图刷新"""
+        if event == 'change':
+            self._dirty_commands.add((category_id, command_id))
+            self._dirty_shortcuts.update(s for s in (old_shortcut, new_shortcut) if s)
+        else:
+            self._rows_stale = True
+        
+        if self._heatmap_dialog is None or self._heatmap_refresh_pending:
+            return
+        from PySide6.QtCore import QTimer
+        self._heatmap_refresh_pending = True
+        QTimer.singleShot(0, self._refresh_keyboard_heatmap)
+    
+    def _refresh_keyboard_heatmap(self):
+        """仅将统计发生变化的按键推送给热力图"""
+        self._heatmap_refresh_pending = False
+        if self._heatmap_dialog is None:
+            return
+        dirty = self.occupancy_index.take_dirty_keys()
+        if dirty:
+            self._heatmap_dialog.keyboard_view.set_key_stats(
+                {name: self.occupancy_index.key_stats(name) for name in dirty}
+            )
+        selected = self._heatmap_dialog.keyboard_view.selected_key()
+        if selected in dirty:
+            self._on_heatmap_key_clicked(selected)
+    
+    def _on_heatmap_key_clicked(self, key_name: str):
+        """列出所选按键各修饰键组合上的命令"""
+        from utils.shortcut_codec import MODIFIER_COMBOS, build_shortcut, encode_key
+        
+        lines = []
+        for mask in range(MODIFIER_COMBOS):
+            shortcut = build_shortcut(key_name, mask)
+            commands = self.occupancy_index.commands_at(encode_key(key_name, mask))
+            if not commands:
+                continue
+            names = [
+                f"[{self.i18n_manager.get_category_name(cat_id)}] "
+                f"{self.i18n_manager.get_command_name(cmd_id)}"
+                for cat_id, cmd_id in commands
+            ]
+            marker = " ⚠" if self.occupancy_index.is_conflicted(encode_key(key_name, mask)) else ""
+            lines.append(f"{shortcut}{marker}：{'，'.join(names)}")
+        
+        if not lines:
+            lines.append(
+                self.i18n_manager.get_text("dialogContent_heatmapKeyFree", "{key} 的所有组合均未占用").format(key=key_name)
+            )
+        self._heatmap_dialog.set_details(lines)
+    
+    def on_show_directory_index(self):
+        """显示团队快捷键目录索引窗口"""
+        from ui.directory_index_dialog import DirectoryIndexDialog
+        
+        if self._index_dialog is None:
+            self._index_dialog = DirectoryIndexDialog(self.dialog)
+            self._index_dialog.btn_browse.clicked.connect(self._on_index_browse)
+            self._index_dialog.btn_rescan.clicked.connect(self._on_index_rescan)
+            self._index_dialog.btn_query.clicked.connect(self._on_index_query)
             
-            if not is_first_shortcut and selected_row > 0:
-                target_row = selected_row - 1
+            directory = self.config_manager.get_team_directory()
+            if directory and os.path.isdir(directory):
+                self._open_directory_index(directory)
+        
+        self._index_dialog.set_texts(
+            self.i18n_manager.get_text("dialogTitle_directoryIndex", "团队快捷键目录"),
+            self.i18n_manager.get_text("label_directory", "目录"),
+            self.i18n_manager.get_text("btn_browse", "浏览"),
+            self.i18n_manager.get_text("btn_rescan", "重新扫描"),
+            self.i18n_manager.get_text("btn_query", "查询"),
+            [
+                self.i18n_manager.get_text("queryMode_whoBinds", "谁绑定了快捷键"),
+                self.i18n_manager.get_text("queryMode_lacks", "未绑定该命令的文件"),
+                self.i18n_manager.get_text("queryMode_common", "命令最常见的绑定")
+            ]
+        )
+        self._index_dialog.show()
+        self._index_dialog.raise_()
+        self._index_dialog.activateWindow()
+    
+    def _on_index_browse(self):
+        """选择要索引的目录"""
+        directory = QFileDialog.getExistingDirectory(
+            self._index_dialog,
+            self.i18n_manager.get_text("dialogTitle_directoryIndex", "团队快捷键目录"),
+            self.config_manager.get_team_directory()
+        )
+        if directory:
+            self.config_manager.set_team_directory(directory)
+            self._open_directory_index(directory)
+    
+    def _open_directory_index(self, directory: str):
+        """打开目录的索引并增量重扫"""
+        from .directory_index import DirectoryIndex
+        
+        self._directory_index = DirectoryIndex(directory)
+        self._index_dialog.edit_directory.setText(directory)
+        self._on_index_rescan()
+    
+    def _on_index_rescan(self):
+        """增量重扫当前目录"""
+        from PySide6.QtCore import Qt
+        
+        if self._directory_index is None:
+            return
+        
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            stats = self._directory_index.rescan()
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        self._index_dialog.label_status.setText(
+            self.i18n_manager.get_text(
+                "dialogContent_indexStats",
+                "已索引 {total} 个文件（新增 {added}，更新 {updated}，移除 {removed}，失败 {failed}）"
+            ).format(total=len(self._directory_index.files), **stats)
+        )
+    
+    def _on_index_query(self):
+        """在索引中执行查询"""
+        from ui.directory_index_dialog import DirectoryIndexDialog
+        
+        text = self._index_dialog.edit_query.text().strip()
+        if self._directory_index is None or not text:
+            return
+        
+        index = self._directory_index
+        mode = self._index_dialog.combo_query.currentIndex()
+        if mode == DirectoryIndexDialog.QUERY_WHO_BINDS:
+            lines = [
+                f"{relative}\t[{self.i18n_manager.get_category_name(cat_id)}] "
+                f"{self.i18n_manager.get_command_name(cmd_id)}"
+                for relative, cat_id, cmd_id in index.who_binds(text)
+            ]
+        elif mode == DirectoryIndexDialog.QUERY_LACKS:
+            lines = index.files_lacking(text)
+        else:
+            lines = [f"{count}\t{shortcut}" for shortcut, count in index.most_common_bindings(text)]
+        
+        if not lines:
+            lines = [self.i18n_manager.get_text("dialogContent_noResults", "没有结果")]
+        self._index_dialog.set_results(lines)
+    
+    def _format_change_lines(self, changes: List[Tuple[str, str, str, str]]) -> List[str]:
+        """将变更列表格式化为预览文本行"""
+        empty_text = self.i18n_manager.get_text("text_unbound", "（无）")
+        lines = []
+        for cat_id, cmd_id, old_shortcut, new_shortcut in changes:
+            cat_name = self.i18n_manager.get_category_name(cat_id)
+            cmd_name = self.i18n_manager.get_command_name(cmd_id)
+            lines.append(
+                f"[{cat_name}] {cmd_name}：{old_shortcut or empty_text} → {new_shortcut or empty_text}"
+            )
+        return lines
+    
+    def _snapshot_link_file(self):
+        """将保存后的链接文件记录到备份历史"""
+        try:
+            self.snapshot_store.add_file(self.config_manager.get_link_path(), KIND_SAVE)
+        except OSError as e:
+            print(f"保存备份失败: {e}")
+        if self._history_dialog is not None and self._history_dialog.isVisible():
+            self._refresh_history()
+    
+    def on_show_history(self):
+        """显示备份历史窗口"""
+        from ui.history_dialog import HistoryDialog
+        
+        if self._history_dialog is None:
+            self._history_dialog = HistoryDialog(self.dialog)
+            self._history_dialog.list_snapshots.currentRowChanged.connect(self._on_history_diff_current)
+            self._history_dialog.btn_diff_current.clicked.connect(
+                lambda: self._on_history_diff_current(self._history_dialog.list_snapshots.currentRow())
+            )
+            self._history_dialog.btn_diff_previous.clicked.connect(self._on_history_diff_previous)
+            self._history_dialog.btn_restore.clicked.connect(self._on_history_restore)
+        
+        self._history_dialog.set_texts(
+            self.i18n_manager.get_text("dialogTitle_history", "备份历史"),
+            self.i18n_manager.get_text("btn_diffCurrent", "与当前文件比较"),
+            self.i18n_manager.get_text("btn_diffPrevious", "与上一版本比较"),
+            self.i18n_manager.get_text("btn_restore", "恢复此版本")
+        )
+        self._refresh_history()
+        self._history_dialog.show()
+        self._history_dialog.raise_()
+        self._history_dialog.activateWindow()
+    
+    def _on_tools_menu_about_to_show(self):
+        """按住 Shift 打开工具菜单或已在记录性能跟踪时显示调试菜单项"""
+        visible = tracer.enabled or bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        for action in (self.dialog.separator_tracing, self.dialog.action_tracing,
+                       self.dialog.action_export_trace, self.dialog.action_metrics):
+            action.setVisible(visible)
+        self.dialog.action_tracing.blockSignals(True)
+        self.dialog.action_tracing.setChecked(tracer.enabled)
+        self.dialog.action_tracing.blockSignals(False)
+        self.dialog.action_export_trace.setEnabled(bool(tracer.records()))
+    
+    def on_tracing_toggled(self, checked: bool):
+        """启用或停用性能跟踪"""
+        tracer.set_enabled(checked)
+    
+    def on_export_trace(self):
+        """将记录的性能跟踪导出为 Chrome trace JSON"""
+        from ui.dialogs import AlertDialog
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self.dialog,
+            self.i18n_manager.get_text("actionExportTrace", "导出性能跟踪..."),
+            default_trace_path(),
+            "Chrome Trace (*.json)"
+        )
+        if not file_path:
+            return
+        
+        try:
+            count = tracer.export_chrome_trace(file_path)
+            message = self.i18n_manager.get_text(
+                "dialogContent_traceExported", "已导出 {count} 条记录，可在 chrome://tracing 或 Perfetto 中打开"
+            ).format(count=count)
+        except Exception as e:
+            message = str(e)
+        AlertDialog.show_alert(
+            self.dialog,
+            self.i18n_manager.get_text("actionExportTrace", "导出性能跟踪..."),
+            message,
+            self.i18n_manager.get_text("btn_ok", "确认")
+        )
+    
+    def on_show_metrics(self):
+        """显示运行指标窗口"""
+        from ui.metrics_dialog import MetricsDialog
+        
+        if self._metrics_dialog is None:
+            self._metrics_dialog = MetricsDialog(self.dialog)
+            self._metrics_dialog.btn_refresh.clicked.connect(self._refresh_metrics)
+            self._metrics_dialog.btn_reset.clicked.connect(self._on_metrics_reset)
+            self._metrics_dialog.btn_export.clicked.connect(self._on_metrics_export)
+        
+        self._metrics_dialog.set_texts(
+            self.i18n_manager.get_text("dialogTitle_metrics", "运行指标"),
+            [
+                self.i18n_manager.get_text("metricsColumn_name", "指标"),
+                self.i18n_manager.get_text("metricsColumn_count", "次数"),
+                self.i18n_manager.get_text("metricsColumn_mean", "平均"),
+                "p50", "p95",
+                self.i18n_manager.get_text("metricsColumn_max", "最大")
+            ],
+            self.i18n_manager.get_text("btn_refresh", "刷新"),
+            self.i18n_manager.get_text("btn_resetMetrics", "清零"),
+            self.i18n_manager.get_text("btn_exportJson", "导出 JSON")
+        )
+        self._refresh_metrics()
+        self._metrics_dialog.show()
+        self._metrics_dialog.raise_()
+        self._metrics_dialog.activateWindow()
+    
+    def _refresh_metrics(self):
+        """重新读取运行指标"""
+        self._metrics_dialog.set_rows(metrics.rows())
+        self._metrics_dialog.label_status.setText(
+            self.i18n_manager.get_text(
+                "status_metrics", "已运行 {seconds:.0f} 秒，退出时写入 {path}"
+            ).format(seconds=metrics.snapshot()["uptime"], path=default_metrics_path())
+        )
+    
+    def _on_metrics_reset(self):
+        """清空运行指标"""
+        metrics.reset()
+        self._refresh_metrics()
+    
+    def _on_metrics_export(self):
+        """将运行指标导出为 JSON"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self._metrics_dialog,
+            self.i18n_manager.get_text("btn_exportJson", "导出 JSON"),
+            default_metrics_path(),
+            "JSON (*.json)"
+        )
+        if file_path:
+            dump_metrics(file_path)
+    
+    def _refresh_history(self):
+        """重新列出历史记录（只读取日志，选中时才解压快照）"""
+        kind_texts = {
+            "import": self.i18n_manager.get_text("historyKind_import", "导入"),
+            "save": self.i18n_manager.get_text("historyKind_save", "保存"),
+            "restore": self.i18n_manager.get_text("historyKind_restore", "恢复")
+        }
+        self._history_entries = self.snapshot_store.entries()
+        labels = [
+            f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['time']))}  "
+            f"{kind_texts.get(entry['kind'], entry['kind'])}  "
+            f"{os.path.basename(entry['source'])}  {entry['hash'][:8]}"
+            for entry in self._history_entries
+        ]
+        self._history_dialog.set_entries(labels)
+        self._history_dialog.label_status.setText(
+            self.i18n_manager.get_text(
+                "status_history", "{entries} 条记录，{versions} 个不同版本"
+            ).format(
+                entries=len(self._history_entries),
+                versions=len({entry["hash"] for entry in self._history_entries})
+            )
+        )
+        self._history_dialog.btn_restore.setEnabled(self.is_linked and bool(labels))
+    
+    def _selected_history_entry(self, row: Optional[int] = None) -> Optional[Dict]:
+        """当前选中的历史记录"""
+        if row is None:
+            row = self._history_dialog.list_snapshots.currentRow()
+        if 0 <= row < len(self._history_entries):
+            return self._history_entries[row]
+        return None
+    
+    def _on_history_diff_current(self, row: int):
+        """比较选中版本与链接文件的当前内容"""
+        entry = self._selected_history_entry(row)
+        if entry is None:
+            return
+        try:
+            link_path = self.config_manager.get_link_path()
+            if link_path and os.path.exists(link_path):
+                lines = self.snapshot_store.diff(entry["hash"], new_path=link_path)
+                if not lines:
+                    lines = [self.i18n_manager.get_text("text_noDifference", "没有差异")]
+            else:
+                lines = self.snapshot_store.read_lines(entry["hash"])
+        except (OSError, ValueError) as e:
+            lines = [str(e)]
+        self._history_dialog.set_diff(lines)
+    
+    def _on_history_diff_previous(self):
+        """比较选中版本与同一文件的上一版本"""
+        entry = self._selected_history_entry()
+        if entry is None:
+            return
+        row = self._history_dialog.list_snapshots.currentRow()
+        previous = next(
+            (older for older in self._history_entries[row + 1:] if older["source"] == entry["source"]),
+            None
+        )
+        try:
+            if previous is None:
+                lines = self.snapshot_store.read_lines(entry["hash"])
+            else:
+                lines = self.snapshot_store.diff(previous["hash"], entry["hash"])
+                if not lines:
+                    lines = [self.i18n_manager.get_text("text_noDifference", "没有差异")]
+        except (OSError, ValueError) as e:
+            lines = [str(e)]
+        self._history_dialog.set_diff(lines)
+    
+    def _on_history_restore(self):
+        """将链接文件恢复为选中版本并重新导入"""
+        from ui.dialogs import AlertDialog, ConfirmDialog
+        
+        entry = self._selected_history_entry()
+        link_path = self.config_manager.get_link_path()
+        if entry is None or not self.is_linked or not link_path:
+            return
+        
+        result = ConfirmDialog.ask(
+            self._history_dialog,
+            self.i18n_manager.get_text("dialogTitle_history", "备份历史"),
+            self.i18n_manager.get_text(
+                "dialogContent_restoreSnapshot", "链接文件将被恢复为所选版本，未保存的修改会丢失。是否继续？"
+            ),
+            self.i18n_manager.get_text("btn_yes", "是"),
+            self.i18n_manager.get_text("btn_no", "否"),
+            self.i18n_manager.get_text("btn_cancel", "取消")
+        )
+        if result != ConfirmDialog.YES:
+            return
         
-        self._render_hotkey_list(target_row=target_row)
-        self._update_button_states()
+        try:
+            self.snapshot_store.restore(entry["hash"], link_path)
+        except (OSError, ValueError) as e:
+            AlertDialog.show_alert(
+                self._history_dialog,
+                self.i18n_manager.get_text("dialogTitle_formatError", "错误"),
+                str(e),
+                self.i18n_manager.get_text("btn_ok", "确认")
+            )
+            return
+        self._do_import(link_path)
+        self._refresh_history()
     
     def on_open_folder(self):
         """打开链接文件所在文件夹"""
@@ -593,7 +1778,8 @@ class Controller:
                 if self.is_linked:
                     self._render_hotkey_list()
                 
-                self._update_status_label()
+                self._request_ui_refresh(UI_STATUS)
+                QTimer.singleShot(0, self._prewarm_dialogs)
     
     def on_info_button(self, info_type: str):
         """处理信息按钮点击"""
@@ -617,14 +1803,14 @@ class Controller:
             content = self._build_about_content()
             is_about = True
         
-        InfoDialog(
+        InfoDialog.show_info(
             self.dialog,
             title,
             content,
             self.i18n_manager.get_text("btn_ok", "确认"),
             use_markdown=False,
             is_about=is_about
-        ).exec()
+        )
     
     def _build_about_content(self) -> str:
         """构建程序信息内容"""
@@ -677,6 +1863,9 @@ class Controller:
             if json_path and link_path:
                 try:
                     FileConverter.json_to_txt(json_path, link_path)
+                    self.link_watcher.mark_synced()
+                    self._save_profiles()
+                    self._snapshot_link_file()
                 except Exception as e:
                     AlertDialog.show_alert(
                         self.dialog,
@@ -721,6 +1910,9 @@ class Controller:
             if json_path and link_path:
                 try:
                     FileConverter.json_to_txt(json_path, link_path)
+                    self.link_watcher.mark_synced()
+                    self._save_profiles()
+                    self._snapshot_link_file()
                 except Exception as e:
                     AlertDialog.show_alert(
                         self.dialog,
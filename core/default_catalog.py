@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+默认快捷键目录模块
+按 Spine 版本保存默认快捷键（defaults/<版本>.json），载入时预先建立按物理按键组合比较的索引，
+并随数据变更增量维护每个命令相对默认值的状态：默认、已修改、新增绑定、已解绑
+"""
+
+import glob
+import json
+import os
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from utils.file_converter import FileConverter
+from utils.resource_path import get_external_resource_path
+from utils.shortcut_codec import canonical_shortcut
+
+from .hotkey_manager import HotkeyManager, ProfileStateCache
+
+CATALOG_VERSION = 1
+
+# 命令状态
+STATUS_DEFAULT = "default"
+STATUS_MODIFIED = "modified"
+STATUS_ADDED = "added"
+STATUS_UNBOUND = "unbound"
+
+# 与默认值不同的状态
+CUSTOMIZED_STATUSES = (STATUS_MODIFIED, STATUS_ADDED, STATUS_UNBOUND)
+
+CommandKey = Tuple[str, str]
+
+
+def catalog_directory() -> str:
+    """默认目录文件所在目录（程序目录下的 defaults）"""
+    return get_external_resource_path("defaults")
+
+
+def _canonical_set(shortcuts: List[str]) -> FrozenSet[str]:
+    return frozenset(canonical_shortcut(s) for s in shortcuts if s)
+
+
+class DefaultCatalog:
+    """单个 Spine 版本的默认快捷键"""
+
+    def __init__(self, version: str, commands: Dict[CommandKey, List[str]]):
+        """
+        初始化目录并建立索引
+
+        Args:
+            version: Spine 版本号
+            commands: {(category_id, command_id): [默认快捷键, ...]}，快捷键已格式化
+        """
+        self.version = version
+        self._shortcuts: Dict[CommandKey, Tuple[str, ...]] = {
+            key: tuple(s for s in shortcuts if s) for key, shortcuts in commands.items()
+        }
+        self._canonical: Dict[CommandKey, FrozenSet[str]] = {
+            key: _canonical_set(list(shortcuts)) for key, shortcuts in self._shortcuts.items()
+        }
+
+    @classmethod
+    def from_hotkey_file(cls, path: str, version: str) -> "DefaultCatalog":
+        """
+        从 Spine 导出的默认快捷键文件生成目录
+
+        Args:
+            path: 快捷键 txt 文件（Spine 恢复默认后保存的文件）
+            version: Spine 版本号
+
+        Returns:
+            默认目录
+        """
+        commands = {}
+        for category in FileConverter.load_hotkey_file(path):
+            for item in category.get("items", []):
+                commands[(category["categoryId"], item["commandId"])] = item.get("shortcuts", [])
+        return cls(version, commands)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["DefaultCatalog"]:
+        """
+        读取目录文件
+
+        Args:
+            path: 目录文件路径
+
+        Returns:
+            默认目录，读取失败或格式版本不符时返回 None
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") != CATALOG_VERSION:
+                return None
+            commands = {
+                (category_id, command_id): shortcuts
+                for category_id, items in data.get("categories", {}).items()
+                for command_id, shortcuts in items.items()
+            }
+            return cls(data.get("version", ""), commands)
+        except Exception as e:
+            print(f"读取默认快捷键目录失败: {e}")
+            return None
+
+    @classmethod
+    def for_version(cls, version: str, directory: Optional[str] = None) -> Optional["DefaultCatalog"]:
+        """
+        读取指定 Spine 版本的目录
+
+        Args:
+            version: Spine 版本号（如 4.3.39-beta）
+            directory: 目录文件所在目录（默认见 catalog_directory）
+
+        Returns:
+            默认目录，不存在时返回 None
+        """
+        path = os.path.join(directory or catalog_directory(), f"{version}.json")
+        if not os.path.exists(path):
+            return None
+        return cls.load(path)
+
+    @staticmethod
+    def available_versions(directory: Optional[str] = None) -> List[str]:
+        """已有目录文件的 Spine 版本"""
+        paths = glob.glob(os.path.join(directory or catalog_directory(), "*.json"))
+        return sorted(os.path.splitext(os.path.basename(path))[0] for path in paths)
+
+    def save(self, path: str) -> None:
+        """
+        写入紧凑的目录文件
+
+        Args:
+            path: 目录文件路径
+        """
+        categories: Dict[str, Dict[str, List[str]]] = {}
+        for (category_id, command_id), shortcuts in self._shortcuts.items():
+            categories.setdefault(category_id, {})[command_id] = list(shortcuts)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"format": CATALOG_VERSION, "version": self.version, "categories": categories},
+                      f, ensure_ascii=False, separators=(",", ":"))
+
+    def __len__(self) -> int:
+        return len(self._shortcuts)
+
+    def __contains__(self, key: CommandKey) -> bool:
+        return key in self._shortcuts
+
+    def get(self, category_id: str, command_id: str) -> Optional[List[str]]:
+        """
+        获取命令的默认快捷键
+
+        Returns:
+            默认快捷键列表，命令不在目录中时返回 None
+        """
+        shortcuts = self._shortcuts.get((category_id, command_id))
+        return list(shortcuts) if shortcuts is not None else None
+
+    def classify(self, category_id: str, command_id: str, shortcuts: List[str]) -> str:
+        """
+        判断命令相对默认值的状态
+
+        默认没有快捷键（或不在目录中）的命令绑定了快捷键为新增，默认有快捷键的命令
+        被清空为解绑，两者都有但物理按键组合不同为修改
+
+        Args:
+            category_id: 类别 ID
+            command_id: 命令 ID
+            shortcuts: 当前快捷键
+
+        Returns:
+            STATUS_DEFAULT、STATUS_MODIFIED、STATUS_ADDED 或 STATUS_UNBOUND
+        """
+        default = self._canonical.get((category_id, command_id), frozenset())
+        current = _canonical_set(shortcuts)
+        if current == default:
+            return STATUS_DEFAULT
+        if not default:
+            return STATUS_ADDED
+        if not current:
+            return STATUS_UNBOUND
+        return STATUS_MODIFIED
+
+
+class DefaultsTracker:
+    """随数据变更增量维护每个命令相对默认值的状态"""
+
+    def __init__(self, hotkey_manager: HotkeyManager, catalog: Optional[DefaultCatalog] = None):
+        """
+        初始化并订阅数据变更
+
+        Args:
+            hotkey_manager: 快捷键管理器实例
+            catalog: 默认目录（None 表示没有对应版本的默认值，所有查询返回空）
+        """
+        self.hotkey_manager = hotkey_manager
+        self.catalog = catalog
+        self._status: Dict[CommandKey, str] = {}
+        self._members: Dict[str, Set[CommandKey]] = {}
+        # 其他配置的状态
+        self._profile_states = ProfileStateCache(
+            hotkey_manager, self._capture_state, self._restore_state, self.rebuild
+        )
+        self.rebuild()
+        hotkey_manager.add_listener(self._on_hotkey_changed)
+
+    def set_catalog(self, catalog: Optional[DefaultCatalog]) -> None:
+        """更换默认目录并重建"""
+        self.catalog = catalog
+        self._profile_states.clear()
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """根据当前数据重建全部状态"""
+        self._status = {}
+        self._members = {status: set() for status in (STATUS_DEFAULT,) + CUSTOMIZED_STATUSES}
+        if self.catalog is None:
+            return
+        for category_id in self.hotkey_manager.get_categories():
+            for item in self.hotkey_manager.get_items_by_category(category_id):
+                self._set((category_id, item.get("commandId", "")), item.get("shortcuts", []))
+
+    def _set(self, key: CommandKey, shortcuts: List[str]) -> None:
+        status = self.catalog.classify(key[0], key[1], shortcuts)
+        previous = self._status.get(key)
+        if previous == status:
+            return
+        if previous is not None:
+            self._members[previous].discard(key)
+        self._status[key] = status
+        self._members[status].add(key)
+
+    def _capture_state(self) -> tuple:
+        return self._status, self._members
+
+    def _restore_state(self, state: tuple) -> None:
+        self._status, self._members = state
+
+    def _on_hotkey_changed(self, event: str, category_id: str, command_id: str,
+                           old_shortcut: str, new_shortcut: str) -> None:
+        """处理快捷键管理器的变更通知"""
+        if event == 'switch':
+            # 状态已由配置状态缓存换入
+            return
+        if event == 'reset':
+            self._profile_states.clear()
+            self.rebuild()
+            return
+        if self.catalog is None:
+            return
+        item = self.hotkey_manager.get_item(category_id, command_id)
+        self._set((category_id, command_id), item.get("shortcuts", []) if item else [])
+
+    def available(self) -> bool:
+        """是否有当前 Spine 版本的默认值"""
+        return self.catalog is not None
+
+    def status(self, category_id: str, command_id: str) -> Optional[str]:
+        """命令的状态（没有默认目录时返回 None）"""
+        return self._status.get((category_id, command_id))
+
+    def is_customized(self, category_id: str, command_id: str) -> bool:
+        """命令是否与默认值不同"""
+        return self._status.get((category_id, command_id), STATUS_DEFAULT) != STATUS_DEFAULT
+
+    def members(self, status: str) -> Set[CommandKey]:
+        """处于指定状态的命令（只读）"""
+        return self._members.get(status, set())
+
+    def customized(self) -> Set[CommandKey]:
+        """与默认值不同的全部命令"""
+        result: Set[CommandKey] = set()
+        for status in CUSTOMIZED_STATUSES:
+            result |= self._members.get(status, set())
+        return result
+
+    def counts(self) -> Dict[str, int]:
+        """各状态的命令数"""
+        return {status: len(keys) for status, keys in self._members.items()}
+
+    def reset_plan(self, keys: List[CommandKey]) -> List[Tuple[str, str, List[str], List[str]]]:
+        """
+        恢复默认值需要的修改（不在默认目录中的命令不包含在内）
+
+        Args:
+            keys: 要恢复的命令
+
+        Returns:
+            [(category_id, command_id, 当前快捷键, 默认快捷键), ...]
+        """
+        plan = []
+        if self.catalog is None:
+            return plan
+        for category_id, command_id in keys:
+            defaults = self.catalog.get(category_id, command_id)
+            if defaults is None or self._status.get((category_id, command_id)) in (None, STATUS_DEFAULT):
+                continue
+            item = self.hotkey_manager.get_item(category_id, command_id)
+            current = [s for s in item.get("shortcuts", []) if s] if item else []
+            plan.append((category_id, command_id, current, defaults))
+        return plan
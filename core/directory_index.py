@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+团队快捷键目录索引模块
+为目录中的 Spine 快捷键文件建立持久化索引，按修改时间与内容哈希增量重扫，并提供绑定查询
+"""
+
+import glob
+import hashlib
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.file_converter import FileConverter
+from utils.shortcut_codec import canonical_shortcut
+
+# 默认索引文件名（保存在被索引的目录中）
+INDEX_FILENAME = ".spine_hotkeys_index.json"
+
+INDEX_VERSION = 1
+
+
+def _file_hash(path: str) -> str:
+    """计算文件内容的 SHA-1"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DirectoryIndex:
+    """快捷键文件目录索引"""
+
+    def __init__(self, directory: str, index_path: Optional[str] = None):
+        """
+        初始化目录索引（自动读取已有索引文件）
+
+        Args:
+            directory: 快捷键文件所在目录
+            index_path: 索引文件路径（默认为目录下的 INDEX_FILENAME）
+        """
+        self.directory = os.path.abspath(directory)
+        self.index_path = index_path or os.path.join(self.directory, INDEX_FILENAME)
+        # {相对路径: {"mtime", "size", "hash", "commands": {category_id: {command_id: [快捷键]}}}}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._shortcut_map: Optional[Dict[str, List[Tuple[str, str, str]]]] = None
+        self.load()
+
+    def load(self) -> bool:
+        """
+        读取索引文件
+
+        Returns:
+            是否读取成功
+        """
+        if not os.path.exists(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return False
+            self.files = data.get("files", {})
+            self._shortcut_map = None
+            return True
+        except Exception as e:
+            print(f"读取索引文件失败: {e}")
+            return False
+
+    def save(self) -> bool:
+        """
+        写入索引文件（先写同目录下的临时文件再替换，中断或多个进程同时写入时不会留下不完整的索引）
+
+        Returns:
+            是否写入成功
+        """
+        # 临时文件名带进程号，同时重扫的进程各写各的；按普通方式创建，权限与直接写入时相同
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "files": self.files},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+            return True
+        except Exception as e:
+            print(f"写入索引文件失败: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+    def rescan(self) -> Dict[str, int]:
+        """
+        增量重扫目录：修改时间与大小未变的文件直接跳过，内容哈希未变的文件只更新时间戳。
+        不是 Spine 快捷键文件的 .txt（见 FileConverter.validate_hotkey_file）不纳入索引
+
+        Returns:
+            统计 {"added", "updated", "unchanged", "removed", "failed"}
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        found = set()
+
+        for path in sorted(glob.glob(os.path.join(self.directory, "**", "*.txt"), recursive=True)):
+            if not FileConverter.validate_hotkey_file(path)[0]:
+                continue
+            relative = os.path.relpath(path, self.directory).replace(os.sep, '/')
+            found.add(relative)
+            try:
+                stat = os.stat(path)
+                entry = self.files.get(relative)
+                if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+
+                digest = _file_hash(path)
+                if entry and entry["hash"] == digest:
+                    entry["mtime"] = stat.st_mtime
+                    entry["size"] = stat.st_size
+                    stats["unchanged"] += 1
+                    continue
+
+                data = FileConverter.load_hotkey_file(path)
+                self.files[relative] = {
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    "hash": digest,
+                    "commands": {
+                        category.get("categoryId", ""): {
+                            item.get("commandId", ""): item.get("shortcuts", [])
+                            for item in category.get("items", [])
+                        }
+                        for category in data
+                    }
+                }
+                stats["updated" if entry else "added"] += 1
+            except Exception as e:
+                print(f"索引文件失败 {relative}: {e}")
+                stats["failed"] += 1
+
+        for relative in list(self.files):
+            if relative not in found:
+                del self.files[relative]
+                stats["removed"] += 1
+
+        if stats["added"] or stats["updated"] or stats["removed"]:
+            self._shortcut_map = None
+        self.save()
+        return stats
+
+    def _iter_commands(self, command_id: str, category_id: Optional[str] = None):
+        """遍历各文件中匹配的命令，产出 (文件, 类别 ID, 快捷键列表或 None)"""
+        for relative, entry in sorted(self.files.items()):
+            commands = entry["commands"]
+            categories = [category_id] if category_id else list(commands)
+            matched = False
+            for cat in categories:
+                shortcuts = commands.get(cat, {}).get(command_id)
+                if shortcuts is not None:
+                    matched = True
+                    yield relative, cat, shortcuts
+            if not matched:
+                yield relative, category_id or "", None
+
+    def who_binds(self, shortcut: str) -> List[Tuple[str, str, str]]:
+        """
+        查询哪些文件的哪些命令绑定了某快捷键（按物理按键组合比较）
+
+        Args:
+            shortcut: 快捷键
+
+        Returns:
+            [(文件, category_id, command_id), ...]
+        """
+        if self._shortcut_map is None:
+            shortcut_map: Dict[str, List[Tuple[str, str, str]]] = {}
+            for relative, entry in sorted(self.files.items()):
+                for cat, commands in entry["commands"].items():
+                    for cmd, shortcuts in commands.items():
+                        for s in shortcuts:
+                            shortcut_map.setdefault(canonical_shortcut(s), []).append(
+                                (relative, cat, cmd)
+                            )
+            self._shortcut_map = shortcut_map
+        return list(self._shortcut_map.get(canonical_shortcut(shortcut), []))
+
+    def files_lacking(self, command_id: str, category_id: Optional[str] = None) -> List[str]:
+        """
+        查询没有为某命令绑定快捷键的文件
+
+        Args:
+            command_id: 命令 ID
+            category_id: 类别 ID（为空则在所有类别中查找）
+
+        Returns:
+            文件列表（命令不存在或没有任何快捷键）
+        """
+        bound = set()
+        all_files = []
+        for relative, _, shortcuts in self._iter_commands(command_id, category_id):
+            if relative not in all_files:
+                all_files.append(relative)
+            if shortcuts:
+                bound.add(relative)
+        return [relative for relative in all_files if relative not in bound]
+
+    def most_common_bindings(self, command_id: str, category_id: Optional[str] = None,
+                             limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        查询某命令最常见的绑定
+
+        Args:
+            command_id: 命令 ID
+            category_id: 类别 ID（为空则合并所有类别）
+            limit: 返回数量
+
+        Returns:
+            [(快捷键, 文件数), ...]，按文件数降序
+        """
+        counter: Counter = Counter()
+        for _, _, shortcuts in self._iter_commands(command_id, category_id):
+            if shortcuts:
+                counter.update({canonical_shortcut(s) for s in shortcuts})
+        return counter.most_common(limit)
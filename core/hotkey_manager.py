@@ -1,23 +1,176 @@
 # -*- coding: utf-8 -*-
 """
 快捷键数据管理器模块
-负责快捷键 JSON 数据的 CRUD 操作
+负责快捷键 JSON 数据的 CRUD 操作，数据实际保存在可替换的存储后端中
 """
 
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.shortcut_codec import canonical_shortcut
+from utils.metrics import metrics
+from utils.tracing import traced
+
+from .storage import HotkeyStorage, MemoryStorage
+
+# 变更监听器签名: (事件, 类别 ID, 命令 ID, 原快捷键, 新快捷键)
+HotkeyListener = Callable[[str, str, str, str, str], None]
+# 配置监听器签名: (事件, 配置名, 原配置名)
+ProfileListener = Callable[[str, str, str], None]
+
+# 配置事件
+PROFILE_SWITCH = "switch"
+PROFILE_DELETE = "delete"
 
 
 class HotkeyManager:
     """快捷键数据管理器"""
     
-    def __init__(self):
-        """初始化快捷键管理器"""
-        self.data: List[Dict[str, Any]] = []
+    def __init__(self, storage: Optional[HotkeyStorage] = None):
+        """
+        初始化快捷键管理器
+        
+        Args:
+            storage: 存储后端（默认为内存存储）
+        """
+        self.storage: HotkeyStorage = storage or MemoryStorage()
         self.json_path: str = ""
         self._modified: bool = False
+        self._listeners: List[HotkeyListener] = []
+        self._profile_listeners: List[ProfileListener] = []
+    
+    def add_listener(self, listener: HotkeyListener) -> None:
+        """
+        注册数据变更监听器
+        
+        事件类型：
+            'reset'  - 数据整体重新加载，其余参数为空
+            'change' - 单个快捷键变更，原/新快捷键为空表示新增/删除
+            'switch' - 切换了配置，数据整体换为另一配置，其余参数为空
+                       （配置名见 add_profile_listener，配置监听器先于本监听器收到通知）
+        
+        Args:
+            listener: 回调函数
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def remove_listener(self, listener: HotkeyListener) -> None:
+        """移除数据变更监听器"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def add_profile_listener(self, listener: ProfileListener) -> None:
+        """
+        注册配置事件监听器
+        
+        事件类型：
+            PROFILE_SWITCH - 切换了配置，参数为新配置名与原配置名
+            PROFILE_DELETE - 删除了配置，参数为被删除的配置名与空字符串
+        
+        Args:
+            listener: 回调函数
+        """
+        if listener not in self._profile_listeners:
+            self._profile_listeners.append(listener)
+    
+    def remove_profile_listener(self, listener: ProfileListener) -> None:
+        """移除配置事件监听器"""
+        if listener in self._profile_listeners:
+            self._profile_listeners.remove(listener)
+    
+    def _notify_profile(self, event: str, profile: str, previous: str = "") -> None:
+        """通知所有配置事件监听器"""
+        for listener in list(self._profile_listeners):
+            listener(event, profile, previous)
     
+    def _notify(self, event: str, category_id: str = "", command_id: str = "",
+                old_shortcut: str = "", new_shortcut: str = "") -> None:
+        """通知所有监听器"""
+        if event == 'change' and old_shortcut == new_shortcut:
+            return
+        for listener in list(self._listeners):
+            listener(event, category_id, command_id, old_shortcut, new_shortcut)
+    
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """完整数据的副本（与 hotkeys.json 结构相同）"""
+        return self.storage.export()
+    
+    def load_data(self, data: List[Dict[str, Any]]) -> None:
+        """
+        整体替换数据
+        
+        Args:
+            data: 与 hotkeys.json 结构相同的类别列表
+        """
+        self.storage.load(data)
+        self._modified = False
+        self._notify('reset')
+    
+    def reload_from_storage(self) -> None:
+        """存储被外部直接修改（如 SQL 批量更新）后通知监听器重建"""
+        self._notify('reset')
+    
+    def profiles(self) -> List[str]:
+        """获取全部配置名（存储后端不支持多配置时为空列表）"""
+        return self.storage.profiles()
+    
+    def active_profile(self) -> str:
+        """获取当前配置名"""
+        return self.storage.active_profile()
+    
+    def switch_profile(self, name: str) -> bool:
+        """
+        切换当前配置（视图切换后需要保存才会写入链接文件）
+        
+        Args:
+            name: 配置名
+            
+        Returns:
+            切换是否成功
+        """
+        previous = self.storage.active_profile()
+        if name == previous:
+            return True
+        if not self.storage.activate_profile(name):
+            return False
+        self._modified = True
+        self._notify_profile(PROFILE_SWITCH, name, previous)
+        self._notify('switch')
+        return True
+    
+    def create_profile(self, name: str, source: Optional[str] = None) -> bool:
+        """
+        新建配置
+        
+        Args:
+            name: 配置名
+            source: 复制的来源配置（默认为当前配置）
+            
+        Returns:
+            新建是否成功
+        """
+        return self.storage.create_profile(name, source)
+    
+    def delete_profile(self, name: str) -> bool:
+        """
+        删除配置（不能删除当前配置）
+        
+        Args:
+            name: 配置名
+            
+        Returns:
+            删除是否成功
+        """
+        if not self.storage.delete_profile(name):
+            return False
+        # 同名配置可能被重新创建，各索引缓存的旧状态必须丢弃
+        self._notify_profile(PROFILE_DELETE, name)
+        return True
+    
+    @traced(category="import")
     def load_from_json(self, json_path: str) -> bool:
         """
         从 JSON 文件加载数据
@@ -31,15 +184,17 @@ class HotkeyManager:
         try:
             if os.path.exists(json_path):
                 with open(json_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+                    data = json.load(f)
+                    metrics.observe_size("load.bytes_read", f.tell())
                 self.json_path = json_path
-                self._modified = False
+                self.load_data(data)
                 return True
             return False
         except Exception as e:
             print(f"加载快捷键数据失败: {e}")
             return False
     
+    @traced(category="save")
     def save_to_json(self, json_path: Optional[str] = None) -> bool:
         """
         保存数据到 JSON 文件
@@ -56,7 +211,8 @@ class HotkeyManager:
                 return False
             
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+                json.dump(self.storage.export(), f, indent=2, ensure_ascii=False)
+                metrics.observe_size("save.json_bytes_written", f.tell())
             
             self._modified = False
             return True
@@ -71,11 +227,11 @@ class HotkeyManager:
         Returns:
             类别 ID 列表
         """
-        return [cat.get("categoryId", "") for cat in self.data]
+        return self.storage.get_categories()
     
     def get_items_by_category(self, category_id: str) -> List[Dict[str, Any]]:
         """
-        根据类别 ID 获取快捷键项列表
+        根据类别 ID 获取快捷键项列表（只读，修改请使用本类的方法）
         
         Args:
             category_id: 类别 ID
@@ -83,14 +239,11 @@ class HotkeyManager:
         Returns:
             快捷键项列表
         """
-        for category in self.data:
-            if category.get("categoryId") == category_id:
-                return category.get("items", [])
-        return []
+        return self.storage.get_items(category_id)
     
     def get_item(self, category_id: str, command_id: str) -> Optional[Dict[str, Any]]:
         """
-        获取指定的快捷键项
+        获取指定的快捷键项（副本）
         
         Args:
             category_id: 类别 ID
@@ -99,11 +252,10 @@ class HotkeyManager:
         Returns:
             快捷键项，未找到返回 None
         """
-        items = self.get_items_by_category(category_id)
-        for item in items:
-            if item.get("commandId") == command_id:
-                return item
-        return None
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is None:
+            return None
+        return {"commandId": command_id, "shortcuts": shortcuts}
     
     def add_shortcut(self, category_id: str, command_id: str, shortcut: str) -> bool:
         """
@@ -117,11 +269,13 @@ class HotkeyManager:
         Returns:
             添加是否成功
         """
-        item = self.get_item(category_id, command_id)
-        if item is not None:
-            if shortcut not in item.get("shortcuts", []):
-                item.setdefault("shortcuts", []).append(shortcut)
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is not None:
+            if shortcut not in shortcuts:
+                shortcuts.append(shortcut)
+                self.storage.set_shortcuts(category_id, command_id, shortcuts)
                 self._modified = True
+                self._notify('change', category_id, command_id, "", shortcut)
                 return True
         return False
     
@@ -137,10 +291,12 @@ class HotkeyManager:
         Returns:
             删除是否成功
         """
-        item = self.get_item(category_id, command_id)
-        if item is not None and shortcut in item.get("shortcuts", []):
-            item["shortcuts"].remove(shortcut)
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is not None and shortcut in shortcuts:
+            shortcuts.remove(shortcut)
+            self.storage.set_shortcuts(category_id, command_id, shortcuts)
             self._modified = True
+            self._notify('change', category_id, command_id, shortcut, "")
             return True
         return False
     
@@ -158,17 +314,20 @@ class HotkeyManager:
         Returns:
             修改是否成功
         """
-        item = self.get_item(category_id, command_id)
-        if item is not None:
-            shortcuts = item.get("shortcuts", [])
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is not None:
             if old_shortcut in shortcuts:
                 index = shortcuts.index(old_shortcut)
                 shortcuts[index] = new_shortcut
+                self.storage.set_shortcuts(category_id, command_id, shortcuts)
                 self._modified = True
+                self._notify('change', category_id, command_id, old_shortcut, new_shortcut)
                 return True
             elif old_shortcut == "" and new_shortcut:
                 shortcuts.append(new_shortcut)
+                self.storage.set_shortcuts(category_id, command_id, shortcuts)
                 self._modified = True
+                self._notify('change', category_id, command_id, "", new_shortcut)
                 return True
         return False
     
@@ -186,15 +345,44 @@ class HotkeyManager:
         Returns:
             设置是否成功
         """
-        item = self.get_item(category_id, command_id)
-        if item is not None:
-            shortcuts = item.get("shortcuts", [])
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is not None:
             if 0 <= index < len(shortcuts):
+                old_shortcut = shortcuts[index]
                 shortcuts[index] = shortcut
+                self.storage.set_shortcuts(category_id, command_id, shortcuts)
                 self._modified = True
+                self._notify('change', category_id, command_id, old_shortcut, shortcut)
                 return True
         return False
     
+    def replace_shortcuts(self, category_id: str, command_id: str, shortcuts: List[str]) -> bool:
+        """
+        整体替换命令的快捷键列表（逐个通知被删除与新增的快捷键）
+        
+        Args:
+            category_id: 类别 ID
+            command_id: 命令 ID
+            shortcuts: 新的快捷键列表
+            
+        Returns:
+            替换是否成功
+        """
+        old_shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if old_shortcuts is None:
+            return False
+        if old_shortcuts == shortcuts:
+            return True
+        self.storage.set_shortcuts(category_id, command_id, shortcuts)
+        self._modified = True
+        for shortcut in old_shortcuts:
+            if shortcut and shortcut not in shortcuts:
+                self._notify('change', category_id, command_id, shortcut, "")
+        for shortcut in shortcuts:
+            if shortcut and shortcut not in old_shortcuts:
+                self._notify('change', category_id, command_id, "", shortcut)
+        return True
+    
     def add_empty_shortcut(self, category_id: str, command_id: str) -> int:
         """
         为命令添加一个空快捷键位置
@@ -206,10 +394,10 @@ class HotkeyManager:
         Returns:
             新增位置的索引，失败返回 -1
         """
-        item = self.get_item(category_id, command_id)
-        if item is not None:
-            shortcuts = item.setdefault("shortcuts", [])
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is not None:
             shortcuts.append("")
+            self.storage.set_shortcuts(category_id, command_id, shortcuts)
             self._modified = True
             return len(shortcuts) - 1
         return -1
@@ -226,15 +414,59 @@ class HotkeyManager:
         Returns:
             删除是否成功
         """
-        item = self.get_item(category_id, command_id)
-        if item is not None:
-            shortcuts = item.get("shortcuts", [])
+        shortcuts = self.storage.get_shortcuts(category_id, command_id)
+        if shortcuts is not None:
             if 0 <= index < len(shortcuts):
-                shortcuts.pop(index)
+                old_shortcut = shortcuts.pop(index)
+                self.storage.set_shortcuts(category_id, command_id, shortcuts)
                 self._modified = True
+                self._notify('change', category_id, command_id, old_shortcut, "")
                 return True
         return False
     
+    def normalize_empty_shortcuts(self) -> None:
+        """将空快捷键列表转换为包含单个空字符串的列表（不触发变更通知）"""
+        with self.storage.transaction():
+            for category_id in self.storage.get_categories():
+                for item in self.storage.get_items(category_id):
+                    if not item.get("shortcuts"):
+                        self.storage.set_shortcuts(category_id, item.get("commandId", ""), [""])
+    
+    def apply_changes(self, changes: List[Tuple[str, str, str, str]]) -> int:
+        """
+        批量应用快捷键变更（在存储后端的单个事务中执行）
+        
+        Args:
+            changes: [(category_id, command_id, 原快捷键, 新快捷键), ...]
+                     原快捷键为空表示新增，新快捷键为空表示删除
+            
+        Returns:
+            成功应用的变更数量
+        """
+        applied = 0
+        with self.storage.transaction():
+            for category_id, command_id, old_shortcut, new_shortcut in changes:
+                shortcuts = self.storage.get_shortcuts(category_id, command_id)
+                if shortcuts is None:
+                    continue
+                
+                if not old_shortcut:
+                    if not new_shortcut or new_shortcut in shortcuts:
+                        continue
+                    if "" in shortcuts:
+                        self.set_shortcut_at_index(category_id, command_id, shortcuts.index(""), new_shortcut)
+                    else:
+                        self.add_shortcut(category_id, command_id, new_shortcut)
+                    applied += 1
+                elif old_shortcut in shortcuts:
+                    index = shortcuts.index(old_shortcut)
+                    if new_shortcut or len(shortcuts) == 1:
+                        self.set_shortcut_at_index(category_id, command_id, index, new_shortcut)
+                    else:
+                        self.remove_shortcut_at_index(category_id, command_id, index)
+                    applied += 1
+        return applied
+    
     def get_all_shortcuts(self) -> List[Tuple[str, str, str, int]]:
         """
         获取所有快捷键的扁平列表
@@ -242,19 +474,11 @@ class HotkeyManager:
         Returns:
             [(category_id, command_id, shortcut, index), ...]
         """
-        result = []
-        for category in self.data:
-            category_id = category.get("categoryId", "")
-            for item in category.get("items", []):
-                command_id = item.get("commandId", "")
-                for idx, shortcut in enumerate(item.get("shortcuts", [])):
-                    if shortcut:
-                        result.append((category_id, command_id, shortcut, idx))
-        return result
+        return self.storage.all_shortcuts()
     
     def find_commands_by_shortcut(self, shortcut: str) -> List[Tuple[str, str, int]]:
         """
-        查找使用某快捷键的所有命令
+        查找使用某快捷键（同一物理按键组合）的所有命令
         
         Args:
             shortcut: 快捷键字符串
@@ -262,19 +486,9 @@ class HotkeyManager:
         Returns:
             [(category_id, command_id, index), ...]
         """
-        result = []
         if not shortcut:
-            return result
-        
-        for category in self.data:
-            category_id = category.get("categoryId", "")
-            for item in category.get("items", []):
-                command_id = item.get("commandId", "")
-                shortcuts = item.get("shortcuts", [])
-                for idx, s in enumerate(shortcuts):
-                    if s == shortcut:
-                        result.append((category_id, command_id, idx))
-        return result
+            return []
+        return self.storage.find_canonical(canonical_shortcut(shortcut))
     
     def is_modified(self) -> bool:
         """判断数据是否被修改"""
@@ -287,3 +501,48 @@ class HotkeyManager:
     def get_json_path(self) -> str:
         """获取当前加载的 JSON 文件路径"""
         return self.json_path
+
+
+class ProfileStateCache:
+    """
+    派生索引的按配置状态缓存
+
+    切换配置时保存原配置的状态并换入新配置已有的状态（没有时重建），删除配置时丢弃其状态，
+    使各索引切换回来时无需重建
+    """
+
+    def __init__(self, hotkey_manager: HotkeyManager, capture: Callable[[], Any],
+                 restore: Callable[[Any], None], rebuild: Callable[[], None]):
+        """
+        初始化并订阅配置事件
+
+        Args:
+            hotkey_manager: 快捷键管理器实例
+            capture: 取出当前状态（返回的对象此后归缓存所有）
+            restore: 换入之前保存的状态
+            rebuild: 新配置没有保存的状态时根据当前数据重建
+        """
+        self._capture = capture
+        self._restore = restore
+        self._rebuild = rebuild
+        self._states: Dict[str, Any] = {}
+        hotkey_manager.add_profile_listener(self._on_profile_event)
+
+    def _on_profile_event(self, event: str, profile: str, previous: str) -> None:
+        """处理配置事件"""
+        if event == PROFILE_SWITCH:
+            self._states[previous] = self._capture()
+            state = self._states.pop(profile, None)
+            if state is None:
+                self._rebuild()
+            else:
+                self._restore(state)
+        elif event == PROFILE_DELETE:
+            self._states.pop(profile, None)
+
+    def clear(self) -> None:
+        """丢弃全部已保存的状态（数据整体重新加载或索引参数变化时）"""
+        self._states.clear()
+
+    def __contains__(self, profile: str) -> bool:
+        return profile in self._states
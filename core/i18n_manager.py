@@ -8,6 +8,8 @@ import json
 import os
 from typing import Any, Dict, Optional, Tuple
 
+from utils.resource_path import read_resource
+
 
 class I18nManager:
     """国际化管理器"""
@@ -17,7 +19,8 @@ class I18nManager:
         初始化国际化管理器
         
         Args:
-            language_dir: 语言包目录路径
+            language_dir: 语言包目录（相对路径经 read_resource 解析：程序目录下的文件优先，
+                其次为编译资源包；也可为绝对路径）
         """
         self.language_dir = language_dir
         self.current_language = ""
@@ -38,9 +41,9 @@ class I18nManager:
             interface_path = os.path.join(
                 self.language_dir, f"Interface.{language_code}.json"
             )
-            if os.path.exists(interface_path):
-                with open(interface_path, 'r', encoding='utf-8') as f:
-                    self.interface_texts = json.load(f)
+            content = read_resource(interface_path)
+            if content is not None:
+                self.interface_texts = json.loads(content.decode('utf-8'))
             else:
                 print(f"界面语言包不存在: {interface_path}")
                 return False
@@ -48,9 +51,9 @@ class I18nManager:
             keydoc_path = os.path.join(
                 self.language_dir, f"KeyDoc.{language_code}.json"
             )
-            if os.path.exists(keydoc_path):
-                with open(keydoc_path, 'r', encoding='utf-8') as f:
-                    self.keydoc_texts = json.load(f)
+            content = read_resource(keydoc_path)
+            if content is not None:
+                self.keydoc_texts = json.loads(content.decode('utf-8'))
             else:
                 print(f"快捷键文档语言包不存在: {keydoc_path}")
                 self.keydoc_texts = {}
@@ -9,6 +9,8 @@ from typing import Optional, Tuple
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QKeyEvent
 
+from utils.metrics import metrics
+
 from utils.key_constants import (
     KEY_NAMES,
     KEY_TO_CHAR,
@@ -70,13 +72,17 @@ class KeyboardHandler:
         Returns:
             快捷键字符串，无效返回 None
         """
+        metrics.increment("keyboard.events_handled")
         if self.is_modifier_only(event):
             return None
         
         if self.mode == 'character':
-            return self._process_character_mode(event)
+            shortcut = self._process_character_mode(event)
         else:
-            return self._process_normal_mode(event)
+            shortcut = self._process_normal_mode(event)
+        if shortcut:
+            metrics.increment("keyboard.shortcuts_captured")
+        return shortcut
     
     def _get_modifiers(self, event: QKeyEvent) -> Tuple[bool, bool, bool]:
         """
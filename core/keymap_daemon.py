@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+本地快捷键守护进程模块
+常驻内存保存已解析并建立索引的快捷键文件，通过 Unix 域套接字上的 JSON 行协议提供查询、
+冲突检查与批量修改；后台线程按修改时间监视已加载的文件
+
+协议：每个请求与响应各占一行 JSON
+    请求 {"id": 任意, "method": 方法名, "params": {...}}
+    响应 {"id": 同请求, "result": ...} 或 {"id": 同请求, "error": 错误信息}
+
+任何能连接套接字的进程都可以发送请求，因此 apply 只写回允许写入的文件：
+预加载的文件，以及启动时通过 allowed_paths 指定的文件或目录下的文件
+"""
+
+import getpass
+import inspect
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import traceback
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.file_converter import FileConverter
+
+from .conflict_detector import ConflictDetector
+from .conflict_scopes import ConflictScopes
+from .hotkey_manager import HotkeyManager
+
+
+def default_socket_path() -> str:
+    """获取默认套接字路径（临时目录下，按用户区分）"""
+    return os.path.join(tempfile.gettempdir(), f"spine_hotkeys_{getpass.getuser()}.sock")
+
+
+class KeymapDaemonError(Exception):
+    """守护进程返回的错误"""
+
+
+# 请求参数的类型
+_PARAM_TYPES: Dict[str, type] = {
+    "path": str,
+    "shortcut": str,
+    "category": str,
+    "command": str,
+    "changes": list,
+    "write": bool,
+}
+
+
+class _Keymap:
+    """单个已加载的快捷键文件"""
+
+    def __init__(self, path: str, scopes: ConflictScopes):
+        self.path = path
+        self.manager = HotkeyManager()
+        self.detector = ConflictDetector(self.manager, scopes)
+        self.stat: Tuple[int, int] = (0, -1)
+
+    def is_stale(self) -> bool:
+        """文件的修改时间或大小是否与已加载版本不同"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) != self.stat
+
+    def reload(self) -> None:
+        """重新解析文件"""
+        stat = os.stat(self.path)
+        self.manager.load_data(FileConverter.load_hotkey_file(self.path))
+        self.stat = (stat.st_mtime_ns, stat.st_size)
+
+    def write(self) -> None:
+        """写回文件并记录新的修改时间，避免监视线程重复解析"""
+        FileConverter.write_hotkey_file(self.manager.data, self.path)
+        self.manager.set_modified(False)
+        stat = os.stat(self.path)
+        self.stat = (stat.st_mtime_ns, stat.st_size)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """逐行处理同一连接上的请求"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.daemon_ref.handle_message(line)
+            self.wfile.write(response)
+            self.wfile.flush()
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+else:
+    _Server = None
+
+
+class KeymapDaemon:
+    """快捷键守护进程"""
+
+    def __init__(self, socket_path: Optional[str] = None,
+                 scopes: Optional[ConflictScopes] = None,
+                 poll_interval: float = 1.0,
+                 allowed_paths: Optional[Iterable[str]] = None):
+        """
+        初始化守护进程
+
+        Args:
+            socket_path: Unix 域套接字路径（默认见 default_socket_path）
+            scopes: 冲突检测使用的类别作用域
+            poll_interval: 文件监视的轮询间隔（秒）
+            allowed_paths: 允许 apply 写回的文件或目录（预加载的文件自动允许）
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.scopes = scopes or ConflictScopes()
+        self.poll_interval = poll_interval
+        self._writable: List[str] = [os.path.realpath(path) for path in allowed_paths or ()]
+        self._keymaps: Dict[str, _Keymap] = {}
+        self._lock = threading.RLock()
+        self._server = None
+        self._stop_event = threading.Event()
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "ping": self._ping,
+            "load": self._load,
+            "unload": self._unload,
+            "list": self._list,
+            "lookup": self._lookup,
+            "command": self._command,
+            "conflicts": self._conflicts,
+            "apply": self._apply,
+            "shutdown": self._shutdown,
+        }
+
+    # ---- 服务 ----
+
+    def start(self) -> None:
+        """
+        绑定套接字并在后台线程中开始服务
+
+        Raises:
+            OSError: 当前平台不支持 Unix 域套接字，或套接字已被占用
+        """
+        if _Server is None:
+            raise OSError("当前平台不支持 Unix 域套接字")
+        if os.path.exists(self.socket_path):
+            if _socket_alive(self.socket_path):
+                raise OSError(f"守护进程已在运行: {self.socket_path}")
+            os.remove(self.socket_path)
+
+        self._server = _Server(self.socket_path, _RequestHandler)
+        self._server.daemon_ref = self
+        self._stop_event.clear()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._watch, daemon=True).start()
+
+    def wait(self) -> None:
+        """阻塞直到收到 shutdown 请求或 Ctrl+C，然后停止服务"""
+        try:
+            while not self._stop_event.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+        self.stop()
+
+    def preload(self, path: str) -> None:
+        """
+        预先解析快捷键文件
+
+        Args:
+            path: 快捷键 txt 文件路径
+        """
+        with self._lock:
+            self._get(path)
+            self.allow_writes(path)
+
+    def allow_writes(self, path: str) -> None:
+        """
+        允许 apply 写回文件（目录表示其下的全部文件）
+
+        Args:
+            path: 文件或目录路径
+        """
+        real_path = os.path.realpath(path)
+        if real_path not in self._writable:
+            self._writable.append(real_path)
+
+    def is_writable(self, path: str) -> bool:
+        """文件是否允许写回（按解析符号链接后的真实路径判断）"""
+        real_path = os.path.realpath(path)
+        for allowed in self._writable:
+            if real_path == allowed:
+                return True
+            if os.path.isdir(allowed) and os.path.commonpath([allowed, real_path]) == allowed:
+                return True
+        return False
+
+    def stop(self) -> None:
+        """停止服务并删除套接字文件"""
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def _watch(self) -> None:
+        """后台轮询已加载文件，变化后提前重新解析"""
+        while not self._stop_event.wait(self.poll_interval):
+            with self._lock:
+                keymaps = list(self._keymaps.values())
+            for keymap in keymaps:
+                with self._lock:
+                    if keymap.is_stale():
+                        try:
+                            keymap.reload()
+                        except Exception as e:
+                            print(f"重新加载失败 {keymap.path}: {e}")
+
+    def handle_message(self, line: bytes) -> bytes:
+        """
+        处理一行请求
+
+        Args:
+            line: 请求 JSON
+
+        Returns:
+            响应 JSON（以换行结尾）
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise KeymapDaemonError("请求必须是 JSON 对象")
+            request_id = request.get("id")
+            method = self._methods.get(request.get("method"))
+            if method is None:
+                raise KeymapDaemonError(f"未知方法: {request.get('method')}")
+            params = self._check_params(method, request.get("params", {}))
+            with self._lock:
+                result = method(**params)
+            response = {"id": request_id, "result": result}
+        except (KeymapDaemonError, json.JSONDecodeError) as e:
+            response = {"id": request_id, "error": str(e)}
+        except Exception as e:
+            traceback.print_exc()
+            response = {"id": request_id, "error": f"内部错误: {e}"}
+        return (json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _check_params(method: Callable[..., Any], params: Any) -> Dict[str, Any]:
+        """
+        校验请求参数的名称、必需项与类型
+
+        Raises:
+            KeymapDaemonError: 参数不符合方法签名
+        """
+        if not isinstance(params, dict):
+            raise KeymapDaemonError("参数错误: params 必须是 JSON 对象")
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as e:
+            raise KeymapDaemonError(f"参数错误: {e}")
+        for name, value in params.items():
+            expected = _PARAM_TYPES.get(name)
+            if expected is not None and not isinstance(value, expected):
+                raise KeymapDaemonError(f"参数错误: {name} 应为 {expected.__name__}")
+        if "changes" in params:
+            for change in params["changes"]:
+                if (not isinstance(change, list) or len(change) != 4
+                        or not all(isinstance(value, str) for value in change)):
+                    raise KeymapDaemonError("参数错误: changes 的每一项应为 4 个字符串")
+        return params
+
+    # ---- 方法 ----
+
+    def _get(self, path: str) -> _Keymap:
+        """获取已加载的文件，首次访问或文件变化时解析"""
+        path = os.path.abspath(path)
+        keymap = self._keymaps.get(path)
+        if keymap is None:
+            if not os.path.isfile(path):
+                raise KeymapDaemonError(f"文件不存在: {path}")
+            keymap = _Keymap(path, self.scopes)
+            keymap.reload()
+            self._keymaps[path] = keymap
+        elif keymap.is_stale():
+            keymap.reload()
+        return keymap
+
+    def _ping(self) -> str:
+        return "pong"
+
+    def _load(self, path: str) -> Dict[str, int]:
+        keymap = self._get(path)
+        return {
+            "categories": len(keymap.manager.get_categories()),
+            "shortcuts": len(keymap.manager.get_all_shortcuts())
+        }
+
+    def _unload(self, path: str) -> bool:
+        return self._keymaps.pop(os.path.abspath(path), None) is not None
+
+    def _list(self) -> List[str]:
+        return sorted(self._keymaps)
+
+    def _lookup(self, path: str, shortcut: str) -> List[Tuple[str, str, int]]:
+        return self._get(path).manager.find_commands_by_shortcut(shortcut)
+
+    def _command(self, path: str, category: str, command: str) -> Optional[List[str]]:
+        item = self._get(path).manager.get_item(category, command)
+        return item["shortcuts"] if item else None
+
+    def _conflicts(self, path: str, shortcut: str, category: str = "",
+                   command: str = "") -> List[Tuple[str, str]]:
+        return self._get(path).detector.get_conflicting_commands(
+            shortcut, category or None, command or None
+        )
+
+    def _apply(self, path: str, changes: List[List[str]], write: bool = True) -> Dict[str, Any]:
+        if write and not self.is_writable(path):
+            raise KeymapDaemonError(f"不允许写入: {os.path.abspath(path)}")
+        keymap = self._get(path)
+        applied = keymap.manager.apply_changes([tuple(change) for change in changes])
+        if applied and write:
+            keymap.write()
+        return {
+            "applied": applied,
+            "conflicts": len(keymap.detector.get_conflicting_bindings())
+        }
+
+    def _shutdown(self) -> bool:
+        self._stop_event.set()
+        return True
+
+
+def _socket_alive(socket_path: str) -> bool:
+    """检查套接字上是否有守护进程在监听"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+class KeymapClient:
+    """守护进程客户端（保持一个连接，可复用于多次调用）"""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 5.0):
+        """
+        连接守护进程
+
+        Args:
+            socket_path: Unix 域套接字路径（默认见 default_socket_path）
+            timeout: 超时（秒）
+
+        Raises:
+            OSError: 连接失败
+        """
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(socket_path or default_socket_path())
+        self._reader = self._sock.makefile("rb")
+        self._next_id = 0
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        调用守护进程方法
+
+        Args:
+            method: 方法名（ping、load、unload、list、lookup、command、conflicts、apply、shutdown）
+            **params: 方法参数
+
+        Returns:
+            结果
+
+        Raises:
+            KeymapDaemonError: 守护进程返回错误
+        """
+        self._next_id += 1
+        request = {"id": self._next_id, "method": method, "params": params}
+        self._sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        line = self._reader.readline()
+        if not line:
+            raise KeymapDaemonError("守护进程已断开连接")
+        response = json.loads(line)
+        if "error" in response:
+            raise KeymapDaemonError(response["error"])
+        return response.get("result")
+
+    def close(self) -> None:
+        """关闭连接"""
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self) -> "KeymapClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
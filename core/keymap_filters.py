@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+快捷键筛选模块
+为“仅冲突”“仅未绑定”“仅多重绑定”“仅已自定义”等全局筛选维护成员集合，
+随数据变更增量更新，切换筛选时只需对结果排序
+"""
+
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
+
+from .conflict_detector import ConflictDetector
+from .default_catalog import DefaultsTracker
+from .hotkey_manager import HotkeyManager, ProfileStateCache
+
+FILTER_ALL = "all"
+FILTER_CONFLICTS = "conflicts"
+FILTER_UNBOUND = "unbound"
+FILTER_MULTI_BOUND = "multi_bound"
+FILTER_CUSTOMIZED = "customized"
+
+FILTERS = (FILTER_ALL, FILTER_CONFLICTS, FILTER_UNBOUND, FILTER_MULTI_BOUND, FILTER_CUSTOMIZED)
+
+CommandKey = Tuple[str, str]
+
+
+class KeymapFilters:
+    """全局筛选的成员集合"""
+
+    def __init__(self, hotkey_manager: HotkeyManager, conflict_detector: ConflictDetector,
+                 defaults_tracker: Optional[DefaultsTracker] = None):
+        """
+        初始化并订阅数据变更
+
+        Args:
+            hotkey_manager: 快捷键管理器实例
+            conflict_detector: 提供冲突命令集合的冲突检测器
+            defaults_tracker: 提供已自定义命令集合的默认值跟踪器
+        """
+        self.hotkey_manager = hotkey_manager
+        self.conflict_detector = conflict_detector
+        self.defaults_tracker = defaults_tracker
+        # 每个命令的有效快捷键数量
+        self._bound_counts: Dict[CommandKey, int] = {}
+        self._unbound: Set[CommandKey] = set()
+        self._multi_bound: Set[CommandKey] = set()
+        # 命令在列表中的位置 (类别序号, 命令序号)，用于排序结果
+        self._order: Dict[CommandKey, Tuple[int, int]] = {}
+        # 其他配置的 (_bound_counts, _unbound, _multi_bound)；配置只覆盖快捷键，类别与命令相同，
+        # 因此 _order 不随配置保存
+        self._profile_sets = ProfileStateCache(
+            hotkey_manager, self._capture_state, self._restore_state, self.rebuild
+        )
+        self.rebuild()
+        hotkey_manager.add_listener(self._on_hotkey_changed)
+
+    def rebuild(self) -> None:
+        """根据当前数据重建全部集合"""
+        self._bound_counts = {}
+        self._unbound = set()
+        self._multi_bound = set()
+        self._order = {}
+        for category_index, category_id in enumerate(self.hotkey_manager.get_categories()):
+            items = self.hotkey_manager.get_items_by_category(category_id)
+            for command_index, item in enumerate(items):
+                key = (category_id, item.get("commandId", ""))
+                self._order.setdefault(key, (category_index, command_index))
+                self._update(key, item.get("shortcuts", []))
+
+    def _update(self, key: CommandKey, shortcuts: List[str]) -> None:
+        count = sum(1 for s in shortcuts if s)
+        if self._bound_counts.get(key) == count:
+            return
+        self._bound_counts[key] = count
+        if count == 0:
+            self._unbound.add(key)
+        else:
+            self._unbound.discard(key)
+        if count > 1:
+            self._multi_bound.add(key)
+        else:
+            self._multi_bound.discard(key)
+
+    def _capture_state(self) -> tuple:
+        return self._bound_counts, self._unbound, self._multi_bound
+
+    def _restore_state(self, state: tuple) -> None:
+        self._bound_counts, self._unbound, self._multi_bound = state
+
+    def _on_hotkey_changed(self, event: str, category_id: str, command_id: str,
+                           old_shortcut: str, new_shortcut: str) -> None:
+        """处理快捷键管理器的变更通知"""
+        if event == 'switch':
+            # 集合已由配置状态缓存换入
+            return
+        if event == 'reset':
+            self._profile_sets.clear()
+            self.rebuild()
+            return
+        shortcuts = self.hotkey_manager.storage.get_shortcuts(category_id, command_id)
+        self._update((category_id, command_id), shortcuts or [])
+
+    def available(self, name: str) -> bool:
+        """筛选当前是否可用（“仅已自定义”需要默认快捷键目录）"""
+        if name == FILTER_CUSTOMIZED:
+            return self.defaults_tracker is not None and self.defaults_tracker.available()
+        return name in FILTERS
+
+    def members(self, name: str) -> AbstractSet[CommandKey]:
+        """
+        获取筛选的成员集合（只读）
+
+        Args:
+            name: 筛选名（FILTER_ALL 以外）
+
+        Returns:
+            {(category_id, command_id), ...}
+        """
+        if name == FILTER_CONFLICTS:
+            return self.conflict_detector.get_conflicting_command_keys()
+        if name == FILTER_UNBOUND:
+            return self._unbound
+        if name == FILTER_MULTI_BOUND:
+            return self._multi_bound
+        if name == FILTER_CUSTOMIZED and self.available(FILTER_CUSTOMIZED):
+            return self.defaults_tracker.customized()
+        return set()
+
+    def matches(self, name: str, category_id: str, command_id: str) -> bool:
+        """命令是否属于筛选结果"""
+        return name == FILTER_ALL or (category_id, command_id) in self.members(name)
+
+    def results(self, name: str) -> List[CommandKey]:
+        """
+        按列表顺序获取筛选结果（代价与结果数量成正比）
+
+        Args:
+            name: 筛选名（FILTER_ALL 以外）
+
+        Returns:
+            [(category_id, command_id), ...]
+        """
+        unknown = (len(self._order), 0)
+        return sorted(self.members(name), key=lambda key: self._order.get(key, unknown))
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+快捷键三方合并模块
+按 (categoryId, commandId) 对齐 base / ours / theirs 三份配置，线性时间内生成合并结果与结构化冲突列表
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.file_converter import FileConverter
+from utils.shortcut_codec import canonical_shortcut
+
+from .conflict_scopes import ConflictScopes
+
+# 冲突类型
+CONFLICT_BOTH_MODIFIED = "both_modified"
+CONFLICT_BOTH_ADDED = "both_added"
+CONFLICT_MODIFY_DELETE = "modify_delete"
+CONFLICT_COLLISION = "collision"
+
+CommandKey = Tuple[str, str]
+
+
+def _shortcut_list(item: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+    """去掉空快捷键；命令不存在时返回 None"""
+    if item is None:
+        return None
+    return [s for s in item.get("shortcuts", []) if s]
+
+
+def merge_shortcuts(base: List[str], ours: List[str],
+                    theirs: List[str]) -> Tuple[List[str], bool]:
+    """
+    三方合并单个命令的快捷键
+
+    一方未修改时取另一方；双方都修改时按物理按键组合合并各自的增删，
+    双方新增了不同的快捷键时视为冲突并保留 ours
+
+    Args:
+        base: 共同基准的快捷键
+        ours: 本方快捷键
+        theirs: 对方快捷键
+
+    Returns:
+        (合并结果, 是否冲突)
+    """
+    if ours == theirs or theirs == base:
+        return list(ours), False
+    if ours == base:
+        return list(theirs), False
+
+    base_set = {canonical_shortcut(s) for s in base}
+    ours_set = {canonical_shortcut(s) for s in ours}
+    theirs_set = {canonical_shortcut(s) for s in theirs}
+    ours_added = ours_set - base_set
+    theirs_added = theirs_set - base_set
+    if ours_added and theirs_added and ours_added != theirs_added:
+        return list(ours), True
+
+    removed = (base_set - ours_set) | (base_set - theirs_set)
+    result = []
+    seen = set()
+    for shortcut in ours + theirs:
+        canonical = canonical_shortcut(shortcut)
+        if canonical in removed or canonical in seen:
+            continue
+        seen.add(canonical)
+        result.append(shortcut)
+    return result, False
+
+
+def _index(data: List[Dict[str, Any]]) -> Dict[CommandKey, Dict[str, Any]]:
+    """(类别, 命令) 到快捷键项的哈希索引"""
+    return {
+        (category.get("categoryId", ""), item.get("commandId", "")): item
+        for category in data
+        for item in category.get("items", [])
+    }
+
+
+def _conflict(kind: str, key: CommandKey, base: Optional[List[str]], ours: Optional[List[str]],
+              theirs: Optional[List[str]], result: Optional[List[str]]) -> Dict[str, Any]:
+    """构造冲突记录"""
+    return {
+        "kind": kind,
+        "category": key[0],
+        "command": key[1],
+        "base": base,
+        "ours": ours,
+        "theirs": theirs,
+        "result": result
+    }
+
+
+def merge_keymaps(base: List[Dict[str, Any]], ours: List[Dict[str, Any]],
+                  theirs: List[Dict[str, Any]],
+                  scopes: Optional[ConflictScopes] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    三方合并快捷键配置
+
+    - 双方对同一命令的修改按 merge_shortcuts 合并
+    - theirs 新增的类别与命令插入到其在 theirs 中前一个命令之后
+    - 一方删除、另一方修改的命令保留修改并记录冲突
+    - 合并后由不同来源引入、且作用域重叠的相同物理按键组合记录为 collision
+
+    Args:
+        base: 共同基准（与 hotkeys.json 结构相同，快捷键已格式化）
+        ours: 本方配置
+        theirs: 对方配置
+        scopes: 冲突检测的类别作用域（默认所有类别互相重叠）
+
+    Returns:
+        (合并后的类别列表, 冲突列表)
+    """
+    scopes = scopes or ConflictScopes()
+    base_index = _index(base)
+    ours_index = _index(ours)
+    theirs_index = _index(theirs)
+
+    conflicts: List[Dict[str, Any]] = []
+    merged_items: Dict[CommandKey, List[str]] = {}
+    # 合并结果中每个快捷键来自哪一方，用于判定 collision
+    from_theirs: Dict[CommandKey, set] = {}
+
+    def resolve(key: CommandKey) -> Optional[List[str]]:
+        b = _shortcut_list(base_index.get(key))
+        o = _shortcut_list(ours_index.get(key))
+        t = _shortcut_list(theirs_index.get(key))
+
+        if o is not None and t is not None:
+            if b is None:
+                result, conflicted = merge_shortcuts([], o, t)
+                if conflicted:
+                    conflicts.append(_conflict(CONFLICT_BOTH_ADDED, key, b, o, t, result))
+            else:
+                result, conflicted = merge_shortcuts(b, o, t)
+                if conflicted:
+                    conflicts.append(_conflict(CONFLICT_BOTH_MODIFIED, key, b, o, t, result))
+        elif o is not None:
+            if b is None or b == o:
+                # 本方新增，或对方删除且本方未修改
+                result = o if b is None else None
+            else:
+                result = o
+                conflicts.append(_conflict(CONFLICT_MODIFY_DELETE, key, b, o, t, result))
+        elif t is not None:
+            if b is None:
+                result = t
+            elif b == t:
+                result = None
+            else:
+                result = None
+                conflicts.append(_conflict(CONFLICT_MODIFY_DELETE, key, b, o, t, result))
+        else:
+            result = None
+
+        if result is not None:
+            ours_canonical = {canonical_shortcut(s) for s in (o or [])}
+            from_theirs[key] = {
+                canonical_shortcut(s) for s in result
+                if canonical_shortcut(s) not in ours_canonical
+            }
+        return result
+
+    # 以 ours 的顺序为主，theirs 独有的类别与命令按其在 theirs 中的前驱插入
+    category_order: List[str] = []
+    commands: Dict[str, List[str]] = {}
+    for category in ours:
+        category_id = category.get("categoryId", "")
+        if category_id not in commands:
+            category_order.append(category_id)
+            commands[category_id] = []
+        commands[category_id].extend(item.get("commandId", "") for item in category.get("items", []))
+
+    ours_categories = set(category_order)
+    inserted_categories: Dict[Optional[str], List[str]] = {}
+    previous_category: Optional[str] = None
+    for category in theirs:
+        category_id = category.get("categoryId", "")
+        if category_id in commands:
+            inserted_commands: Dict[Optional[str], List[str]] = {}
+            existing = set(commands[category_id])
+            previous: Optional[str] = None
+            for item in category.get("items", []):
+                command_id = item.get("commandId", "")
+                if command_id in existing:
+                    previous = command_id
+                else:
+                    inserted_commands.setdefault(previous, []).append(command_id)
+                    existing.add(command_id)
+            if inserted_commands:
+                order = list(inserted_commands.get(None, []))
+                for command_id in commands[category_id]:
+                    order.append(command_id)
+                    order.extend(inserted_commands.get(command_id, []))
+                commands[category_id] = order
+            previous_category = category_id
+        else:
+            inserted_categories.setdefault(previous_category, []).append(category_id)
+            commands[category_id] = [item.get("commandId", "") for item in category.get("items", [])]
+
+    if inserted_categories:
+        order = list(inserted_categories.get(None, []))
+        for category_id in category_order:
+            order.append(category_id)
+            order.extend(inserted_categories.get(category_id, []))
+        category_order = order
+
+    merged: List[Dict[str, Any]] = []
+    seen_keys = set()
+    for category_id in category_order:
+        items = []
+        for command_id in commands[category_id]:
+            key = (category_id, command_id)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            result = resolve(key)
+            if result is not None:
+                merged_items[key] = result
+                items.append({"commandId": command_id, "shortcuts": result})
+        if items or category_id in ours_categories:
+            merged.append({"categoryId": category_id, "items": items})
+
+    conflicts.extend(_collisions(merged_items, from_theirs, scopes))
+    return merged, conflicts
+
+
+def _collisions(merged_items: Dict[CommandKey, List[str]], from_theirs: Dict[CommandKey, set],
+                scopes: ConflictScopes) -> List[Dict[str, Any]]:
+    """找出合并时由 theirs 引入、与其他命令重复的物理按键组合"""
+    buckets: Dict[str, List[CommandKey]] = {}
+    for key, shortcuts in merged_items.items():
+        for shortcut in shortcuts:
+            buckets.setdefault(canonical_shortcut(shortcut), []).append(key)
+
+    result = []
+    for canonical, keys in buckets.items():
+        if len(keys) < 2 or not any(canonical in from_theirs.get(key, ()) for key in keys):
+            continue
+        for key in keys:
+            if canonical not in from_theirs.get(key, ()):
+                continue
+            others = [
+                list(other) for other in keys
+                if other != key and scopes.overlaps(key[0], other[0])
+            ]
+            if others:
+                conflict = _conflict(CONFLICT_COLLISION, key, None, None, None, merged_items[key])
+                conflict["shortcut"] = canonical
+                conflict["with"] = others
+                result.append(conflict)
+    return result
+
+
+def merge_files(base_path: str, ours_path: str, theirs_path: str, output_path: str,
+                scopes: Optional[ConflictScopes] = None) -> List[Dict[str, Any]]:
+    """
+    三方合并快捷键 txt 文件并写出结果
+
+    Args:
+        base_path: 共同基准文件
+        ours_path: 本方文件
+        theirs_path: 对方文件
+        output_path: 输出文件（可与 ours_path 相同）
+        scopes: 冲突检测的类别作用域
+
+    Returns:
+        冲突列表
+    """
+    merged, conflicts = merge_keymaps(
+        FileConverter.load_hotkey_file(base_path),
+        FileConverter.load_hotkey_file(ours_path),
+        FileConverter.load_hotkey_file(theirs_path),
+        scopes
+    )
+    FileConverter.write_hotkey_file(merged, output_path)
+    return conflicts
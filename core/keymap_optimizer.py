@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+"""
+键位人体工学优化模块
+以模拟退火搜索无冲突的重新分配方案，使手部移动与修饰键负担的加权总和最小
+"""
+
+import multiprocessing
+import queue
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .conflict_scopes import ConflictScopes
+from .hotkey_manager import HotkeyManager
+from .shortcut_finder import EXCLUDED_KEYS, MODIFIER_COST, key_center
+from utils.key_constants import KEY_NAMES
+from utils.shortcut_codec import (
+    MODIFIER_COMBOS,
+    NORMAL_SLOT_COUNT,
+    build_shortcut,
+    canonical_keystroke,
+    decode_key,
+    encode_key,
+    parse_shortcut
+)
+
+# 双手基准行按键
+HOME_KEYS = ("A", "S", "D", "F", "J", "K", "L", "SEMICOLON")
+
+# 每轮并行评估的候选移动数量
+BATCH_SIZE = 256
+
+# 进度回调间隔（秒）
+PROGRESS_INTERVAL = 0.1
+
+# 变更项: (category_id, command_id, 原快捷键, 新快捷键)
+Change = Tuple[str, str, str, str]
+
+
+class ErgonomicCostModel:
+    """键盘几何成本模型"""
+
+    def __init__(self, travel_weight: float = 1.0, modifier_weight: float = 1.0):
+        """
+        初始化成本模型
+
+        Args:
+            travel_weight: 手部移动距离权重
+            modifier_weight: 修饰键负担权重
+        """
+        self.travel_weight = travel_weight
+        self.modifier_weight = modifier_weight
+
+    def slot_costs(self) -> np.ndarray:
+        """
+        计算每个一般模式编码的操作成本
+
+        Returns:
+            长度为 NORMAL_SLOT_COUNT 的数组
+        """
+        centers = np.array([key_center(name) for name in KEY_NAMES])
+        homes = np.array([key_center(name) for name in HOME_KEYS])
+        distances = np.linalg.norm(centers[:, None, :] - homes[None, :, :], axis=2)
+        travel = distances.min(axis=1)
+
+        modifier = np.asarray(MODIFIER_COST, dtype=float)
+        costs = (self.travel_weight * travel[:, None]
+                 + self.modifier_weight * modifier[None, :])
+        return costs.reshape(NORMAL_SLOT_COUNT)
+
+    @staticmethod
+    def target_mask() -> np.ndarray:
+        """
+        获取可作为分配目标的编码
+
+        Returns:
+            布尔数组，不推荐的按键（如 ESCAPE、ENTER）为 False
+        """
+        excluded = np.array([name in EXCLUDED_KEYS for name in KEY_NAMES])
+        return np.repeat(~excluded, MODIFIER_COMBOS)
+
+
+class KeymapOptimizer:
+    """键位优化问题构建器"""
+
+    def __init__(self, hotkey_manager: HotkeyManager,
+                 cost_model: Optional[ErgonomicCostModel] = None,
+                 priorities: Optional[Dict[str, Dict[str, float]]] = None,
+                 pinned: Optional[Dict[str, List[str]]] = None,
+                 change_penalty: float = 1.0,
+                 scopes: Optional[ConflictScopes] = None):
+        """
+        初始化键位优化器
+
+        Args:
+            hotkey_manager: 快捷键管理器实例
+            cost_model: 成本模型（默认使用 ErgonomicCostModel）
+            priorities: 命令优先级权重 {category_id: {command_id: 权重}}，默认 1.0
+            pinned: 固定不动的命令 {category_id: [command_id, ...]}
+            change_penalty: 每改动一个快捷键的额外代价
+            scopes: 类别作用域（互斥的类别可共用同一编码，默认所有类别两两冲突）
+        """
+        self.hotkey_manager = hotkey_manager
+        self.cost_model = cost_model or ErgonomicCostModel()
+        self.priorities = priorities or {}
+        self.pinned = pinned or {}
+        self.change_penalty = change_penalty
+        self.scopes = scopes
+
+    def build_problem(self) -> Dict[str, Any]:
+        """
+        从当前数据构建可序列化的优化问题
+
+        一般模式且未固定的绑定参与优化；单引号字面量与固定命令的绑定保持原位，
+        其中可还原为物理按键的字面量同样占用对应编码。
+        不推荐的按键不会被分配给其他命令，但已绑定在上面的命令可以保留。
+        每个类别为一组，编码的占用按组记录，只有作用域重叠的组之间才互相占用。
+
+        Returns:
+            传给 optimize() 的问题描述
+        """
+        costs = self.cost_model.slot_costs()
+        movable: List[Tuple[str, str, str]] = []
+        original: List[int] = []
+        priority: List[float] = []
+        groups: List[int] = []
+        blocked: List[Tuple[int, int]] = []
+        categories: Dict[str, int] = {}
+
+        for category_id, command_id, shortcut, _ in self.hotkey_manager.get_all_shortcuts():
+            parsed = canonical_keystroke(shortcut)
+            if parsed is None or parsed[2]:
+                continue
+            code = encode_key(parsed[0], parsed[1])
+            group = categories.setdefault(category_id, len(categories))
+            if parse_shortcut(shortcut)[2] or command_id in self.pinned.get(category_id, []):
+                blocked.append((code, group))
+                continue
+            movable.append((category_id, command_id, shortcut))
+            original.append(code)
+            priority.append(float(self.priorities.get(category_id, {}).get(command_id, 1.0)))
+            groups.append(group)
+
+        names = list(categories)
+        if self.scopes is None:
+            overlaps = [[True] * len(names) for _ in names]
+        else:
+            overlaps = [[self.scopes.overlaps(a, b) for b in names] for a in names]
+
+        return {
+            "movable": movable,
+            "original": original,
+            "priority": priority,
+            "groups": groups,
+            "blocked": blocked,
+            "overlaps": overlaps,
+            "slot_costs": costs.tolist(),
+            "targets": self.cost_model.target_mask().tolist(),
+            "change_penalty": self.change_penalty
+        }
+
+    @staticmethod
+    def changes_from_assignment(problem: Dict[str, Any], assignment: List[int]) -> List[Change]:
+        """
+        将优化结果转换为变更列表
+
+        Args:
+            problem: build_problem() 的返回值
+            assignment: 每个可移动绑定的新编码
+
+        Returns:
+            [(category_id, command_id, 原快捷键, 新快捷键), ...]
+        """
+        changes: List[Change] = []
+        for (category_id, command_id, shortcut), old_code, new_code in zip(
+                problem["movable"], problem["original"], assignment):
+            if new_code != old_code:
+                key_name, mask = decode_key(new_code)
+                changes.append((category_id, command_id, shortcut, build_shortcut(key_name, mask)))
+        return changes
+
+
+def _total_cost(costs: np.ndarray, priority: np.ndarray, original: np.ndarray,
+                assign: np.ndarray, penalty: float) -> float:
+    """计算分配方案的总成本"""
+    return float(np.sum(priority * costs[assign]) + penalty * np.count_nonzero(assign != original))
+
+
+def optimize(problem: Dict[str, Any], time_budget: float = 5.0,
+             progress: Optional[Callable[[float, float], None]] = None,
+             seed: Optional[int] = None) -> Tuple[List[int], float, float, List[int]]:
+    """
+    模拟退火搜索无冲突的最优分配
+
+    每轮以 NumPy 批量生成并评估移动/交换候选，再依次应用互不重叠的已接受候选。
+    占用按组（类别）记录，目标编码上只与作用域重叠的组比较。
+    可分配的空闲编码不足时，无法消除冲突的绑定保持原快捷键且不参与搜索。
+
+    Args:
+        problem: KeymapOptimizer.build_problem() 的返回值
+        time_budget: 搜索时间上限（秒）
+        progress: 进度回调 (完成比例, 当前最优成本)
+        seed: 随机种子
+
+    Returns:
+        (最优分配, 无冲突初始解成本, 最优成本, 未能安置的可移动绑定下标)
+    """
+    costs = np.asarray(problem["slot_costs"], dtype=float)
+    targets = np.asarray(problem["targets"], dtype=bool)
+    original = np.asarray(problem["original"], dtype=np.int64)
+    priority = np.asarray(problem["priority"], dtype=float)
+    penalty = float(problem["change_penalty"])
+    group = np.asarray(problem["groups"], dtype=np.int64)
+    count = len(original)
+
+    if count == 0:
+        return [], 0.0, 0.0, []
+
+    overlaps = np.asarray(problem["overlaps"], dtype=bool)
+
+    # owner[组, 编码]: -1 空闲, -2 固定占用, >=0 为可移动绑定下标
+    owner = np.full((len(overlaps), len(costs)), -1, dtype=np.int64)
+    for code, blocked_group in problem["blocked"]:
+        owner[blocked_group, code] = -2
+
+    def conflicts(g: int, slot: int) -> bool:
+        return bool(np.any(overlaps[g] & (owner[:, slot] != -1)))
+
+    # 先将冲突的绑定移到最便宜的可用编码，得到无冲突的初始解
+    allowed = np.flatnonzero(targets)
+    free_order = [int(c) for c in allowed[np.argsort(costs[allowed], kind="stable")]]
+    assign = original.copy()
+    unplaced: List[int] = []
+    for i in range(count):
+        g = int(group[i])
+        slot = int(assign[i])
+        if conflicts(g, slot):
+            free = next((c for c in free_order if not conflicts(g, c)), None)
+            if free is None:
+                # 没有可用编码：保持原快捷键，并阻止其他绑定再移入
+                unplaced.append(i)
+                if owner[g, slot] == -1:
+                    owner[g, slot] = -2
+                continue
+            slot = free
+            assign[i] = slot
+        owner[g, slot] = i
+
+    placed = np.setdiff1d(np.arange(count), np.asarray(unplaced, dtype=np.int64))
+
+    # 以消除冲突后的初始解作为比较基准，原始方案含冲突时其成本不可比
+    initial_cost = _total_cost(costs, priority, original, assign, penalty)
+    current = initial_cost
+    best_assign = assign.copy()
+    best_cost = current
+
+    finite = costs[allowed]
+    temp_start = max(float(finite.max() - finite.min()), 1.0) * float(priority.mean())
+    temp_end = 0.01
+    rng = np.random.default_rng(seed)
+
+    start = time.perf_counter()
+    last_report = start
+    rows = np.arange(BATCH_SIZE)
+    while len(placed):
+        now = time.perf_counter()
+        fraction = (now - start) / time_budget if time_budget > 0 else 1.0
+        if fraction >= 1.0:
+            break
+        if progress is not None and now - last_report >= PROGRESS_INTERVAL:
+            progress(fraction, best_cost)
+            last_report = now
+        temperature = temp_start * (temp_end / temp_start) ** fraction
+
+        i = placed[rng.integers(0, len(placed), BATCH_SIZE)]
+        g = group[i]
+        target = allowed[rng.integers(0, len(allowed), BATCH_SIZE)]
+        source = assign[i]
+        # 目标编码上与本组作用域重叠的占用者：没有时直接移动，恰有一个可移动绑定时交换
+        occupants = owner[:, target].T
+        hits = overlaps[g] & (occupants != -1)
+        other = np.where(hits.sum(axis=1) == 1, occupants[rows, hits.argmax(axis=1)], -1)
+        other = np.where(hits.sum(axis=1) > 1, -2, other)
+        swap = other >= 0
+        j = np.where(swap, other, 0)
+        # 交换时对方会落到原编码上，该编码须是可分配目标，且除本绑定外没有与对方冲突的占用者
+        source_hits = overlaps[group[j]] & (owner[:, source].T != -1)
+        source_hits[rows, g] = False
+        valid = ((other != -2) & (target != source)
+                 & (~swap | (targets[source] & ~source_hits.any(axis=1))))
+
+        source_cost = costs[source]
+        target_cost = costs[target]
+        delta = (priority[i] * (target_cost - source_cost)
+                 + penalty * ((target != original[i]).astype(float)
+                              - (source != original[i]).astype(float)))
+        delta += np.where(
+            swap,
+            priority[j] * (source_cost - target_cost)
+            + penalty * ((source != original[j]).astype(float)
+                         - (target != original[j]).astype(float)),
+            0.0
+        )
+        accept = valid & ((delta < 0) | (rng.random(BATCH_SIZE) < np.exp(-np.maximum(delta, 0.0) / temperature)))
+
+        touched = set()
+        for k in np.flatnonzero(accept):
+            a, t, b = int(i[k]), int(target[k]), int(other[k])
+            s = int(source[k])
+            keys = (('i', a), ('s', s), ('s', t)) + ((('i', b),) if b >= 0 else ())
+            if any(key in touched for key in keys):
+                continue
+            touched.update(keys)
+            owner[group[a], s] = -1
+            assign[a] = t
+            if b >= 0:
+                owner[group[b], t] = -1
+                assign[b] = s
+                owner[group[b], s] = b
+            owner[group[a], t] = a
+            current += float(delta[k])
+
+        if current < best_cost - 1e-9:
+            best_cost = current
+            best_assign = assign.copy()
+
+    if progress is not None:
+        progress(1.0, best_cost)
+    return [int(c) for c in best_assign], initial_cost, best_cost, unplaced
+
+
+def _worker_main(problem: Dict[str, Any], time_budget: float, messages) -> None:
+    """优化子进程入口"""
+    try:
+        def report(fraction: float, cost: float) -> None:
+            messages.put(("progress", fraction, cost))
+
+        assignment, initial_cost, best_cost, unplaced = optimize(problem, time_budget, report)
+        messages.put(("result", assignment, initial_cost, best_cost, unplaced))
+    except Exception as e:
+        messages.put(("error", str(e)))
+
+
+class OptimizerWorker:
+    """在独立进程中运行优化，避免阻塞界面"""
+
+    def __init__(self, problem: Dict[str, Any], time_budget: float = 5.0):
+        """
+        初始化优化工作进程
+
+        Args:
+            problem: KeymapOptimizer.build_problem() 的返回值
+            time_budget: 搜索时间上限（秒）
+        """
+        self.problem = problem
+        self.time_budget = time_budget
+        self._messages = multiprocessing.Queue()
+        self._process: Optional[multiprocessing.Process] = None
+
+    def start(self) -> None:
+        """启动子进程"""
+        self._process = multiprocessing.Process(
+            target=_worker_main,
+            args=(self.problem, self.time_budget, self._messages),
+            daemon=True
+        )
+        self._process.start()
+
+    def poll(self) -> List[tuple]:
+        """
+        取出子进程发送的全部消息（不阻塞）
+
+        Returns:
+            [("progress", 比例, 成本) | ("result", 分配, 初始成本, 最优成本, 未安置下标) | ("error", 信息), ...]
+        """
+        result = []
+        while True:
+            try:
+                result.append(self._messages.get_nowait())
+            except queue.Empty:
+                break
+        return result
+
+    def is_alive(self) -> bool:
+        """子进程是否仍在运行"""
+        return self._process is not None and self._process.is_alive()
+    
+    def cancel(self) -> None:
+        """终止子进程"""
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(1.0)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+链接文件监视模块
+监视已链接的快捷键文件，防抖后按类别段落哈希找出变化的段落，
+只对变化段落做行级比较并解析受影响的命令
+"""
+
+import difflib
+import hashlib
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from utils.file_converter import FileConverter
+
+# 外部变更: (category_id, command_id, 变更前的快捷键, 变更后的快捷键)，快捷键均已格式化
+ExternalChange = Tuple[str, str, List[str], List[str]]
+
+
+class SectionSnapshot:
+    """按类别段落切分的快捷键文件文本"""
+
+    def __init__(self, lines: List[str]):
+        """
+        切分文本行
+
+        Args:
+            lines: 文件文本行
+        """
+        self.sections: Dict[str, List[str]] = {}
+        self.hashes: Dict[str, str] = {}
+        current = None
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith('---') and stripped.endswith('---'):
+                current = stripped.strip('-').strip()
+                self.sections.setdefault(current, [])
+            elif current is not None and stripped:
+                self.sections[current].append(stripped)
+        for category_id, section in self.sections.items():
+            self.hashes[category_id] = hashlib.sha1("\n".join(section).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def from_file(cls, path: str) -> "SectionSnapshot":
+        """读取文件并切分"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read().splitlines())
+
+    def categories(self) -> List[str]:
+        """类别 ID 列表（文件顺序）"""
+        return list(self.sections)
+
+    def command_shortcuts(self, category_id: str, command_ids: Set[str]) -> Dict[str, List[str]]:
+        """
+        解析段落中指定命令的快捷键（经 FileConverter 格式化）
+
+        Args:
+            category_id: 类别 ID
+            command_ids: 需要解析的命令 ID
+
+        Returns:
+            {command_id: [快捷键, ...]}，段落中不存在的命令不包含在内
+        """
+        lines = [f"--- {category_id} ---"] + [
+            line for line in self.sections.get(category_id, [])
+            if line.split(':', 1)[0].strip() in command_ids
+        ]
+        data = FileConverter.format_data(FileConverter.parse_txt_lines(lines))
+        if not data:
+            return {}
+        return {item["commandId"]: item["shortcuts"] for item in data[0]["items"]}
+
+
+def diff_snapshots(base: SectionSnapshot,
+                   current: SectionSnapshot) -> Tuple[List[ExternalChange], bool]:
+    """
+    比较两个快照，只对哈希变化的段落做行级比较
+
+    Args:
+        base: 上次同步时的快照
+        current: 当前文件的快照
+
+    Returns:
+        (变更列表, 是否存在类别或命令的增删)
+    """
+    changes: List[ExternalChange] = []
+    structural = base.categories() != current.categories()
+
+    for category_id in current.categories():
+        if category_id not in base.hashes or base.hashes[category_id] == current.hashes[category_id]:
+            continue
+
+        old_lines = base.sections[category_id]
+        new_lines = current.sections[category_id]
+        touched: Set[str] = set()
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            for line in old_lines[i1:i2] + new_lines[j1:j2]:
+                touched.add(line.split(':', 1)[0].strip())
+
+        before = base.command_shortcuts(category_id, touched)
+        after = current.command_shortcuts(category_id, touched)
+        if set(before) != set(after):
+            structural = True
+        for command_id in sorted(touched, key=lambda c: (c not in after, c)):
+            if command_id in before and command_id in after and before[command_id] != after[command_id]:
+                changes.append((category_id, command_id, before[command_id], after[command_id]))
+
+    return changes, structural
+
+
+class LinkWatcher(QObject):
+    """
+    已链接文件监视器
+    文件变化后防抖，再与上次同步的快照比较，通过 external_change 信号发出变化的命令
+    """
+
+    # (List[ExternalChange], 是否存在类别或命令的增删)
+    external_change = Signal(list, bool)
+
+    def __init__(self, debounce_ms: int = 300, parent: Optional[QObject] = None):
+        """
+        初始化监视器
+
+        Args:
+            debounce_ms: 防抖间隔（毫秒），Spine 写文件时可能连续触发多次
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.path = ""
+        self._snapshot: Optional[SectionSnapshot] = None
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._process)
+
+    def watch(self, path: str) -> None:
+        """
+        开始监视文件，并以当前内容作为同步基准
+
+        Args:
+            path: 快捷键 txt 文件路径
+        """
+        self.stop()
+        self.path = path
+        self.mark_synced()
+        if os.path.exists(path):
+            self._watcher.addPath(path)
+
+    def stop(self) -> None:
+        """停止监视"""
+        self._timer.stop()
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+        self.path = ""
+        self._snapshot = None
+
+    def base_snapshot(self) -> Optional[SectionSnapshot]:
+        """上次同步时的快照"""
+        return self._snapshot
+
+    def mark_synced(self) -> None:
+        """以文件当前内容作为新的同步基准（导入或本程序保存后调用）"""
+        try:
+            self._snapshot = SectionSnapshot.from_file(self.path)
+        except OSError:
+            self._snapshot = None
+
+    def _on_file_changed(self, path: str) -> None:
+        """文件变化（防抖）"""
+        # 以替换方式写入的文件会从监视列表中移除，需要重新添加
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        self._timer.start()
+
+    def _process(self) -> None:
+        """比较文件与同步基准，发出变化"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        if self.path not in self._watcher.files():
+            self._watcher.addPath(self.path)
+        try:
+            current = SectionSnapshot.from_file(self.path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"读取链接文件失败: {e}")
+            return
+        if self._snapshot is None:
+            self._snapshot = current
+            return
+        if current.hashes == self._snapshot.hashes:
+            return
+
+        changes, structural = diff_snapshots(self._snapshot, current)
+        self._snapshot = current
+        if changes or structural:
+            self.external_change.emit(changes, structural)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+快捷键占用索引模块
+按整数编码维护每个快捷键组合的占用情况，随数据变更增量更新
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from .conflict_scopes import ConflictScopes
+from .hotkey_manager import HotkeyManager, ProfileStateCache
+from utils.key_constants import KEY_NAMES
+from utils.shortcut_codec import KEY_INDEX, MODIFIER_COMBOS, NORMAL_SLOT_COUNT, ShortcutSpace
+
+
+class OccupancyIndex:
+    """快捷键占用索引"""
+
+    def __init__(self, hotkey_manager: HotkeyManager,
+                 scopes: Optional[ConflictScopes] = None):
+        """
+        初始化占用索引并订阅数据变更
+
+        Args:
+            hotkey_manager: 快捷键管理器实例
+            scopes: 判断冲突所用的类别作用域矩阵（默认所有类别互相重叠）
+        """
+        self.hotkey_manager = hotkey_manager
+        self.scopes = scopes or ConflictScopes()
+        self.space = ShortcutSpace()
+        # 占用计数表：下标为快捷键编码，计数大于 0 即表示已占用
+        self._counts: List[int] = [0] * len(self.space)
+        self._slot_commands: Dict[int, List[Tuple[str, str]]] = {}
+        # 按键聚合：每个按键已占用 / 冲突的修饰键组合数量
+        self._key_bound: List[int] = [0] * len(KEY_NAMES)
+        self._key_conflicted: List[int] = [0] * len(KEY_NAMES)
+        self._dirty_keys: Set[str] = set()
+        # 其他配置的索引
+        self._profile_indexes = ProfileStateCache(
+            hotkey_manager, self._capture_state, self._restore_state, self.rebuild
+        )
+
+        self.rebuild()
+        hotkey_manager.add_listener(self._on_hotkey_changed)
+
+    def rebuild(self) -> None:
+        """根据当前数据重建索引"""
+        self._counts = [0] * len(self.space)
+        self._slot_commands = {}
+        self._key_bound = [0] * len(KEY_NAMES)
+        self._key_conflicted = [0] * len(KEY_NAMES)
+        self._dirty_keys.update(KEY_NAMES)
+        for category_id, command_id, shortcut, _ in self.hotkey_manager.get_all_shortcuts():
+            self._add(category_id, command_id, shortcut)
+
+    def set_scopes(self, scopes: ConflictScopes) -> None:
+        """
+        更换作用域矩阵并重建索引
+
+        Args:
+            scopes: 新的作用域矩阵
+        """
+        self.scopes = scopes
+        self._profile_indexes.clear()
+        self.rebuild()
+
+    def _capture_state(self) -> tuple:
+        return self._counts, self._slot_commands, self._key_bound, self._key_conflicted
+    
+    def _restore_state(self, state: tuple) -> None:
+        self._counts, self._slot_commands, self._key_bound, self._key_conflicted = state
+        self._dirty_keys.update(KEY_NAMES)
+
+    def _on_hotkey_changed(self, event: str, category_id: str, command_id: str,
+                           old_shortcut: str, new_shortcut: str) -> None:
+        """处理快捷键管理器的变更通知"""
+        if event == 'switch':
+            # 索引已由配置状态缓存换入
+            return
+        if event == 'reset':
+            self._profile_indexes.clear()
+            self.rebuild()
+            return
+        if old_shortcut:
+            self._remove(category_id, command_id, old_shortcut)
+        if new_shortcut:
+            self._add(category_id, command_id, new_shortcut)
+
+    def _add(self, category_id: str, command_id: str, shortcut: str) -> None:
+        """登记一次占用"""
+        code = self.space.encode(shortcut)
+        if code is None:
+            return
+        if code >= len(self._counts):
+            self._counts.extend([0] * (len(self.space) - len(self._counts)))
+        was_conflicted = self.is_conflicted(code)
+        self._counts[code] += 1
+        self._slot_commands.setdefault(code, []).append((category_id, command_id))
+        self._update_key(code, self._counts[code] > 1, was_conflicted)
+
+    def _remove(self, category_id: str, command_id: str, shortcut: str) -> None:
+        """撤销一次占用"""
+        code = self.space.encode(shortcut)
+        if code is None or code >= len(self._counts) or self._counts[code] == 0:
+            return
+        commands = self._slot_commands.get(code, [])
+        if (category_id, command_id) in commands:
+            was_conflicted = self.is_conflicted(code)
+            commands.remove((category_id, command_id))
+            self._counts[code] -= 1
+            if not commands:
+                del self._slot_commands[code]
+            self._update_key(code, True, was_conflicted)
+
+    def _update_key(self, code: int, was_bound: bool, was_conflicted: bool) -> None:
+        """根据编码占用状态的变化更新按键聚合"""
+        if code >= NORMAL_SLOT_COUNT:
+            return
+        key_index = code // MODIFIER_COMBOS
+        bound_delta = (self._counts[code] > 0) - was_bound
+        conflict_delta = self.is_conflicted(code) - was_conflicted
+        if bound_delta or conflict_delta:
+            self._key_bound[key_index] += bound_delta
+            self._key_conflicted[key_index] += conflict_delta
+            self._dirty_keys.add(KEY_NAMES[key_index])
+
+    def count(self, code: int) -> int:
+        """
+        获取编码的占用次数
+
+        Args:
+            code: 快捷键编码
+
+        Returns:
+            占用该组合的绑定数量
+        """
+        if 0 <= code < len(self._counts):
+            return self._counts[code]
+        return 0
+
+    def is_free(self, code: int) -> bool:
+        """判断编码对应的组合是否空闲"""
+        return self.count(code) == 0
+
+    def is_conflicted(self, code: int) -> bool:
+        """判断编码上是否存在作用域重叠的多个命令"""
+        if self.count(code) < 2:
+            return False
+        return bool(self.scopes.conflicting(self._slot_commands[code]))
+
+    def is_shortcut_free(self, shortcut: str) -> bool:
+        """
+        判断快捷键是否空闲
+
+        Args:
+            shortcut: 快捷键字符串
+
+        Returns:
+            未被任何命令占用返回 True，无效快捷键返回 False
+        """
+        code = self.space.encode(shortcut)
+        return code is not None and self.is_free(code)
+
+    def commands_at(self, code: int) -> List[Tuple[str, str]]:
+        """
+        获取占用某编码的命令
+
+        Args:
+            code: 快捷键编码
+
+        Returns:
+            [(category_id, command_id), ...]
+        """
+        return list(self._slot_commands.get(code, []))
+
+    def key_stats(self, key_name: str) -> Tuple[int, int]:
+        """
+        获取按键的占用统计
+
+        Args:
+            key_name: 键名
+
+        Returns:
+            (已占用的修饰键组合数, 冲突的修饰键组合数)，均不超过 8
+        """
+        key_index = KEY_INDEX[key_name]
+        return self._key_bound[key_index], self._key_conflicted[key_index]
+
+    def take_dirty_keys(self) -> Set[str]:
+        """
+        取出并清空自上次调用以来统计发生变化的按键
+
+        Returns:
+            键名集合
+        """
+        dirty = self._dirty_keys
+        self._dirty_keys = set()
+        return dirty
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+多配置分析模块
+将多份快捷键配置构建为 配置 × (命令, 快捷键) 关联矩阵，批量计算差异度、重载与共识绑定
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.file_converter import FileConverter
+from utils.shortcut_codec import ShortcutSpace
+
+
+class ProfileAnalyzer:
+    """多配置分析器"""
+
+    def __init__(self):
+        """初始化分析器"""
+        self.space = ShortcutSpace()
+        self.names: List[str] = []
+        self._command_index: Dict[Tuple[str, str], int] = {}
+        self._commands: List[Tuple[str, str]] = []
+        # 关联矩阵的坐标形式：第 i 个绑定属于 配置 _rows[i]、命令 _cmds[i]、编码 _codes[i]
+        self._rows: List[int] = []
+        self._cmds: List[int] = []
+        self._codes: List[int] = []
+
+    def add_profile(self, name: str, data: List[Dict[str, Any]]) -> None:
+        """
+        添加一份配置
+
+        Args:
+            name: 配置名称
+            data: 格式化后的类别列表（与 hotkeys.json 结构相同）
+        """
+        row = len(self.names)
+        self.names.append(name)
+        seen = set()
+        for category in data:
+            category_id = category.get("categoryId", "")
+            for item in category.get("items", []):
+                key = (category_id, item.get("commandId", ""))
+                command = self._command_index.get(key)
+                if command is None:
+                    command = len(self._commands)
+                    self._command_index[key] = command
+                    self._commands.append(key)
+                for shortcut in item.get("shortcuts", []):
+                    code = self.space.encode(shortcut) if shortcut else None
+                    if code is None or (command, code) in seen:
+                        continue
+                    seen.add((command, code))
+                    self._rows.append(row)
+                    self._cmds.append(command)
+                    self._codes.append(code)
+
+    def add_file(self, txt_path: str, name: Optional[str] = None) -> None:
+        """
+        通过 FileConverter 流程加载并添加一个快捷键文件
+
+        Args:
+            txt_path: 快捷键 txt 文件路径
+            name: 配置名称（默认使用文件名）
+        """
+        if name is None:
+            name = os.path.splitext(os.path.basename(txt_path))[0]
+        self.add_profile(name, FileConverter.load_hotkey_file(txt_path))
+
+    def analyze(self, baseline: Optional[str] = None) -> Dict[str, Any]:
+        """
+        计算分析结果
+
+        Args:
+            baseline: 作为基准的配置名称，为空则不计算偏离
+
+        Returns:
+            可直接序列化为 JSON 的结果字典，包含 profiles、divergence、drift、
+            overload、profile_overload、consensus
+
+        Raises:
+            ValueError: 没有配置或基准配置不存在
+        """
+        if not self.names:
+            raise ValueError("没有可分析的配置")
+        if baseline is not None and baseline not in self.names:
+            raise ValueError(f"基准配置不存在: {baseline}")
+
+        profile_count = len(self.names)
+        slot_count = len(self.space)
+        rows = np.asarray(self._rows, dtype=np.int64)
+        cmds = np.asarray(self._cmds, dtype=np.int64)
+        codes = np.asarray(self._codes, dtype=np.int64)
+
+        # 列为出现过的 (命令, 编码) 组合
+        columns, col_of = np.unique(cmds * slot_count + codes, return_inverse=True)
+        col_cmds = columns // slot_count
+        col_codes = columns % slot_count
+
+        incidence = np.zeros((profile_count, len(columns)), dtype=np.float32)
+        incidence[rows, col_of] = 1.0
+
+        result: Dict[str, Any] = {
+            "profiles": list(self.names),
+            # 先转为 float64 再取整，否则 float32 的取整结果转为 Python float 后仍带有表示误差
+            "divergence": self._divergence(incidence).astype(np.float64).round(4).tolist(),
+            "baseline": baseline,
+            "drift": [],
+            "overload": [],
+            "profile_overload": [],
+            "consensus": []
+        }
+
+        if baseline is not None:
+            result["drift"] = self._drift(incidence, col_cmds, self.names.index(baseline))
+
+        result["overload"], result["profile_overload"] = self._overload(rows, cmds, codes)
+        result["consensus"] = self._consensus(incidence, rows, cmds, col_cmds, col_codes)
+        return result
+
+    @staticmethod
+    def _divergence(incidence: np.ndarray) -> np.ndarray:
+        """两两配置间的 Jaccard 距离"""
+        sizes = incidence.sum(axis=1)
+        intersection = incidence @ incidence.T
+        union = sizes[:, None] + sizes[None, :] - intersection
+        similarity = np.divide(intersection, union, out=np.ones_like(union), where=union > 0)
+        return 1.0 - similarity
+
+    def _drift(self, incidence: np.ndarray, col_cmds: np.ndarray, base: int) -> List[Dict[str, Any]]:
+        """各配置相对基准的偏离"""
+        present = incidence > 0
+        base_row = present[base]
+        added = (present & ~base_row).sum(axis=1)
+        removed = (~present & base_row).sum(axis=1)
+
+        diff_rows, diff_cols = np.nonzero(present != base_row)
+        command_count = max(len(self._commands), 1)
+        touched = np.unique(diff_rows * command_count + col_cmds[diff_cols])
+        changed = np.bincount(touched // command_count, minlength=len(self.names))
+
+        sizes = incidence.sum(axis=1)
+        intersection = incidence @ incidence[base]
+        union = sizes + sizes[base] - intersection
+        distance = 1.0 - np.divide(intersection, union, out=np.ones_like(union), where=union > 0)
+
+        return [
+            {
+                "profile": name,
+                "distance": round(float(distance[i]), 4),
+                "added": int(added[i]),
+                "removed": int(removed[i]),
+                "changed_commands": int(changed[i])
+            }
+            for i, name in enumerate(self.names)
+        ]
+
+    def _overload(self, rows: np.ndarray, cmds: np.ndarray,
+                  codes: np.ndarray) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """统计每个配置中被多个命令占用的快捷键"""
+        slot_count = len(self.space)
+        keys, counts = np.unique(rows * slot_count + codes, return_counts=True)
+        overloaded = counts > 1
+        over_rows = keys[overloaded] // slot_count
+        over_codes = keys[overloaded] % slot_count
+        over_counts = counts[overloaded]
+
+        per_code = np.bincount(over_codes, minlength=slot_count)
+        max_commands = np.zeros(slot_count, dtype=np.int64)
+        np.maximum.at(max_commands, over_codes, over_counts)
+
+        order = np.argsort(-per_code, kind="stable")
+        overload = [
+            {
+                "shortcut": self.space.decode(int(code)),
+                "profiles": int(per_code[code]),
+                "max_commands": int(max_commands[code])
+            }
+            for code in order if per_code[code] > 0
+        ]
+
+        per_profile = np.bincount(over_rows, minlength=len(self.names))
+        profile_overload = [
+            {"profile": name, "overloaded_shortcuts": int(per_profile[i])}
+            for i, name in enumerate(self.names)
+        ]
+        return overload, profile_overload
+
+    def _consensus(self, incidence: np.ndarray, rows: np.ndarray, cmds: np.ndarray,
+                   col_cmds: np.ndarray, col_codes: np.ndarray) -> List[Dict[str, Any]]:
+        """每个命令被最多配置采用的绑定"""
+        if len(col_cmds) == 0:
+            return []
+        command_count = len(self._commands)
+        adoption = incidence.sum(axis=0).astype(np.int64)
+
+        # 按 (命令, 采用数降序) 排序后取每个命令的第一列
+        order = np.lexsort((-adoption, col_cmds))
+        sorted_cmds = col_cmds[order]
+        first = np.flatnonzero(np.r_[True, sorted_cmds[1:] != sorted_cmds[:-1]])
+        best = order[first]
+
+        bound_profiles = np.bincount(
+            np.unique(rows * command_count + cmds) % command_count, minlength=command_count
+        )
+        profile_count = len(self.names)
+
+        result = []
+        for col in best:
+            command = int(col_cmds[col])
+            category_id, command_id = self._commands[command]
+            result.append({
+                "category": category_id,
+                "command": command_id,
+                "shortcut": self.space.decode(int(col_codes[col])),
+                "profiles": int(adoption[col]),
+                "bound_profiles": int(bound_profiles[command]),
+                "agreement": round(float(adoption[col]) / profile_count, 4)
+            })
+        return result
+
+
+def export_json(result: Dict[str, Any], output_path: str) -> None:
+    """
+    导出分析结果为 JSON
+
+    Args:
+        result: ProfileAnalyzer.analyze() 的返回值
+        output_path: 输出文件路径
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+def export_csv(result: Dict[str, Any], output_dir: str) -> List[str]:
+    """
+    导出分析结果为多个 CSV 文件
+
+    Args:
+        result: ProfileAnalyzer.analyze() 的返回值
+        output_dir: 输出目录
+
+    Returns:
+        写入的文件路径列表
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+
+    def write(name: str, header: List[str], rows: List[List[Any]]) -> None:
+        path = os.path.join(output_dir, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        written.append(path)
+
+    profiles = result["profiles"]
+    write("divergence.csv", ["profile"] + profiles,
+          [[name] + row for name, row in zip(profiles, result["divergence"])])
+
+    tables = [
+        ("drift.csv", ["profile", "distance", "added", "removed", "changed_commands"], "drift"),
+        ("overload.csv", ["shortcut", "profiles", "max_commands"], "overload"),
+        ("profile_overload.csv", ["profile", "overloaded_shortcuts"], "profile_overload"),
+        ("consensus.csv", ["category", "command", "shortcut", "profiles",
+                           "bound_profiles", "agreement"], "consensus")
+    ]
+    for name, header, key in tables:
+        if result[key]:
+            write(name, header, [[entry[field] for field in header] for entry in result[key]])
+    return written
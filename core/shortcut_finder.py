@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+空闲快捷键推荐模块
+基于占用索引为命令推荐未被占用的快捷键组合
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from .occupancy_index import OccupancyIndex
+from utils.key_constants import KEY_NAMES, KEY_POSITIONS, NUMPAD_KEYS
+from utils.shortcut_codec import (
+    MODIFIER_COMBOS,
+    NORMAL_SLOT_COUNT,
+    canonical_keystroke,
+    decode_key,
+    encode_key
+)
+
+# 修饰键组合的操作成本（下标为掩码 ctrl=1 shift=2 alt=4）
+MODIFIER_COST = [0.0, 1.0, 1.5, 2.5, 2.0, 3.0, 3.5, 4.5]
+
+# 不作为推荐目标的按键
+EXCLUDED_KEYS = {
+    "ESCAPE", "ENTER", "NUMPAD_ENTER", "TAB", "BACKSPACE",
+    "NUM_LOCK", "SCROLL_LOCK", "PRINT_SCREEN",
+    "AT", "COLON", "PLUS", "POUND", "STAR"
+}
+
+# 相邻按键的最大中心距离（键宽单位）
+NEIGHBOR_DISTANCE = 1.6
+
+INITIAL_BONUS = -3.0
+LETTER_BONUS = -1.5
+SAME_KEY_BONUS = -2.0
+NEIGHBOR_BONUS = -1.0
+
+
+def key_center(key_name: str) -> tuple:
+    """获取按键中心坐标"""
+    x, y, width = KEY_POSITIONS[key_name]
+    return x + width / 2, y + 0.5
+
+
+def _key_cost(key_name: str) -> float:
+    """按键本身的操作成本"""
+    if len(key_name) == 1:
+        return 0.0
+    if key_name.startswith("NUM_"):
+        return 0.5
+    if key_name.startswith("F") and key_name[1:].isdigit():
+        return 1.0 if int(key_name[1:]) <= 12 else 3.0
+    if key_name in NUMPAD_KEYS:
+        return 2.0
+    return 1.5
+
+
+def _build_neighbors() -> Dict[str, List[str]]:
+    """预计算每个按键的相邻按键"""
+    centers = {name: key_center(name) for name in KEY_NAMES}
+    neighbors: Dict[str, List[str]] = {}
+    for name, (x1, y1) in centers.items():
+        neighbors[name] = [
+            other for other, (x2, y2) in centers.items()
+            if other != name and math.hypot(x1 - x2, y1 - y2) <= NEIGHBOR_DISTANCE
+        ]
+    return neighbors
+
+
+_NEIGHBORS = _build_neighbors()
+
+# 每个一般模式编码的基础成本，排除的按键为 None
+_BASE_COST: List[Optional[float]] = [
+    None if decode_key(code)[0] in EXCLUDED_KEYS
+    else _key_cost(decode_key(code)[0]) + MODIFIER_COST[decode_key(code)[1]]
+    for code in range(NORMAL_SLOT_COUNT)
+]
+
+# 按基础成本排序的候选编码，用于补足推荐数量
+_ORDERED_CODES = sorted(
+    (code for code in range(NORMAL_SLOT_COUNT) if _BASE_COST[code] is not None),
+    key=lambda code: (_BASE_COST[code], code)
+)
+
+
+class ShortcutFinder:
+    """空闲快捷键推荐器"""
+
+    def __init__(self, occupancy_index: OccupancyIndex):
+        """
+        初始化推荐器
+
+        Args:
+            occupancy_index: 快捷键占用索引
+        """
+        self.occupancy_index = occupancy_index
+
+    def base_cost(self, code: int) -> Optional[float]:
+        """
+        获取一般模式编码的基础成本
+
+        Args:
+            code: 快捷键编码
+
+        Returns:
+            成本值，不可推荐的编码返回 None
+        """
+        if 0 <= code < NORMAL_SLOT_COUNT:
+            return _BASE_COST[code]
+        return None
+
+    def free_codes(self) -> List[int]:
+        """
+        获取全部可推荐的空闲编码
+
+        Returns:
+            按基础成本升序排列的编码列表
+        """
+        is_free = self.occupancy_index.is_free
+        return [code for code in _ORDERED_CODES if is_free(code)]
+
+    def score_candidates(self, names: Sequence[str],
+                         existing_shortcuts: Iterable[str] = (),
+                         limit: int = 5,
+                         exclude: Optional[Set[int]] = None) -> Dict[int, float]:
+        """
+        为命令计算空闲候选编码及其成本（越低越好）
+
+        Args:
+            names: 用于提取助记键的名称（按优先级排列，如翻译名、命令 ID）
+            existing_shortcuts: 命令已有的快捷键
+            limit: 按基础成本补足的候选数量
+            exclude: 额外排除的编码
+
+        Returns:
+            {编码: 成本}
+        """
+        scores: Dict[int, float] = {}
+        excluded = exclude or set()
+        is_free = self.occupancy_index.is_free
+
+        def consider(code: int, bonus: float) -> None:
+            cost = _BASE_COST[code]
+            if cost is None or code in excluded or not is_free(code):
+                return
+            cost += bonus
+            if cost < scores.get(code, math.inf):
+                scores[code] = cost
+
+        for key_name, bonus in self._mnemonic_keys(names):
+            for mask in range(MODIFIER_COMBOS):
+                consider(encode_key(key_name, mask), bonus)
+
+        for shortcut in existing_shortcuts:
+            parsed = canonical_keystroke(shortcut)
+            if parsed is None or parsed[2]:
+                continue
+            key_name, mask, _ = parsed
+            for other_mask in range(MODIFIER_COMBOS):
+                consider(encode_key(key_name, other_mask), SAME_KEY_BONUS)
+            for neighbor in _NEIGHBORS[key_name]:
+                consider(encode_key(neighbor, mask), NEIGHBOR_BONUS)
+
+        filled = 0
+        for code in _ORDERED_CODES:
+            if filled >= limit:
+                break
+            if code not in scores and code not in excluded and is_free(code):
+                scores[code] = _BASE_COST[code]
+                filled += 1
+
+        return scores
+
+    def suggest(self, names: Sequence[str],
+                existing_shortcuts: Iterable[str] = (),
+                limit: int = 5) -> List[str]:
+        """
+        推荐空闲快捷键
+
+        Args:
+            names: 用于提取助记键的名称（按优先级排列）
+            existing_shortcuts: 命令已有的快捷键
+            limit: 推荐数量
+
+        Returns:
+            按推荐程度排序的快捷键字符串列表
+        """
+        scores = self.score_candidates(names, existing_shortcuts, limit)
+        ranked = sorted(scores, key=lambda code: (scores[code], code))[:limit]
+        return [self.occupancy_index.space.decode(code) for code in ranked]
+
+    @staticmethod
+    def _mnemonic_keys(names: Sequence[str]) -> List[tuple]:
+        """
+        从名称中提取助记字母键
+
+        Returns:
+            [(键名, 加成), ...]，单词首字母加成高于其他字母
+        """
+        result = []
+        seen = set()
+        for rank, name in enumerate(names):
+            decay = rank * 0.5
+            words = name.replace('-', ' ').replace('/', ' ').split()
+            initials = [word[:1] for word in words]
+            others = [word[1:] for word in words]
+            for chars, bonus in ((initials, INITIAL_BONUS), (others, LETTER_BONUS)):
+                for char in "".join(chars):
+                    key_name = char.upper()
+                    if not ('A' <= key_name <= 'Z') or key_name in seen:
+                        continue
+                    seen.add(key_name)
+                    result.append((key_name, bonus + decay))
+        return result
@@ -0,0 +1,767 @@
+# -*- coding: utf-8 -*-
+"""
+快捷键存储后端模块
+HotkeyManager 通过统一的存储接口读写数据，可选内存列表或 SQLite 数据库
+"""
+
+import copy
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from utils.shortcut_codec import canonical_shortcut
+
+
+class HotkeyStorage(ABC):
+    """
+    存储后端接口
+    数据结构与 hotkeys.json 相同：[{"categoryId": ..., "items": [{"commandId": ..., "shortcuts": [...]}]}]
+    """
+
+    @abstractmethod
+    def load(self, data: List[Dict[str, Any]]) -> None:
+        """整体替换数据"""
+
+    @abstractmethod
+    def export(self) -> List[Dict[str, Any]]:
+        """导出完整数据（副本）"""
+
+    @abstractmethod
+    def get_categories(self) -> List[str]:
+        """获取类别 ID 列表"""
+
+    @abstractmethod
+    def get_items(self, category_id: str) -> List[Dict[str, Any]]:
+        """获取类别下的快捷键项（只读）"""
+
+    @abstractmethod
+    def get_shortcuts(self, category_id: str, command_id: str) -> Optional[List[str]]:
+        """获取命令的快捷键列表副本，命令不存在返回 None"""
+
+    @abstractmethod
+    def set_shortcuts(self, category_id: str, command_id: str, shortcuts: List[str]) -> bool:
+        """整体替换命令的快捷键列表"""
+
+    @abstractmethod
+    def all_shortcuts(self) -> List[Tuple[str, str, str, int]]:
+        """获取所有非空快捷键 [(category_id, command_id, shortcut, index), ...]"""
+
+    @abstractmethod
+    def find_canonical(self, canonical: str) -> List[Tuple[str, str, int]]:
+        """按规范快捷键查找 [(category_id, command_id, index), ...]"""
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """将多次写入合并为一个事务（可嵌套）"""
+        yield
+
+    def profiles(self) -> List[str]:
+        """获取全部配置名（不支持多配置的后端返回空列表）"""
+        return []
+
+    def active_profile(self) -> str:
+        """获取当前配置名"""
+        return ""
+
+    def activate_profile(self, name: str) -> bool:
+        """切换当前配置"""
+        return False
+
+    def create_profile(self, name: str, source: Optional[str] = None) -> bool:
+        """新建配置（默认复制当前配置）"""
+        return False
+
+    def delete_profile(self, name: str) -> bool:
+        """删除非当前配置"""
+        return False
+
+    def close(self) -> None:
+        """释放资源"""
+
+
+class MemoryStorage(HotkeyStorage):
+    """内存存储：直接持有 JSON 结构，并维护 (类别, 命令) 到项、规范快捷键到命令的索引"""
+
+    def __init__(self):
+        """初始化内存存储"""
+        self._data: List[Dict[str, Any]] = []
+        self._items: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._positions: Dict[Tuple[str, str], int] = {}
+        self._by_canonical: Dict[str, Set[Tuple[str, str]]] = {}
+
+    def load(self, data: List[Dict[str, Any]]) -> None:
+        data = _merge_duplicates(data)
+        self._data = data
+        self._items = {}
+        self._positions = {}
+        self._by_canonical = {}
+        for category in data:
+            category_id = category.get("categoryId", "")
+            for item in category.get("items", []):
+                key = (category_id, item.get("commandId", ""))
+                self._items[key] = item
+                self._positions.setdefault(key, len(self._positions))
+                self._index(key, item.get("shortcuts", []), True)
+
+    def _index(self, key: Tuple[str, str], shortcuts: List[str], add: bool) -> None:
+        """在规范快捷键索引中添加或移除命令的快捷键"""
+        for shortcut in shortcuts:
+            if not shortcut:
+                continue
+            canonical = canonical_shortcut(shortcut)
+            if add:
+                self._by_canonical.setdefault(canonical, set()).add(key)
+            else:
+                keys = self._by_canonical.get(canonical)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._by_canonical[canonical]
+
+    def export(self) -> List[Dict[str, Any]]:
+        return copy.deepcopy(self._data)
+
+    def get_categories(self) -> List[str]:
+        return [category.get("categoryId", "") for category in self._data]
+
+    def get_items(self, category_id: str) -> List[Dict[str, Any]]:
+        for category in self._data:
+            if category.get("categoryId") == category_id:
+                return category.get("items", [])
+        return []
+
+    def get_shortcuts(self, category_id: str, command_id: str) -> Optional[List[str]]:
+        item = self._items.get((category_id, command_id))
+        if item is None:
+            return None
+        return list(item.get("shortcuts", []))
+
+    def set_shortcuts(self, category_id: str, command_id: str, shortcuts: List[str]) -> bool:
+        item = self._items.get((category_id, command_id))
+        if item is None:
+            return False
+        key = (category_id, command_id)
+        self._index(key, item.get("shortcuts", []), False)
+        item["shortcuts"] = list(shortcuts)
+        self._index(key, item["shortcuts"], True)
+        return True
+
+    def all_shortcuts(self) -> List[Tuple[str, str, str, int]]:
+        result = []
+        for category in self._data:
+            category_id = category.get("categoryId", "")
+            for item in category.get("items", []):
+                command_id = item.get("commandId", "")
+                for idx, shortcut in enumerate(item.get("shortcuts", [])):
+                    if shortcut:
+                        result.append((category_id, command_id, shortcut, idx))
+        return result
+
+    def find_canonical(self, canonical: str) -> List[Tuple[str, str, int]]:
+        result = []
+        for key in sorted(self._by_canonical.get(canonical, ()), key=self._positions.__getitem__):
+            for idx, shortcut in enumerate(self._items[key].get("shortcuts", [])):
+                if shortcut and canonical_shortcut(shortcut) == canonical:
+                    result.append((key[0], key[1], idx))
+        return result
+
+
+class SQLiteStorage(HotkeyStorage):
+    """
+    SQLite 存储
+    categories / commands / bindings 三张表，按 profile 区分多份配置；
+    快捷键（原始与规范形式）和 commandId 建有索引，文件数据库使用 WAL 模式
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            profile TEXT NOT NULL,
+            category_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            UNIQUE (profile, category_id)
+        );
+        CREATE TABLE IF NOT EXISTS commands (
+            id INTEGER PRIMARY KEY,
+            category_ref INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+            command_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            UNIQUE (category_ref, command_id)
+        );
+        CREATE TABLE IF NOT EXISTS bindings (
+            command_ref INTEGER NOT NULL REFERENCES commands(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            shortcut TEXT NOT NULL,
+            canonical TEXT NOT NULL,
+            PRIMARY KEY (command_ref, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_bindings_shortcut ON bindings (shortcut);
+        CREATE INDEX IF NOT EXISTS idx_bindings_canonical ON bindings (canonical);
+        CREATE INDEX IF NOT EXISTS idx_commands_command_id ON commands (command_id);
+    """
+
+    def __init__(self, db_path: str = ":memory:", profile: str = "default"):
+        """
+        打开（或创建）数据库
+
+        Args:
+            db_path: 数据库文件路径，":memory:" 为内存数据库
+            profile: 本实例读写的配置名
+        """
+        self.db_path = db_path
+        self.profile = profile
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._depth = 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        if self._depth == 0:
+            self._conn.execute("BEGIN")
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """
+        执行只读查询（连接在执行期间处于 query_only 状态，写入语句会失败）
+
+        Args:
+            sql: SQL 语句
+            params: 参数
+
+        Returns:
+            结果行列表
+
+        Raises:
+            sqlite3.Error: 语句有误或试图写入
+        """
+        self._conn.execute("PRAGMA query_only = ON")
+        try:
+            return self._conn.execute(sql, params).fetchall()
+        finally:
+            self._conn.execute("PRAGMA query_only = OFF")
+
+    def _select(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """执行内部的查询语句（不切换 query_only）"""
+        return self._conn.execute(sql, params).fetchall()
+
+    def execute_bulk(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        在单个事务中批量执行写入语句
+
+        Args:
+            sql: SQL 语句
+            rows: 每次执行的参数
+
+        Returns:
+            受影响的行数
+        """
+        with self.transaction():
+            return self._conn.executemany(sql, rows).rowcount
+
+    def profiles(self) -> List[str]:
+        """获取数据库中的全部配置名"""
+        rows = self._select("SELECT DISTINCT profile FROM categories ORDER BY profile")
+        return [row[0] for row in rows]
+
+    def active_profile(self) -> str:
+        return self.profile
+
+    def activate_profile(self, name: str) -> bool:
+        if name not in self.profiles():
+            return False
+        self.profile = name
+        return True
+
+    def create_profile(self, name: str, source: Optional[str] = None) -> bool:
+        if name in self.profiles():
+            return False
+        current = self.profile
+        self.profile = source or current
+        data = self.export()
+        self.profile = name
+        self.load(data)
+        self.profile = current
+        return True
+
+    def delete_profile(self, name: str) -> bool:
+        if name == self.profile:
+            return False
+        with self.transaction():
+            deleted = self._conn.execute(
+                "DELETE FROM categories WHERE profile = ?", (name,)
+            ).rowcount
+        return deleted > 0
+
+    def _command_ref(self, category_id: str, command_id: str) -> Optional[int]:
+        """获取命令行号"""
+        row = self._conn.execute(
+            "SELECT c.id FROM commands c JOIN categories g ON c.category_ref = g.id "
+            "WHERE g.profile = ? AND g.category_id = ? AND c.command_id = ?",
+            (self.profile, category_id, command_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def load(self, data: List[Dict[str, Any]]) -> None:
+        with self.transaction():
+            self._conn.execute("DELETE FROM categories WHERE profile = ?", (self.profile,))
+            # 重复的类别标题合并为一个类别，重复的命令以最后一次出现的快捷键为准（与 MemoryStorage 一致）
+            category_refs: Dict[str, int] = {}
+            command_refs: Dict[Tuple[int, str], int] = {}
+            command_counts: Dict[int, int] = {}
+            for category in data:
+                category_id = category.get("categoryId", "")
+                category_ref = category_refs.get(category_id)
+                if category_ref is None:
+                    category_ref = self._conn.execute(
+                        "INSERT INTO categories (profile, category_id, position) VALUES (?, ?, ?)",
+                        (self.profile, category_id, len(category_refs))
+                    ).lastrowid
+                    category_refs[category_id] = category_ref
+                    command_counts[category_ref] = 0
+                for item in category.get("items", []):
+                    key = (category_ref, item.get("commandId", ""))
+                    command_ref = command_refs.get(key)
+                    if command_ref is None:
+                        command_ref = self._conn.execute(
+                            "INSERT INTO commands (category_ref, command_id, position) VALUES (?, ?, ?)",
+                            (category_ref, key[1], command_counts[category_ref])
+                        ).lastrowid
+                        command_refs[key] = command_ref
+                        command_counts[category_ref] += 1
+                    else:
+                        self._conn.execute("DELETE FROM bindings WHERE command_ref = ?", (command_ref,))
+                    self._conn.executemany(
+                        "INSERT INTO bindings (command_ref, position, shortcut, canonical) "
+                        "VALUES (?, ?, ?, ?)",
+                        [
+                            (command_ref, idx, shortcut, canonical_shortcut(shortcut) if shortcut else "")
+                            for idx, shortcut in enumerate(item.get("shortcuts", []))
+                        ]
+                    )
+
+    def export(self) -> List[Dict[str, Any]]:
+        return [
+            {"categoryId": category_id, "items": self.get_items(category_id)}
+            for category_id in self.get_categories()
+        ]
+
+    def get_categories(self) -> List[str]:
+        rows = self._select(
+            "SELECT category_id FROM categories WHERE profile = ? ORDER BY position",
+            (self.profile,)
+        )
+        return [row[0] for row in rows]
+
+    def get_items(self, category_id: str) -> List[Dict[str, Any]]:
+        rows = self._select(
+            "SELECT c.command_id, b.shortcut FROM categories g "
+            "JOIN commands c ON c.category_ref = g.id "
+            "LEFT JOIN bindings b ON b.command_ref = c.id "
+            "WHERE g.profile = ? AND g.category_id = ? "
+            "ORDER BY c.position, b.position",
+            (self.profile, category_id)
+        )
+        items: List[Dict[str, Any]] = []
+        for command_id, shortcut in rows:
+            if not items or items[-1]["commandId"] != command_id:
+                items.append({"commandId": command_id, "shortcuts": []})
+            if shortcut is not None:
+                items[-1]["shortcuts"].append(shortcut)
+        return items
+
+    def get_shortcuts(self, category_id: str, command_id: str) -> Optional[List[str]]:
+        command_ref = self._command_ref(category_id, command_id)
+        if command_ref is None:
+            return None
+        rows = self._select(
+            "SELECT shortcut FROM bindings WHERE command_ref = ? ORDER BY position",
+            (command_ref,)
+        )
+        return [row[0] for row in rows]
+
+    def set_shortcuts(self, category_id: str, command_id: str, shortcuts: List[str]) -> bool:
+        command_ref = self._command_ref(category_id, command_id)
+        if command_ref is None:
+            return False
+        with self.transaction():
+            self._conn.execute("DELETE FROM bindings WHERE command_ref = ?", (command_ref,))
+            self._conn.executemany(
+                "INSERT INTO bindings (command_ref, position, shortcut, canonical) VALUES (?, ?, ?, ?)",
+                [
+                    (command_ref, idx, shortcut, canonical_shortcut(shortcut) if shortcut else "")
+                    for idx, shortcut in enumerate(shortcuts)
+                ]
+            )
+        return True
+
+    def all_shortcuts(self) -> List[Tuple[str, str, str, int]]:
+        return self._select(
+            "SELECT g.category_id, c.command_id, b.shortcut, b.position FROM bindings b "
+            "JOIN commands c ON b.command_ref = c.id "
+            "JOIN categories g ON c.category_ref = g.id "
+            "WHERE g.profile = ? AND b.shortcut != '' "
+            "ORDER BY g.position, c.position, b.position",
+            (self.profile,)
+        )
+
+    def find_canonical(self, canonical: str) -> List[Tuple[str, str, int]]:
+        return self._select(
+            "SELECT g.category_id, c.command_id, b.position FROM bindings b "
+            "JOIN commands c ON b.command_ref = c.id "
+            "JOIN categories g ON c.category_ref = g.id "
+            "WHERE b.canonical = ? AND g.profile = ? "
+            "ORDER BY g.position, c.position, b.position",
+            (canonical, self.profile)
+        )
+
+
+class ProfileStorage(MemoryStorage):
+    """
+    多配置内存存储
+    各配置表示为共享基准之上的差异：视图中未修改的类别直接引用基准中的同一对象，
+    首次修改某类别时才复制该类别（写时复制）。切换配置只交换视图与索引的引用，
+    已激活过的配置保留其视图，再次切换无需重建
+    """
+
+    DEFAULT_PROFILE = "default"
+    FILE_VERSION = 1
+
+    def __init__(self):
+        """初始化多配置存储"""
+        super().__init__()
+        self._base: List[Dict[str, Any]] = []
+        self._base_positions: Dict[str, int] = {}
+        self._active = self.DEFAULT_PROFILE
+        self._owned: Set[str] = set()
+        self._category_positions: Dict[str, int] = {}
+        # 未激活过的配置以差异形式保存 {配置名: {category_id: {command_id: [快捷键]}}}
+        self._deltas: Dict[str, Dict[str, Dict[str, List[str]]]] = {self.DEFAULT_PROFILE: {}}
+        # 已激活过的配置视图 {配置名: 视图状态}
+        self._states: Dict[str, Tuple[Any, ...]] = {}
+
+    # ---- 视图状态 ----
+
+    def _capture(self) -> Tuple[Any, ...]:
+        """当前视图与索引的引用"""
+        return (self._data, self._items, self._positions, self._by_canonical,
+                self._owned, self._category_positions)
+
+    def _restore(self, state: Tuple[Any, ...]) -> None:
+        """换入视图与索引的引用"""
+        (self._data, self._items, self._positions, self._by_canonical,
+         self._owned, self._category_positions) = state
+
+    def _build(self, delta: Dict[str, Dict[str, List[str]]]) -> None:
+        """在基准上应用差异并建立索引，只复制差异涉及的类别"""
+        data = list(self._base)
+        owned = set()
+        for category_id, commands in delta.items():
+            position = self._base_positions.get(category_id)
+            if position is None:
+                data.append({"categoryId": category_id, "items": []})
+                position = len(data) - 1
+            else:
+                data[position] = self._copy_category(data[position])
+            owned.add(category_id)
+            items = {item["commandId"]: item for item in data[position]["items"]}
+            for command_id, shortcuts in commands.items():
+                if command_id in items:
+                    items[command_id]["shortcuts"] = list(shortcuts) or [""]
+                else:
+                    data[position]["items"].append(
+                        {"commandId": command_id, "shortcuts": list(shortcuts) or [""]}
+                    )
+        MemoryStorage.load(self, data)
+        self._owned = owned
+        self._category_positions = {
+            category.get("categoryId", ""): i for i, category in enumerate(data)
+        }
+
+    @staticmethod
+    def _copy_category(category: Dict[str, Any]) -> Dict[str, Any]:
+        """复制一个类别（快捷键列表也复制）"""
+        return {
+            "categoryId": category.get("categoryId", ""),
+            "items": [
+                {"commandId": item.get("commandId", ""), "shortcuts": list(item.get("shortcuts", []))}
+                for item in category.get("items", [])
+            ]
+        }
+
+    @staticmethod
+    def _normalize(data: List[Dict[str, Any]]) -> None:
+        """空快捷键列表统一为 [""]，避免加载后逐个类别被复制"""
+        for category in data:
+            for item in category.get("items", []):
+                if not item.get("shortcuts"):
+                    item["shortcuts"] = [""]
+
+    def _delta_of(self, data: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[str]]]:
+        """计算一份完整数据相对基准的差异（忽略空快捷键）"""
+        base_items = _index_items(self._base)
+        delta: Dict[str, Dict[str, List[str]]] = {}
+        for category in data:
+            category_id = category.get("categoryId", "")
+            for item in category.get("items", []):
+                command_id = item.get("commandId", "")
+                shortcuts = [s for s in item.get("shortcuts", []) if s]
+                base_item = base_items.get((category_id, command_id))
+                if base_item is None or shortcuts != [s for s in base_item.get("shortcuts", []) if s]:
+                    delta.setdefault(category_id, {})[command_id] = shortcuts
+        return delta
+
+    # ---- HotkeyStorage ----
+
+    def load(self, data: List[Dict[str, Any]]) -> None:
+        """
+        载入链接文件的数据
+
+        数据成为当前配置的内容与新的基准；其他配置保留原有内容，差异按新基准重新计算，
+        文件中已不存在的类别和命令从各配置中去除
+        """
+        data = _merge_duplicates(data)
+        self._normalize(data)
+        base_items = _index_items(self._base)
+        deltas = {}
+        for name in self.profiles():
+            if name == self._active:
+                continue
+            bindings = {
+                key: [s for s in item.get("shortcuts", []) if s] for key, item in base_items.items()
+            }
+            for category_id, commands in self.profile_delta(name).items():
+                for command_id, shortcuts in commands.items():
+                    bindings[(category_id, command_id)] = [s for s in shortcuts if s]
+            delta: Dict[str, Dict[str, List[str]]] = {}
+            for (category_id, command_id), item in _index_items(data).items():
+                shortcuts = bindings.get((category_id, command_id))
+                if shortcuts is not None and shortcuts != [s for s in item.get("shortcuts", []) if s]:
+                    delta.setdefault(category_id, {})[command_id] = shortcuts
+            deltas[name] = delta
+
+        self._base = data
+        self._base_positions = {
+            category.get("categoryId", ""): i for i, category in enumerate(data)
+        }
+        self._deltas = deltas
+        self._states.clear()
+        self._build({})
+
+    def set_shortcuts(self, category_id: str, command_id: str, shortcuts: List[str]) -> bool:
+        if (category_id, command_id) not in self._items:
+            return False
+        if category_id not in self._owned:
+            position = self._category_positions[category_id]
+            copy = self._copy_category(self._data[position])
+            self._data[position] = copy
+            for item in copy["items"]:
+                self._items[(category_id, item["commandId"])] = item
+            self._owned.add(category_id)
+        return super().set_shortcuts(category_id, command_id, shortcuts)
+
+    # ---- 配置 ----
+
+    def profiles(self) -> List[str]:
+        names = set(self._deltas) | set(self._states) | {self._active}
+        return sorted(names, key=lambda name: (name != self.DEFAULT_PROFILE, name))
+
+    def active_profile(self) -> str:
+        return self._active
+
+    def profile_delta(self, name: str) -> Dict[str, Dict[str, List[str]]]:
+        """
+        获取配置相对基准的差异
+
+        Args:
+            name: 配置名
+
+        Returns:
+            {category_id: {command_id: [快捷键]}}
+        """
+        if name == self._active:
+            state = self._capture()
+        else:
+            state = self._states.get(name)
+        if state is None:
+            return self._deltas.get(name, {})
+        data, owned = state[0], state[4]
+        return self._delta_of([category for category in data if category.get("categoryId", "") in owned])
+
+    def activate_profile(self, name: str) -> bool:
+        if name not in self.profiles():
+            return False
+        if name == self._active:
+            return True
+        self._states[self._active] = self._capture()
+        state = self._states.get(name)
+        if state is None:
+            self._build(self._deltas.pop(name, {}))
+        else:
+            self._restore(state)
+            del self._states[name]
+        self._active = name
+        return True
+
+    def create_profile(self, name: str, source: Optional[str] = None) -> bool:
+        if not name or name in self.profiles():
+            return False
+        self._deltas[name] = copy.deepcopy(self.profile_delta(source or self._active))
+        return True
+
+    def delete_profile(self, name: str) -> bool:
+        if name == self._active or name == self.DEFAULT_PROFILE or name not in self.profiles():
+            return False
+        self._deltas.pop(name, None)
+        self._states.pop(name, None)
+        return True
+
+    def save_file(self, path: str) -> bool:
+        """
+        将基准与各配置的差异写入文件
+
+        Args:
+            path: JSON 文件路径
+
+        Returns:
+            是否写入成功
+        """
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False)
+            return True
+        except Exception as e:
+            print(f"保存配置文件失败: {e}")
+            return False
+
+    def load_file(self, path: str) -> bool:
+        """
+        从文件恢复基准与各配置
+
+        Args:
+            path: JSON 文件路径
+
+        Returns:
+            是否读取成功
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return self.from_dict(json.load(f))
+        except Exception as e:
+            print(f"读取配置文件失败: {e}")
+            return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """序列化为基准与各配置的差异"""
+        return {
+            "version": self.FILE_VERSION,
+            "active": self._active,
+            "base": self._base,
+            "profiles": {name: self.profile_delta(name) for name in self.profiles()}
+        }
+
+    def from_dict(self, content: Dict[str, Any]) -> bool:
+        """
+        从 to_dict() 的结果恢复
+
+        Returns:
+            是否恢复成功
+        """
+        if content.get("version") != self.FILE_VERSION:
+            return False
+        self._base = _merge_duplicates(content.get("base", []))
+        self._normalize(self._base)
+        self._base_positions = {
+            category.get("categoryId", ""): i for i, category in enumerate(self._base)
+        }
+        self._deltas = dict(content.get("profiles", {}))
+        self._deltas.setdefault(self.DEFAULT_PROFILE, {})
+        self._states.clear()
+        self._active = content.get("active", self.DEFAULT_PROFILE)
+        if self._active not in self._deltas:
+            self._active = self.DEFAULT_PROFILE
+        self._build(self._deltas.pop(self._active))
+        return True
+
+
+def _index_items(data: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """(类别, 命令) 到快捷键项的索引"""
+    return {
+        (category.get("categoryId", ""), item.get("commandId", "")): item
+        for category in data
+        for item in category.get("items", [])
+    }
+
+
+def _merge_duplicates(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    合并重复的类别标题与重复的命令
+
+    类别与命令按首次出现的位置排列，重复的命令以最后一次出现的快捷键为准；
+    没有重复时直接返回原列表
+
+    Args:
+        data: 与 hotkeys.json 结构相同的类别列表
+
+    Returns:
+        合并后的类别列表（不修改传入的数据）
+    """
+    merged: List[Dict[str, Any]] = []
+    categories: Dict[str, Dict[str, Any]] = {}
+    positions: Dict[Tuple[str, str], int] = {}
+    duplicated = False
+    for category in data:
+        category_id = category.get("categoryId", "")
+        target = categories.get(category_id)
+        if target is None:
+            target = categories[category_id] = {"categoryId": category_id, "items": []}
+            merged.append(target)
+        else:
+            duplicated = True
+        for item in category.get("items", []):
+            key = (category_id, item.get("commandId", ""))
+            position = positions.get(key)
+            if position is None:
+                positions[key] = len(target["items"])
+                target["items"].append(item)
+            else:
+                target["items"][position] = item
+                duplicated = True
+    return merged if duplicated else data
+
+
+def create_storage(settings: Optional[Dict[str, Any]] = None) -> HotkeyStorage:
+    """
+    根据配置创建存储后端
+
+    Args:
+        settings: {"backend": "memory" | "sqlite", "path": 数据库路径, "profile": 配置名}
+
+    Returns:
+        存储后端实例（内存后端为支持多配置的 ProfileStorage）
+    """
+    settings = settings or {}
+    if settings.get("backend") == "sqlite":
+        return SQLiteStorage(settings.get("path") or ":memory:", settings.get("profile") or "default")
+    return ProfileStorage()
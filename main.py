@@ -3,6 +3,7 @@
 Spine 热键设置 GUI 程序入口
 """
 
+import multiprocessing
 import sys
 import os
 
@@ -12,20 +13,35 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from ui import HotkeyDialog
 from core.controller import Controller
+from utils.metrics import dump_metrics
+from utils.resource_cache import apply_application_resources
+from utils.resource_path import register_resource_bundle
+from utils.stall_watchdog import StallWatchdog
 
 
 def main():
     """程序主入口"""
+    multiprocessing.freeze_support()
+    
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
     app = QApplication(sys.argv)
     app.setApplicationName("Spine Hotkey GUI")
+    register_resource_bundle()
+    apply_application_resources()
     
     dialog = HotkeyDialog()
     controller = Controller(dialog)
     controller.initialize()
+    app.aboutToQuit.connect(controller.config_manager.flush)
+    app.aboutToQuit.connect(dump_metrics)
+    
+    watchdog = StallWatchdog.from_environment()
+    if watchdog is not None:
+        watchdog.start(app)
+        app.aboutToQuit.connect(watchdog.stop)
     dialog.show()
     
     sys.exit(app.exec())
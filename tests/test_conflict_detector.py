@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""冲突检测按物理按键组合比较时对同一命令重复绑定的处理"""
+
+from core.conflict_detector import ConflictDetector
+from core.hotkey_manager import HotkeyManager
+from core.storage import MemoryStorage
+
+
+def _manager(items):
+    manager = HotkeyManager(MemoryStorage())
+    manager.load_data([{"categoryId": "General", "items": items}])
+    return manager
+
+
+def test_equivalent_bindings_on_one_command_are_not_a_conflict():
+    manager = _manager([{"commandId": "A", "shortcuts": ["'!'", "shift + NUM_1"]}])
+    detector = ConflictDetector(manager)
+    assert detector.detect_all_conflicts() == {}
+    assert not detector.is_command_conflicting("'!'", "General", "A")
+    assert detector.get_conflicting_command_keys() == set()
+
+
+def test_equivalent_bindings_on_two_commands_still_conflict():
+    manager = _manager([
+        {"commandId": "A", "shortcuts": ["'!'", "shift + NUM_1"]},
+        {"commandId": "B", "shortcuts": ["F1"]},
+    ])
+    detector = ConflictDetector(manager)
+    detector.detect_all_conflicts()
+
+    manager.update_shortcut("General", "B", "F1", "shift + NUM_1")
+    conflicts = detector.detect_all_conflicts()
+    assert list(conflicts.values()) == [[("General", "A"), ("General", "B")]]
+
+    manager.update_shortcut("General", "B", "shift + NUM_1", "F1")
+    assert detector.detect_all_conflicts() == {}
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""一次性冲突解决方案的正确性"""
+
+import copy
+
+from core.conflict_detector import ConflictDetector
+from core.conflict_resolver import ConflictResolver
+from core.hotkey_manager import HotkeyManager
+from core.occupancy_index import OccupancyIndex
+from core.shortcut_finder import ShortcutFinder
+from core.storage import MemoryStorage
+
+DATA = [
+    {"categoryId": "General", "items": [
+        {"commandId": "Undo", "shortcuts": ["ctrl + Z"]},
+        {"commandId": "Redo", "shortcuts": ["ctrl + Z"]},
+        {"commandId": "Zoom", "shortcuts": ["ctrl + Z"]},
+        {"commandId": "Save", "shortcuts": ["ctrl + S"]},
+    ]},
+    {"categoryId": "Tree", "items": [
+        {"commandId": "Select", "shortcuts": ["ctrl + S", "'!'"]},
+        {"commandId": "Expand", "shortcuts": ["shift + NUM_1"]},
+    ]},
+]
+
+
+def _resolver(data):
+    manager = HotkeyManager(MemoryStorage())
+    manager.load_data(copy.deepcopy(data))
+    detector = ConflictDetector(manager)
+    finder = ShortcutFinder(OccupancyIndex(manager))
+    return manager, detector, ConflictResolver(manager, detector, finder)
+
+
+def test_resolve_leaves_no_conflicts():
+    manager, detector, resolver = _resolver(DATA)
+    assert len(detector.detect_all_conflicts()) == 3
+
+    changes = resolver.resolve()
+    assert manager.apply_changes(changes) == len(changes)
+    assert detector.detect_all_conflicts() == {}
+    # 每个冲突快捷键都保留给其中一个命令
+    kept = {shortcut for _, _, shortcut, _ in manager.get_all_shortcuts()}
+    assert {"ctrl + Z", "ctrl + S"} <= kept
+
+
+def test_resolve_never_moves_pinned_bindings():
+    manager, detector, resolver = _resolver(DATA)
+    pinned = {"General": ["Redo"], "Tree": ["Select"]}
+
+    changes = resolver.resolve(pinned=pinned)
+    moved = {(category_id, command_id) for category_id, command_id, _, _ in changes}
+    assert not moved & {("General", "Redo"), ("Tree", "Select")}
+    assert ("General", "Save") in moved
+
+    manager.apply_changes(changes)
+    assert detector.detect_all_conflicts() == {}
+    assert manager.storage.get_shortcuts("General", "Redo") == ["ctrl + Z"]
+    assert manager.storage.get_shortcuts("Tree", "Select") == ["ctrl + S", "'!'"]
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""类别作用域对冲突判断的影响"""
+
+from core.conflict_detector import ConflictDetector
+from core.conflict_scopes import ConflictScopes
+from core.hotkey_manager import HotkeyManager
+from core.storage import MemoryStorage
+
+SETUP = ("Setup Mode", "bones")
+ANIMATE = ("Animate Mode", "keys")
+GENERAL = ("General", "undo")
+
+
+def test_categories_overlap_unless_excluded():
+    scopes = ConflictScopes({"Setup Mode": ["Animate Mode"]})
+    assert not scopes.overlaps("Setup Mode", "Animate Mode")
+    assert not scopes.overlaps("Animate Mode", "Setup Mode")
+    assert scopes.overlaps("Setup Mode", "General")
+    assert scopes.overlaps("Setup Mode", "Setup Mode")
+    assert scopes.to_config() == {"Setup Mode": ["Animate Mode"]}
+
+
+def test_exclusion_suppresses_conflict():
+    assert ConflictScopes().conflicting([SETUP, ANIMATE]) == [SETUP, ANIMATE]
+    scopes = ConflictScopes({"Setup Mode": ["Animate Mode"]})
+    assert scopes.conflicting([SETUP, ANIMATE]) == []
+    # 与两者都重叠的类别仍然冲突，两个互斥类别各自与它冲突
+    assert scopes.conflicting([SETUP, ANIMATE, GENERAL]) == [SETUP, ANIMATE, GENERAL]
+    # 同一类别中的两个命令总是冲突
+    assert scopes.conflicting([SETUP, ("Setup Mode", "slots"), ANIMATE]) == [SETUP, ("Setup Mode", "slots")]
+
+
+def test_detector_follows_scope_changes():
+    manager = HotkeyManager(MemoryStorage())
+    manager.load_data([
+        {"categoryId": "Setup Mode", "items": [{"commandId": "bones", "shortcuts": ["B"]}]},
+        {"categoryId": "Animate Mode", "items": [{"commandId": "keys", "shortcuts": ["B"]}]},
+    ])
+    detector = ConflictDetector(manager, ConflictScopes({"Setup Mode": ["Animate Mode"]}))
+    assert detector.detect_all_conflicts() == {}
+    assert detector.get_conflicting_commands("B", "Setup Mode", "bones") == []
+
+    detector.set_scopes(ConflictScopes())
+    assert detector.detect_all_conflicts() == {"B": [SETUP, ANIMATE]}
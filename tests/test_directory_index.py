@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""目录索引的原子写入与扫描范围"""
+
+import os
+
+from core.directory_index import DirectoryIndex
+
+
+def test_failed_save_keeps_previous_index(tmp_path):
+    index = DirectoryIndex(str(tmp_path))
+    index.files = {"a.txt": {"hash": "1"}}
+    assert index.save()
+
+    index.files = {"b.txt": {"hash": object()}}
+    assert not index.save()
+
+    assert os.listdir(tmp_path) == [os.path.basename(index.index_path)]
+    assert DirectoryIndex(str(tmp_path)).files == {"a.txt": {"hash": "1"}}
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_rescan_skips_files_that_are_not_keymaps(tmp_path):
+    _write(tmp_path / "hotkeys-a.txt", "--- General ---\nUndo: ctrl + Z\n")
+    _write(tmp_path / "hotkeys-b.txt", "--- General ---\nUndo: \n")
+    _write(tmp_path / "README.txt", "Team keymaps live here.\n")
+    _write(tmp_path / "hotkeys-notes.txt", "todo: share the animate layout\n")
+
+    index = DirectoryIndex(str(tmp_path))
+    stats = index.rescan()
+
+    assert sorted(index.files) == ["hotkeys-a.txt", "hotkeys-b.txt"]
+    assert stats["added"] == 2 and stats["failed"] == 0
+    assert index.files_lacking("Undo") == ["hotkeys-b.txt"]
+
+
+def test_rescan_drops_previously_indexed_non_keymaps(tmp_path):
+    _write(tmp_path / "hotkeys-a.txt", "--- General ---\nUndo: ctrl + Z\n")
+    index = DirectoryIndex(str(tmp_path))
+    index.files = {"README.txt": {"mtime": 0, "size": 0, "hash": "", "commands": {}}}
+    _write(tmp_path / "README.txt", "Team keymaps live here.\n")
+
+    stats = index.rescan()
+
+    assert sorted(index.files) == ["hotkeys-a.txt"]
+    assert stats["removed"] == 1
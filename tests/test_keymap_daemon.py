@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""守护进程的写入白名单与参数校验"""
+
+import json
+
+import pytest
+
+from core.keymap_daemon import KeymapDaemon
+
+CONTENT = "--- General ---\nundo: ctrl + Z\n--- Menu ---\na: ctrl + A\n"
+
+
+def _call(daemon, method, **params):
+    line = json.dumps({"id": 1, "method": method, "params": params}).encode("utf-8")
+    return json.loads(daemon.handle_message(line))
+
+
+@pytest.fixture
+def keymap_file(tmp_path):
+    path = tmp_path / "hotkeys.txt"
+    path.write_text(CONTENT, encoding="utf-8")
+    return path
+
+
+def test_apply_rejects_paths_outside_allowlist(tmp_path, keymap_file):
+    daemon = KeymapDaemon(str(tmp_path / "d.sock"))
+    response = _call(daemon, "apply", path=str(keymap_file), changes=[["Menu", "a", "ctrl + A", "ctrl + B"]])
+    assert "不允许写入" in response["error"]
+    assert keymap_file.read_text(encoding="utf-8") == CONTENT
+
+    # 不写回的修改只影响内存
+    response = _call(daemon, "apply", path=str(keymap_file),
+                     changes=[["Menu", "a", "ctrl + A", "ctrl + B"]], write=False)
+    assert response["result"]["applied"] == 1
+    assert keymap_file.read_text(encoding="utf-8") == CONTENT
+
+
+def test_apply_writes_preloaded_and_allowed_files(tmp_path, keymap_file):
+    daemon = KeymapDaemon(str(tmp_path / "d.sock"))
+    daemon.preload(str(keymap_file))
+    response = _call(daemon, "apply", path=str(keymap_file), changes=[["Menu", "a", "ctrl + A", "ctrl + B"]])
+    assert response["result"]["applied"] == 1
+    assert "ctrl + B" in keymap_file.read_text(encoding="utf-8")
+
+    other = tmp_path / "team" / "hotkeys.txt"
+    other.parent.mkdir()
+    other.write_text(CONTENT, encoding="utf-8")
+    daemon = KeymapDaemon(str(tmp_path / "d.sock"), allowed_paths=[str(other.parent)])
+    assert _call(daemon, "apply", path=str(other), changes=[])["result"]["applied"] == 0
+    assert "error" in _call(daemon, "apply", path=str(keymap_file), changes=[])
+
+
+def test_invalid_params_are_reported(tmp_path, keymap_file):
+    daemon = KeymapDaemon(str(tmp_path / "d.sock"))
+    assert "参数错误" in _call(daemon, "lookup", path=str(keymap_file))["error"]
+    assert "参数错误" in _call(daemon, "lookup", path=1, shortcut="A")["error"]
+    assert "参数错误" in _call(daemon, "apply", path=str(keymap_file), changes=[["Menu"]], write=False)["error"]
+
+
+def test_internal_errors_are_not_reported_as_parameter_errors(tmp_path, keymap_file, monkeypatch):
+    daemon = KeymapDaemon(str(tmp_path / "d.sock"))
+
+    def broken(path, shortcut):
+        raise TypeError("bug")
+
+    monkeypatch.setitem(daemon._methods, "lookup", broken)
+    error = _call(daemon, "lookup", path=str(keymap_file), shortcut="A")["error"]
+    assert error.startswith("内部错误")
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""三方合并的冲突判定与 merge 命令的退出码"""
+
+import json
+
+import cli
+from core.conflict_scopes import ConflictScopes
+from core.keymap_merge import (
+    CONFLICT_BOTH_MODIFIED, CONFLICT_COLLISION, CONFLICT_MODIFY_DELETE, merge_keymaps
+)
+from utils.file_converter import FileConverter
+
+
+def _keymap(**commands):
+    return [{"categoryId": "Menu", "items": [
+        {"commandId": command_id, "shortcuts": shortcuts}
+        for command_id, shortcuts in commands.items()
+    ]}]
+
+
+def _shortcuts(merged):
+    return {item["commandId"]: item["shortcuts"] for item in merged[0]["items"]}
+
+
+def test_non_overlapping_changes_merge_cleanly():
+    base = _keymap(a=["ctrl + A"], b=["ctrl + B"])
+    ours = _keymap(a=["ctrl + Q"], b=["ctrl + B"])
+    theirs = _keymap(a=["ctrl + A"], b=["ctrl + W"], c=["ctrl + E"])
+
+    merged, conflicts = merge_keymaps(base, ours, theirs)
+
+    assert conflicts == []
+    assert _shortcuts(merged) == {"a": ["ctrl + Q"], "b": ["ctrl + W"], "c": ["ctrl + E"]}
+
+
+def test_both_modified_keeps_ours_and_reports():
+    base = _keymap(a=["ctrl + A"])
+    merged, conflicts = merge_keymaps(base, _keymap(a=["ctrl + Q"]), _keymap(a=["ctrl + W"]))
+
+    assert [c["kind"] for c in conflicts] == [CONFLICT_BOTH_MODIFIED]
+    assert _shortcuts(merged) == {"a": ["ctrl + Q"]}
+
+
+def test_modify_delete_keeps_modification():
+    base = _keymap(a=["ctrl + A"], b=["ctrl + B"])
+    merged, conflicts = merge_keymaps(base, _keymap(a=["ctrl + Q"], b=["ctrl + B"]), _keymap(b=["ctrl + B"]))
+
+    assert [(c["kind"], c["command"]) for c in conflicts] == [(CONFLICT_MODIFY_DELETE, "a")]
+    assert _shortcuts(merged)["a"] == ["ctrl + Q"]
+
+
+def test_collision_respects_scopes():
+    base = [{"categoryId": "Setup", "items": [{"commandId": "a", "shortcuts": []}]},
+            {"categoryId": "Animate", "items": [{"commandId": "b", "shortcuts": ["ctrl + K"]}]}]
+    theirs = [{"categoryId": "Setup", "items": [{"commandId": "a", "shortcuts": ["ctrl + K"]}]},
+              base[1]]
+
+    _, conflicts = merge_keymaps(base, base, theirs)
+    assert [c["kind"] for c in conflicts] == [CONFLICT_COLLISION]
+
+    _, conflicts = merge_keymaps(base, base, theirs, ConflictScopes({"Setup": ["Animate"]}))
+    assert conflicts == []
+
+
+def _write(path, data):
+    FileConverter.write_hotkey_file(data, str(path))
+    return str(path)
+
+
+def test_cli_exit_code_reflects_remaining_conflicts(tmp_path, capsys):
+    base = _write(tmp_path / "base.txt", _keymap(a=["ctrl + A"]))
+    theirs = _write(tmp_path / "theirs.txt", _keymap(a=["ctrl + W"]))
+    clean = _write(tmp_path / "clean.txt", _keymap(a=["ctrl + A"]))
+    conflicting = _write(tmp_path / "conflicting.txt", _keymap(a=["ctrl + Q"]))
+    report = str(tmp_path / "report.json")
+
+    assert cli.main(["merge", base, theirs, clean, "--output", str(tmp_path / "out.txt"),
+                     "--report", report]) == 0
+    assert cli.main(["merge", base, theirs, conflicting, "--output", str(tmp_path / "out.txt"),
+                     "--report", report]) == 1
+    with open(report, encoding='utf-8') as f:
+        assert [c["kind"] for c in json.load(f)[conflicting]] == [CONFLICT_BOTH_MODIFIED]
+    assert cli.main(["merge", base, theirs, str(tmp_path / "missing.txt"),
+                     "--output", str(tmp_path / "out.txt")]) == 2
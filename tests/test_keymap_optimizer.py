@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""键位优化在可用编码不足与类别作用域下的分配"""
+
+from core.conflict_scopes import ConflictScopes
+from core.hotkey_manager import HotkeyManager
+from core.keymap_optimizer import KeymapOptimizer, optimize
+from core.storage import ProfileStorage
+from utils.shortcut_codec import canonical_keystroke, encode_key
+
+
+def _code(shortcut):
+    key_name, mask, _ = canonical_keystroke(shortcut)
+    return encode_key(key_name, mask)
+
+
+def _manager(data):
+    manager = HotkeyManager(ProfileStorage())
+    manager.load_data(data)
+    return manager
+
+
+def _restrict(problem, shortcuts):
+    """只允许分配到给定快捷键，且按给定顺序由便宜到贵"""
+    codes = [_code(shortcut) for shortcut in shortcuts]
+    problem["targets"] = [code in codes for code in range(len(problem["targets"]))]
+    problem["slot_costs"] = [10.0] * len(problem["slot_costs"])
+    for rank, code in enumerate(codes):
+        problem["slot_costs"][code] = float(rank)
+    return problem
+
+
+def test_reports_unplaced_when_free_slots_run_out():
+    manager = _manager([{"categoryId": "Menu", "items": [
+        {"commandId": name, "shortcuts": ["ctrl + A"]} for name in ("a", "b", "c")
+    ]}])
+    problem = _restrict(KeymapOptimizer(manager).build_problem(), ["ctrl + A", "ctrl + B"])
+
+    assignment, _, _, unplaced = optimize(problem, time_budget=0.0, seed=0)
+
+    assert unplaced == [2]
+    assert assignment == [_code("ctrl + A"), _code("ctrl + B"), _code("ctrl + A")]
+    changes = KeymapOptimizer.changes_from_assignment(problem, assignment)
+    assert [change[1] for change in changes] == ["b"]
+
+
+def test_exclusive_scopes_share_slots():
+    data = [
+        {"categoryId": "Menu", "items": [{"commandId": "a", "shortcuts": ["ctrl + B"]}]},
+        {"categoryId": "Timeline", "items": [{"commandId": "x", "shortcuts": ["ctrl + A"]}]},
+    ]
+    manager = _manager(data)
+    pinned = {"Timeline": ["x"]}
+
+    scoped = KeymapOptimizer(manager, pinned=pinned, change_penalty=0.0,
+                             scopes=ConflictScopes({"Menu": ["Timeline"]}))
+    problem = _restrict(scoped.build_problem(), ["ctrl + A", "ctrl + B"])
+    assignment, _, best_cost, unplaced = optimize(problem, time_budget=0.2, seed=0)
+    assert unplaced == []
+    assert assignment == [_code("ctrl + A")]
+    assert best_cost == 0.0
+
+    shared = KeymapOptimizer(manager, pinned=pinned, change_penalty=0.0)
+    problem = _restrict(shared.build_problem(), ["ctrl + A", "ctrl + B"])
+    assignment, _, _, _ = optimize(problem, time_budget=0.2, seed=0)
+    assert assignment == [_code("ctrl + B")]
+
+
+def test_conflicts_resolved_only_within_overlapping_scopes():
+    data = [
+        {"categoryId": "Menu", "items": [
+            {"commandId": "a", "shortcuts": ["ctrl + A"]},
+            {"commandId": "b", "shortcuts": ["ctrl + A"]},
+        ]},
+        {"categoryId": "Timeline", "items": [{"commandId": "x", "shortcuts": ["ctrl + A"]}]},
+    ]
+    optimizer = KeymapOptimizer(_manager(data), scopes=ConflictScopes({"Menu": ["Timeline"]}))
+    problem = _restrict(optimizer.build_problem(), ["ctrl + A", "ctrl + B"])
+
+    assignment, _, _, unplaced = optimize(problem, time_budget=0.2, seed=0)
+
+    assert unplaced == []
+    menu = sorted(assignment[:2])
+    assert menu == sorted([_code("ctrl + A"), _code("ctrl + B")])
+    assert assignment[2] == _code("ctrl + A")
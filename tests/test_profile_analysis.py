@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""分析结果中的数值在序列化时不带 float32 表示误差"""
+
+import json
+
+from core.profile_analysis import ProfileAnalyzer
+
+
+def _profile(letters):
+    return [{"categoryId": "Menu", "items": [
+        {"commandId": letter, "shortcuts": [f"ctrl + {letter}"]} for letter in letters
+    ]}]
+
+
+def test_divergence_is_serialized_with_rounded_values():
+    analyzer = ProfileAnalyzer()
+    analyzer.add_profile("a", _profile("ABCDEFG"))
+    analyzer.add_profile("b", _profile("ABCDEHI"))
+
+    result = analyzer.analyze("a")
+
+    # Jaccard 距离 1 - 5/9
+    assert result["divergence"][0][1] == 0.4444
+    text = json.dumps(result)
+    assert "0.4444," in text or "0.4444]" in text
+    assert "0.44440" not in text
+    assert result["drift"][1]["distance"] == 0.4444
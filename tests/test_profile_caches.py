@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""按配置缓存的索引在切换、删除与重建配置后的一致性"""
+
+import pytest
+
+from core.conflict_detector import ConflictDetector
+from core.default_catalog import DefaultCatalog, DefaultsTracker
+from core.hotkey_manager import HotkeyManager
+from core.keymap_filters import FILTER_MULTI_BOUND, FILTER_UNBOUND, KeymapFilters
+from core.occupancy_index import OccupancyIndex
+from core.storage import ProfileStorage
+
+DATA = [{"categoryId": "Menu", "items": [
+    {"commandId": "a", "shortcuts": ["ctrl + A"]},
+    {"commandId": "b", "shortcuts": ["ctrl + B"]},
+]}]
+
+
+@pytest.fixture
+def manager():
+    manager = HotkeyManager(ProfileStorage())
+    manager.load_data(DATA)
+    return manager
+
+
+def _make_conflict(manager):
+    manager.update_shortcut("Menu", "b", "ctrl + B", "ctrl + A")
+
+
+def test_switch_keeps_per_profile_state(manager):
+    detector = ConflictDetector(manager)
+    default = manager.active_profile()
+    assert manager.create_profile("foo")
+    assert manager.switch_profile("foo")
+    _make_conflict(manager)
+    assert "ctrl + A" in detector.detect_all_conflicts()
+
+    assert manager.switch_profile(default)
+    assert detector.detect_all_conflicts() == {}
+    assert manager.switch_profile("foo")
+    assert "ctrl + A" in detector.detect_all_conflicts()
+
+
+def test_recreated_profile_does_not_reuse_deleted_state(manager):
+    detector = ConflictDetector(manager)
+    occupancy = OccupancyIndex(manager)
+    filters = KeymapFilters(manager, detector)
+    tracker = DefaultsTracker(manager, DefaultCatalog("test", {
+        ("Menu", "a"): ["ctrl + A"], ("Menu", "b"): ["ctrl + B"]
+    }))
+    default = manager.active_profile()
+
+    manager.create_profile("foo")
+    manager.switch_profile("foo")
+    _make_conflict(manager)
+    manager.add_shortcut("Menu", "a", "ctrl + Z")
+    assert "ctrl + A" in detector.detect_all_conflicts()
+    manager.switch_profile(default)
+    assert manager.delete_profile("foo")
+
+    manager.create_profile("foo")
+    manager.switch_profile("foo")
+    assert detector.detect_all_conflicts() == {}
+    assert not occupancy.is_conflicted(occupancy.space.encode("ctrl + A"))
+    assert filters.results(FILTER_MULTI_BOUND) == []
+    assert filters.results(FILTER_UNBOUND) == []
+    assert not tracker.is_customized("Menu", "b")
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""快捷键规范化：字符模式字面量与一般模式按键的等价关系"""
+
+import pytest
+
+from utils.shortcut_codec import ShortcutSpace, canonical_keystroke, canonical_shortcut
+
+
+@pytest.mark.parametrize("shortcut, canonical", [
+    ("'!'", "shift + NUM_1"),
+    ("shift + NUM_1", "shift + NUM_1"),
+    ("ctrl + '!'", "ctrl + shift + NUM_1"),
+    ("shift + ctrl + A", "ctrl + shift + A"),
+    ("'a'", "A"),
+    ("'A'", "shift + A"),
+    ("'1'", "NUM_1"),
+    ("' '", "SPACE"),
+])
+def test_equivalent_spellings_share_a_canonical_form(shortcut, canonical):
+    assert canonical_shortcut(shortcut) == canonical
+    assert canonical_shortcut(canonical) == canonical
+
+
+def test_distinct_keystrokes_stay_distinct():
+    assert canonical_shortcut("'1'") != canonical_shortcut("'!'")
+    assert canonical_shortcut("'a'") != canonical_shortcut("'A'")
+
+
+def test_unmapped_input_is_kept():
+    assert canonical_shortcut("bogus + X") == "bogus + X"
+    assert canonical_keystroke("'€'") == ("€", 0, True)
+    assert canonical_shortcut("'€'") == "'€'"
+
+
+def test_space_encodes_equivalent_spellings_to_one_code():
+    space = ShortcutSpace()
+    assert space.encode("'!'") == space.encode("shift + NUM_1")
+    assert space.encode("'!'") != space.encode("NUM_1")
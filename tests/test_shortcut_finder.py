@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""空闲快捷键推荐随占用变化的正确性"""
+
+from core.hotkey_manager import HotkeyManager
+from core.occupancy_index import OccupancyIndex
+from core.shortcut_finder import ShortcutFinder
+from core.storage import MemoryStorage
+
+
+def _finder():
+    manager = HotkeyManager(MemoryStorage())
+    manager.load_data([{"categoryId": "General", "items": [
+        {"commandId": "Undo", "shortcuts": ["ctrl + Z"]},
+        {"commandId": "Duplicate", "shortcuts": ["D"]},
+        {"commandId": "Zoom", "shortcuts": [""]},
+    ]}])
+    occupancy = OccupancyIndex(manager)
+    return manager, occupancy, ShortcutFinder(occupancy)
+
+
+def test_suggestions_are_free():
+    _, occupancy, finder = _finder()
+    suggestions = finder.suggest(["Duplicate"], ["D"], limit=8)
+    assert len(suggestions) == 8
+    assert len(set(suggestions)) == 8
+    assert "D" not in suggestions
+    assert all(occupancy.is_shortcut_free(shortcut) for shortcut in suggestions)
+
+
+def test_suggestions_follow_edits():
+    manager, occupancy, finder = _finder()
+    first = finder.suggest(["Zoom"])[0]
+    assert manager.add_shortcut("General", "Zoom", first)
+    assert not occupancy.is_shortcut_free(first)
+    assert first not in finder.suggest(["Zoom"])
+
+    # 移走的快捷键重新成为候选，新占用的不再出现
+    space = occupancy.space
+    assert space.encode("ctrl + Z") not in finder.score_candidates(["Zoom"])
+    assert manager.update_shortcut("General", "Undo", "ctrl + Z", "F12")
+    scores = finder.score_candidates(["Zoom"])
+    assert space.encode("ctrl + Z") in scores
+    assert space.encode("F12") not in scores
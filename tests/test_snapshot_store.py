@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""快照保留策略：受保护的记录不应在每次写入时触发清理"""
+
+import time
+
+from utils.snapshot_store import KIND_SAVE, SnapshotStore
+
+
+def _count_prunes(store, monkeypatch):
+    calls = []
+    prune = store.prune
+
+    def counting_prune():
+        calls.append(1)
+        return prune()
+
+    monkeypatch.setattr(store, "prune", counting_prune)
+    return calls
+
+
+def test_protected_old_entry_does_not_trigger_prune(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path), max_snapshots=0, max_age_days=1)
+    store.add(b"old", KIND_SAVE, str(tmp_path / "a.txt"))
+    # 来源 a 的唯一记录已过期，但作为其最新记录受保护
+    store._load_entries()[0]["time"] = time.time() - 3 * 86400
+    calls = _count_prunes(store, monkeypatch)
+
+    for i in range(5):
+        store.add(b"b%d" % i, KIND_SAVE, str(tmp_path / "b.txt"))
+
+    assert calls == []
+    assert len(store.entries()) == 6
+
+
+def test_prune_runs_when_entries_are_removable(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path), max_snapshots=2)
+    source = str(tmp_path / "a.txt")
+    for i in range(2):
+        store.add(b"v%d" % i, KIND_SAVE, source)
+    calls = _count_prunes(store, monkeypatch)
+
+    store.add(b"v2", KIND_SAVE, source)
+
+    assert calls == [1]
+    assert [entry["size"] for entry in store.entries()] == [2, 2]
+    assert store.read(store.entries()[0]["hash"]) == b"v2"
+
+
+def test_count_limit_ignores_protected_sources(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path), max_snapshots=2)
+    calls = _count_prunes(store, monkeypatch)
+    for i in range(4):
+        store.add(b"x", KIND_SAVE, str(tmp_path / ("%d.txt" % i)))
+
+    assert calls == []
+    assert len(store.entries()) == 4
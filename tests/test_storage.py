@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""存储后端对重复类别与重复命令的处理"""
+
+import copy
+import sqlite3
+
+import pytest
+
+from core.storage import HotkeyStorage, MemoryStorage, ProfileStorage, SQLiteStorage
+from utils.file_converter import FileConverter
+
+
+def _both():
+    return [MemoryStorage(), SQLiteStorage()]
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        HotkeyStorage()
+
+
+@pytest.mark.parametrize("storage", _both(), ids=["memory", "sqlite"])
+def test_duplicate_command_uses_last_occurrence(storage):
+    storage.load([{"categoryId": "Menu", "items": [
+        {"commandId": "a", "shortcuts": ["ctrl + A"]},
+        {"commandId": "b", "shortcuts": ["ctrl + B"]},
+        {"commandId": "a", "shortcuts": ["ctrl + Z", "F2"]},
+    ]}])
+    assert storage.get_shortcuts("Menu", "a") == ["ctrl + Z", "F2"]
+    assert storage.get_shortcuts("Menu", "b") == ["ctrl + B"]
+
+
+def test_sqlite_merges_repeated_category_headers():
+    lines = [
+        "--- Menu ---\n", "a: ctrl + A\n",
+        "--- Tools ---\n", "t: T\n",
+        "--- Menu ---\n", "b: ctrl + B\n",
+    ]
+    storage = SQLiteStorage()
+    storage.load(FileConverter.parse_txt_lines(lines))
+    assert storage.get_categories() == ["Menu", "Tools"]
+    assert [item["commandId"] for item in storage.get_items("Menu")] == ["a", "b"]
+    assert storage.get_shortcuts("Menu", "b") == ["ctrl + B"]
+
+
+@pytest.mark.parametrize("storage", _both() + [ProfileStorage()], ids=["memory", "sqlite", "profiles"])
+def test_backends_merge_repeated_categories_alike(storage):
+    data = [
+        {"categoryId": "General", "items": [{"commandId": "A", "shortcuts": ["F1"]}]},
+        {"categoryId": "Tree", "items": [{"commandId": "B", "shortcuts": ["F2"]}]},
+        {"categoryId": "General", "items": [
+            {"commandId": "A", "shortcuts": ["F3"]},
+            {"commandId": "C", "shortcuts": ["F4"]},
+        ]},
+    ]
+    reference = SQLiteStorage()
+    reference.load(copy.deepcopy(data))
+    storage.load(copy.deepcopy(data))
+
+    assert storage.export() == reference.export() == [
+        {"categoryId": "General", "items": [
+            {"commandId": "A", "shortcuts": ["F3"]},
+            {"commandId": "C", "shortcuts": ["F4"]},
+        ]},
+        {"categoryId": "Tree", "items": [{"commandId": "B", "shortcuts": ["F2"]}]},
+    ]
+    assert storage.all_shortcuts() == reference.all_shortcuts()
+    assert storage.find_canonical("F1") == []
+
+
+def test_sqlite_query_is_read_only():
+    storage = SQLiteStorage()
+    storage.load([{"categoryId": "Menu", "items": [{"commandId": "a", "shortcuts": ["A"]}]}])
+    assert storage.query("SELECT COUNT(*) FROM bindings") == [(1,)]
+    with pytest.raises(sqlite3.Error):
+        storage.query("DELETE FROM bindings")
+    assert storage.get_shortcuts("Menu", "a") == ["A"]
+    assert storage.set_shortcuts("Menu", "a", ["B"])
+    assert storage.get_shortcuts("Menu", "a") == ["B"]
+
+
+def _menu(**bindings):
+    return {"categoryId": "Menu", "items": [
+        {"commandId": command_id, "shortcuts": [shortcut]} for command_id, shortcut in bindings.items()
+    ]}
+
+
+def test_profile_import_rebases_and_drops_removed_commands():
+    storage = ProfileStorage()
+    storage.load([_menu(a="ctrl + A", b="ctrl + B", c="ctrl + C"),
+                  {"categoryId": "Tools", "items": [{"commandId": "t", "shortcuts": ["T"]}]}])
+    assert storage.create_profile("work")
+    assert storage.activate_profile("work")
+    assert storage.set_shortcuts("Menu", "b", ["F2"])
+    assert storage.set_shortcuts("Menu", "c", ["F3"])
+
+    imported = [_menu(a="F1", b="F2", d="F4")]
+    storage.load(imported)
+
+    assert storage.export() == imported
+    assert storage.get_shortcuts("Menu", "c") is None
+    assert [s for _, _, s, _ in storage.all_shortcuts()] == ["F1", "F2", "F4"]
+
+    assert storage.activate_profile("default")
+    assert storage.get_categories() == ["Menu"]
+    assert storage.get_shortcuts("Menu", "a") == ["ctrl + A"]
+    assert storage.get_shortcuts("Menu", "b") == ["ctrl + B"]
+    assert storage.get_shortcuts("Menu", "c") is None
+    assert storage.get_shortcuts("Menu", "d") == ["F4"]
+
+    restored = ProfileStorage()
+    assert restored.from_dict(storage.to_dict())
+    assert restored.export() == storage.export()
+    assert restored.activate_profile("work")
+    assert restored.export() == imported
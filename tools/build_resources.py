@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+编译资源包
+将图标、样式表与语言包编译为单个 Qt 二进制资源包（resources.rcc），
+程序启动时只需打开并内存映射这一个文件，代替逐个读取散装文件
+
+用法：
+    python tools/build_resources.py [-o resources.rcc] [--rcc 路径]
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import List, Optional
+from xml.sax.saxutils import escape
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.resource_path import BUNDLED_DIRS, RESOURCE_BUNDLE
+
+# 各目录中编译进资源包的文件
+PATTERNS = {
+    "icon": ("*.png", "*.ico", "*.svg"),
+    "styles": ("*.qss",),
+    "language": ("*.json",),
+}
+
+
+def collect_files(root: str) -> List[str]:
+    """
+    收集要编译的资源文件
+
+    Args:
+        root: 项目根目录
+
+    Returns:
+        相对路径列表（以 / 分隔）
+    """
+    files = []
+    for directory in BUNDLED_DIRS:
+        for pattern in PATTERNS.get(directory, ("*",)):
+            for path in glob.glob(os.path.join(root, directory, pattern)):
+                files.append(os.path.relpath(path, root).replace(os.sep, '/'))
+    return sorted(set(files))
+
+
+def write_qrc(files: List[str], qrc_path: str) -> None:
+    """写入 .qrc 清单（资源路径与相对路径相同，如 :/icon/warning.png）"""
+    lines = ['<!DOCTYPE RCC>', '<RCC version="1.0">', '<qresource prefix="/">']
+    for relative in files:
+        lines.append(f'    <file alias="{escape(relative)}">{escape(relative)}</file>')
+    lines.extend(['</qresource>', '</RCC>', ''])
+    with open(qrc_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines))
+
+
+def find_rcc() -> Optional[List[str]]:
+    """查找资源编译器（PySide6 自带的 pyside6-rcc 或 Qt 的 rcc）"""
+    for name in ("pyside6-rcc", "rcc"):
+        path = shutil.which(name)
+        if path:
+            return [path]
+    try:
+        import PySide6
+        package_dir = os.path.dirname(PySide6.__file__)
+        for candidate in ("rcc", "rcc.exe", os.path.join("Qt", "libexec", "rcc")):
+            path = os.path.join(package_dir, candidate)
+            if os.path.isfile(path):
+                return [path]
+    except ImportError:
+        pass
+    return None
+
+
+def build(output: str, rcc: Optional[List[str]] = None, root: str = ROOT_DIR) -> int:
+    """
+    编译资源包
+
+    Args:
+        output: 输出文件路径
+        rcc: 资源编译器命令（None 表示自动查找）
+        root: 项目根目录
+
+    Returns:
+        退出码
+    """
+    files = collect_files(root)
+    if not files:
+        print("未找到要编译的资源文件", file=sys.stderr)
+        return 1
+
+    rcc = rcc or find_rcc()
+    if rcc is None:
+        print("未找到资源编译器 pyside6-rcc", file=sys.stderr)
+        return 1
+
+    # .qrc 中的路径相对于清单所在目录，因此清单写在项目根目录
+    fd, qrc_path = tempfile.mkstemp(suffix=".qrc", dir=root)
+    os.close(fd)
+    try:
+        write_qrc(files, qrc_path)
+        result = subprocess.run(
+            rcc + ["--binary", "--compress-algo", "zlib", "-o", output, qrc_path],
+            cwd=root, capture_output=True, text=True
+        )
+    finally:
+        os.remove(qrc_path)
+
+    if result.returncode != 0:
+        print(result.stderr or result.stdout, file=sys.stderr)
+        return result.returncode
+
+    print(f"已编译 {len(files)} 个文件 -> {output} ({os.path.getsize(output)} 字节)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="将图标、样式表与语言包编译为 Qt 二进制资源包")
+    parser.add_argument("-o", "--output", default=os.path.join(ROOT_DIR, RESOURCE_BUNDLE),
+                        help=f"输出文件（默认为项目根目录下的 {RESOURCE_BUNDLE}）")
+    parser.add_argument("--rcc", help="资源编译器路径（默认自动查找 pyside6-rcc）")
+    args = parser.parse_args()
+    return build(os.path.abspath(args.output), [args.rcc] if args.rcc else None)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,16 @@
 """UI模块"""
 
 from .hotkey_dialog import HotkeyDialog
-from .dialogs import InfoDialog, ConfirmDialog, KeyInputDialog, AlertDialog
+from .dialogs import (
+    InfoDialog, ConfirmDialog, KeyInputDialog, AlertDialog, ChangePreviewDialog, TextInputDialog
+)
+from .keyboard_view import KeyboardView, KeyboardHeatmapDialog
+from .directory_index_dialog import DirectoryIndexDialog
+from .history_dialog import HistoryDialog
+from .metrics_dialog import MetricsDialog
 
-__all__ = ["HotkeyDialog", "InfoDialog", "ConfirmDialog", "KeyInputDialog", "AlertDialog"]
+__all__ = [
+    "HotkeyDialog", "InfoDialog", "ConfirmDialog", "KeyInputDialog", "AlertDialog",
+    "ChangePreviewDialog", "TextInputDialog", "KeyboardView", "KeyboardHeatmapDialog", "DirectoryIndexDialog",
+    "HistoryDialog", "MetricsDialog"
+]
@@ -1,45 +1,97 @@
 # -*- coding: utf-8 -*-
 """
 自定义对话框模块
-包含信息提示窗、操作确认窗、录入提示窗、单按钮提示窗
+包含信息提示窗、操作确认窗、录入提示窗、单按钮提示窗、文本输入窗
 """
 
 import os
-from typing import Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTextBrowser, QWidget, QFrame
+    QPushButton, QTextBrowser, QWidget, QFrame, QLineEdit
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon, QKeyEvent
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QKeyEvent, QTextDocument
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.keyboard_handler import KeyboardHandler
+from utils.metrics import metrics
+from utils.resource_cache import apply_application_resources
 
 
-def _load_global_stylesheet() -> str:
-    """加载全局样式表"""
-    from utils.resource_path import get_bundled_resource_path
+# 复用的对话框 {(类, 父窗口 id, 变体): 对话框}
+_dialog_pool: Dict[Tuple[type, int, object], QDialog] = {}
+# 已排版的信息文档 {(是否 Markdown, 内容): 文档}，内容随语言变化，因此按语言分别缓存
+_document_cache: Dict[Tuple[bool, str], QTextDocument] = {}
+
+
+def _pooled_dialog(cls: type, parent: Optional[QWidget], variant: object = None) -> QDialog:
+    """
+    获取可复用的对话框（每个父窗口每种对话框只创建一次，父窗口销毁时移出）
     
-    style_path = get_bundled_resource_path("styles/style.qss")
-    if os.path.exists(style_path):
-        with open(style_path, "r", encoding="utf-8") as f:
-            stylesheet = f.read()
-        
-        icon_dir = get_bundled_resource_path("icon")
-        icon_dir = icon_dir.replace(os.sep, '/')
-        stylesheet = stylesheet.replace('./icon/', f'{icon_dir}/')
-        
-        return stylesheet
-    return ""
+    对话框正在显示（嵌套弹出同类对话框）时返回一个新的临时对话框
+    """
+    key = (cls, id(parent), variant)
+    dialog = _dialog_pool.get(key)
+    if dialog is None:
+        dialog = cls(parent) if variant is None else cls(parent, is_about=variant)
+        _dialog_pool[key] = dialog
+        if parent is not None:
+            parent.destroyed.connect(lambda *_: _dialog_pool.pop(key, None))
+    elif dialog.isVisible():
+        dialog = cls(parent) if variant is None else cls(parent, is_about=variant)
+    return dialog
+
+
+def _exec_measured(dialog: QDialog, started: float) -> int:
+    """
+    以模态方式显示对话框，并记录从请求打开到对话框的事件循环开始处理事件（已显示）的延迟
+    
+    Args:
+        dialog: 对话框
+        started: 请求打开时的 time.perf_counter()
+    
+    Returns:
+        dialog.exec() 的结果
+    """
+    name = f"dialog.open.{type(dialog).__name__}"
+    QTimer.singleShot(0, lambda: metrics.observe_latency(name, time.perf_counter() - started))
+    return dialog.exec()
+
+
+def _cached_document(content: str, use_markdown: bool) -> QTextDocument:
+    """获取已排版的文档（相同内容只解析一次）"""
+    key = (use_markdown, content)
+    document = _document_cache.get(key)
+    if document is None:
+        document = QTextDocument()
+        if use_markdown:
+            document.setMarkdown(content)
+        else:
+            document.setPlainText(content)
+        _document_cache[key] = document
+    return document
+
+
+def prewarm_dialogs(parent: Optional[QWidget]) -> None:
+    """
+    预先创建常用对话框，使首次打开时无需构建界面
+    
+    Args:
+        parent: 对话框的父窗口（与之后打开时传入的父窗口相同）
+    """
+    for cls in (KeyInputDialog, AlertDialog, ConfirmDialog):
+        dialog = _pooled_dialog(cls, parent)
+        dialog.ensurePolished()
 
 
-def _get_icon_path() -> str:
-    """获取图标路径"""
-    from utils.resource_path import get_bundled_resource_path
-    return get_bundled_resource_path("icon/icon.png")
+def prepare_document(content: str, use_markdown: bool = False) -> None:
+    """预先解析信息文档（如较长的快捷键说明），打开信息窗时直接复用"""
+    if content:
+        _cached_document(content, use_markdown)
 
 
 class InfoDialog(QDialog):
@@ -48,7 +100,7 @@ class InfoDialog(QDialog):
     用于信息展示（使用说明、快捷键说明、关键字对应、程序信息）
     """
     
-    def __init__(self, parent: Optional[QWidget], title: str, content: str,
+    def __init__(self, parent: Optional[QWidget], title: str = "", content: str = "",
                  button_text: str = "确认", use_markdown: bool = False,
                  is_about: bool = False):
         """
@@ -63,7 +115,6 @@ class InfoDialog(QDialog):
             is_about: 是否为程序信息对话框
         """
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setModal(True)
         
         if is_about:
@@ -71,10 +122,6 @@ class InfoDialog(QDialog):
         else:
             self.setMinimumSize(400, 250)
         
-        icon_path = _get_icon_path()
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
@@ -85,18 +132,11 @@ class InfoDialog(QDialog):
             self.content_browser.setOpenExternalLinks(True)
             self.content_browser.setReadOnly(True)
             self.content_browser.setStyleSheet("background-color: transparent; border: none;")
-            self.content_browser.setMarkdown(content)
             layout.addWidget(self.content_browser, 4)
         else:
             self.content_browser = QTextBrowser()
             self.content_browser.setOpenExternalLinks(True)
             self.content_browser.setReadOnly(True)
-            
-            if use_markdown:
-                self.content_browser.setMarkdown(content)
-            else:
-                self.content_browser.setPlainText(content)
-            
             layout.addWidget(self.content_browser, 4)
         
         button_layout = QHBoxLayout()
@@ -109,7 +149,41 @@ class InfoDialog(QDialog):
         button_layout.addStretch()
         layout.addLayout(button_layout, 1)
         
-        self.setStyleSheet(_load_global_stylesheet())
+        apply_application_resources()
+        # 程序信息固定使用 Markdown 渲染
+        self.set_content(title, content, button_text, use_markdown or is_about)
+    
+    def set_content(self, title: str, content: str, button_text: str = "确认",
+                    use_markdown: bool = False) -> None:
+        """
+        更新标题、内容与按钮文本（内容文档按内容缓存，重复打开不再重新排版）
+        
+        Args:
+            title: 对话框标题
+            content: 内容文本
+            button_text: 按钮文本
+            use_markdown: 是否使用 Markdown 渲染
+        """
+        self.setWindowTitle(title)
+        self.btn_ok.setText(button_text)
+        document = _cached_document(content, use_markdown)
+        if document is not self.content_browser.document():
+            if document.defaultFont() != self.content_browser.font():
+                document.setDefaultFont(self.content_browser.font())
+            self.content_browser.setDocument(document)
+        self.content_browser.verticalScrollBar().setValue(0)
+    
+    @staticmethod
+    def show_info(parent: Optional[QWidget], title: str, content: str,
+                  button_text: str = "确认", use_markdown: bool = False,
+                  is_about: bool = False) -> None:
+        """
+        静态方法：显示信息提示窗（复用已创建的窗口）
+        """
+        started = time.perf_counter()
+        dialog = _pooled_dialog(InfoDialog, parent, is_about)
+        dialog.set_content(title, content, button_text, use_markdown or is_about)
+        _exec_measured(dialog, started)
 
 
 class AlertDialog(QDialog):
@@ -119,7 +193,7 @@ class AlertDialog(QDialog):
     与 ConfirmDialog 样式一致，但只有一个确认按钮
     """
     
-    def __init__(self, parent: Optional[QWidget], title: str, content: str,
+    def __init__(self, parent: Optional[QWidget], title: str = "", content: str = "",
                  button_text: str = "确认"):
         """
         初始化单按钮提示窗
@@ -131,19 +205,14 @@ class AlertDialog(QDialog):
             button_text: 按钮文本
         """
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setMinimumSize(350, 150)
         self.setModal(True)
         
-        icon_path = _get_icon_path()
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
         
-        self.label_content = QLabel(content)
+        self.label_content = QLabel()
         self.label_content.setWordWrap(True)
         self.label_content.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.label_content, 4)
@@ -151,23 +220,102 @@ class AlertDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        self.btn_confirm = QPushButton(button_text)
+        self.btn_confirm = QPushButton()
         self.btn_confirm.setObjectName("btnConfirm")
         self.btn_confirm.clicked.connect(self.accept)
         button_layout.addWidget(self.btn_confirm)
         button_layout.addStretch()
         layout.addLayout(button_layout, 1)
         
-        self.setStyleSheet(_load_global_stylesheet())
+        apply_application_resources()
+        self.set_texts(title, content, button_text)
+    
+    def set_texts(self, title: str, content: str, button_text: str = "确认") -> None:
+        """更新标题、内容与按钮文本（复用窗口时调用）"""
+        self.setWindowTitle(title)
+        self.label_content.setText(content)
+        self.btn_confirm.setText(button_text)
+        self.adjustSize()
     
     @staticmethod
     def show_alert(parent: Optional[QWidget], title: str, content: str,
                    button_text: str = "确认") -> None:
         """
-        静态方法：显示单按钮提示对话框
+        静态方法：显示单按钮提示对话框（复用已创建的窗口）
         """
-        dialog = AlertDialog(parent, title, content, button_text)
-        dialog.exec()
+        started = time.perf_counter()
+        dialog = _pooled_dialog(AlertDialog, parent)
+        dialog.set_texts(title, content, button_text)
+        _exec_measured(dialog, started)
+
+
+class TextInputDialog(QDialog):
+    """
+    文本输入窗
+    与 AlertDialog 样式一致，用于输入名称等单行文本
+    """
+    
+    def __init__(self, parent: Optional[QWidget], title: str, label: str,
+                 ok_text: str = "确认", cancel_text: str = "取消", text: str = ""):
+        """
+        初始化文本输入窗
+        
+        Args:
+            parent: 父窗口
+            title: 对话框标题
+            label: 输入框说明
+            ok_text: 确认按钮文本
+            cancel_text: 取消按钮文本
+            text: 初始文本
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setMinimumSize(350, 150)
+        self.setModal(True)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+        
+        self.label_content = QLabel(label)
+        layout.addWidget(self.label_content)
+        
+        self.edit_text = QLineEdit(text)
+        layout.addWidget(self.edit_text)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        self.btn_confirm = QPushButton(ok_text)
+        self.btn_confirm.setObjectName("btnConfirm")
+        self.btn_confirm.clicked.connect(self.accept)
+        button_layout.addWidget(self.btn_confirm)
+        
+        self.btn_cancel = QPushButton(cancel_text)
+        self.btn_cancel.setObjectName("btnCancel")
+        self.btn_cancel.clicked.connect(self.reject)
+        button_layout.addWidget(self.btn_cancel)
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        
+        self.edit_text.returnPressed.connect(self.accept)
+        apply_application_resources()
+    
+    @staticmethod
+    def get_text(parent: Optional[QWidget], title: str, label: str,
+                 ok_text: str = "确认", cancel_text: str = "取消",
+                 text: str = "") -> Optional[str]:
+        """
+        静态方法：显示文本输入窗
+        
+        Returns:
+            去除首尾空白的输入文本，取消时返回 None
+        """
+        started = time.perf_counter()
+        dialog = TextInputDialog(parent, title, label, ok_text, cancel_text, text)
+        if _exec_measured(dialog, started) != QDialog.Accepted:
+            return None
+        return dialog.edit_text.text().strip()
 
 
 class ConfirmDialog(QDialog):
@@ -180,7 +328,7 @@ class ConfirmDialog(QDialog):
     NO = 0
     CANCEL = -1
     
-    def __init__(self, parent: Optional[QWidget], title: str, content: str,
+    def __init__(self, parent: Optional[QWidget], title: str = "", content: str = "",
                  yes_text: str = "是", no_text: str = "否", cancel_text: str = "取消"):
         """
         初始化操作确认窗
@@ -194,21 +342,16 @@ class ConfirmDialog(QDialog):
             cancel_text: "取消"按钮文本
         """
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setMinimumSize(350, 150)
         self.setModal(True)
         
         self._result = self.CANCEL
         
-        icon_path = _get_icon_path()
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
         
-        self.label_content = QLabel(content)
+        self.label_content = QLabel()
         self.label_content.setWordWrap(True)
         self.label_content.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.label_content, 4)
@@ -216,7 +359,7 @@ class ConfirmDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        self.btn_yes = QPushButton(yes_text)
+        self.btn_yes = QPushButton()
         self.btn_yes.setObjectName("btnYes")
         self.btn_yes.setStyleSheet("""
             QPushButton#btnYes {
@@ -238,12 +381,12 @@ class ConfirmDialog(QDialog):
         self.btn_yes.clicked.connect(self._on_yes)
         button_layout.addWidget(self.btn_yes)
         
-        self.btn_no = QPushButton(no_text)
+        self.btn_no = QPushButton()
         self.btn_no.setObjectName("btnNo")
         self.btn_no.clicked.connect(self._on_no)
         button_layout.addWidget(self.btn_no)
         
-        self.btn_cancel = QPushButton(cancel_text)
+        self.btn_cancel = QPushButton()
         self.btn_cancel.setObjectName("btnCancel")
         self.btn_cancel.clicked.connect(self._on_cancel)
         button_layout.addWidget(self.btn_cancel)
@@ -251,7 +394,19 @@ class ConfirmDialog(QDialog):
         button_layout.addStretch()
         layout.addLayout(button_layout, 1)
         
-        self.setStyleSheet(_load_global_stylesheet())
+        apply_application_resources()
+        self.set_texts(title, content, yes_text, no_text, cancel_text)
+    
+    def set_texts(self, title: str, content: str, yes_text: str = "是",
+                  no_text: str = "否", cancel_text: str = "取消") -> None:
+        """更新文本并重置结果（复用窗口时调用）"""
+        self.setWindowTitle(title)
+        self.label_content.setText(content)
+        self.btn_yes.setText(yes_text)
+        self.btn_no.setText(no_text)
+        self.btn_cancel.setText(cancel_text)
+        self._result = self.CANCEL
+        self.adjustSize()
     
     def _on_yes(self):
         """处理"是"按钮点击"""
@@ -277,16 +432,85 @@ class ConfirmDialog(QDialog):
             yes_text: str = "是", no_text: str = "否",
             cancel_text: str = "取消") -> int:
         """
-        静态方法：显示确认对话框并返回结果
+        静态方法：显示确认对话框并返回结果（复用已创建的窗口）
         
         Returns:
             ConfirmDialog.YES, ConfirmDialog.NO, 或 ConfirmDialog.CANCEL
         """
-        dialog = ConfirmDialog(parent, title, content, yes_text, no_text, cancel_text)
-        dialog.exec()
+        started = time.perf_counter()
+        dialog = _pooled_dialog(ConfirmDialog, parent)
+        dialog.set_texts(title, content, yes_text, no_text, cancel_text)
+        _exec_measured(dialog, started)
         return dialog.get_result()
 
 
+class ChangePreviewDialog(QDialog):
+    """
+    变更预览窗
+    列出即将批量应用的快捷键变更，确认后一次性应用
+    """
+    
+    def __init__(self, parent: Optional[QWidget], title: str, content: str,
+                 changes: List[str], apply_text: str = "应用", cancel_text: str = "取消"):
+        """
+        初始化变更预览窗
+        
+        Args:
+            parent: 父窗口
+            title: 对话框标题
+            content: 说明文本
+            changes: 每行一条的变更描述
+            apply_text: 应用按钮文本
+            cancel_text: 取消按钮文本
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setMinimumSize(520, 360)
+        self.setModal(True)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+        
+        self.label_content = QLabel(content)
+        self.label_content.setWordWrap(True)
+        layout.addWidget(self.label_content)
+        
+        self.change_browser = QTextBrowser()
+        self.change_browser.setReadOnly(True)
+        self.change_browser.setPlainText("\n".join(changes))
+        layout.addWidget(self.change_browser, 4)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        self.btn_apply = QPushButton(apply_text)
+        self.btn_apply.setObjectName("btnConfirm")
+        self.btn_apply.clicked.connect(self.accept)
+        button_layout.addWidget(self.btn_apply)
+        
+        self.btn_cancel = QPushButton(cancel_text)
+        self.btn_cancel.setObjectName("btnCancel")
+        self.btn_cancel.clicked.connect(self.reject)
+        button_layout.addWidget(self.btn_cancel)
+        
+        button_layout.addStretch()
+        layout.addLayout(button_layout, 1)
+        
+        apply_application_resources()
+    
+    @staticmethod
+    def confirm(parent: Optional[QWidget], title: str, content: str,
+                changes: List[str], apply_text: str = "应用",
+                cancel_text: str = "取消") -> bool:
+        """
+        静态方法：显示变更预览并返回是否应用
+        """
+        started = time.perf_counter()
+        dialog = ChangePreviewDialog(parent, title, content, changes, apply_text, cancel_text)
+        return _exec_measured(dialog, started) == QDialog.Accepted
+
+
 class KeyInputDialog(QDialog):
     """
     录入提示窗 (C)
@@ -298,7 +522,9 @@ class KeyInputDialog(QDialog):
     def __init__(self, parent: Optional[QWidget], mode: str = 'normal',
                  current_hotkey: str = "", mode_text: str = "一般模式",
                  prompt_text: str = "请从键盘按下要设置的快捷键",
-                 delete_text: str = "删除快捷键", cancel_text: str = "取消"):
+                 delete_text: str = "删除快捷键", cancel_text: str = "取消",
+                 suggestions: Optional[List[str]] = None,
+                 suggestion_text: str = "推荐："):
         """
         初始化录入提示窗
         
@@ -310,42 +536,44 @@ class KeyInputDialog(QDialog):
             prompt_text: 提示文本
             delete_text: 删除按钮文本
             cancel_text: 取消按钮文本
+            suggestions: 推荐的空闲快捷键（点击即录入）
+            suggestion_text: 推荐栏标题
         """
         super().__init__(parent)
         
-        self.mode = mode
-        self.current_hotkey = current_hotkey
-        self._captured_hotkey: Optional[str] = None
-        self._deleted = False
         self.keyboard_handler = KeyboardHandler(mode)
-        
-        self.setWindowTitle(mode_text)
-        self.setFixedSize(400, 160)
         self.setModal(True)
         
-        icon_path = _get_icon_path()
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
         
-        self.label_prompt = QLabel(prompt_text)
+        self.label_prompt = QLabel()
         self.label_prompt.setObjectName("promptLabel")
         self.label_prompt.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.label_prompt, 4)
         
+        # 推荐栏：按钮按需创建，复用窗口时只更新文本与可见性
+        self.suggestion_bar = QWidget()
+        self._suggestion_layout = QHBoxLayout(self.suggestion_bar)
+        self._suggestion_layout.setContentsMargins(0, 0, 0, 0)
+        self._suggestion_layout.setSpacing(6)
+        self.label_suggestion = QLabel()
+        self.label_suggestion.setObjectName("suggestionLabel")
+        self._suggestion_layout.addWidget(self.label_suggestion)
+        self._suggestion_layout.addStretch()
+        self._suggestion_buttons: List[QPushButton] = []
+        layout.addWidget(self.suggestion_bar)
+        
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        self.btn_delete = QPushButton(delete_text)
+        self.btn_delete = QPushButton()
         self.btn_delete.setObjectName("btnCancel")
-        self.btn_delete.setEnabled(bool(current_hotkey))
         self.btn_delete.clicked.connect(self._on_delete)
         button_layout.addWidget(self.btn_delete)
         
-        self.btn_cancel = QPushButton(cancel_text)
+        self.btn_cancel = QPushButton()
         self.btn_cancel.setObjectName("btnCancel")
         self.btn_cancel.clicked.connect(self.reject)
         button_layout.addWidget(self.btn_cancel)
@@ -354,7 +582,45 @@ class KeyInputDialog(QDialog):
         layout.addLayout(button_layout, 1)
         
         self.setFocusPolicy(Qt.StrongFocus)
-        self.setStyleSheet(_load_global_stylesheet())
+        apply_application_resources()
+        self.reset(mode, current_hotkey, mode_text, prompt_text, delete_text,
+                   cancel_text, suggestions, suggestion_text)
+    
+    def reset(self, mode: str = 'normal', current_hotkey: str = "",
+              mode_text: str = "一般模式", prompt_text: str = "请从键盘按下要设置的快捷键",
+              delete_text: str = "删除快捷键", cancel_text: str = "取消",
+              suggestions: Optional[List[str]] = None,
+              suggestion_text: str = "推荐：") -> None:
+        """
+        重置录入状态并更新文本（复用窗口时调用，参数同构造函数）
+        """
+        self.mode = mode
+        self.current_hotkey = current_hotkey
+        self._captured_hotkey: Optional[str] = None
+        self._deleted = False
+        self.keyboard_handler.set_mode(mode)
+        
+        self.setWindowTitle(mode_text)
+        self.label_prompt.setText(prompt_text)
+        self.btn_delete.setText(delete_text)
+        self.btn_delete.setEnabled(bool(current_hotkey))
+        self.btn_cancel.setText(cancel_text)
+        
+        suggestions = suggestions or []
+        self.label_suggestion.setText(suggestion_text)
+        while len(self._suggestion_buttons) < len(suggestions):
+            btn = QPushButton()
+            btn.setObjectName("btnSuggestion")
+            btn.setFocusPolicy(Qt.NoFocus)
+            btn.clicked.connect(lambda _=False, b=btn: self._on_suggestion(b.text()))
+            self._suggestion_layout.insertWidget(len(self._suggestion_buttons) + 1, btn)
+            self._suggestion_buttons.append(btn)
+        for i, btn in enumerate(self._suggestion_buttons):
+            if i < len(suggestions):
+                btn.setText(suggestions[i])
+            btn.setVisible(i < len(suggestions))
+        self.suggestion_bar.setVisible(bool(suggestions))
+        self.setFixedSize(400, 200 if suggestions else 160)
     
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """处理键盘按下事件"""
@@ -368,6 +634,11 @@ class KeyInputDialog(QDialog):
             self._captured_hotkey = shortcut
             self.accept()
     
+    def _on_suggestion(self, shortcut: str):
+        """处理推荐快捷键点击"""
+        self._captured_hotkey = shortcut
+        self.accept()
+    
     def _on_delete(self):
         """处理删除按钮点击"""
         self._deleted = True
@@ -392,18 +663,23 @@ class KeyInputDialog(QDialog):
                 current_hotkey: str = "", mode_text: str = "一般模式",
                 prompt_text: str = "请从键盘按下要设置的快捷键",
                 delete_text: str = "删除快捷键",
-                cancel_text: str = "取消") -> Optional[str]:
+                cancel_text: str = "取消",
+                suggestions: Optional[List[str]] = None,
+                suggestion_text: str = "推荐：") -> Optional[str]:
         """
-        静态方法：显示录入对话框并返回结果
+        静态方法：显示录入对话框并返回结果（复用已创建的窗口）
         
         Returns:
             录入的快捷键，删除返回空字符串，取消返回 None
         """
-        dialog = KeyInputDialog(
-            parent, mode, current_hotkey, mode_text,
-            prompt_text, delete_text, cancel_text
+        started = time.perf_counter()
+        dialog = _pooled_dialog(KeyInputDialog, parent)
+        dialog.reset(
+            mode, current_hotkey, mode_text,
+            prompt_text, delete_text, cancel_text,
+            suggestions, suggestion_text
         )
-        result = dialog.exec()
+        result = _exec_measured(dialog, started)
         
         if result == QDialog.Accepted:
             return dialog.get_hotkey()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+团队快捷键目录索引窗口
+仅包含界面布局，索引与查询逻辑由控制器处理
+"""
+
+from typing import List, Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QComboBox, QTextBrowser, QWidget
+)
+
+from utils.resource_cache import apply_application_resources
+
+
+class DirectoryIndexDialog(QDialog):
+    """目录索引窗口"""
+
+    QUERY_WHO_BINDS = 0
+    QUERY_LACKS = 1
+    QUERY_COMMON = 2
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setMinimumSize(560, 420)
+        self.setModal(False)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        dir_layout = QHBoxLayout()
+        self.label_directory = QLabel("目录")
+        self.edit_directory = QLineEdit()
+        self.edit_directory.setReadOnly(True)
+        self.btn_browse = QPushButton("浏览")
+        self.btn_rescan = QPushButton("重新扫描")
+        dir_layout.addWidget(self.label_directory)
+        dir_layout.addWidget(self.edit_directory, 1)
+        dir_layout.addWidget(self.btn_browse)
+        dir_layout.addWidget(self.btn_rescan)
+        layout.addLayout(dir_layout)
+
+        self.label_status = QLabel("")
+        self.label_status.setObjectName("indexStatusLabel")
+        layout.addWidget(self.label_status)
+
+        query_layout = QHBoxLayout()
+        self.combo_query = QComboBox()
+        self.combo_query.addItems(["谁绑定了快捷键", "未绑定该命令的文件", "命令最常见的绑定"])
+        self.edit_query = QLineEdit()
+        self.btn_query = QPushButton("查询")
+        self.btn_query.setObjectName("btnConfirm")
+        query_layout.addWidget(self.combo_query)
+        query_layout.addWidget(self.edit_query, 1)
+        query_layout.addWidget(self.btn_query)
+        layout.addLayout(query_layout)
+
+        self.result_browser = QTextBrowser()
+        self.result_browser.setReadOnly(True)
+        layout.addWidget(self.result_browser, 1)
+
+        self.edit_query.returnPressed.connect(self.btn_query.click)
+
+        apply_application_resources()
+
+    def set_texts(self, title: str, directory_text: str, browse_text: str,
+                  rescan_text: str, query_text: str, query_modes: List[str]) -> None:
+        """设置界面文本（多语言）"""
+        self.setWindowTitle(title)
+        self.label_directory.setText(directory_text)
+        self.btn_browse.setText(browse_text)
+        self.btn_rescan.setText(rescan_text)
+        self.btn_query.setText(query_text)
+        for i, text in enumerate(query_modes):
+            self.combo_query.setItemText(i, text)
+
+    def set_results(self, lines: List[str]) -> None:
+        """显示查询结果"""
+        self.result_browser.setPlainText("\n".join(lines))
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+备份历史窗口
+仅包含界面布局，快照的读取、比较与恢复由控制器处理
+"""
+
+from typing import List, Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListWidget,
+    QPushButton, QSplitter, QTextBrowser, QWidget
+)
+from PySide6.QtCore import Qt
+
+from utils.resource_cache import apply_application_resources
+
+
+class HistoryDialog(QDialog):
+    """备份历史窗口"""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setMinimumSize(720, 460)
+        self.setModal(False)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        self.label_status = QLabel("")
+        self.label_status.setObjectName("indexStatusLabel")
+        layout.addWidget(self.label_status)
+
+        splitter = QSplitter(Qt.Horizontal)
+        self.list_snapshots = QListWidget()
+        self.diff_browser = QTextBrowser()
+        self.diff_browser.setReadOnly(True)
+        self.diff_browser.setLineWrapMode(QTextBrowser.NoWrap)
+        splitter.addWidget(self.list_snapshots)
+        splitter.addWidget(self.diff_browser)
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 2)
+        layout.addWidget(splitter, 1)
+
+        button_layout = QHBoxLayout()
+        self.btn_diff_current = QPushButton("与当前文件比较")
+        self.btn_diff_previous = QPushButton("与上一版本比较")
+        self.btn_restore = QPushButton("恢复此版本")
+        self.btn_restore.setObjectName("btnConfirm")
+        button_layout.addWidget(self.btn_diff_current)
+        button_layout.addWidget(self.btn_diff_previous)
+        button_layout.addStretch()
+        button_layout.addWidget(self.btn_restore)
+        layout.addLayout(button_layout)
+
+        apply_application_resources()
+
+    def set_texts(self, title: str, diff_current_text: str, diff_previous_text: str,
+                  restore_text: str) -> None:
+        """设置界面文本（多语言）"""
+        self.setWindowTitle(title)
+        self.btn_diff_current.setText(diff_current_text)
+        self.btn_diff_previous.setText(diff_previous_text)
+        self.btn_restore.setText(restore_text)
+
+    def set_entries(self, labels: List[str]) -> None:
+        """显示历史记录（最新在前）"""
+        self.list_snapshots.clear()
+        self.list_snapshots.addItems(labels)
+        self.diff_browser.clear()
+
+    def set_diff(self, lines: List[str]) -> None:
+        """显示差异或快照内容"""
+        self.diff_browser.setPlainText("\n".join(lines))
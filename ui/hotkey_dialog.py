@@ -4,22 +4,28 @@
 仅包含界面布局和样式，不包含业务逻辑
 """
 
-import os
+from bisect import bisect_right
+from typing import Sequence
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QLabel, QComboBox, QWidget, QTableWidget,
-    QPushButton, QLineEdit, QDialogButtonBox,
-    QSizePolicy, QFrame, QHeaderView, QAbstractItemView
+    QLabel, QComboBox, QWidget,
+    QPushButton, QDialogButtonBox,
+    QFrame, QHeaderView, QAbstractItemView, QMenu
+)
+from PySide6.QtCore import Qt, QModelIndex, Signal
+from utils.resource_cache import apply_application_resources, get_pixmap
+from .hotkey_list_model import (
+    COLUMN_HOTKEY, ROW_HEADER, ROW_HOTKEY, ROW_SEPARATOR,
+    HotkeyListModel, HotkeyRowDelegate, HotkeyTableView, RowSpec, hotkey_row
 )
-from PySide6.QtCore import Qt, QEvent, Signal
-from PySide6.QtGui import QIcon, QPixmap
-from utils.resource_path import get_bundled_resource_path
 
 
 class HotkeyDialog(QDialog):
     """热键设置主对话框"""
     
     hotkey_edit_clicked = Signal(int)
+    # 滚动后顶部所在的类别段落发生变化（段落键）
+    section_changed = Signal(str)
     
     RIGHT_PANEL_WIDTH = 140
     LEFT_BUTTON_PANEL_WIDTH = 140
@@ -40,10 +46,6 @@ class HotkeyDialog(QDialog):
         self.setWindowTitle("快捷键设置")
         self.setMinimumSize(900, 600)
         self.resize(1000, 700)
-        
-        icon_path = get_bundled_resource_path("icon/icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
     
     def _create_widgets(self):
         """创建所有控件"""
@@ -55,14 +57,52 @@ class HotkeyDialog(QDialog):
         self.combo_category.addItem("菜单")
         self.combo_category.setMinimumWidth(100)
         
-        self.hotkey_table = QTableWidget()
+        self.label_filter = QLabel("筛选：")
+        self.label_filter.setObjectName("labelFilter")
+        
+        self.combo_filter = QComboBox()
+        self.combo_filter.setObjectName("comboFilter")
+        self.combo_filter.addItems(["全部", "仅冲突", "仅未绑定", "仅多重绑定", "仅已自定义"])
+        
+        self.label_profile = QLabel("配置：")
+        self.label_profile.setObjectName("labelProfile")
+        
+        self.combo_profile = QComboBox()
+        self.combo_profile.setObjectName("comboProfile")
+        self.combo_profile.setMinimumWidth(100)
+        
+        self.btn_profile = QPushButton("配置管理")
+        self.btn_profile.setObjectName("btnProfile")
+        self.menu_profile = QMenu(self.btn_profile)
+        self.menu_profile.setObjectName("menuProfile")
+        self.action_new_profile = self.menu_profile.addAction("新建配置（复制当前）")
+        self.action_delete_profile = self.menu_profile.addAction("删除当前配置")
+        self.btn_profile.setMenu(self.menu_profile)
+        
+        # 列表内容由模型保存，视图只绘制可见行
+        self.hotkey_table = HotkeyTableView()
         self.hotkey_table.setObjectName("hotkeyTable")
+        self.hotkey_model = HotkeyListModel(self.hotkey_table)
+        self.hotkey_table.setModel(self.hotkey_model)
+        self.hotkey_delegate = HotkeyRowDelegate(self.hotkey_model, self.hotkey_table)
+        self.hotkey_table.setItemDelegate(self.hotkey_delegate)
+        self.warning_icon_path = "icon/warning.png"
         self._setup_hotkey_table()
         
         self._selected_row = -1
-        self.hotkey_rows = {}
-        self._separator_rows = set()
-        self.warning_icon_path = get_bundled_resource_path("icon/warning.png")
+        # 类别标题行（递增），用于吸顶标题与跳转
+        self._header_rows = []
+        self._current_section = ""
+        
+        self.sticky_header = QLabel(self.hotkey_table.viewport())
+        self.sticky_header.setObjectName("stickyHeader")
+        self.sticky_header.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.sticky_header.hide()
+        
+        self.hotkey_table.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        # 视图尺寸变化或滚动条出现/消失时，可见区域宽度随之变化
+        self.hotkey_table.resized.connect(self._on_viewport_resized)
+        self.hotkey_table.verticalScrollBar().rangeChanged.connect(self._on_viewport_resized)
         
         self.btn_edit_hotkey = QPushButton("修改快捷键")
         self.btn_edit_hotkey.setObjectName("btnEditHotkey")
@@ -76,6 +116,29 @@ class HotkeyDialog(QDialog):
         self.btn_quote_mode = QPushButton("单引号模式")
         self.btn_quote_mode.setObjectName("btnQuoteMode")
         
+        self.btn_tools = QPushButton("工具")
+        self.btn_tools.setObjectName("btnTools")
+        self.menu_tools = QMenu(self.btn_tools)
+        self.menu_tools.setObjectName("menuTools")
+        self.action_resolve_conflicts = self.menu_tools.addAction("解决全部冲突")
+        self.action_optimize_keymap = self.menu_tools.addAction("优化键位布局")
+        self.action_reset_default = self.menu_tools.addAction("恢复默认快捷键")
+        self.action_reset_all_defaults = self.menu_tools.addAction("全部恢复默认")
+        self.menu_tools.addSeparator()
+        self.action_keyboard_heatmap = self.menu_tools.addAction("键盘热力图")
+        self.action_directory_index = self.menu_tools.addAction("团队快捷键目录")
+        self.action_history = self.menu_tools.addAction("备份历史")
+        # 调试项（隐藏，按住 Shift 打开菜单时显示）
+        self.separator_tracing = self.menu_tools.addSeparator()
+        self.action_tracing = self.menu_tools.addAction("记录性能跟踪")
+        self.action_tracing.setCheckable(True)
+        self.action_export_trace = self.menu_tools.addAction("导出性能跟踪...")
+        self.action_metrics = self.menu_tools.addAction("运行指标")
+        for action in (self.separator_tracing, self.action_tracing, self.action_export_trace,
+                       self.action_metrics):
+            action.setVisible(False)
+        self.btn_tools.setMenu(self.menu_tools)
+        
         self.btn_link = QPushButton("链接")
         self.btn_link.setObjectName("btnLink")
         
@@ -115,7 +178,6 @@ class HotkeyDialog(QDialog):
     def _setup_hotkey_table(self):
         """配置快捷键表格"""
         table = self.hotkey_table
-        table.setColumnCount(3)
         table.horizontalHeader().setVisible(False)
         table.verticalHeader().setVisible(False)
         table.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -134,7 +196,13 @@ class HotkeyDialog(QDialog):
         table.setColumnWidth(0, 200)
         table.verticalHeader().setDefaultSectionSize(36)
         table.verticalHeader().setMinimumSectionSize(0)
-        table.itemSelectionChanged.connect(self._on_selection_changed)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        table.clicked.connect(self._on_table_clicked)
+        self.hotkey_delegate.warning_pixmap = get_pixmap(
+            self.warning_icon_path, HotkeyRowDelegate.ICON_SIZE, HotkeyRowDelegate.ICON_SIZE,
+            self.devicePixelRatioF()
+        )
     
     def _add_sample_hotkeys(self):
         """添加示例快捷键数据（用于布局展示）"""
@@ -153,50 +221,101 @@ class HotkeyDialog(QDialog):
             ("Tree Filter - Text Search Filters", "", False),
         ]
         
-        for name, hotkey, has_warning in sample_data:
-            self.add_hotkey_row(name, hotkey, has_warning)
+        self.set_hotkey_rows([hotkey_row(name, hotkey, has_warning)
+                              for name, hotkey, has_warning in sample_data])
+    
+    def set_hotkey_rows(self, rows: Sequence[RowSpec]):
+        """
+        显示全部行（类别标题、分割线与快捷键行）
+        
+        Args:
+            rows: 行记录（见 ui.hotkey_list_model 的 hotkey_row/header_row/separator_row）
+        """
+        table = self.hotkey_table
+        self.hotkey_model.set_rows(rows)
+        table.clearSpans()
+        self._header_rows = []
+        for row, spec in enumerate(rows):
+            if spec[0] == ROW_HEADER:
+                table.setSpan(row, 0, 1, 3)
+                table.setRowHeight(row, 30)
+                self._header_rows.append(row)
+            elif spec[0] == ROW_SEPARATOR:
+                table.setRowHeight(row, 1)
+        self._current_section = ""
+        self._sync_selected_row()
+        self._update_sticky_header(max(table.rowAt(0), 0))
+    
+    def replace_hotkey_rows(self, first: int, count: int, rows: Sequence[RowSpec]):
+        """
+        替换一段连续的快捷键行（如单个命令的全部快捷键），其余行不重新创建
+        
+        Args:
+            first: 起始行
+            count: 被替换的行数
+            rows: 新的快捷键行记录（只能是快捷键行）
+        """
+        self.hotkey_model.replace_rows(first, count, rows)
+        delta = len(rows) - count
+        if delta:
+            self._header_rows = [row + delta if row >= first + count else row
+                                 for row in self._header_rows]
+        self._sync_selected_row()
+        self._update_sticky_header(max(self.hotkey_table.rowAt(0), 0), emit_section=False)
+    
+    def scroll_to_section(self, key: str) -> bool:
+        """
+        滚动到类别标题行
+        
+        Args:
+            key: 段落键
+            
+        Returns:
+            列表中是否存在该段落
+        """
+        for row in self._header_rows:
+            if self.hotkey_model.row_spec(row)[4] == key:
+                # 列表末尾的短段落无法滚动到顶部，跳转目标仍视为当前段落，不发出 section_changed
+                self._current_section = key
+                self.hotkey_table.scrollTo(
+                    self.hotkey_model.index(row, 0), QAbstractItemView.PositionAtTop
+                )
+                self._update_sticky_header(max(self.hotkey_table.rowAt(0), 0), emit_section=False)
+                return True
+        return False
+    
+    def is_selectable_row(self, row: int) -> bool:
+        """行是否为可选中的快捷键行"""
+        spec = self.hotkey_model.row_spec(row)
+        return spec is not None and spec[0] == ROW_HOTKEY
+    
+    def _on_scrolled(self, *args):
+        """滚动后更新吸顶标题"""
+        self._update_sticky_header(max(self.hotkey_table.rowAt(0), 0))
     
-    def add_hotkey_row(self, name: str, hotkey: str = "", show_warning: bool = False):
-        """添加一行快捷键"""
-        row = self.hotkey_table.rowCount()
-        self.hotkey_table.insertRow(row)
-        
-        name_label = QLabel(name)
-        name_label.setMinimumWidth(200)
-        name_label.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Expanding)
-        name_label.setContentsMargins(10, 0, 4, 0)
-        name_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.hotkey_table.setCellWidget(row, 0, name_label)
-        
-        warning_container = QWidget()
-        warning_container.setAttribute(Qt.WA_TransparentForMouseEvents)
-        warning_layout = QHBoxLayout(warning_container)
-        warning_layout.setContentsMargins(0, 0, 0, 0)
-        warning_layout.setSpacing(0)
-        warning_layout.setAlignment(Qt.AlignCenter)
-        
-        warning_label = QLabel()
-        warning_label.setFixedSize(24, 24)
-        warning_label.setAlignment(Qt.AlignCenter)
-        warning_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        if show_warning and os.path.exists(self.warning_icon_path):
-            pixmap = QPixmap(self.warning_icon_path).scaled(
-                24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation
+    def _update_sticky_header(self, first_row: int, emit_section: bool = True):
+        """显示首个可见行所属的类别标题"""
+        index = bisect_right(self._header_rows, first_row) - 1
+        if index < 0:
+            self.sticky_header.hide()
+            return
+        
+        header_row = self._header_rows[index]
+        _, title, _, _, key = self.hotkey_model.row_spec(header_row)
+        if header_row == first_row and self.hotkey_table.rowViewportPosition(first_row) >= 0:
+            # 标题行本身完整可见时不需要吸顶
+            self.sticky_header.hide()
+        else:
+            self.sticky_header.setText(title)
+            self.sticky_header.setGeometry(
+                0, 0, self.hotkey_table.viewport().width(), self.hotkey_table.rowHeight(header_row)
             )
-            warning_label.setPixmap(pixmap)
-        warning_layout.addWidget(warning_label)
-        self.hotkey_table.setCellWidget(row, 1, warning_container)
-        
-        hotkey_edit = QLineEdit(hotkey)
-        hotkey_edit.setReadOnly(True)
-        hotkey_edit.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        hotkey_edit.setFixedWidth(280)
-        hotkey_edit.setContentsMargins(0, 0, 0, 0)
-        hotkey_edit.installEventFilter(self)
-        hotkey_edit.setProperty("row", row)
-        self.hotkey_table.setCellWidget(row, 2, hotkey_edit)
-        
-        self.hotkey_rows[row] = (name_label, warning_label, hotkey_edit)
+            self.sticky_header.show()
+            self.sticky_header.raise_()
+        
+        if emit_section and key != self._current_section:
+            self._current_section = key
+            self.section_changed.emit(key)
     
     def _setup_layout(self):
         """设置布局"""
@@ -216,7 +335,13 @@ class HotkeyDialog(QDialog):
         category_layout = QHBoxLayout()
         category_layout.addWidget(self.label_category)
         category_layout.addWidget(self.combo_category)
+        category_layout.addSpacing(10)
+        category_layout.addWidget(self.label_filter)
+        category_layout.addWidget(self.combo_filter)
         category_layout.addStretch()
+        category_layout.addWidget(self.label_profile)
+        category_layout.addWidget(self.combo_profile)
+        category_layout.addWidget(self.btn_profile)
         group_layout.addLayout(category_layout)
         
         body_layout = QHBoxLayout()
@@ -229,6 +354,7 @@ class HotkeyDialog(QDialog):
         left_btn_layout.addWidget(self.btn_add_hotkey)
         left_btn_layout.addWidget(self.btn_delete_hotkey)
         left_btn_layout.addWidget(self.btn_quote_mode)
+        left_btn_layout.addWidget(self.btn_tools)
         left_btn_layout.addStretch()
         
         left_btn_widget = QWidget()
@@ -286,19 +412,8 @@ class HotkeyDialog(QDialog):
         main_layout.addLayout(button_layout)
     
     def _load_stylesheet(self):
-        """加载样式表"""
-        from utils.resource_path import get_bundled_resource_path
-        
-        style_path = get_bundled_resource_path("styles/style.qss")
-        if os.path.exists(style_path):
-            with open(style_path, "r", encoding="utf-8") as f:
-                stylesheet = f.read()
-            
-            icon_dir = get_bundled_resource_path("icon")
-            icon_dir = icon_dir.replace(os.sep, '/')
-            stylesheet = stylesheet.replace('./icon/', f'{icon_dir}/')
-            
-            self.setStyleSheet(stylesheet)
+        """加载样式表与窗口图标（在应用级别设置，所有窗口共享）"""
+        apply_application_resources()
     
     def set_status_text(self, text: str):
         """设置状态栏文本"""
@@ -306,39 +421,34 @@ class HotkeyDialog(QDialog):
     
     def clear_hotkey_list(self):
         """清空快捷键列表"""
-        self.hotkey_table.setRowCount(0)
-        self.hotkey_rows.clear()
-        self._separator_rows.clear()
+        self.set_hotkey_rows([])
     
     def set_row_warning(self, row: int, show_warning: bool):
         """设置指定行的警告图标"""
-        if row in self.hotkey_rows:
-            warning_label = self.hotkey_rows[row][1]
-            if show_warning and os.path.exists(self.warning_icon_path):
-                pixmap = QPixmap(self.warning_icon_path).scaled(
-                    20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                warning_label.setPixmap(pixmap)
-            else:
-                warning_label.clear()
+        if self.is_selectable_row(row):
+            kind, name, hotkey, _, key = self.hotkey_model.row_spec(row)
+            self.hotkey_model.update_row(row, (kind, name, hotkey, show_warning, key))
     
-    def eventFilter(self, obj, event):
-        """事件过滤器：处理QLineEdit的点击事件"""
-        if event.type() == QEvent.MouseButtonPress:
-            if isinstance(obj, QLineEdit) and obj.property("row") is not None:
-                row = obj.property("row")
-                self.hotkey_table.selectRow(row)
-                self._selected_row = row
-                self.hotkey_edit_clicked.emit(row)
-                return True
-        return super().eventFilter(obj, event)
+    def _on_viewport_resized(self, *args):
+        """列表可见区域的尺寸变化时更新吸顶标题"""
+        self._update_sticky_header(max(self.hotkey_table.rowAt(0), 0), emit_section=False)
+    
+    def _on_table_clicked(self, index: QModelIndex):
+        """点击快捷键列时发出 hotkey_edit_clicked"""
+        if index.column() == COLUMN_HOTKEY and self.is_selectable_row(index.row()):
+            self.select_row(index.row())
+            self.hotkey_edit_clicked.emit(index.row())
     
-    def _on_selection_changed(self):
+    def _sync_selected_row(self):
+        """行增删后选中项随之移动，重新读取选中行"""
+        self._on_selection_changed()
+    
+    def _on_selection_changed(self, *args):
         """处理选择变化事件"""
         selected_rows = self.hotkey_table.selectionModel().selectedRows()
         if selected_rows:
             row = selected_rows[0].row()
-            if row in self._separator_rows:
+            if not self.is_selectable_row(row):
                 self.hotkey_table.clearSelection()
                 self._selected_row = -1
             else:
@@ -350,6 +460,12 @@ class HotkeyDialog(QDialog):
         """获取当前选中的行索引，未选中返回-1"""
         return self._selected_row
     
+    def select_row(self, row: int):
+        """选中指定的快捷键行（不可选中的行忽略）"""
+        if self.is_selectable_row(row):
+            self.hotkey_table.selectRow(row)
+            self._selected_row = row
+    
     def clear_selection(self):
         """清除选中状态"""
         self.hotkey_table.clearSelection()
@@ -361,31 +477,15 @@ class HotkeyDialog(QDialog):
         button.style().unpolish(button)
         button.style().polish(button)
     
-    def add_separator_row(self):
-        """添加分割线行"""
-        from PySide6.QtWidgets import QTableWidgetItem
-        
-        row = self.hotkey_table.rowCount()
-        self.hotkey_table.insertRow(row)
-        
-        for col in range(3):
-            item = QTableWidgetItem()
-            item.setFlags(item.flags() & ~Qt.ItemIsSelectable & ~Qt.ItemIsEnabled)
-            self.hotkey_table.setItem(row, col, item)
-        
-        self.hotkey_table.setRowHeight(row, 1)
-        self._separator_rows.add(row)
-    
     def get_row_hotkey(self, row: int) -> str:
         """获取指定行的快捷键"""
-        if row in self.hotkey_rows:
-            hotkey_edit = self.hotkey_rows[row][2]
-            return hotkey_edit.text()
+        if self.is_selectable_row(row):
+            return self.hotkey_model.row_spec(row)[2]
         return ""
     
     def set_row_hotkey(self, row: int, hotkey: str):
         """设置指定行的快捷键"""
-        if row in self.hotkey_rows:
-            hotkey_edit = self.hotkey_rows[row][2]
-            hotkey_edit.setText(hotkey)
+        if self.is_selectable_row(row):
+            kind, name, _, show_warning, key = self.hotkey_model.row_spec(row)
+            self.hotkey_model.update_row(row, (kind, name, hotkey, show_warning, key))
 
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+快捷键列表模型与绘制代理
+列表内容保存为轻量的行记录，视图只绘制可见行，不为每行创建控件
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QRect, Qt, Signal
+from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtWidgets import (
+    QLineEdit, QStyle, QStyledItemDelegate, QStyleOptionFrame, QStyleOptionViewItem, QTableView, QWidget
+)
+
+ROW_HOTKEY = 0
+ROW_HEADER = 1
+ROW_SEPARATOR = 2
+
+COLUMN_NAME = 0
+COLUMN_WARNING = 1
+COLUMN_HOTKEY = 2
+
+# 行记录: (行类型, 名称或标题, 快捷键, 是否显示警告, 段落键)
+RowSpec = Tuple[int, str, str, bool, str]
+
+
+def hotkey_row(name: str, hotkey: str = "", show_warning: bool = False) -> RowSpec:
+    """快捷键行记录"""
+    return (ROW_HOTKEY, name, hotkey, show_warning, "")
+
+
+def header_row(title: str, key: str) -> RowSpec:
+    """类别标题行记录"""
+    return (ROW_HEADER, title, "", False, key)
+
+
+def separator_row() -> RowSpec:
+    """分割线行记录"""
+    return (ROW_SEPARATOR, "", "", False, "")
+
+
+class HotkeyListModel(QAbstractTableModel):
+    """快捷键列表模型（名称、警告图标、快捷键三列）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[RowSpec] = []
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 3
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, text, hotkey, _, _ = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == COLUMN_NAME and kind != ROW_SEPARATOR:
+                return text
+            if column == COLUMN_HOTKEY and kind == ROW_HOTKEY:
+                return hotkey
+        elif role == Qt.FontRole and kind == ROW_HEADER:
+            return self._header_font
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        kind = self._rows[index.row()][0]
+        if kind == ROW_HOTKEY:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if kind == ROW_HEADER:
+            return Qt.ItemIsEnabled
+        return Qt.NoItemFlags
+
+    def row_spec(self, row: int) -> Optional[RowSpec]:
+        """获取行记录（越界时返回 None）"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def set_rows(self, rows: Sequence[RowSpec]) -> None:
+        """整体替换全部行"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def update_row(self, row: int, spec: RowSpec) -> None:
+        """更新单行内容"""
+        self._rows[row] = spec
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 2))
+
+    def replace_rows(self, first: int, count: int, rows: Sequence[RowSpec]) -> None:
+        """
+        将从 first 开始的 count 行替换为 rows（行数不同时只插入或删除差额部分）
+
+        Args:
+            first: 起始行
+            count: 被替换的行数
+            rows: 新的行记录
+        """
+        common = min(count, len(rows))
+        if common:
+            self._rows[first:first + common] = rows[:common]
+            self.dataChanged.emit(self.index(first, 0), self.index(first + common - 1, 2))
+        if len(rows) > count:
+            self.beginInsertRows(QModelIndex(), first + count, first + len(rows) - 1)
+            self._rows[first + count:first + count] = rows[count:]
+            self.endInsertRows()
+        elif count > len(rows):
+            self.beginRemoveRows(QModelIndex(), first + common, first + count - 1)
+            del self._rows[first + common:first + count]
+            self.endRemoveRows()
+
+
+class HotkeyTableView(QTableView):
+    """快捷键列表视图（尺寸变化时发出信号，用于更新吸顶标题）"""
+
+    resized = Signal()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.resized.emit()
+
+
+class HotkeyRowDelegate(QStyledItemDelegate):
+    """绘制警告图标与输入框样式的快捷键单元格"""
+
+    HOTKEY_WIDTH = 280
+    ICON_SIZE = 24
+    NAME_INDENT = 6
+
+    def __init__(self, model: HotkeyListModel, parent: QWidget):
+        super().__init__(parent)
+        self._model = model
+        self.warning_pixmap = QPixmap()
+        # 只用于套用样式表中输入框的外观，不显示
+        self._frame_source = QLineEdit(parent)
+        self._frame_source.setReadOnly(True)
+        self._frame_source.hide()
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        spec = self._model.row_spec(index.row())
+        if spec is None or spec[0] != ROW_HOTKEY or index.column() == COLUMN_NAME:
+            if spec is not None and spec[0] == ROW_HOTKEY:
+                option = QStyleOptionViewItem(option)
+                option.rect = option.rect.adjusted(self.NAME_INDENT, 0, 0, 0)
+            super().paint(painter, option, index)
+            return
+
+        # 先绘制选中背景，再在其上绘制图标或输入框
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.text = ""
+        widget = option.widget
+        style = widget.style() if widget is not None else self._frame_source.style()
+        style.drawControl(QStyle.CE_ItemViewItem, background, painter, widget)
+
+        if index.column() == COLUMN_WARNING:
+            if spec[3] and not self.warning_pixmap.isNull():
+                size = self.ICON_SIZE
+                rect = QRect(0, 0, size, size)
+                rect.moveCenter(option.rect.center())
+                painter.drawPixmap(rect, self.warning_pixmap)
+            return
+
+        frame = QStyleOptionFrame()
+        frame.initFrom(self._frame_source)
+        height = min(self._frame_source.sizeHint().height(), option.rect.height() - 2)
+        frame.rect = QRect(option.rect.left(), option.rect.top() + (option.rect.height() - height) // 2,
+                           min(self.HOTKEY_WIDTH, option.rect.width()), height)
+        frame.lineWidth = 1
+        frame.midLineWidth = 0
+        frame.state |= QStyle.State_Sunken
+        source_style = self._frame_source.style()
+        source_style.drawPrimitive(QStyle.PE_PanelLineEdit, frame, painter, self._frame_source)
+
+        text_rect = source_style.subElementRect(QStyle.SE_LineEditContents, frame, self._frame_source)
+        text = option.fontMetrics.elidedText(spec[2], Qt.ElideRight, text_rect.width() - 8)
+        painter.save()
+        painter.setPen(self._frame_source.palette().text().color())
+        painter.drawText(text_rect.adjusted(4, 0, -4, 0), Qt.AlignVCenter | Qt.AlignLeft, text)
+        painter.restore()
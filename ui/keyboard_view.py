@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+键盘热力图模块
+按键位绘制整个键盘，用颜色表示每个按键的修饰键组合占用与冲突情况
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextBrowser, QWidget, QSizePolicy
+)
+from PySide6.QtCore import Qt, QRectF, QSize, Signal
+from PySide6.QtGui import QColor, QFont, QMouseEvent, QPainter, QPaintEvent, QPen, QPixmap
+
+from utils.key_constants import KEY_NAMES, KEY_POSITIONS, KEY_TO_CHAR
+from utils.resource_cache import apply_application_resources
+
+# 每个按键的修饰键组合数
+COMBOS_PER_KEY = 8
+
+# 按键单位尺寸（像素）与间距
+KEY_UNIT = 34
+KEY_GAP = 3
+
+COLOR_BACKGROUND = QColor("#2b2b2b")
+COLOR_EMPTY = QColor("#3c3f41")
+COLOR_BOUND = QColor("#4a90d9")
+COLOR_CONFLICT = QColor("#d9534f")
+COLOR_TEXT = QColor("#e0e0e0")
+COLOR_SELECTED = QColor("#f0c040")
+
+# 键名过长时显示的缩写
+_SHORT_LABELS = {
+    "BACKSPACE": "Bksp", "DELETE": "Del", "ESCAPE": "Esc", "INSERT": "Ins",
+    "PAGE_UP": "PgUp", "PAGE_DOWN": "PgDn", "PRINT_SCREEN": "PrtSc",
+    "SCROLL_LOCK": "ScrLk", "NUM_LOCK": "Num", "HOME": "Home", "END": "End", "ENTER": "Enter", "SPACE": "Space",
+    "NUMPAD_DIVIDE": "/", "NUMPAD_MULTIPLY": "*", "NUMPAD_MINUS": "-",
+    "NUMPAD_PLUS": "+", "NUMPAD_DOT": ".", "NUMPAD_ENTER": "Ent",
+    "NUMPAD_EQUALS": "=", "NUMPAD_LEFT_PAREN": "(", "NUMPAD_RIGHT_PAREN": ")",
+    "LEFT": "←", "RIGHT": "→", "UP": "↑", "DOWN": "↓"
+}
+
+# 按键统计: (已占用组合数, 冲突组合数)
+KeyStats = Tuple[int, int]
+
+
+def key_label(key_name: str) -> str:
+    """获取按键上显示的文本"""
+    if key_name in _SHORT_LABELS:
+        return _SHORT_LABELS[key_name]
+    if key_name.startswith("NUMPAD_"):
+        return key_name[len("NUMPAD_"):]
+    if key_name.startswith("NUM_"):
+        return key_name[len("NUM_"):]
+    if len(key_name) > 1 and key_name in KEY_TO_CHAR:
+        return KEY_TO_CHAR[key_name]
+    return key_name
+
+
+def _blend(base: QColor, target: QColor, ratio: float) -> QColor:
+    """按比例混合两种颜色"""
+    ratio = max(0.0, min(1.0, ratio))
+    return QColor(
+        round(base.red() + (target.red() - base.red()) * ratio),
+        round(base.green() + (target.green() - base.green()) * ratio),
+        round(base.blue() + (target.blue() - base.blue()) * ratio)
+    )
+
+
+class KeyboardView(QWidget):
+    """
+    键盘热力图控件
+    键盘绘制在缓存的 QPixmap 中，统计变化时只重绘受影响的按键
+    """
+
+    key_clicked = Signal(str)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._stats: Dict[str, KeyStats] = {name: (0, 0) for name in KEY_NAMES}
+        self._selected_key = ""
+        self._pixmap: Optional[QPixmap] = None
+
+        min_x = min(x for x, _, _ in KEY_POSITIONS.values())
+        min_y = min(y for _, y, _ in KEY_POSITIONS.values())
+        self._origin = (min_x, min_y)
+        self._rects: Dict[str, QRectF] = {
+            name: self._key_rect(name) for name in KEY_NAMES if name in KEY_POSITIONS
+        }
+        right = max(rect.right() for rect in self._rects.values())
+        bottom = max(rect.bottom() for rect in self._rects.values())
+        self._size = QSize(int(right) + KEY_GAP * 2, int(bottom) + KEY_GAP * 2)
+
+        self.setFixedSize(self._size)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.setMouseTracking(True)
+
+    def _key_rect(self, key_name: str) -> QRectF:
+        """计算按键在控件中的矩形"""
+        x, y, width = KEY_POSITIONS[key_name]
+        return QRectF(
+            (x - self._origin[0]) * KEY_UNIT + KEY_GAP,
+            (y - self._origin[1]) * KEY_UNIT + KEY_GAP,
+            width * KEY_UNIT - KEY_GAP,
+            KEY_UNIT - KEY_GAP
+        )
+
+    def sizeHint(self) -> QSize:
+        return self._size
+
+    def set_key_stats(self, stats: Dict[str, KeyStats]) -> None:
+        """
+        更新按键统计，仅重绘数值发生变化的按键
+
+        Args:
+            stats: {键名: (已占用组合数, 冲突组合数)}
+        """
+        changed = [
+            name for name, value in stats.items()
+            if name in self._rects and self._stats.get(name) != value
+        ]
+        self._stats.update({name: stats[name] for name in changed})
+        self._repaint_keys(changed)
+
+    def set_selected_key(self, key_name: str) -> None:
+        """设置高亮的按键"""
+        previous = self._selected_key
+        self._selected_key = key_name
+        self._repaint_keys([name for name in (previous, key_name) if name])
+
+    def selected_key(self) -> str:
+        """获取当前高亮的按键"""
+        return self._selected_key
+
+    def _repaint_keys(self, key_names: Iterable[str]) -> None:
+        """在缓存中重绘指定按键并刷新对应区域"""
+        key_names = list(key_names)
+        if not key_names or self._pixmap is None:
+            return
+        painter = QPainter(self._pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for name in key_names:
+            self._paint_key(painter, name)
+        painter.end()
+        for name in key_names:
+            self.update(self._rects[name].adjusted(-2, -2, 2, 2).toAlignedRect())
+
+    def _ensure_pixmap(self) -> None:
+        """按当前设备像素比创建完整的缓存"""
+        ratio = self.devicePixelRatioF()
+        if self._pixmap is not None and self._pixmap.devicePixelRatio() == ratio:
+            return
+        self._pixmap = QPixmap(self._size * ratio)
+        self._pixmap.setDevicePixelRatio(ratio)
+        self._pixmap.fill(COLOR_BACKGROUND)
+        painter = QPainter(self._pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for name in self._rects:
+            self._paint_key(painter, name)
+        painter.end()
+
+    def _paint_key(self, painter: QPainter, key_name: str) -> None:
+        """绘制单个按键"""
+        rect = self._rects[key_name]
+        bound, conflicted = self._stats.get(key_name, (0, 0))
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(COLOR_BACKGROUND)
+        painter.drawRect(rect.adjusted(-2, -2, 2, 2))
+
+        fill = _blend(COLOR_EMPTY, COLOR_BOUND, bound / COMBOS_PER_KEY)
+        if conflicted:
+            fill = _blend(fill, COLOR_CONFLICT, 0.4 + 0.6 * conflicted / COMBOS_PER_KEY)
+        if key_name == self._selected_key:
+            painter.setPen(QPen(COLOR_SELECTED, 2))
+        painter.setBrush(fill)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        painter.setPen(COLOR_TEXT)
+        font = QFont(painter.font())
+        font.setPixelSize(10)
+        painter.setFont(font)
+        painter.drawText(rect.adjusted(2, 1, -2, -12), Qt.AlignCenter, key_label(key_name))
+        if bound:
+            font.setPixelSize(8)
+            painter.setFont(font)
+            painter.drawText(rect.adjusted(2, 0, -3, -1), Qt.AlignRight | Qt.AlignBottom,
+                             f"{bound}" if not conflicted else f"{bound}/{conflicted}")
+
+    def key_at(self, x: float, y: float) -> str:
+        """获取坐标处的按键名，无按键返回空字符串"""
+        for name, rect in self._rects.items():
+            if rect.contains(x, y):
+                return name
+        return ""
+
+    def paintEvent(self, event: QPaintEvent):
+        self._ensure_pixmap()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == Qt.LeftButton:
+            key_name = self.key_at(event.position().x(), event.position().y())
+            if key_name:
+                self.set_selected_key(key_name)
+                self.key_clicked.emit(key_name)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        key_name = self.key_at(event.position().x(), event.position().y())
+        if key_name:
+            bound, conflicted = self._stats.get(key_name, (0, 0))
+            self.setToolTip(f"{key_name}  {bound}/{COMBOS_PER_KEY}  ({conflicted})")
+        else:
+            self.setToolTip("")
+        super().mouseMoveEvent(event)
+
+
+class KeyboardHeatmapDialog(QDialog):
+    """
+    键盘热力图窗口
+    上方为键盘视图，下方列出所选按键各修饰键组合上的命令
+    """
+
+    def __init__(self, parent: Optional[QWidget], title: str, legend_text: str):
+        """
+        初始化热力图窗口
+
+        Args:
+            parent: 父窗口
+            title: 窗口标题
+            legend_text: 图例说明文本
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setModal(False)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        self.keyboard_view = KeyboardView(self)
+        view_layout = QHBoxLayout()
+        view_layout.addStretch()
+        view_layout.addWidget(self.keyboard_view)
+        view_layout.addStretch()
+        layout.addLayout(view_layout)
+
+        self.label_legend = QLabel(legend_text)
+        self.label_legend.setObjectName("heatmapLegend")
+        self.label_legend.setWordWrap(True)
+        layout.addWidget(self.label_legend)
+
+        self.detail_browser = QTextBrowser()
+        self.detail_browser.setReadOnly(True)
+        self.detail_browser.setMinimumHeight(140)
+        layout.addWidget(self.detail_browser)
+
+        apply_application_resources()
+
+    def set_details(self, lines: List[str]) -> None:
+        """显示所选按键的命令列表"""
+        self.detail_browser.setPlainText("\n".join(lines))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+运行指标窗口
+仅包含界面布局，指标的读取与清空由控制器处理
+"""
+
+from typing import List, Optional, Sequence
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTreeWidget, QTreeWidgetItem, QWidget
+)
+
+from utils.resource_cache import apply_application_resources
+
+
+class MetricsDialog(QDialog):
+    """运行指标窗口"""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setMinimumSize(640, 420)
+        self.setModal(False)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        self.label_status = QLabel("")
+        self.label_status.setObjectName("indexStatusLabel")
+        layout.addWidget(self.label_status)
+
+        self.tree_metrics = QTreeWidget()
+        self.tree_metrics.setRootIsDecorated(False)
+        self.tree_metrics.setAlternatingRowColors(True)
+        layout.addWidget(self.tree_metrics, 1)
+
+        button_layout = QHBoxLayout()
+        self.btn_refresh = QPushButton("刷新")
+        self.btn_reset = QPushButton("清零")
+        self.btn_export = QPushButton("导出 JSON")
+        button_layout.addWidget(self.btn_refresh)
+        button_layout.addWidget(self.btn_reset)
+        button_layout.addStretch()
+        button_layout.addWidget(self.btn_export)
+        layout.addLayout(button_layout)
+
+        apply_application_resources()
+
+    def set_texts(self, title: str, headers: List[str], refresh_text: str,
+                  reset_text: str, export_text: str) -> None:
+        """设置界面文本（多语言）"""
+        self.setWindowTitle(title)
+        self.tree_metrics.setHeaderLabels(headers)
+        self.btn_refresh.setText(refresh_text)
+        self.btn_reset.setText(reset_text)
+        self.btn_export.setText(export_text)
+
+    def set_rows(self, rows: List[Sequence[str]]) -> None:
+        """显示指标行（名称、次数、平均值、p50、p95、最大值）"""
+        self.tree_metrics.clear()
+        self.tree_metrics.addTopLevelItems([QTreeWidgetItem(list(row)) for row in rows])
+        for column in range(self.tree_metrics.columnCount()):
+            self.tree_metrics.resizeColumnToContents(column)
@@ -10,11 +10,22 @@ from .key_constants import (
     NUMPAD_KEYS,
     SHIFT_CHAR_MAP,
     VALID_MODIFIERS,
-    MODIFIER_ORDER
+    MODIFIER_ORDER,
+    KEY_POSITIONS
 )
+from .shortcut_codec import (
+    ShortcutSpace,
+    parse_shortcut,
+    build_shortcut,
+    canonical_shortcut
+)
+from .snapshot_store import SnapshotStore
 from .file_converter import FileConverter
 from .resource_path import (
     get_resource_base_path,
     get_bundled_resource_path,
-    get_external_resource_path
+    get_external_resource_path,
+    register_resource_bundle,
+    resolve_resource,
+    read_resource
 )
@@ -6,10 +6,13 @@
 
 import json
 import os
-import shutil
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .key_constants import KEY_TO_CHAR, CHAR_TO_KEY, VALID_MODIFIERS
+from .shortcut_codec import canonical_shortcut
+from .snapshot_store import KIND_IMPORT, SnapshotStore
+from .metrics import metrics
+from .tracing import span, traced
 
 
 class FileConverter:
@@ -46,6 +49,60 @@ class FileConverter:
         
         return True, ""
     
+    @staticmethod
+    def parse_txt_lines(lines: List[str]) -> List[Dict[str, Any]]:
+        """
+        将快捷键文本行解析为类别列表
+        
+        Args:
+            lines: 文本行
+            
+        Returns:
+            [{"categoryId": ..., "items": [{"commandId": ..., "shortcuts": [...]}]}, ...]
+        """
+        categories = []
+        current_category = None
+        current_items = []
+        
+        for line in lines:
+            line = line.strip()
+            if line.startswith('---') and line.endswith('---'):
+                if current_category is not None:
+                    categories.append({
+                        "categoryId": current_category,
+                        "items": current_items
+                    })
+                current_category = line.strip('-').strip()
+                current_items = []
+            elif line and ':' in line:
+                parts = line.split(':', 1)
+                command_id = parts[0].strip()
+                shortcut = parts[1].strip()
+                
+                existing_item = None
+                for item in current_items:
+                    if item["commandId"] == command_id:
+                        existing_item = item
+                        break
+                
+                if existing_item:
+                    if shortcut and shortcut not in existing_item["shortcuts"]:
+                        existing_item["shortcuts"].append(shortcut)
+                else:
+                    shortcuts = [shortcut] if shortcut else []
+                    current_items.append({
+                        "commandId": command_id,
+                        "shortcuts": shortcuts
+                    })
+        
+        if current_category is not None:
+            categories.append({
+                "categoryId": current_category,
+                "items": current_items
+            })
+        
+        return categories
+    
     @staticmethod
     def txt_to_json(input_path: str, output_path: str) -> bool:
         """
@@ -62,46 +119,7 @@ class FileConverter:
             with open(input_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
             
-            categories = []
-            current_category = None
-            current_items = []
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('---') and line.endswith('---'):
-                    if current_category is not None:
-                        categories.append({
-                            "categoryId": current_category,
-                            "items": current_items
-                        })
-                    current_category = line.strip('-').strip()
-                    current_items = []
-                elif line and ':' in line:
-                    parts = line.split(':', 1)
-                    command_id = parts[0].strip()
-                    shortcut = parts[1].strip()
-                    
-                    existing_item = None
-                    for item in current_items:
-                        if item["commandId"] == command_id:
-                            existing_item = item
-                            break
-                    
-                    if existing_item:
-                        if shortcut and shortcut not in existing_item["shortcuts"]:
-                            existing_item["shortcuts"].append(shortcut)
-                    else:
-                        shortcuts = [shortcut] if shortcut else []
-                        current_items.append({
-                            "commandId": command_id,
-                            "shortcuts": shortcuts
-                        })
-            
-            if current_category is not None:
-                categories.append({
-                    "categoryId": current_category,
-                    "items": current_items
-                })
+            categories = FileConverter.parse_txt_lines(lines)
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(categories, f, indent=2, ensure_ascii=False)
@@ -200,6 +218,39 @@ class FileConverter:
         else:
             return final_key
     
+    @staticmethod
+    def format_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        就地格式化类别列表中的快捷键名称
+        
+        同一命令下指向相同物理按键组合的写法（如 '!' 与 shift + NUM_1）只保留第一个。
+        
+        Args:
+            data: parse_txt_lines() 的返回值
+            
+        Returns:
+            格式化后的同一列表
+        """
+        for category in data:
+            for item in category.get('items', []):
+                seen = set()
+                unique_shortcuts = []
+                
+                raw_shortcuts = item.get('shortcuts', [])
+                
+                for shortcut in raw_shortcuts:
+                    formatted = FileConverter._parse_and_format_shortcut(shortcut)
+                    
+                    if formatted:
+                        canonical = canonical_shortcut(formatted)
+                        if canonical not in seen:
+                            seen.add(canonical)
+                            unique_shortcuts.append(formatted)
+                
+                item['shortcuts'] = unique_shortcuts
+        
+        return data
+    
     @staticmethod
     def format_key_names(input_path: str, output_path: str) -> bool:
         """
@@ -216,22 +267,7 @@ class FileConverter:
             with open(input_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            for category in data:
-                for item in category.get('items', []):
-                    seen = set()
-                    unique_shortcuts = []
-                    
-                    raw_shortcuts = item.get('shortcuts', [])
-                    
-                    for shortcut in raw_shortcuts:
-                        formatted = FileConverter._parse_and_format_shortcut(shortcut)
-                        
-                        if formatted:
-                            if formatted not in seen:
-                                seen.add(formatted)
-                                unique_shortcuts.append(formatted)
-                    
-                    item['shortcuts'] = unique_shortcuts
+            FileConverter.format_data(data)
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -241,6 +277,30 @@ class FileConverter:
             raise Exception(f"format_key_names 处理失败: {str(e)}")
     
     @staticmethod
+    @traced(category="import")
+    def load_hotkey_file(txt_path: str) -> List[Dict[str, Any]]:
+        """
+        在内存中执行 txt_to_json 与 format_key_names 流程，不写入中间文件
+        
+        Args:
+            txt_path: 快捷键 txt 文件路径
+            
+        Returns:
+            格式化后的类别列表
+            
+        Raises:
+            Exception: 读取或解析失败
+        """
+        try:
+            with open(txt_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except Exception as e:
+            raise Exception(f"读取文件失败: {str(e)}")
+        
+        return FileConverter.format_data(FileConverter.parse_txt_lines(lines))
+    
+    @staticmethod
+    @traced(category="save")
     def json_to_txt(input_path: str, output_path: str) -> bool:
         """
         将 JSON 格式转换回快捷键文本文件
@@ -255,38 +315,69 @@ class FileConverter:
         try:
             with open(input_path, 'r', encoding='utf-8') as f:
                 categories = json.load(f)
+                metrics.observe_size("save.bytes_read", f.tell())
             
-            output_lines = []
-            for i, category in enumerate(categories):
-                output_lines.append(f"--- {category['categoryId']} ---")
-                for item in category['items']:
-                    command_id = item['commandId']
-                    shortcuts = item['shortcuts']
-                    
-                    if shortcuts:
-                        for shortcut in shortcuts:
-                            output_lines.append(f"{command_id}: {shortcut}")
-                    else:
-                        output_lines.append(f"{command_id}: ")
-                
-                if i < len(categories) - 1:
-                    output_lines.append("")
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("\n".join(output_lines))
+            FileConverter.write_hotkey_file(categories, output_path)
             
             return True
         except Exception as e:
             raise Exception(f"json_to_txt 转换失败: {str(e)}")
     
     @staticmethod
-    def import_and_process(txt_path: str, processing_dir: str) -> str:
+    def format_txt_lines(categories: List[Dict[str, Any]]) -> List[str]:
+        """
+        将类别列表格式化为快捷键文本行（parse_txt_lines 的逆过程）
+        
+        Args:
+            categories: 与 hotkeys.json 结构相同的类别列表
+            
+        Returns:
+            文本行（不含换行符）
+        """
+        output_lines = []
+        for i, category in enumerate(categories):
+            output_lines.append(f"--- {category['categoryId']} ---")
+            for item in category['items']:
+                command_id = item['commandId']
+                shortcuts = item['shortcuts']
+                
+                if shortcuts:
+                    for shortcut in shortcuts:
+                        output_lines.append(f"{command_id}: {shortcut}")
+                else:
+                    output_lines.append(f"{command_id}: ")
+            
+            if i < len(categories) - 1:
+                output_lines.append("")
+        return output_lines
+    
+    @staticmethod
+    @traced(category="save")
+    def write_hotkey_file(categories: List[Dict[str, Any]], output_path: str) -> None:
+        """
+        将类别列表直接写为快捷键文本文件
+        
+        Args:
+            categories: 与 hotkeys.json 结构相同的类别列表
+            output_path: 输出的 txt 文件路径
+        """
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(FileConverter.format_txt_lines(categories)))
+            metrics.observe_size("save.bytes_written", f.tell())
+    
+    @staticmethod
+    def import_and_process(txt_path: str, processing_dir: str,
+                           snapshot_store: Optional["SnapshotStore"] = None) -> str:
         """
         执行完整的导入和预处理流程
         
+        原始文件只读取一次：内容交给快照存储备份（内容未变化时只做哈希比较），
+        并直接在内存中解析与格式化
+        
         Args:
             txt_path: 原始 txt 文件路径
             processing_dir: 处理目录路径
+            snapshot_store: 备份用的快照存储（None 表示不备份）
             
         Returns:
             处理后的 json 文件路径
@@ -296,17 +387,27 @@ class FileConverter:
         """
         os.makedirs(processing_dir, exist_ok=True)
         
-        basename = os.path.basename(txt_path)
-        copied_txt = os.path.join(processing_dir, basename)
-        shutil.copy2(txt_path, copied_txt)
+        with span("FileConverter.read", "import"):
+            with open(txt_path, 'rb') as f:
+                content = f.read()
+        metrics.observe_size("import.bytes_read", len(content))
+        if snapshot_store is not None:
+            with span("FileConverter.snapshot", "import", bytes=len(content)):
+                snapshot_store.add(content, KIND_IMPORT, txt_path)
         
-        temp_json = os.path.join(processing_dir, 'hotkeys_temp.json')
-        final_json = os.path.join(processing_dir, 'hotkeys.json')
-        
-        FileConverter.txt_to_json(copied_txt, temp_json)
-        FileConverter.format_key_names(temp_json, final_json)
+        with span("FileConverter.parse", "import"):
+            try:
+                lines = content.decode('utf-8').splitlines(keepends=True)
+            except UnicodeDecodeError as e:
+                raise Exception(f"txt_to_json 转换失败: {str(e)}")
+            parsed = FileConverter.parse_txt_lines(lines)
+        with span("FileConverter.format", "import", categories=len(parsed)):
+            categories = FileConverter.format_data(parsed)
         
-        if os.path.exists(temp_json):
-            os.remove(temp_json)
+        final_json = os.path.join(processing_dir, 'hotkeys.json')
+        with span("FileConverter.write_json", "import"):
+            with open(final_json, 'w', encoding='utf-8') as f:
+                json.dump(categories, f, indent=2, ensure_ascii=False)
+                metrics.observe_size("import.bytes_written", f.tell())
         
         return final_json
@@ -108,6 +108,66 @@ VALID_MODIFIERS = {'ctrl', 'alt', 'shift'}
 
 MODIFIER_ORDER = ['ctrl', 'shift', 'alt']
 
+# 美式键盘物理布局：键名 -> (x, y, 宽度)，单位为一个标准键宽
+# 用于估算按键距离与绘制键盘视图
+KEY_POSITIONS = {
+    # 扩展功能键 F13-F24
+    "F13": (2.0, -1.25, 1.0), "F14": (3.0, -1.25, 1.0), "F15": (4.0, -1.25, 1.0),
+    "F16": (5.0, -1.25, 1.0), "F17": (6.5, -1.25, 1.0), "F18": (7.5, -1.25, 1.0),
+    "F19": (8.5, -1.25, 1.0), "F20": (9.5, -1.25, 1.0), "F21": (11.0, -1.25, 1.0),
+    "F22": (12.0, -1.25, 1.0), "F23": (13.0, -1.25, 1.0), "F24": (14.0, -1.25, 1.0),
+    # 功能键行
+    "ESCAPE": (0.0, 0.0, 1.0),
+    "F1": (2.0, 0.0, 1.0), "F2": (3.0, 0.0, 1.0), "F3": (4.0, 0.0, 1.0), "F4": (5.0, 0.0, 1.0),
+    "F5": (6.5, 0.0, 1.0), "F6": (7.5, 0.0, 1.0), "F7": (8.5, 0.0, 1.0), "F8": (9.5, 0.0, 1.0),
+    "F9": (11.0, 0.0, 1.0), "F10": (12.0, 0.0, 1.0), "F11": (13.0, 0.0, 1.0), "F12": (14.0, 0.0, 1.0),
+    "PRINT_SCREEN": (15.25, 0.0, 1.0), "SCROLL_LOCK": (16.25, 0.0, 1.0),
+    # 数字行
+    "GRAVE": (0.0, 1.25, 1.0),
+    "NUM_1": (1.0, 1.25, 1.0), "NUM_2": (2.0, 1.25, 1.0), "NUM_3": (3.0, 1.25, 1.0),
+    "NUM_4": (4.0, 1.25, 1.0), "NUM_5": (5.0, 1.25, 1.0), "NUM_6": (6.0, 1.25, 1.0),
+    "NUM_7": (7.0, 1.25, 1.0), "NUM_8": (8.0, 1.25, 1.0), "NUM_9": (9.0, 1.25, 1.0),
+    "NUM_0": (10.0, 1.25, 1.0), "MINUS": (11.0, 1.25, 1.0), "EQUALS": (12.0, 1.25, 1.0),
+    "BACKSPACE": (13.0, 1.25, 2.0),
+    # 上排字母
+    "TAB": (0.0, 2.25, 1.5),
+    "Q": (1.5, 2.25, 1.0), "W": (2.5, 2.25, 1.0), "E": (3.5, 2.25, 1.0), "R": (4.5, 2.25, 1.0),
+    "T": (5.5, 2.25, 1.0), "Y": (6.5, 2.25, 1.0), "U": (7.5, 2.25, 1.0), "I": (8.5, 2.25, 1.0),
+    "O": (9.5, 2.25, 1.0), "P": (10.5, 2.25, 1.0),
+    "LEFT_BRACKET": (11.5, 2.25, 1.0), "RIGHT_BRACKET": (12.5, 2.25, 1.0),
+    "BACKSLASH": (13.5, 2.25, 1.5),
+    # 中排字母（基准行）
+    "A": (1.75, 3.25, 1.0), "S": (2.75, 3.25, 1.0), "D": (3.75, 3.25, 1.0), "F": (4.75, 3.25, 1.0),
+    "G": (5.75, 3.25, 1.0), "H": (6.75, 3.25, 1.0), "J": (7.75, 3.25, 1.0), "K": (8.75, 3.25, 1.0),
+    "L": (9.75, 3.25, 1.0), "SEMICOLON": (10.75, 3.25, 1.0), "APOSTROPHE": (11.75, 3.25, 1.0),
+    "ENTER": (12.75, 3.25, 2.25),
+    # 下排字母
+    "Z": (2.25, 4.25, 1.0), "X": (3.25, 4.25, 1.0), "C": (4.25, 4.25, 1.0), "V": (5.25, 4.25, 1.0),
+    "B": (6.25, 4.25, 1.0), "N": (7.25, 4.25, 1.0), "M": (8.25, 4.25, 1.0),
+    "COMMA": (9.25, 4.25, 1.0), "PERIOD": (10.25, 4.25, 1.0), "SLASH": (11.25, 4.25, 1.0),
+    # 空格行
+    "SPACE": (3.75, 5.25, 6.25),
+    # 编辑与方向键
+    "INSERT": (15.25, 1.25, 1.0), "HOME": (16.25, 1.25, 1.0), "PAGE_UP": (17.25, 1.25, 1.0),
+    "DELETE": (15.25, 2.25, 1.0), "END": (16.25, 2.25, 1.0), "PAGE_DOWN": (17.25, 2.25, 1.0),
+    "UP": (16.25, 4.25, 1.0),
+    "LEFT": (15.25, 5.25, 1.0), "DOWN": (16.25, 5.25, 1.0), "RIGHT": (17.25, 5.25, 1.0),
+    # 小键盘
+    "NUMPAD_LEFT_PAREN": (18.5, 0.0, 1.0), "NUMPAD_RIGHT_PAREN": (19.5, 0.0, 1.0),
+    "NUMPAD_EQUALS": (20.5, 0.0, 1.0),
+    "NUM_LOCK": (18.5, 1.25, 1.0), "NUMPAD_DIVIDE": (19.5, 1.25, 1.0),
+    "NUMPAD_MULTIPLY": (20.5, 1.25, 1.0), "NUMPAD_MINUS": (21.5, 1.25, 1.0),
+    "NUMPAD_7": (18.5, 2.25, 1.0), "NUMPAD_8": (19.5, 2.25, 1.0), "NUMPAD_9": (20.5, 2.25, 1.0),
+    "NUMPAD_PLUS": (21.5, 2.25, 1.0),
+    "NUMPAD_4": (18.5, 3.25, 1.0), "NUMPAD_5": (19.5, 3.25, 1.0), "NUMPAD_6": (20.5, 3.25, 1.0),
+    "NUMPAD_1": (18.5, 4.25, 1.0), "NUMPAD_2": (19.5, 4.25, 1.0), "NUMPAD_3": (20.5, 4.25, 1.0),
+    "NUMPAD_ENTER": (21.5, 4.25, 1.0),
+    "NUMPAD_0": (18.5, 5.25, 2.0), "NUMPAD_DOT": (20.5, 5.25, 1.0),
+    # 非美式布局的独立符号键
+    "AT": (0.0, 6.5, 1.0), "COLON": (1.0, 6.5, 1.0), "PLUS": (2.0, 6.5, 1.0),
+    "POUND": (3.0, 6.5, 1.0), "STAR": (4.0, 6.5, 1.0),
+}
+
 from PySide6.QtCore import Qt
 
 QT_KEY_TO_NAME = {
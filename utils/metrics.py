@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+运行指标模块
+记录热点路径的计数器与分桶直方图（耗时、字节数），可在调试面板中查看，程序退出时写入 JSON。
+计数与观测只做字典更新，不加锁（多线程下计数为近似值）
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 直方图桶上界：耗时（毫秒）与大小（字节）
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+SIZE_BUCKETS: Tuple[float, ...] = tuple(1024 * 4 ** i for i in range(8))
+
+UNIT_MS = "ms"
+UNIT_BYTES = "bytes"
+
+
+class Histogram:
+    """固定分桶直方图"""
+
+    __slots__ = ("unit", "bounds", "buckets", "count", "total", "minimum", "maximum")
+
+    def __init__(self, unit: str, bounds: Tuple[float, ...]):
+        """
+        初始化直方图
+
+        Args:
+            unit: 观测值单位
+            bounds: 递增的桶上界（超过最后一个上界的值计入溢出桶）
+        """
+        self.unit = unit
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+
+    def observe(self, value: float) -> None:
+        """记录一个观测值"""
+        index = 0
+        for bound in self.bounds:
+            if value <= bound:
+                break
+            index += 1
+        self.buckets[index] += 1
+        if self.count == 0 or value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, fraction: float) -> float:
+        """
+        估计分位数（取所在桶的上界，溢出桶取最大值）
+
+        Args:
+            fraction: 0~1 之间的比例
+        """
+        if self.count == 0:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.maximum)
+                return self.maximum
+        return self.maximum
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可序列化的字典"""
+        labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return {
+            "unit": self.unit,
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "min": round(self.minimum, 3),
+            "max": round(self.maximum, 3),
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(0.5), 3),
+            "p95": round(self.percentile(0.95), 3),
+            "buckets": {label: count for label, count in zip(labels, self.buckets) if count}
+        }
+
+
+class MetricsRegistry:
+    """计数器与直方图的注册表"""
+
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._started = time.time()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """
+        计数器加一（或指定数量）
+
+        Args:
+            name: 计数器名（以点分隔的层级，如 render.rows_updated）
+            amount: 增加的数量
+        """
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe_latency(self, name: str, seconds: float) -> None:
+        """
+        记录一次耗时
+
+        Args:
+            name: 直方图名
+            seconds: 耗时（秒，按毫秒分桶）
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram(UNIT_MS, LATENCY_BUCKETS_MS)
+        histogram.observe(seconds * 1000)
+
+    def observe_size(self, name: str, size: int) -> None:
+        """
+        记录一次读写的字节数
+
+        Args:
+            name: 直方图名
+            size: 字节数
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram(UNIT_BYTES, SIZE_BUCKETS)
+        histogram.observe(size)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        记录 with 语句块的耗时
+
+        Args:
+            name: 直方图名
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_latency(name, time.perf_counter() - start)
+
+    def counter(self, name: str) -> int:
+        """获取计数器当前值"""
+        return self._counters.get(name, 0)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        """获取直方图（不存在时返回 None）"""
+        return self._histograms.get(name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取全部指标
+
+        Returns:
+            {"started": 开始时间, "uptime": 秒数, "counters": {...}, "histograms": {名称: {...}}}
+        """
+        return {
+            "started": self._started,
+            "uptime": round(time.time() - self._started, 3),
+            "counters": dict(sorted(self._counters.items())),
+            "histograms": {name: self._histograms[name].to_dict() for name in sorted(self._histograms)}
+        }
+
+    def rows(self) -> List[Tuple[str, str, str, str, str, str]]:
+        """
+        获取用于表格显示的指标行
+
+        Returns:
+            [(名称, 次数, 平均值, p50, p95, 最大值), ...]，计数器只填次数
+        """
+        rows = [(name, str(value), "", "", "", "") for name, value in sorted(self._counters.items())]
+        for name in sorted(self._histograms):
+            data = self._histograms[name].to_dict()
+            unit = data["unit"]
+            rows.append((
+                name, str(data["count"]),
+                _format_value(data["mean"], unit), _format_value(data["p50"], unit),
+                _format_value(data["p95"], unit), _format_value(data["max"], unit)
+            ))
+        return rows
+
+    def reset(self) -> None:
+        """清空全部指标"""
+        self._counters.clear()
+        self._histograms.clear()
+        self._started = time.time()
+
+    def dump_json(self, path: str) -> None:
+        """
+        将全部指标写入 JSON 文件
+
+        Args:
+            path: 输出文件路径
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2, ensure_ascii=False)
+
+
+def _format_value(value: float, unit: str) -> str:
+    if unit == UNIT_BYTES:
+        return f"{value / 1024:.1f} KB" if value >= 1024 else f"{value:.0f} B"
+    return f"{value:.2f} {unit}"
+
+
+metrics = MetricsRegistry()
+
+
+def default_metrics_path() -> str:
+    """默认输出路径：程序目录下的 processing/metrics.json"""
+    from .resource_path import get_external_resource_path
+    return get_external_resource_path(os.path.join("processing", "metrics.json"))
+
+
+def dump_metrics(path: Optional[str] = None) -> None:
+    """
+    将全局指标写入 JSON 文件（用于程序退出时）
+
+    Args:
+        path: 输出文件路径（默认见 default_metrics_path）
+    """
+    try:
+        metrics.dump_json(path or default_metrics_path())
+    except Exception as e:
+        print(f"写入运行指标失败: {e}")
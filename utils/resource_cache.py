@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+资源缓存模块
+进程内共享的图标、位图与样式表缓存：资源经 resolve_resource 从覆盖文件或编译资源包中定位，
+每个文件只读取一次，位图按尺寸与设备像素比缩放一次，样式表与窗口图标在应用级别设置一次，
+之后渲染列表或打开对话框不再访问文件系统
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from .resource_path import read_resource, resolve_resource
+
+STYLESHEET_PATH = "styles/style.qss"
+WINDOW_ICON_PATH = "icon/icon.png"
+
+_stylesheet: Optional[str] = None
+_icons: Dict[str, QIcon] = {}
+_source_pixmaps: Dict[str, QPixmap] = {}
+_scaled_pixmaps: Dict[Tuple[str, int, int, float], QPixmap] = {}
+# 已设置过全局资源的 QApplication 实例
+_applied_app: Optional[QApplication] = None
+
+
+def get_stylesheet() -> str:
+    """
+    获取全局样式表（首次调用时读取，并将 ./icon/ 下的图标替换为实际位置）
+
+    Returns:
+        样式表文本，文件不存在时返回空字符串
+    """
+    global _stylesheet
+    if _stylesheet is None:
+        content = read_resource(STYLESHEET_PATH)
+        stylesheet = content.decode("utf-8") if content is not None else ""
+        _stylesheet = re.sub(r"\./icon/([^)'\"\s]+)", _resolve_stylesheet_icon, stylesheet)
+    return _stylesheet
+
+
+def _resolve_stylesheet_icon(match: "re.Match") -> str:
+    path = resolve_resource(f"icon/{match.group(1)}")
+    return path.replace("\\", "/") if path else match.group(0)
+
+
+def get_icon(relative_path: str) -> QIcon:
+    """
+    获取图标（每个文件只读取一次）
+
+    Args:
+        relative_path: 相对于程序资源目录的路径（如 "icon/icon.png"）
+
+    Returns:
+        图标，文件不存在时为空图标
+    """
+    icon = _icons.get(relative_path)
+    if icon is None:
+        path = resolve_resource(relative_path)
+        icon = QIcon(path) if path else QIcon()
+        _icons[relative_path] = icon
+    return icon
+
+
+def get_pixmap(relative_path: str, width: int, height: int,
+               device_pixel_ratio: float = 1.0) -> QPixmap:
+    """
+    获取缩放后的位图（每个尺寸与设备像素比只缩放一次）
+
+    Args:
+        relative_path: 相对于程序资源目录的路径（如 "icon/warning.png"）
+        width: 逻辑宽度
+        height: 逻辑高度
+        device_pixel_ratio: 设备像素比（高分屏按物理像素缩放，保持清晰）
+
+    Returns:
+        位图，文件不存在时为空位图
+    """
+    key = (relative_path, width, height, device_pixel_ratio)
+    pixmap = _scaled_pixmaps.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    source = _source_pixmaps.get(relative_path)
+    if source is None:
+        path = resolve_resource(relative_path)
+        source = QPixmap(path) if path else QPixmap()
+        _source_pixmaps[relative_path] = source
+
+    if source.isNull():
+        pixmap = QPixmap()
+    else:
+        pixmap = source.scaled(
+            round(width * device_pixel_ratio), round(height * device_pixel_ratio),
+            Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+    _scaled_pixmaps[key] = pixmap
+    return pixmap
+
+
+def apply_application_resources() -> bool:
+    """
+    为当前 QApplication 设置全局样式表与窗口图标（每个应用实例只设置一次）
+
+    Returns:
+        本次调用是否实际进行了设置
+    """
+    global _applied_app
+    app = QApplication.instance()
+    if app is None or app is _applied_app:
+        return False
+    app.setStyleSheet(get_stylesheet())
+    icon = get_icon(WINDOW_ICON_PATH)
+    if not icon.isNull():
+        app.setWindowIcon(icon)
+    _applied_app = app
+    return True
+
+
+def clear() -> None:
+    """清空缓存（资源文件被替换后重新读取）"""
+    global _stylesheet, _applied_app
+    _stylesheet = None
+    _applied_app = None
+    _icons.clear()
+    _source_pixmaps.clear()
+    _scaled_pixmaps.clear()
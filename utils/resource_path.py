@@ -6,6 +6,7 @@
 
 import os
 import sys
+from typing import Optional, Set
 
 
 def get_resource_base_path() -> str:
@@ -58,3 +59,114 @@ def get_external_resource_path(relative_path: str) -> str:
     """
     base_path = get_resource_base_path()
     return os.path.join(base_path, relative_path)
+
+
+# ---- 编译资源包 ----
+# 图标、样式表与语言包可由 tools/build_resources.py 编译为单个 Qt 二进制资源包，
+# 启动时只打开并内存映射这一个文件；程序目录下同名的散装文件优先于资源包中的副本
+
+RESOURCE_BUNDLE = "resources.rcc"
+BUNDLED_DIRS = ("icon", "styles", "language")
+
+_bundle_registered: Optional[bool] = None
+_external_files: Optional[Set[str]] = None
+
+
+def register_resource_bundle() -> bool:
+    """
+    注册编译资源包（只注册一次，Qt 以内存映射方式读取）
+
+    Returns:
+        资源包是否可用
+    """
+    global _bundle_registered
+    if _bundle_registered is None:
+        _bundle_registered = False
+        bundle_path = get_bundled_resource_path(RESOURCE_BUNDLE)
+        if os.path.exists(bundle_path):
+            from PySide6.QtCore import QResource
+            _bundle_registered = QResource.registerResource(bundle_path)
+            if not _bundle_registered:
+                print(f"注册资源包失败: {bundle_path}")
+    return _bundle_registered
+
+
+def _list_external_files() -> Set[str]:
+    """程序目录下可覆盖资源包的散装文件（每个目录只列举一次，不逐个检查文件）"""
+    global _external_files
+    if _external_files is None:
+        _external_files = set()
+        base_path = get_resource_base_path()
+        for directory in BUNDLED_DIRS:
+            try:
+                with os.scandir(os.path.join(base_path, directory)) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            _external_files.add(f"{directory}/{entry.name}")
+            except OSError:
+                continue
+    return _external_files
+
+
+def resolve_resource(relative_path: str) -> Optional[str]:
+    """
+    解析资源位置：程序目录下的散装文件 > 编译资源包 > 打包目录中的散装文件
+
+    Args:
+        relative_path: 相对路径（如 "icon/warning.png"）；绝对路径按普通文件处理
+
+    Returns:
+        文件路径或 Qt 资源路径（":/..."），资源不存在时返回 None
+    """
+    if os.path.isabs(relative_path):
+        return relative_path if os.path.exists(relative_path) else None
+
+    key = relative_path.replace(os.sep, '/')
+    if key in _list_external_files():
+        return get_external_resource_path(relative_path)
+
+    if register_resource_bundle():
+        from PySide6.QtCore import QFile
+        if QFile.exists(f":/{key}"):
+            return f":/{key}"
+
+    bundled_path = get_bundled_resource_path(relative_path)
+    if bundled_path != get_external_resource_path(relative_path) and os.path.exists(bundled_path):
+        return bundled_path
+    return None
+
+
+def read_resource(relative_path: str) -> Optional[bytes]:
+    """
+    读取资源内容（解析顺序见 resolve_resource）
+
+    Args:
+        relative_path: 相对路径
+
+    Returns:
+        文件内容，资源不存在或读取失败时返回 None
+    """
+    path = resolve_resource(relative_path)
+    if path is None:
+        return None
+    try:
+        if path.startswith(":/"):
+            from PySide6.QtCore import QFile, QIODevice
+            resource = QFile(path)
+            if not resource.open(QIODevice.ReadOnly):
+                return None
+            try:
+                return bytes(resource.readAll().data())
+            finally:
+                resource.close()
+        with open(path, 'rb') as f:
+            return f.read()
+    except Exception as e:
+        print(f"读取资源失败: {relative_path}: {e}")
+        return None
+
+
+def reset_resource_lookup() -> None:
+    """清空散装文件列表（程序目录中的覆盖文件变化后重新列举）"""
+    global _external_files
+    _external_files = None
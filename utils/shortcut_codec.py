@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+快捷键编码模块
+将快捷键字符串解析为 (按键, 修饰键掩码)，并映射到整数编码空间
+字符模式的单引号字面量会还原为对应的物理按键与修饰键，使两种模式的同一按键组合可以比较
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .key_constants import CHAR_TO_KEY, KEY_NAMES, KEY_TO_CHAR, MODIFIER_ORDER, SHIFT_CHAR_MAP
+from .metrics import metrics
+
+MODIFIER_BITS = {'ctrl': 1, 'shift': 2, 'alt': 4}
+
+# 三个修饰键的全部组合数
+MODIFIER_COMBOS = 8
+
+KEY_INDEX = {name: i for i, name in enumerate(KEY_NAMES)}
+
+# 一般模式编码占用 [0, NORMAL_SLOT_COUNT)，之后为单引号字面量
+NORMAL_SLOT_COUNT = len(KEY_NAMES) * MODIFIER_COMBOS
+
+
+def _build_char_keystrokes() -> Dict[str, Tuple[str, int]]:
+    """
+    预计算字符到物理按键的映射表
+
+    需要 shift 的符号优先按 SHIFT_CHAR_MAP 还原（如 '!' -> shift + NUM_1），
+    其余字符按 KEY_TO_CHAR / CHAR_TO_KEY 还原，字母按大小写决定是否带 shift。
+    """
+    shift = MODIFIER_BITS['shift']
+    table: Dict[str, Tuple[str, int]] = {}
+    for key, char in SHIFT_CHAR_MAP.items():
+        table[char] = (key, shift)
+    for key, char in KEY_TO_CHAR.items():
+        table.setdefault(char, (key, 0))
+    for char, key in CHAR_TO_KEY.items():
+        table.setdefault(char, (key, 0))
+    for code in range(ord('A'), ord('Z') + 1):
+        letter = chr(code)
+        table[letter.lower()] = (letter, 0)
+        table[letter] = (letter, shift)
+    return table
+
+
+# 字符 -> (物理键名, 需要附加的修饰键掩码)
+CHAR_KEYSTROKES = _build_char_keystrokes()
+
+# 快捷键字符串 -> 规范形式 的缓存
+_canonical_cache: Dict[str, str] = {}
+
+
+def split_shortcut(shortcut: str) -> List[str]:
+    """
+    按 '+' 拆分快捷键（忽略单引号内的 '+'）
+
+    Args:
+        shortcut: 快捷键字符串
+
+    Returns:
+        去除首尾空白后的各段
+    """
+    parts = []
+    buffer = ""
+    in_quote = False
+
+    for char in shortcut:
+        if char == "'":
+            in_quote = not in_quote
+            buffer += char
+        elif char == '+' and not in_quote:
+            parts.append(buffer.strip())
+            buffer = ""
+        else:
+            buffer += char
+    parts.append(buffer.strip())
+    return parts
+
+
+def modifier_mask(modifiers) -> int:
+    """将修饰键名称集合转换为掩码"""
+    mask = 0
+    for mod in modifiers:
+        mask |= MODIFIER_BITS[mod]
+    return mask
+
+
+def mask_to_modifiers(mask: int) -> List[str]:
+    """将掩码转换为按 MODIFIER_ORDER 排序的修饰键列表"""
+    return [mod for mod in MODIFIER_ORDER if mask & MODIFIER_BITS[mod]]
+
+
+def parse_shortcut(shortcut: str) -> Optional[Tuple[str, int, bool]]:
+    """
+    解析快捷键字符串
+
+    Args:
+        shortcut: 格式化后的快捷键（如 "ctrl + shift + A"、"alt + 'x'"）
+
+    Returns:
+        (按键或字符, 修饰键掩码, 是否为单引号字面量)，无效返回 None
+    """
+    if not shortcut:
+        return None
+
+    parts = split_shortcut(shortcut)
+    if any(not p for p in parts):
+        return None
+
+    mask = 0
+    for mod in parts[:-1]:
+        bit = MODIFIER_BITS.get(mod.lower())
+        if bit is None:
+            return None
+        mask |= bit
+
+    key = parts[-1]
+    if len(key) >= 3 and key.startswith("'") and key.endswith("'"):
+        content = key[1:-1]
+        return KEY_TO_CHAR.get(content, content), mask, True
+
+    if key not in KEY_INDEX:
+        return None
+    return key, mask, False
+
+
+def canonical_keystroke(shortcut: str) -> Optional[Tuple[str, int, bool]]:
+    """
+    将快捷键解析为物理按键组合
+
+    Args:
+        shortcut: 快捷键字符串
+
+    Returns:
+        与 parse_shortcut 相同的三元组；可还原为物理按键的字面量返回 (键名, 掩码, False)
+    """
+    parsed = parse_shortcut(shortcut)
+    if parsed is None or not parsed[2]:
+        return parsed
+
+    char, mask, _ = parsed
+    keystroke = CHAR_KEYSTROKES.get(char)
+    if keystroke is None:
+        return parsed
+    return keystroke[0], mask | keystroke[1], False
+
+
+def canonical_shortcut(shortcut: str) -> str:
+    """
+    获取快捷键的规范形式，同一物理按键组合的不同写法得到相同结果
+
+    例如 "'!'" 与 "shift + NUM_1" 均规范为 "shift + NUM_1"。结果会被缓存。
+
+    Args:
+        shortcut: 快捷键字符串
+
+    Returns:
+        规范化的快捷键字符串，无法解析时原样返回
+    """
+    canonical = _canonical_cache.get(shortcut)
+    if canonical is not None:
+        metrics.increment("normalizer.cache_hits")
+    else:
+        metrics.increment("normalizer.cache_misses")
+        parsed = canonical_keystroke(shortcut)
+        canonical = shortcut if parsed is None else build_shortcut(*parsed)
+        _canonical_cache[shortcut] = canonical
+    return canonical
+
+
+def build_shortcut(key: str, mask: int, literal: bool = False) -> str:
+    """
+    构建与 KeyboardHandler 输出一致的快捷键字符串
+
+    Args:
+        key: 键名或字符
+        mask: 修饰键掩码
+        literal: 是否为单引号字面量
+
+    Returns:
+        快捷键字符串
+    """
+    key_part = f"'{key}'" if literal else key
+    modifiers = mask_to_modifiers(mask)
+    if modifiers:
+        return f"{' + '.join(modifiers)} + {key_part}"
+    return key_part
+
+
+def encode_key(key: str, mask: int) -> int:
+    """一般模式按键编码"""
+    return KEY_INDEX[key] * MODIFIER_COMBOS + mask
+
+
+def decode_key(code: int) -> Tuple[str, int]:
+    """一般模式编码解码为 (键名, 掩码)"""
+    return KEY_NAMES[code // MODIFIER_COMBOS], code % MODIFIER_COMBOS
+
+
+class ShortcutSpace:
+    """
+    快捷键整数编码空间
+    一般模式按键为 键索引 * 8 + 掩码，可还原为物理按键的字面量与之共用编码；
+    其余单引号字面量按首次出现顺序追加编号
+    """
+
+    def __init__(self):
+        """初始化编码空间"""
+        self._literal_codes: Dict[Tuple[str, int], int] = {}
+        self._literals: List[Tuple[str, int]] = []
+        self._codes: Dict[str, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        """当前编码空间大小"""
+        return NORMAL_SLOT_COUNT + len(self._literals)
+
+    def encode(self, shortcut: str) -> Optional[int]:
+        """
+        获取快捷键的整数编码（字面量首次出现时分配新编码）
+
+        Args:
+            shortcut: 快捷键字符串
+
+        Returns:
+            整数编码，无效返回 None
+        """
+        if shortcut in self._codes:
+            return self._codes[shortcut]
+
+        parsed = canonical_keystroke(shortcut)
+        if parsed is None:
+            code = None
+        elif not parsed[2]:
+            code = encode_key(parsed[0], parsed[1])
+        else:
+            literal_key = (parsed[0], parsed[1])
+            code = self._literal_codes.get(literal_key)
+            if code is None:
+                code = NORMAL_SLOT_COUNT + len(self._literals)
+                self._literal_codes[literal_key] = code
+                self._literals.append(literal_key)
+        self._codes[shortcut] = code
+        return code
+
+    def decode(self, code: int) -> str:
+        """
+        将整数编码还原为快捷键字符串
+
+        Args:
+            code: 整数编码
+
+        Returns:
+            快捷键字符串
+        """
+        if code < NORMAL_SLOT_COUNT:
+            key, mask = decode_key(code)
+            return build_shortcut(key, mask)
+        char, mask = self._literals[code - NORMAL_SLOT_COUNT]
+        return build_shortcut(char, mask, literal=True)
+
+    def is_literal(self, code: int) -> bool:
+        """判断编码是否为单引号字面量"""
+        return code >= NORMAL_SLOT_COUNT
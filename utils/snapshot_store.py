@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+快照存储模块
+按内容哈希保存快捷键文件的各个版本：相同内容只保存一份 zlib 压缩对象，
+历史记录为追加写入的 JSON 行日志，按保留策略清理旧记录与不再被引用的对象
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# 快照类型
+KIND_IMPORT = "import"
+KIND_SAVE = "save"
+KIND_RESTORE = "restore"
+
+LOG_FILENAME = "log.jsonl"
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    """先写临时文件再替换，避免中断时留下不完整的文件"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+class SnapshotStore:
+    """内容寻址的快照存储"""
+
+    def __init__(self, root: str, max_snapshots: int = 50, max_age_days: int = 0):
+        """
+        初始化快照存储（目录在首次写入时创建）
+
+        Args:
+            root: 存储目录
+            max_snapshots: 最多保留的历史记录数（0 表示不限）
+            max_age_days: 历史记录的最长保留天数（0 表示不限）
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.log_path = os.path.join(root, LOG_FILENAME)
+        self.max_snapshots = max_snapshots
+        self.max_age_days = max_age_days
+        # 历史记录（时间顺序），首次访问时读取日志
+        self._entries: Optional[List[Dict[str, Any]]] = None
+
+    # ---- 历史记录 ----
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        获取历史记录（最新在前），只读取日志，不解压任何快照
+
+        Returns:
+            [{"hash", "time", "kind", "source", "size"}, ...]
+        """
+        return list(reversed(self._load_entries()))
+
+    def latest(self, source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        获取最新的历史记录
+
+        Args:
+            source: 只查找该文件的记录（None 表示不限）
+
+        Returns:
+            历史记录，不存在时返回 None
+        """
+        for entry in reversed(self._load_entries()):
+            if source is None or entry["source"] == source:
+                return entry
+        return None
+
+    def _load_entries(self) -> List[Dict[str, Any]]:
+        """读取日志（只读取一次），跳过损坏的行"""
+        if self._entries is not None:
+            return self._entries
+        self._entries = []
+        if not os.path.exists(self.log_path):
+            return self._entries
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and "hash" in entry:
+                        self._entries.append(entry)
+        except Exception as e:
+            print(f"读取快照日志失败: {e}")
+        return self._entries
+
+    # ---- 写入 ----
+
+    def add(self, content: bytes, kind: str, source: str = "") -> Tuple[Dict[str, Any], bool]:
+        """
+        保存一个版本
+
+        内容已存在时不写对象；与该文件的最新记录内容相同时也不追加记录
+
+        Args:
+            content: 文件内容
+            kind: 快照类型（KIND_IMPORT、KIND_SAVE、KIND_RESTORE）
+            source: 来源文件路径
+
+        Returns:
+            (对应的历史记录, 是否新增了记录)
+        """
+        digest = hashlib.sha1(content).hexdigest()
+        source = os.path.abspath(source) if source else ""
+        latest = self.latest(source)
+        if latest is not None and latest["hash"] == digest and self.has_object(digest):
+            return latest, False
+
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            _write_atomic(object_path, zlib.compress(content, 6))
+
+        entry = {
+            "hash": digest,
+            "time": time.time(),
+            "kind": kind,
+            "source": source,
+            "size": len(content)
+        }
+        self._load_entries().append(entry)
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        if self._over_limit():
+            self.prune()
+        return entry, True
+
+    def add_file(self, path: str, kind: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        保存文件的当前版本
+
+        Args:
+            path: 文件路径
+            kind: 快照类型
+
+        Returns:
+            (对应的历史记录, 是否新增了记录)
+        """
+        with open(path, 'rb') as f:
+            content = f.read()
+        return self.add(content, kind, path)
+
+    # ---- 读取 ----
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def has_object(self, digest: str) -> bool:
+        """快照对象是否存在"""
+        return os.path.exists(self._object_path(digest))
+
+    def read(self, digest: str) -> bytes:
+        """
+        读取并解压快照
+
+        Args:
+            digest: 内容哈希
+
+        Returns:
+            文件内容
+
+        Raises:
+            OSError: 快照不存在
+            ValueError: 快照已损坏（哈希不符）
+        """
+        with open(self._object_path(digest), 'rb') as f:
+            content = zlib.decompress(f.read())
+        if hashlib.sha1(content).hexdigest() != digest:
+            raise ValueError(f"快照已损坏: {digest}")
+        return content
+
+    def read_lines(self, digest: str) -> List[str]:
+        """读取快照文本行"""
+        return self.read(digest).decode('utf-8', errors='replace').splitlines()
+
+    def diff(self, old_digest: str, new_digest: Optional[str] = None,
+             new_path: Optional[str] = None, context: int = 3) -> List[str]:
+        """
+        比较两个版本（统一差异格式）
+
+        Args:
+            old_digest: 旧版本哈希
+            new_digest: 新版本哈希
+            new_path: 不指定 new_digest 时与该文件的当前内容比较
+            context: 上下文行数
+
+        Returns:
+            差异行
+        """
+        old_lines = self.read_lines(old_digest)
+        if new_digest is not None:
+            new_lines = self.read_lines(new_digest)
+            new_name = new_digest[:10]
+        else:
+            with open(new_path, 'r', encoding='utf-8', errors='replace') as f:
+                new_lines = f.read().splitlines()
+            new_name = os.path.basename(new_path)
+        return list(difflib.unified_diff(
+            old_lines, new_lines, old_digest[:10], new_name, n=context, lineterm=""
+        ))
+
+    def restore(self, digest: str, path: str) -> Dict[str, Any]:
+        """
+        将文件恢复为指定版本，并记录一次恢复
+
+        Args:
+            digest: 内容哈希
+            path: 目标文件路径
+
+        Returns:
+            新增的历史记录
+        """
+        content = self.read(digest)
+        _write_atomic(path, content)
+        entry, _ = self.add(content, KIND_RESTORE, path)
+        return entry
+
+    # ---- 保留策略 ----
+
+    def _over_limit(self) -> bool:
+        """是否有可删除的记录（每个来源文件的最新记录不可删除，不计入）"""
+        entries = self._load_entries()
+        too_many = self.max_snapshots and len(entries) > self.max_snapshots
+        too_old = self.max_age_days and entries and entries[0]["time"] < self._cutoff()
+        if not (too_many or too_old):
+            return False
+        return bool(self._removable(entries))
+
+    def _cutoff(self) -> float:
+        return time.time() - self.max_age_days * 86400
+
+    def _removable(self, entries: List[Dict[str, Any]]) -> Set[int]:
+        """
+        按保留策略可删除的记录下标
+
+        Args:
+            entries: 历史记录（时间顺序）
+
+        Returns:
+            超出数量或超过保留天数、且不是其来源文件最新记录的下标
+        """
+        cutoff = self._cutoff() if self.max_age_days else None
+        protected = set({entry["source"]: i for i, entry in enumerate(entries)}.values())
+        removable = set()
+        for i, entry in enumerate(entries):
+            too_many = self.max_snapshots and len(entries) - i > self.max_snapshots
+            too_old = cutoff is not None and entry["time"] < cutoff
+            if i not in protected and (too_many or too_old):
+                removable.add(i)
+        return removable
+
+    def prune(self) -> Dict[str, int]:
+        """
+        按保留策略删除旧记录，并删除不再被任何记录引用的对象
+        每个来源文件的最新记录总是保留
+
+        Returns:
+            {"entries": 删除的记录数, "objects": 删除的对象数}
+        """
+        entries = self._load_entries()
+        removable = self._removable(entries)
+        kept = [entry for i, entry in enumerate(entries) if i not in removable]
+
+        removed_entries = len(entries) - len(kept)
+        if removed_entries:
+            lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in kept)
+            _write_atomic(self.log_path, lines.encode('utf-8'))
+            self._entries = kept
+
+        referenced = {entry["hash"] for entry in kept}
+        removed_objects = 0
+        if os.path.isdir(self.objects_dir):
+            for prefix in os.listdir(self.objects_dir):
+                prefix_dir = os.path.join(self.objects_dir, prefix)
+                if not os.path.isdir(prefix_dir):
+                    continue
+                for name in os.listdir(prefix_dir):
+                    if prefix + name not in referenced:
+                        os.remove(os.path.join(prefix_dir, name))
+                        removed_objects += 1
+                if not os.listdir(prefix_dir):
+                    os.rmdir(prefix_dir)
+
+        return {"entries": removed_entries, "objects": removed_objects}
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+界面卡顿监测模块
+GUI 线程通过定时器定期更新心跳，监测线程发现心跳超过阈值未更新时，持续采样 GUI 线程的
+Python 调用栈，卡顿结束后将持续时间、触发操作与按出现次数汇总的调用栈写入滚动日志
+
+通过环境变量启用：
+    SPINE_HOTKEYS_WATCHDOG=1        启用监测（日志写入 processing/stalls.log）
+    SPINE_HOTKEYS_STALL_MS=50       卡顿阈值（毫秒，默认 50）
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from logging.handlers import RotatingFileHandler
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QAbstractButton, QApplication, QMenu
+
+from .resource_path import get_external_resource_path
+
+WATCHDOG_ENV = "SPINE_HOTKEYS_WATCHDOG"
+STALL_MS_ENV = "SPINE_HOTKEYS_STALL_MS"
+DEFAULT_STALL_MS = 50
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+# 每个报告保留的调用栈种类数与栈深度
+MAX_STACKS = 5
+MAX_DEPTH = 30
+
+# 记录为触发操作的输入事件
+_INPUT_EVENTS = frozenset((
+    QEvent.Type.MouseButtonRelease,
+    QEvent.Type.KeyPress,
+    QEvent.Type.Wheel,
+))
+
+StackKey = Tuple[Tuple[str, int, str], ...]
+
+
+class _InputRecorder(QObject):
+    """记录最近一次用户输入，作为卡顿的触发操作"""
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.action = ""
+        self.time = 0.0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in _INPUT_EVENTS:
+            self.action = self._describe(watched, event)
+            self.time = time.monotonic()
+        return False
+
+    @staticmethod
+    def _describe(watched: QObject, event: QEvent) -> str:
+        kind = event.type().name
+        target = watched.objectName() or type(watched).__name__
+        if isinstance(watched, QMenu) and watched.activeAction() is not None:
+            target = f"{target} > {watched.activeAction().text()}"
+        elif isinstance(watched, QAbstractButton) and watched.text():
+            target = f"{target} ({watched.text()})"
+        return f"{kind} {target}"
+
+
+class StallWatchdog:
+    """GUI 线程卡顿监测器"""
+
+    def __init__(self, threshold_ms: int = DEFAULT_STALL_MS, log_path: Optional[str] = None):
+        """
+        初始化监测器
+
+        Args:
+            threshold_ms: 卡顿阈值（毫秒）
+            log_path: 日志文件路径（默认为程序目录下的 processing/stalls.log）
+        """
+        self.threshold = max(threshold_ms, 1) / 1000
+        self.log_path = log_path or get_external_resource_path(os.path.join("processing", "stalls.log"))
+        # 心跳间隔取阈值的一半（至多 25 毫秒），采样间隔取阈值的五分之一
+        self.heartbeat_interval = min(self.threshold / 2, 0.025)
+        self.sample_interval = max(self.threshold / 5, 0.002)
+        self.stall_count = 0
+        self._last_beat = time.monotonic()
+        self._gui_thread_id = 0
+        self._timer: Optional[QTimer] = None
+        self._recorder: Optional[_InputRecorder] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._logger: Optional[logging.Logger] = None
+
+    @classmethod
+    def from_environment(cls) -> Optional["StallWatchdog"]:
+        """
+        根据环境变量创建监测器
+
+        Returns:
+            监测器，未启用时返回 None
+        """
+        if os.environ.get(WATCHDOG_ENV, "").strip().lower() in ("", "0", "false", "off"):
+            return None
+        try:
+            threshold_ms = int(os.environ.get(STALL_MS_ENV, DEFAULT_STALL_MS))
+        except ValueError:
+            print(f"{STALL_MS_ENV} 无效，使用默认值 {DEFAULT_STALL_MS}")
+            threshold_ms = DEFAULT_STALL_MS
+        return cls(threshold_ms)
+
+    def start(self, app: QApplication) -> None:
+        """
+        开始监测（须在 GUI 线程中调用）
+
+        Args:
+            app: 应用实例
+        """
+        if self._thread is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+
+        self._timer = QTimer(app)
+        self._timer.setInterval(max(int(self.heartbeat_interval * 1000), 1))
+        self._timer.timeout.connect(self._beat)
+        self._timer.start()
+
+        self._recorder = _InputRecorder(app)
+        app.installEventFilter(self._recorder)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止监测"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._recorder is not None:
+            app = QApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self._recorder)
+            self._recorder = None
+        if self._logger is not None:
+            for handler in list(self._logger.handlers):
+                handler.close()
+                self._logger.removeHandler(handler)
+            self._logger = None
+
+    def _beat(self) -> None:
+        self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        """监测线程：发现卡顿后采样直到心跳恢复"""
+        while not self._stop_event.wait(self.heartbeat_interval):
+            beat = self._last_beat
+            # 允许一个心跳间隔的定时误差
+            if time.monotonic() - beat < self.threshold + self.heartbeat_interval:
+                continue
+            stacks: Counter = Counter()
+            while self._last_beat == beat and not self._stop_event.is_set():
+                stack = self._sample()
+                if stack:
+                    stacks[stack] += 1
+                time.sleep(self.sample_interval)
+            if self._stop_event.is_set():
+                return
+            duration = self._last_beat - beat - self.heartbeat_interval
+            if duration >= self.threshold:
+                self._report(duration, beat, stacks)
+
+    def _sample(self) -> Optional[StackKey]:
+        frame = sys._current_frames().get(self._gui_thread_id)
+        if frame is None:
+            return None
+        summary = traceback.extract_stack(frame)[-MAX_DEPTH:]
+        return tuple((entry.filename, entry.lineno, entry.name) for entry in summary)
+
+    def _report(self, duration: float, started: float, stacks: Counter) -> None:
+        """写入一次卡顿报告"""
+        self.stall_count += 1
+        recorder = self._recorder
+        action = ""
+        if recorder is not None and recorder.action and recorder.time <= started + self.heartbeat_interval:
+            age = max(started - recorder.time, 0.0)
+            action = f"{recorder.action}（卡顿前 {age * 1000:.0f} ms）"
+
+        samples = sum(stacks.values())
+        lines = [f"卡顿 {duration * 1000:.0f} ms，触发操作：{action or '未知'}，采样 {samples} 次"]
+        for stack, count in stacks.most_common(MAX_STACKS):
+            lines.append(f"  [{count}/{samples}]")
+            lines.extend(self._format_stack(stack))
+        self._get_logger().warning("\n".join(lines))
+
+    @staticmethod
+    def _format_stack(stack: StackKey) -> List[str]:
+        lines = []
+        for filename, lineno, name in stack:
+            lines.append(f'    File "{filename}", line {lineno}, in {name}')
+        return lines
+
+    def _get_logger(self) -> logging.Logger:
+        if self._logger is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+            handler = RotatingFileHandler(self.log_path, maxBytes=LOG_MAX_BYTES,
+                                          backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger = logging.getLogger(f"{__name__}.{id(self)}")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+性能跟踪模块
+在导入、渲染、保存等关键路径上记录耗时区间，保存在固定容量的环形缓冲区中，
+可导出为 Chrome trace JSON（chrome://tracing 或 Perfetto 中打开）。
+未启用时 span 返回共享的空上下文，traced 只多一次属性判断
+
+通过环境变量 SPINE_HOTKEYS_TRACE 启用：值为 1 时退出时导出到 processing/trace.json，
+值为 .json 路径时导出到该文件；也可在界面中按住 Shift 打开“工具”菜单启用
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+TRACE_ENV = "SPINE_HOTKEYS_TRACE"
+DEFAULT_CAPACITY = 20000
+
+# (名称, 类别, 开始时间 ns, 持续时间 ns, 线程 ID, 参数)
+SpanRecord = Tuple[str, str, int, int, int, Optional[Dict[str, Any]]]
+
+
+class _NullSpan:
+    """未启用时使用的空上下文"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """记录一个耗时区间"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str,
+                 args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter_ns()
+        self.tracer.record(self.name, self.category, self.start, end - self.start, self.args)
+
+
+class Tracer:
+    """耗时区间记录器"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        """
+        初始化记录器
+
+        Args:
+            capacity: 环形缓冲区容量（超出后丢弃最早的记录）
+            enabled: 是否启用
+        """
+        self.enabled = enabled
+        self._records: Deque[SpanRecord] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """启用或停用记录（已记录的内容保留）"""
+        self.enabled = enabled
+
+    def span(self, name: str, category: str = "app", **args: Any):
+        """
+        创建耗时区间（用于 with 语句）
+
+        Args:
+            name: 区间名称
+            category: 类别（Chrome trace 中的 cat）
+            args: 附加参数（显示在 trace 详情中）
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args or None)
+
+    def record(self, name: str, category: str, start_ns: int, duration_ns: int,
+               args: Optional[Dict[str, Any]] = None) -> None:
+        """记录一个已完成的区间"""
+        with self._lock:
+            self._records.append(
+                (name, category, start_ns, duration_ns, threading.get_ident(), args)
+            )
+
+    def records(self) -> List[SpanRecord]:
+        """获取缓冲区中的全部记录（时间顺序）"""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """清空缓冲区"""
+        with self._lock:
+            self._records.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        转换为 Chrome trace 格式
+
+        Returns:
+            {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        pid = os.getpid()
+        events = []
+        for name, category, start, duration, tid, args in self.records():
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """
+        导出为 Chrome trace JSON 文件
+
+        Args:
+            path: 输出文件路径
+
+        Returns:
+            导出的区间数
+        """
+        trace = self.to_chrome_trace()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False)
+        return len(trace["traceEvents"])
+
+
+def _env_setting() -> str:
+    return os.environ.get(TRACE_ENV, "").strip()
+
+
+tracer = Tracer(enabled=_env_setting().lower() not in ("", "0", "false", "off"))
+
+
+def span(name: str, category: str = "app", **args: Any):
+    """使用全局记录器创建耗时区间（见 Tracer.span）"""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args or None)
+
+
+def traced(name: Optional[str] = None, category: str = "app") -> Callable:
+    """
+    装饰器：将函数调用记录为耗时区间
+
+    Args:
+        name: 区间名称（默认为函数的限定名）
+        category: 类别
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, span_name, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def default_trace_path() -> str:
+    """默认导出路径：环境变量给出的 .json 路径，否则为程序目录下的 processing/trace.json"""
+    setting = _env_setting()
+    if setting.lower().endswith(".json"):
+        return setting
+    from .resource_path import get_external_resource_path
+    return get_external_resource_path(os.path.join("processing", "trace.json"))
+
+
+def _export_at_exit() -> None:
+    if tracer.enabled and tracer.records():
+        try:
+            tracer.export_chrome_trace(default_trace_path())
+        except Exception as e:
+            print(f"导出性能跟踪失败: {e}")
+
+
+if tracer.enabled:
+    atexit.register(_export_at_exit)